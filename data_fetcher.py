@@ -18,63 +18,48 @@ Features:
 """
 
 import os
+import sys
 import time
-import requests
 import yfinance as yf
 from datetime import datetime, timedelta
-from collections import deque
 from typing import Dict, List, Optional
 from dotenv import load_dotenv
 import json
 
+# Shared pooled HTTP client
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'wolfpack'))
+from utils.http_client import get_http_client
+from utils.rate_limiter import Priority
+from utils.single_flight import get_single_flight
+from utils.shared_quotes import get_live_quote
+
 # Load environment variables
 load_dotenv()
 
 
-class RateLimiter:
-    """Enforces rate limits per API"""
+class DataFetcher:
+    """Safe API wrapper with rate limiting and fallbacks"""
     
-    def __init__(self, max_calls: int, time_window: int = 60):
+    def __init__(self, priority: Priority = Priority.NORMAL):
         """
         Args:
-            max_calls: Maximum calls allowed
-            time_window: Time window in seconds (default 60 = per minute)
+            priority: Rate-limit priority for this fetcher's API calls
+                      (Priority.HIGH for position monitoring)
         """
-        self.max_calls = max_calls
-        self.time_window = time_window
-        self.calls = deque()
-    
-    def can_call(self) -> bool:
-        """Check if we can make a call without exceeding rate limit"""
-        now = time.time()
-        
-        # Remove calls outside time window
-        while self.calls and now - self.calls[0] > self.time_window:
-            self.calls.popleft()
-        
-        return len(self.calls) < self.max_calls
-    
-    def wait_if_needed(self):
-        """Block until we can make a call"""
-        while not self.can_call():
-            time.sleep(1)
-        
-        self.calls.append(time.time())
-
-
-class DataFetcher:
-    """Safe API wrapper with rate limiting and fallbacks"""
-    
-    def __init__(self):
         # API keys
         self.finnhub_key = os.getenv('FINNHUB_API_KEY')
         self.polygon_key = os.getenv('POLYGON_API_KEY')
         self.newsapi_key = os.getenv('NEWSAPI_KEY')
         
-        # Rate limiters
-        self.finnhub_limiter = RateLimiter(max_calls=60, time_window=60)  # 60/min
-        self.polygon_limiter = RateLimiter(max_calls=5, time_window=60)   # 5/min
-        self.newsapi_limiter = RateLimiter(max_calls=100, time_window=86400)  # 100/day
+        # Pooled keep-alive connections (one session per provider).
+        # Rate limits (Finnhub 60/min, Polygon 5/min, NewsAPI 100/day) are
+        # shared token buckets enforced across every process by the client.
+        self.http = get_http_client()
+        self.priority = priority
+        
+        # Concurrent get_quote() calls for the same ticker and priority share one fetch
+        # (shared by every DataFetcher in the process)
+        self.quote_flight = get_single_flight('data_fetcher.quote')
         
         # Cache with TTL (5 minutes)
         self.cache = {}
@@ -105,16 +90,28 @@ class DataFetcher:
                 'timestamp': str
             }
         """
+        # Live quote from the shared table (quote_feeder.py) - no API call
+        live = get_live_quote(ticker)
+        if live:
+            return live
+        
         cache_key = f"quote_{ticker}"
         cached = self._get_cache(cache_key)
         if cached:
             return cached
         
+        # Keyed by priority too: a HIGH caller (stops) never waits behind a
+        # LOW/NORMAL fetch queued for a rate-limit token
+        return self.quote_flight.do((ticker, self.priority), self._fetch_quote, ticker)
+    
+    def _fetch_quote(self, ticker: str) -> Optional[Dict]:
+        """Uncached quote fetch - Finnhub with yfinance fallback"""
+        cache_key = f"quote_{ticker}"
+        
         # Try Finnhub first
         try:
-            self.finnhub_limiter.wait_if_needed()
             url = f"https://finnhub.io/api/v1/quote?symbol={ticker}&token={self.finnhub_key}"
-            response = requests.get(url, timeout=10)
+            response = self.http.get(url, timeout=10, priority=self.priority)
             
             if response.status_code == 200:
                 data = response.json()
@@ -234,14 +231,12 @@ class DataFetcher:
         
         # Try Finnhub
         try:
-            self.finnhub_limiter.wait_if_needed()
-            
             # Get news from last 7 days
             to_date = datetime.now().strftime('%Y-%m-%d')
             from_date = (datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d')
             
             url = f"https://finnhub.io/api/v1/company-news?symbol={ticker}&from={from_date}&to={to_date}&token={self.finnhub_key}"
-            response = requests.get(url, timeout=10)
+            response = self.http.get(url, timeout=10, priority=self.priority)
             
             if response.status_code == 200:
                 data = response.json()
@@ -276,9 +271,8 @@ class DataFetcher:
             }
         """
         try:
-            self.finnhub_limiter.wait_if_needed()
             url = f"https://finnhub.io/api/v1/stock/market-status?exchange=US&token={self.finnhub_key}"
-            response = requests.get(url, timeout=10)
+            response = self.http.get(url, timeout=10, priority=self.priority)
             
             if response.status_code == 200:
                 data = response.json()
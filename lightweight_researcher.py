@@ -16,14 +16,14 @@ import os
 import sys
 import json
 import pandas as pd
-import yfinance as yf
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 import logging
 
 # Add wolfpack to path for shared utilities
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'wolfpack'))
-from utils.indicators import calculate_rsi, calculate_volume_ratio
+from utils.market_data import get_market_data_service
+from utils.screener import panel_to_arrays, compute_features
 
 # Setup logging
 logging.basicConfig(
@@ -121,10 +121,27 @@ class LightweightResearcher:
             'TSLA', 'GME', 'AMC', 'BBBY', 'LCID', 'RIVN'
         ]
     
-    def analyze_wounded_prey(self, symbol: str) -> Optional[Dict]:
+    def load_features(self, symbols: List[str]) -> tuple:
+        """
+        Bulk 3mo panel + vectorized screener features for all symbols
+        
+        Returns (panel, features) - features indexed by symbol
+        """
+        panel = get_market_data_service().get_panel(symbols, period='3mo')
+        features = compute_features(
+            panel_to_arrays(panel, symbols), horizons=(),
+            high_window=252, volume_window=20, recent_volume_window=5
+        )
+        return panel, features
+    
+    def analyze_wounded_prey(self, symbol: str, features: Optional[pd.Series] = None,
+                             df: Optional[pd.DataFrame] = None) -> Optional[Dict]:
         """
         Analyze a single symbol for wounded prey pattern
         
+        features / df: screener row and bars from load_features()
+        (fetched here if omitted)
+        
         Returns dict with:
         - convergence_score (0-100)
         - signals (dict of individual signal scores)
@@ -135,30 +152,35 @@ class LightweightResearcher:
             log.info(f"🔍 Analyzing {symbol}...")
             
             # Get historical data
-            ticker = yf.Ticker(symbol)
-            df = ticker.history(period='3mo', interval='1d')
+            if features is None or df is None:
+                panel, table = self.load_features([symbol])
+                if symbol not in table.index:
+                    log.warning(f"⚠️  {symbol}: Insufficient data")
+                    return None
+                features = table.loc[symbol]
+                df = panel[symbol].dropna(how='all')
             
-            if len(df) < 30:
+            if features['bars'] < 30:
                 log.warning(f"⚠️  {symbol}: Insufficient data")
                 return None
             
             # Calculate signals
             signals = {}
             
-            # 1. Volume Spike (0-20 points) - using unified indicators
-            avg_volume = df['Volume'].tail(20).mean()
-            recent_volume = df['Volume'].tail(5).mean()
-            volume_ratio = calculate_volume_ratio(recent_volume, avg_volume)
+            # 1. Volume Spike (0-20 points) - 5-day vs 20-day average
+            avg_volume = features['avg_volume']
+            recent_volume = features['volume']
+            volume_ratio = features['volume_ratio']
             signals['volume_spike'] = min(20, volume_ratio * 10)
             
             # 2. Price Decline (wounded prey - 0-20 points)
-            high_52w = df['High'].tail(252).max()
-            current_price = df['Close'].iloc[-1]
-            decline_pct = ((high_52w - current_price) / high_52w) * 100
+            high_52w = features['high']
+            current_price = features['price']
+            decline_pct = features['drawdown'] * 100
             signals['decline'] = min(20, decline_pct / 3)  # More decline = more points
             
-            # 3. RSI Oversold (0-20 points) - using unified indicators
-            rsi = calculate_rsi(df['Close'])
+            # 3. RSI Oversold (0-20 points)
+            rsi = features['rsi']
             if rsi < 30:
                 signals['rsi_oversold'] = 20
             elif rsi < 40:
@@ -272,9 +294,16 @@ class LightweightResearcher:
         universe = self.load_universe()
         log.info(f"📋 Scanning {len(universe)} symbols...")
         
+        # One bulk download + one vectorized feature pass for the whole universe
+        panel, features = self.load_features(universe)
+        
         results = []
         for symbol in universe:
-            result = self.analyze_wounded_prey(symbol)
+            if symbol not in features.index:
+                log.warning(f"⚠️  {symbol}: Insufficient data")
+                continue
+            df = panel[symbol].dropna(how='all')
+            result = self.analyze_wounded_prey(symbol, features=features.loc[symbol], df=df)
             if result:
                 results.append(result)
         
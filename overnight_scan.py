@@ -13,13 +13,16 @@ import os
 import sys
 import json
 from datetime import datetime
-from typing import List, Dict
-import yfinance as yf
+from typing import List, Dict, Optional
+import pandas as pd
 
 # Add parent paths
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'wolfpack'))
 
 from src.core.wolf_mind import WolfMind
+from utils.market_data import get_market_data_service
+from utils.screener import panel_to_arrays, compute_features
 
 class OvernightScanner:
     """
@@ -49,33 +52,42 @@ class OvernightScanner:
         
         return wounded
     
-    def score_ticker(self, ticker: str, wounded_score: int) -> Dict:
+    def load_features(self, tickers: List[str]) -> pd.DataFrame:
+        """
+        5-day price/volume features for every ticker at once
+        (one bulk download + one vectorized screener pass)
+        """
+        panel = get_market_data_service().get_panel(tickers, period='5d')
+        return compute_features(panel_to_arrays(panel, tickers), horizons=(5,))
+    
+    def score_ticker(self, ticker: str, wounded_score: int,
+                     features: Optional[pd.Series] = None) -> Dict:
         """
         Score ticker for trading opportunity
         
         Args:
             ticker: Stock ticker
             wounded_score: How wounded it is (0-100)
+            features: Row from load_features() (fetched here if omitted)
             
         Returns:
             Dict with score and reasoning
         """
         try:
-            stock = yf.Ticker(ticker)
-            hist = stock.history(period='5d')
+            if features is None:
+                table = self.load_features([ticker])
+                if ticker not in table.index:
+                    return None
+                features = table.loc[ticker]
             
-            if hist.empty:
+            if not features['bars']:
                 return None
             
-            current_price = hist['Close'].iloc[-1]
+            current_price = float(features['price'])
             
             # Calculate basic signals
-            volume_5d_avg = hist['Volume'].mean()
-            volume_today = hist['Volume'].iloc[-1]
-            volume_ratio = volume_today / volume_5d_avg if volume_5d_avg > 0 else 1.0
-            
-            price_5d_ago = hist['Close'].iloc[0]
-            price_change_5d = ((current_price - price_5d_ago) / price_5d_ago) * 100
+            volume_ratio = float(features['volume_ratio'])
+            price_change_5d = float(features['change_5d'])
             
             # Base score = wounded score + volume spike + momentum
             base_score = wounded_score
@@ -137,6 +149,8 @@ class OvernightScanner:
         # Score each ticker
         print(f"\n🔍 Scoring {len(wounded_prey)} tickers...")
         
+        features = self.load_features([prey['ticker'] for prey in wounded_prey])
+        
         opportunities = []
         for i, prey in enumerate(wounded_prey, 1):
             ticker = prey['ticker']
@@ -145,7 +159,10 @@ class OvernightScanner:
             if i % 5 == 0:
                 print(f"   Progress: {i}/{len(wounded_prey)}")
             
-            result = self.score_ticker(ticker, wounded_score)
+            if ticker not in features.index:
+                continue
+            
+            result = self.score_ticker(ticker, wounded_score, features.loc[ticker])
             if result:
                 opportunities.append(result)
         
@@ -0,0 +1,77 @@
+"""
+QUOTE FEEDER - One Price Feed For Every Wolf Script
+===================================================
+Writes live quotes for every watchlist ticker into the shared-memory quote
+table (wolfpack/utils/shared_quotes.py).
+
+Run ONE of these next to autonomous_brain, safe_position_monitor, maestro,
+wolf_terminal and the dashboards. They read prices from the table instead of
+each calling Finnhub / yfinance for the same tickers.
+
+Usage:
+    python quote_feeder.py                  # brain_config.json watchlists
+    python quote_feeder.py MU KTOS          # ...plus extra tickers
+    python quote_feeder.py --poll 15        # poll every 15s even if a stream is configured
+"""
+
+import os
+import sys
+import json
+import argparse
+from pathlib import Path
+
+# Add current directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'wolfpack'))
+
+from utils.shared_quotes import SharedQuoteTable, QuoteFeeder
+
+
+def load_watchlist_tickers(path: str = 'brain_config.json') -> list:
+    """Every ticker in brain_config.json watchlists (IPO_WATCH names aren't listed yet)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+    except Exception as e:
+        print(f"⚠️  Could not load watchlists from {path}: {e}")
+        return []
+
+    tickers = []
+    for name, watchlist in config.get('watchlists', {}).items():
+        if name == 'IPO_WATCH' or not isinstance(watchlist, dict):
+            continue
+        listed = watchlist.get('tickers', {})
+        tickers.extend(listed.keys() if isinstance(listed, dict) else listed)
+    return list(dict.fromkeys(tickers))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='🐺 Shared quote feeder')
+    parser.add_argument('tickers', nargs='*', help='Extra tickers to feed')
+    parser.add_argument('--poll', type=float, metavar='SECONDS',
+                        help='Poll on this interval instead of streaming')
+    args = parser.parse_args()
+
+    tickers = list(dict.fromkeys(load_watchlist_tickers() + [t.upper() for t in args.tickers]))
+    if not tickers:
+        print("❌ No tickers to feed")
+        return
+
+    try:
+        table = SharedQuoteTable.create()
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        return
+
+    try:
+        feeder = QuoteFeeder(table, tickers)
+        if args.poll:
+            feeder.run(stream=False, poll_seconds=args.poll)
+        else:
+            feeder.run()
+    finally:
+        table.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -22,6 +22,8 @@ import sys
 import time
 import json
 import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -29,15 +31,27 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from data_fetcher import DataFetcher
+from utils.rate_limiter import Priority
+from utils.quote_stream import (QuoteBus, QuoteStream, VolumeSpikeDetector, StopMonitor,
+                                DailyReference, default_stream_url, WEBSOCKETS_AVAILABLE)
+from utils.tick_buffer import TickBuffers
 from alerter import Alerter
 from fenrir_thinking_engine import FenrirThinkingEngine
 
+VOLUME_SPIKE_RATIO = 1.5  # Same threshold as DataFetcher.get_volume_analysis
+STOP_ALERT_PCT = 8.0      # Default stop: this far below avg cost (config 'stop' overrides)
+TICK_CAPACITY = 4096      # Ticks kept in memory per position
+TICK_FLUSH_SECONDS = 5    # Batched background writes to the database
+RECENT_MINUTES = 15       # Window for VWAP / range / slope context on alerts
+ALERT_WORKERS = 2         # News / Ollama / Discord alert work runs off the quote bus thread
+
 
 class SafePositionMonitor:
     """Monitor YOUR positions only - safe and efficient"""
     
     def __init__(self):
-        self.data_fetcher = DataFetcher()
+        # Positions outrank background research for shared API budgets
+        self.data_fetcher = DataFetcher(priority=Priority.HIGH)
         self.alerter = Alerter()
         self.brain = FenrirThinkingEngine()
         
@@ -45,8 +59,16 @@ class SafePositionMonitor:
         self.db_path = "wolfpack.db"
         self._init_database()
         
+        # Recent ticks live in memory; the database is written in batches
+        # off the monitoring thread
+        self.ticks = TickBuffers(capacity=TICK_CAPACITY)
+        self._pending_quotes = []
+        self._pending_lock = threading.Lock()
+        self.ticks.start_flusher(self._flush_to_db, interval=TICK_FLUSH_SECONDS)
+        
         # Load your positions from brain config
         self.positions = self._load_positions()
+        self.stops = self._load_stops()
         
         print(f"🐺 Safe Position Monitor Initialized")
         print(f"   Monitoring {len(self.positions)} positions")
@@ -81,6 +103,27 @@ class SafePositionMonitor:
             # Fallback
             return ["MU", "RCAT", "UUUU", "MRNO", "IVF", "NTLA", "RDW", "UEC", "IBRX"]
     
+    def _load_stops(self):
+        """Stop price per position: config 'stop', else STOP_ALERT_PCT below avg cost"""
+        stops = {}
+        try:
+            with open('brain_config.json', 'r', encoding='utf-8') as f:
+                config = json.load(f)
+            tickers = config.get('watchlists', {}).get('MY_POSITIONS', {}).get('tickers', {})
+        except Exception:
+            return stops
+        
+        for ticker, info in tickers.items():
+            if not isinstance(info, dict):
+                continue
+            if info.get('stop'):
+                stops[ticker] = float(info['stop'])
+                continue
+            costs = [info[k] for k in ('avg_cost_rh', 'avg_cost_fid', 'avg_cost') if info.get(k)]
+            if costs:
+                stops[ticker] = sum(costs) / len(costs) * (1 - STOP_ALERT_PCT / 100)
+        return stops
+    
     def _init_database(self):
         """Initialize database tables if they don't exist (Integration 3)"""
         try:
@@ -102,6 +145,18 @@ class SafePositionMonitor:
                 )
             ''')
             
+            # Tick history table (batched writes from the in-memory ring buffers)
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS tick_history (
+                    symbol TEXT NOT NULL,
+                    timestamp REAL NOT NULL,
+                    price REAL NOT NULL,
+                    size REAL,
+                    volume REAL
+                )
+            ''')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_tick_history_symbol ON tick_history(symbol, timestamp)')
+            
             # Brain thoughts table (already exists but ensure it's there)
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS brain_thoughts (
@@ -123,29 +178,78 @@ class SafePositionMonitor:
             print(f"⚠️  Database initialization error: {e}")
     
     def _log_quote_to_db(self, quote: dict):
-        """Log quote to database (Integration 3)"""
+        """Queue quote for the next batched database write (Integration 3)"""
+        row = (
+            quote['ticker'],
+            quote['price'],
+            quote.get('change', 0),
+            quote['change_pct'],
+            quote.get('volume', 0),
+            quote.get('source', 'finnhub'),
+            datetime.now().isoformat()
+        )
+        with self._pending_lock:
+            self._pending_quotes.append(row)
+    
+    def _flush_to_db(self, ticks: list):
+        """Write buffered ticks + queued quotes in one transaction (runs on the flusher thread)"""
+        with self._pending_lock:
+            quotes, self._pending_quotes = self._pending_quotes, []
+        
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = sqlite3.connect(self.db_path, timeout=30)
             cursor = conn.cursor()
             
-            cursor.execute('''
+            cursor.executemany('''
+                INSERT INTO tick_history (symbol, timestamp, price, size, volume)
+                VALUES (?, ?, ?, ?, ?)
+            ''', ticks)
+            cursor.executemany('''
                 INSERT INTO price_history (symbol, price, change, change_pct, volume, source, timestamp)
                 VALUES (?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                quote['ticker'],
-                quote['price'],
-                quote.get('change', 0),
-                quote['change_pct'],
-                quote.get('volume', 0),
-                quote.get('source', 'finnhub'),
-                datetime.now().isoformat()
-            ))
+            ''', quotes)
             
             conn.commit()
             conn.close()
-            
-        except Exception as e:
-            print(f"⚠️  Database logging error: {e}")
+        
+        except Exception:
+            # Put quotes back; TickBuffers keeps the ticks for the next flush
+            with self._pending_lock:
+                self._pending_quotes[:0] = quotes
+            raise
+    
+    def flush_db(self):
+        """Write everything still buffered now (end of a scan / loop)"""
+        self.ticks.flush()
+        if self._pending_quotes:
+            try:
+                self._flush_to_db([])
+            except Exception as e:
+                print(f"⚠️  Database logging error: {e}")
+    
+    def close(self):
+        """Stop the background flusher after one final flush (monitor shutdown)"""
+        self.ticks.stop_flusher()
+        self.flush_db()
+    
+    def recent_action(self, ticker: str, minutes: float = RECENT_MINUTES) -> dict:
+        """VWAP, range and trend over the last few minutes, from memory"""
+        high, low = self.ticks.high_low(ticker, minutes)
+        return {
+            'vwap': self.ticks.vwap(ticker, minutes),
+            'high': high,
+            'low': low,
+            'slope_pct': self.ticks.slope(ticker, minutes)
+        }
+    
+    def _print_recent_action(self, ticker: str, minutes: float = RECENT_MINUTES):
+        """One-line VWAP / range / trend context for an alert"""
+        action = self.recent_action(ticker, minutes)
+        if action['vwap'] is None:
+            return
+        slope = f" | trend {action['slope_pct']:+.2f}%/min" if action['slope_pct'] is not None else ""
+        print(f"      📈 {minutes:.0f}m VWAP ${action['vwap']:.2f} | "
+              f"range ${action['low']:.2f}-${action['high']:.2f}{slope}")
     
     def _log_thought_to_db(self, thought: dict):
         """Log brain thought to database (Integration 3)"""
@@ -189,6 +293,7 @@ class SafePositionMonitor:
             'volume': quote['volume'],
             'status': 'ok'
         }
+        self.ticks.record(ticker, time.time(), quote['price'], volume=quote['volume'])
         
         # Check for volume spike
         if volume_data and volume_data['is_spike']:
@@ -203,14 +308,50 @@ class SafePositionMonitor:
         
         return result
     
-    def monitor_loop(self, interval_minutes: int = 5, max_iterations: int = None):
+    def handle_volume_spike(self, ticker: str, volume_ratio: float, change_pct: float, news: list = None):
+        """Brain analysis + Discord alert for a volume spike"""
+        if news is None:
+            news = self.data_fetcher.get_news(ticker, limit=3)
+        
+        # INTEGRATION 1: Ask brain to think about it
+        print("      🧠 Consulting brain...")
+        thought = self.brain.think_about_volume_spike(
+            ticker=ticker,
+            volume_ratio=volume_ratio,
+            price_change=change_pct,
+            news=news
+        )
+        
+        # INTEGRATION 3: Log thought to database
+        self._log_thought_to_db(thought)
+        
+        # Alert via Discord WITH brain's reasoning
+        self.alerter.alert_brain_thought(
+            thought_type='volume_spike',
+            trigger=f"{ticker} volume {volume_ratio:.1f}x",
+            reasoning=thought['reasoning'],
+            confidence=thought['confidence'],
+            action=thought['action']
+        )
+        
+        print(f"      💡 Brain: {thought['action']}")
+        print(f"      📊 Confidence: {thought['confidence']}%")
+        if news:
+            print(f"      📰 Latest: {news[0]['headline'][:60]}...")
+    
+    def monitor_loop(self, interval_minutes: int = 5, max_iterations: int = None, stream: bool = True):
         """
         Main monitoring loop - SAFE, won't crash
         
         Args:
             interval_minutes: Minutes between checks (default 5)
             max_iterations: Stop after N iterations (None = infinite)
+            stream: Use the quote stream when one is configured (alerts on
+                    the trade that triggers them instead of the next scan)
         """
+        if stream and WEBSOCKETS_AVAILABLE and default_stream_url():
+            return self.monitor_stream(interval_minutes, max_iterations)
+        
         iteration = 0
         
         print(f"\n{'='*70}")
@@ -253,34 +394,9 @@ class SafePositionMonitor:
                         # Check for alerts
                         if result.get('volume_spike'):
                             print(f" 🔥 VOLUME SPIKE {result['volume_ratio']:.1f}x")
-                            
-                            # INTEGRATION 1: Ask brain to think about it
-                            print(f"      🧠 Consulting brain...")
-                            thought = self.brain.think_about_volume_spike(
-                                ticker=ticker,
-                                volume_ratio=result['volume_ratio'],
-                                price_change=result['change_pct'],
-                                news=result.get('recent_news')
-                            )
-                            
-                            # INTEGRATION 3: Log thought to database
-                            self._log_thought_to_db(thought)
-                            
-                            # Alert via Discord WITH brain's reasoning
-                            self.alerter.alert_brain_thought(
-                                thought_type='volume_spike',
-                                trigger=f"{ticker} volume {result['volume_ratio']:.1f}x",
-                                reasoning=thought['reasoning'],
-                                confidence=thought['confidence'],
-                                action=thought['action']
-                            )
-                            
-                            print(f"      💡 Brain: {thought['action']}")
-                            print(f"      📊 Confidence: {thought['confidence']}%")
-                            
-                            # Check if there's news
-                            if result.get('recent_news'):
-                                print(f"      📰 Latest: {result['recent_news'][0]['headline'][:60]}...")
+                            self._print_recent_action(ticker)
+                            self.handle_volume_spike(ticker, result['volume_ratio'], result['change_pct'],
+                                                     news=result.get('recent_news') or [])
                         else:
                             print(f" ✅ Normal")
                         
@@ -303,6 +419,98 @@ class SafePositionMonitor:
         except KeyboardInterrupt:
             print(f"\n\n🛑 Monitor stopped by user")
             print(f"Completed {iteration} scans")
+        finally:
+            self.flush_db()
+    
+    def monitor_stream(self, interval_minutes: int = 5, max_iterations: int = None, url: str = None):
+        """
+        Event-driven position monitoring over the quote stream.
+        
+        Volume spikes and stop breaks alert on the trade that causes them.
+        Quotes are still written to price_history once per interval (latest
+        tick per position), not on every trade. Prev close / average volume
+        are reloaded at each new session.
+        """
+        print(f"\n{'='*70}")
+        print("🐺 WOLF PACK POSITION MONITOR - STREAMING")
+        print(f"{'='*70}")
+        print(f"Monitoring: {', '.join(self.positions)}")
+        for ticker, stop in self.stops.items():
+            print(f"   Stop {ticker}: ${stop:.2f}")
+        print(f"Quote logging: Every {interval_minutes} minutes")
+        print("Press Ctrl+C to stop")
+        print(f"{'='*70}\n")
+        
+        reference = DailyReference(self.positions)
+        
+        # Callbacks run on the bus thread - print now, hand the slow part
+        # (news, Ollama, Discord) to a pool. Stop alerts get their own
+        # worker so they never queue behind spike research.
+        alerts = ThreadPoolExecutor(max_workers=ALERT_WORKERS)
+        stop_alerts = ThreadPoolExecutor(max_workers=1)
+        
+        def change_pct(tick):
+            prev_close = reference.get(tick.ticker, 'prev_close')
+            return (tick.price / prev_close - 1) * 100 if prev_close else 0.0
+        
+        def on_spike(tick, volume, volume_ratio):
+            print(f"\n[{datetime.now().strftime('%H:%M:%S')}] {tick.ticker} ${tick.price:.2f} "
+                  f"({change_pct(tick):+.1f}%) 🔥 VOLUME SPIKE {volume_ratio:.1f}x")
+            self._print_recent_action(tick.ticker)
+            alerts.submit(self.handle_volume_spike, tick.ticker, volume_ratio, change_pct(tick))
+        
+        def on_stop(tick, stop):
+            print(f"\n[{datetime.now().strftime('%H:%M:%S')}] 🛑 {tick.ticker} ${tick.price:.2f} "
+                  f"through stop ${stop:.2f}")
+            stop_alerts.submit(self.alerter.alert_thesis_break, tick.ticker,
+                          f"Traded ${tick.price:.2f}, through stop ${stop:.2f} ({change_pct(tick):+.1f}% today)")
+        
+        volumes = VolumeSpikeDetector(
+            reference.field('avg_volume'),
+            ratio=VOLUME_SPIKE_RATIO,
+            baseline=reference.field('volume'),
+            on_spike=on_spike
+        )
+        bus = QuoteBus().start()
+        bus.subscribe(self.ticks)           # every trade into the ring buffers
+        bus.subscribe(volumes)
+        bus.subscribe(StopMonitor(self.stops, on_stop=on_stop))
+        quotes = QuoteStream(bus, self.positions, url=url).start()
+        
+        iteration = 0
+        try:
+            while not max_iterations or iteration < max_iterations:
+                time.sleep(interval_minutes * 60)
+                iteration += 1
+                
+                if reference.refresh():
+                    volumes.rebase(reference.field('avg_volume'), reference.field('volume'))
+                    print(f"📅 New session - reference bars reloaded for {len(reference)} positions")
+                
+                # INTEGRATION 3: Log latest quote per position
+                logged = 0
+                for ticker in self.positions:
+                    tick = bus.last(ticker)
+                    if not tick:
+                        continue
+                    self._log_quote_to_db({
+                        'ticker': ticker,
+                        'price': tick.price,
+                        'change_pct': change_pct(tick),
+                        'volume': int(volumes.volume.get(ticker, 0)),
+                        'source': 'stream'
+                    })
+                    logged += 1
+                print(f"[{datetime.now().strftime('%H:%M:%S')}] {quotes.stats['ticks']:,} ticks | "
+                      f"{logged}/{len(self.positions)} quotes logged")
+        except KeyboardInterrupt:
+            print("\n\n🛑 Monitor stopped by user")
+        finally:
+            quotes.stop()
+            bus.stop()
+            alerts.shutdown(wait=False)
+            stop_alerts.shutdown(wait=False)
+            self.flush_db()
     
     def scan_once(self):
         """Run one scan and exit - good for testing"""
@@ -340,6 +548,8 @@ class SafePositionMonitor:
             
             time.sleep(1)  # Polite delay
         
+        self.flush_db()
+        
         print(f"\n{'='*70}")
         print(f"✅ Scan Complete")
         
@@ -365,16 +575,19 @@ def main():
     
     monitor = SafePositionMonitor()
     
-    if '--once' in sys.argv or '-1' in sys.argv:
-        # Single scan
-        monitor.scan_once()
-    elif '--test' in sys.argv:
-        # Test mode - 3 iterations, 1 minute intervals
-        print("\n⚙️  TEST MODE: 3 scans, 1 minute intervals\n")
-        monitor.monitor_loop(interval_minutes=1, max_iterations=3)
-    else:
-        # Continuous monitoring
-        monitor.monitor_loop(interval_minutes=5)
+    try:
+        if '--once' in sys.argv or '-1' in sys.argv:
+            # Single scan
+            monitor.scan_once()
+        elif '--test' in sys.argv:
+            # Test mode - 3 iterations, 1 minute intervals
+            print("\n⚙️  TEST MODE: 3 scans, 1 minute intervals\n")
+            monitor.monitor_loop(interval_minutes=1, max_iterations=3)
+        else:
+            # Continuous monitoring
+            monitor.monitor_loop(interval_minutes=5)
+    finally:
+        monitor.close()
 
 
 if __name__ == "__main__":
@@ -26,17 +26,36 @@ Added pattern detector for 3-6 month flat setups with insider buying.
 Validated examples: IVF (+30%), IBRX (+52%), ONCY (Director $103K buy)
 """
 
-import yfinance as yf
-from typing import List, Dict, Any
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Any, Iterator, Optional
 from datetime import datetime, timedelta
 from flat_to_boom_detector import FlatToBoomDetector, ChaseVsCatchFilter, analyze_ticker_comprehensive
 
+# Shared batched market data
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'wolfpack'))
+from utils.market_data import get_market_data_service
+from utils.fundamentals_cache import get_fundamentals_cache
+
+# Parallel scan
+SCAN_WORKERS = 8
+STREAM_TOP_N = 5  # Leaderboard size printed while scan_all() is running
+
+# Every .info field the scorers read - one fundamentals lookup per ticker
+CONTEXT_FIELDS = [
+    'sharesOutstanding', 'floatShares', 'heldPercentInsiders',
+    'shortPercentOfFloat', 'currentPrice', 'regularMarketPrice'
+]
+
 class ConvergenceEngine:
     
     def __init__(self):
         self.master_watchlist = self._load_watchlist()
         self.ftb_detector = FlatToBoomDetector()
         self.chase_filter = ChaseVsCatchFilter()
+        self.market_data = get_market_data_service()
+        self.fundamentals = get_fundamentals_cache()
         
     def _load_watchlist(self) -> List[str]:
         """Load all tickers to score - EXPANDED to 100+ universe"""
@@ -58,7 +77,31 @@ class ConvergenceEngine:
             all_tickers = tier1 + tier2 + tier3 + tier4 + scanner_finds
             return list(set(all_tickers))
     
-    def score_float(self, ticker: str) -> dict:
+    def load_context(self, ticker: str) -> dict:
+        """
+        Fetch everything score_ticker() needs for one ticker, once.
+        
+        info: one fundamentals snapshot covering every scorer's fields
+        hist: 1y daily bars (flat-to-boom + chase filter)
+        hist_1mo: last month (volume + momentum), sliced from the same bars
+        """
+        return {
+            'info': self.fundamentals.get_info(ticker, fields=CONTEXT_FIELDS),
+            'hist': self.market_data.get_history(ticker, period='1y'),
+            'hist_1mo': self.market_data.get_history(ticker, period='1mo')
+        }
+    
+    def _info(self, ticker: str, fields: List[str], context: Optional[dict]) -> dict:
+        if context is not None:
+            return context['info']
+        return self.fundamentals.get_info(ticker, fields=fields)
+    
+    def _month_history(self, ticker: str, context: Optional[dict]):
+        if context is not None:
+            return context['hist_1mo']
+        return self.market_data.get_history(ticker, period='1mo')
+    
+    def score_float(self, ticker: str, context: Optional[dict] = None) -> dict:
         """
         Score float (20 points max) - DOUBLED WEIGHT
         
@@ -72,8 +115,7 @@ class ConvergenceEngine:
         >100M = 0 pts (tanker)
         """
         try:
-            stock = yf.Ticker(ticker)
-            info = stock.info
+            info = self._info(ticker, ['sharesOutstanding', 'floatShares'], context)
             shares_out = info.get('sharesOutstanding', 0)
             float_shares = info.get('floatShares', shares_out)
             
@@ -109,7 +151,7 @@ class ConvergenceEngine:
         except Exception as e:
             return {'score': 0, 'reason': 'Data error', 'float_m': 0}
     
-    def score_insider_ownership(self, ticker: str) -> dict:
+    def score_insider_ownership(self, ticker: str, context: Optional[dict] = None) -> dict:
         """
         Score insider ownership (20 points max) - DOUBLED WEIGHT
         
@@ -123,8 +165,7 @@ class ConvergenceEngine:
         <20% = 0 pts (weak)
         """
         try:
-            stock = yf.Ticker(ticker)
-            info = stock.info
+            info = self._info(ticker, ['heldPercentInsiders'], context)
             insider_pct = info.get('heldPercentInsiders', 0) * 100
             
             # Known insider buying from research
@@ -168,7 +209,7 @@ class ConvergenceEngine:
         except Exception as e:
             return {'score': 0, 'reason': 'Data error', 'insider_pct': 0}
     
-    def score_short_interest(self, ticker: str) -> dict:
+    def score_short_interest(self, ticker: str, context: Optional[dict] = None) -> dict:
         """
         Score short interest (10 points max)
         
@@ -179,8 +220,7 @@ class ConvergenceEngine:
         <5% = 0 pts (no squeeze)
         """
         try:
-            stock = yf.Ticker(ticker)
-            info = stock.info
+            info = self._info(ticker, ['shortPercentOfFloat'], context)
             short_pct = info.get('shortPercentOfFloat', 0) * 100
             
             if short_pct > 30:
@@ -257,7 +297,7 @@ class ConvergenceEngine:
             'reason': reason
         }
     
-    def score_volume(self, ticker: str) -> dict:
+    def score_volume(self, ticker: str, context: Optional[dict] = None) -> dict:
         """
         Score volume spike (5 points max) - HALVED WEIGHT
         
@@ -270,8 +310,7 @@ class ConvergenceEngine:
         <2x = 0 pts (normal)
         """
         try:
-            stock = yf.Ticker(ticker)
-            hist = stock.history(period='1mo')
+            hist = self._month_history(ticker, context)
             
             if hist.empty or len(hist) < 10:
                 return {'score': 0, 'reason': 'No data', 'volume_ratio': 0}
@@ -308,7 +347,7 @@ class ConvergenceEngine:
         except Exception as e:
             return {'score': 0, 'reason': 'Data error', 'volume_ratio': 0}
     
-    def score_momentum(self, ticker: str) -> dict:
+    def score_momentum(self, ticker: str, context: Optional[dict] = None) -> dict:
         """
         Score momentum (5 points max) - HALVED WEIGHT
         
@@ -321,8 +360,7 @@ class ConvergenceEngine:
         Negative = 0 pts (weak)
         """
         try:
-            stock = yf.Ticker(ticker)
-            hist = stock.history(period='1mo')
+            hist = self._month_history(ticker, context)
             
             if hist.empty or len(hist) < 5:
                 return {'score': 0, 'reason': 'No data', 'momentum_pct': 0}
@@ -356,25 +394,31 @@ class ConvergenceEngine:
         except Exception as e:
             return {'score': 0, 'reason': 'Data error', 'momentum_pct': 0}
     
-    def score_ticker(self, ticker: str) -> dict:
+    def score_ticker(self, ticker: str, context: Optional[dict] = None, verbose: bool = True) -> dict:
         """
         Score a single ticker across all dimensions.
         Now includes flat-to-boom pattern detection.
+        
+        context: load_context() output - all scorers share one fetch
+        verbose: print the one-line result (scan_all prints its own)
         """
-        print(f"[Scoring] ${ticker}...", end='', flush=True)
+        if verbose:
+            print(f"[Scoring] ${ticker}...", end='', flush=True)
         
         try:
-            stock = yf.Ticker(ticker)
-            info = stock.info
+            if context is None:
+                context = self.load_context(ticker)
+            
+            info = context['info']
             price = info.get('currentPrice', info.get('regularMarketPrice', 0))
             
             # Score all dimensions
-            float_score = self.score_float(ticker)
-            insider_score = self.score_insider_ownership(ticker)
-            short_score = self.score_short_interest(ticker)
+            float_score = self.score_float(ticker, context)
+            insider_score = self.score_insider_ownership(ticker, context)
+            short_score = self.score_short_interest(ticker, context)
             catalyst_score = self.score_catalyst(ticker)
-            volume_score = self.score_volume(ticker)
-            momentum_score = self.score_momentum(ticker)
+            volume_score = self.score_volume(ticker, context)
+            momentum_score = self.score_momentum(ticker, context)
             
             # Total score (70 max)
             total_score = (
@@ -413,10 +457,10 @@ class ConvergenceEngine:
                 catalysts = known_catalysts.get(ticker, [])
             
             # Run flat-to-boom detection
-            ftb_result = self.ftb_detector.detect(ticker, insider_buys, catalysts)
+            ftb_result = self.ftb_detector.detect(ticker, insider_buys, catalysts, hist=context['hist'])
             
             # Run chase/catch filter
-            chase_check = self.chase_filter.is_chasing(ticker)
+            chase_check = self.chase_filter.is_chasing(ticker, hist=context['hist'])
             
             # Determine if this is a CATCHING opportunity
             is_catching = False
@@ -425,7 +469,8 @@ class ConvergenceEngine:
                     ticker,
                     ftb_result['score'],
                     ftb_result['metrics'].get('has_insider_signal', False),
-                    ftb_result['metrics'].get('has_catalyst', False)
+                    ftb_result['metrics'].get('has_catalyst', False),
+                    hist=context['hist']
                 )
                 is_catching = catch_check.get('is_catching', False)
             
@@ -444,7 +489,8 @@ class ConvergenceEngine:
             if chase_check.get('is_chasing'):
                 tier += " (⚠️ CHASING - PASS)"
             
-            print(f" ✅ {total_score}/70 pts ({tier})")
+            if verbose:
+                print(f" ✅ {total_score}/70 pts ({tier})")
             
             return {
                 'ticker': ticker,
@@ -462,7 +508,8 @@ class ConvergenceEngine:
                 'is_catching': is_catching
             }
         except Exception as e:
-            print(f" ❌ Error: {str(e)}")
+            if verbose:
+                print(f" ❌ Error: {str(e)}")
             return {
                 'ticker': ticker,
                 'total_score': 0,
@@ -470,9 +517,28 @@ class ConvergenceEngine:
                 'error': str(e)
             }
     
-    def scan_all(self) -> List[dict]:
+    def scan_iter(self, workers: int = SCAN_WORKERS) -> Iterator[dict]:
+        """
+        Score all watchlist tickers in parallel, yielding each result as
+        soon as it is ready (completion order, not score order).
+        """
+        # One bulk download for the whole watchlist; 1mo is sliced from it
+        self.market_data.prefetch(self.master_watchlist, period='1y')
+        
+        def score(ticker):
+            return self.score_ticker(ticker, self.load_context(ticker), verbose=False)
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(score, t): t for t in sorted(self.master_watchlist)}
+            for future in as_completed(futures):
+                yield future.result()
+    
+    def scan_all(self, workers: int = SCAN_WORKERS, top_n: int = STREAM_TOP_N) -> List[dict]:
         """
         Score all watchlist tickers.
+        
+        Results stream in as workers finish; the current top convergences
+        are printed whenever the leaderboard changes.
         """
         print("\n" + "="*80)
         print("🎯 CONVERGENCE ENGINE V2 - WEIGHTED MULTI-FACTOR SCORING")
@@ -484,9 +550,22 @@ class ConvergenceEngine:
         print()
         
         results = []
-        for ticker in sorted(self.master_watchlist):
-            result = self.score_ticker(ticker)
+        leaders = []
+        total = len(self.master_watchlist)
+        for result in self.scan_iter(workers):
             results.append(result)
+            if result.get('error'):
+                print(f"[{len(results)}/{total}] ${result['ticker']} ❌ Error: {result['error']}")
+            else:
+                print(f"[{len(results)}/{total}] ${result['ticker']} ✅ {result['total_score']}/70 pts ({result['tier']})")
+            
+            # Partial leaderboard while the scan is still running
+            ranked = sorted(results, key=lambda x: x['total_score'], reverse=True)[:top_n]
+            ranked = [r for r in ranked if r['total_score'] > 0]
+            if [r['ticker'] for r in ranked] != leaders:
+                leaders = [r['ticker'] for r in ranked]
+                board = ', '.join(f"${r['ticker']} {r['total_score']}" for r in ranked)
+                print(f"   🔥 Top {len(ranked)} so far: {board}")
         
         # Sort by total score descending
         results.sort(key=lambda x: x['total_score'], reverse=True)
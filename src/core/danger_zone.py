@@ -30,8 +30,10 @@ Brother, you just saved the whole pack. 🐺
 import os
 import sys
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
+import pandas as pd
 import yfinance as yf
 import requests
 
@@ -43,6 +45,88 @@ try:
 except ImportError:
     from database import Database
 
+# Shared batched market data
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'wolfpack'))
+from utils.market_data import get_market_data_service
+from utils.fundamentals_cache import get_fundamentals_cache
+
+
+# Every .info field any danger check reads - fetched together, once
+DANGER_INFO_FIELDS = [
+    'firstTradeDateEpochUtc', 'longName', 'longBusinessSummary',
+    'marketCap', 'sharesOutstanding', 'floatShares',
+    'heldPercentInstitutions', 'shortPercentOfFloat', 'totalRevenue',
+]
+
+# (danger key, details key, check method) - in scan order
+DANGER_CHECKS = [
+    ('ipo_too_new', 'ipo', 'check_ipo_age'),
+    ('lockup_expiry', 'lockup', 'check_lockup'),
+    ('spac_trap', 'spac', 'check_spac_status'),
+    ('pump_dump', 'pump', 'check_pump_pattern'),
+    ('meme_extreme', 'meme', 'check_social_sentiment'),
+    ('insider_dumping', 'insider', 'check_insider_sells'),
+    ('dilution_risk', 'dilution', 'check_recent_offering'),
+    ('penny_manipulation', 'penny', 'check_market_cap'),
+    ('dead_cat', 'dead_cat', 'check_bounce_quality'),
+    ('no_institutional', 'institutional', 'check_institutional_support'),
+    ('earnings_trap', 'earnings', 'check_earnings_trap'),
+    ('short_squeeze_bait', 'short_squeeze', 'check_short_squeeze_bait'),
+]
+
+
+class DangerContext:
+    """
+    Everything the danger checks need for one ticker.
+    
+    Each piece (info, price history, insider rows, earnings calendar) is
+    fetched on first use and then shared by all 12 checks. scan_many()
+    preloads the pieces in bulk so the checks never touch the network.
+    """
+    
+    _MISSING = object()
+    
+    def __init__(self, zone: 'DangerZone', ticker: str):
+        self.zone = zone
+        self.ticker = ticker
+        self._data = {}
+    
+    def _get(self, key: str, loader):
+        value = self._data.get(key, self._MISSING)
+        if value is self._MISSING:
+            try:
+                value = loader()
+            except Exception as e:
+                value = e
+            self._data[key] = value
+        if isinstance(value, Exception):
+            raise value  # Surface the original error inside each check
+        return value
+    
+    def preload(self, key: str, value):
+        """Seed a piece of data fetched elsewhere (e.g. in bulk)"""
+        self._data[key] = value
+    
+    @property
+    def info(self) -> Dict:
+        return self._get('info', lambda: self.zone.fundamentals.get_info(self.ticker, fields=DANGER_INFO_FIELDS))
+    
+    @property
+    def hist_1mo(self) -> pd.DataFrame:
+        return self._get('hist_1mo', lambda: self.zone.market_data.get_history(self.ticker, period='1mo'))
+    
+    @property
+    def hist_3mo(self) -> pd.DataFrame:
+        return self._get('hist_3mo', lambda: self.zone.market_data.get_history(self.ticker, period='3mo'))
+    
+    @property
+    def insider_transactions(self) -> List[tuple]:
+        return self._get('insider', lambda: self.zone._load_insider_transactions([self.ticker]).get(self.ticker, []))
+    
+    @property
+    def calendar(self):
+        return self._get('calendar', lambda: yf.Ticker(self.ticker).calendar)
+
 
 class DangerZone:
     """
@@ -56,6 +140,8 @@ class DangerZone:
     
     def __init__(self):
         self.db = Database()
+        self.market_data = get_market_data_service()
+        self.fundamentals = get_fundamentals_cache()
     
     def scan(self, ticker: str) -> Dict:
         """
@@ -70,32 +156,81 @@ class DangerZone:
                 'details': Specific findings
             }
         """
-        print(f"\n🚨 DANGER ZONE: Scanning {ticker}...")
+        return self._evaluate(ticker, DangerContext(self, ticker), verbose=True)
+    
+    def scan_many(self, tickers: List[str], max_workers: int = 10) -> pd.DataFrame:
+        """
+        Batch danger scan - one data load per ticker, tickers run concurrently.
+        
+        Price history for the whole list is pulled in one bulk download and
+        insider rows in one query. Each ticker then gets a DangerContext and
+        all 12 checks run against it - no per-check fetching, no printing.
+        
+        Returns:
+            DataFrame indexed by ticker with columns:
+                status, dangers, revisit_date, message, details,
+                plus one bool column per danger (ipo_too_new, pump_dump, ...)
+        """
+        tickers = list(dict.fromkeys(tickers))
+        columns = ['status', 'dangers', 'revisit_date', 'message', 'details'] + [d for d, _, _ in DANGER_CHECKS]
+        if not tickers:
+            return pd.DataFrame(columns=columns)
+        
+        # Bulk loads shared by every ticker ('1mo' is sliced from '3mo')
+        self.market_data.prefetch(tickers, period='3mo')
+        try:
+            insider_rows = self._load_insider_transactions(tickers)
+            insider_error = None
+        except Exception as e:
+            insider_rows, insider_error = {}, e
+        
+        def evaluate(ticker: str) -> Dict:
+            ctx = DangerContext(self, ticker)
+            ctx.preload('insider', insider_error or insider_rows.get(ticker, []))
+            return self._evaluate(ticker, ctx, verbose=False)
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(evaluate, tickers))
+        
+        rows = []
+        for result in results:
+            row = {
+                'ticker': result['ticker'],
+                'status': result['status'],
+                'dangers': result['dangers'],
+                'revisit_date': result.get('revisit_date'),
+                'message': result['message'],
+                'details': result['details'],
+            }
+            for danger, _, _ in DANGER_CHECKS:
+                row[danger] = danger in result['dangers']
+            rows.append(row)
+        
+        table = pd.DataFrame(rows).set_index('ticker')
+        blocked = int((table['status'] == 'BLOCKED').sum())
+        print(f"🚨 DANGER ZONE: {len(table)} scanned, {blocked} blocked, {len(table) - blocked} clear")
+        return table[columns]
+    
+    def _evaluate(self, ticker: str, ctx: DangerContext, verbose: bool = True) -> Dict:
+        """Run every danger check against one shared context"""
+        if verbose:
+            print(f"\n🚨 DANGER ZONE: Scanning {ticker}...")
         
         dangers = {}
         details = {}
         
         # Run all danger checks
-        dangers['ipo_too_new'], details['ipo'] = self.check_ipo_age(ticker)
-        dangers['lockup_expiry'], details['lockup'] = self.check_lockup(ticker)
-        dangers['spac_trap'], details['spac'] = self.check_spac_status(ticker)
-        dangers['pump_dump'], details['pump'] = self.check_pump_pattern(ticker)
-        dangers['meme_extreme'], details['meme'] = self.check_social_sentiment(ticker)
-        dangers['insider_dumping'], details['insider'] = self.check_insider_sells(ticker)
-        dangers['dilution_risk'], details['dilution'] = self.check_recent_offering(ticker)
-        dangers['penny_manipulation'], details['penny'] = self.check_market_cap(ticker)
-        dangers['dead_cat'], details['dead_cat'] = self.check_bounce_quality(ticker)
-        dangers['no_institutional'], details['institutional'] = self.check_institutional_support(ticker)
-        dangers['earnings_trap'], details['earnings'] = self.check_earnings_trap(ticker)
-        dangers['short_squeeze_bait'], details['short_squeeze'] = self.check_short_squeeze_bait(ticker)
+        for danger, detail_key, method in DANGER_CHECKS:
+            dangers[danger], details[detail_key] = getattr(self, method)(ticker, ctx)
         
         # Count detected dangers
         detected = [k for k, v in dangers.items() if v]
         
         if detected:
-            print(f"   🚫 DANGER DETECTED: {len(detected)} traps found")
-            for danger in detected:
-                print(f"      • {danger.upper()}: {details.get(danger, 'Check failed')}")
+            if verbose:
+                print(f"   🚫 DANGER DETECTED: {len(detected)} traps found")
+                for danger in detected:
+                    print(f"      • {danger.upper()}: {details.get(danger, 'Check failed')}")
             
             return {
                 'status': 'BLOCKED',
@@ -107,7 +242,8 @@ class DangerZone:
                 'message': f"⚠️ BLOCKED: {', '.join(detected)}"
             }
         
-        print(f"   ✅ CLEAR: No traps detected - proceed to opportunity analysis")
+        if verbose:
+            print(f"   ✅ CLEAR: No traps detected - proceed to opportunity analysis")
         return {
             'status': 'CLEAR',
             'ticker': ticker,
@@ -119,7 +255,7 @@ class DangerZone:
     
     # ==================== DANGER CHECKS ====================
     
-    def check_ipo_age(self, ticker: str) -> tuple[bool, str]:
+    def check_ipo_age(self, ticker: str, ctx: Optional[DangerContext] = None) -> tuple[bool, str]:
         """
         Check if IPO is too recent (< 6 months).
         
@@ -127,8 +263,7 @@ class DangerZone:
         price discovery phase = massive volatility.
         """
         try:
-            stock = yf.Ticker(ticker)
-            info = stock.info
+            info = (ctx or DangerContext(self, ticker)).info
             
             # Try to get IPO date from various fields
             ipo_date = None
@@ -148,7 +283,7 @@ class DangerZone:
         except Exception as e:
             return False, f"IPO check failed: {e}"
     
-    def check_lockup(self, ticker: str) -> tuple[bool, str]:
+    def check_lockup(self, ticker: str, ctx: Optional[DangerContext] = None) -> tuple[bool, str]:
         """
         Check for upcoming lockup expiry (90-180 days post-IPO).
         
@@ -156,8 +291,7 @@ class DangerZone:
         Massive supply incoming = price crater.
         """
         try:
-            stock = yf.Ticker(ticker)
-            info = stock.info
+            info = (ctx or DangerContext(self, ticker)).info
             
             if 'firstTradeDateEpochUtc' in info and info['firstTradeDateEpochUtc']:
                 ipo_date = datetime.fromtimestamp(info['firstTradeDateEpochUtc'])
@@ -172,7 +306,7 @@ class DangerZone:
         except Exception as e:
             return False, f"Lockup check failed: {e}"
     
-    def check_spac_status(self, ticker: str) -> tuple[bool, str]:
+    def check_spac_status(self, ticker: str, ctx: Optional[DangerContext] = None) -> tuple[bool, str]:
         """
         Check if SPAC (pre/post merger).
         
@@ -180,8 +314,7 @@ class DangerZone:
         Hype pre-merger, reality post-merger = you're the bag holder.
         """
         try:
-            stock = yf.Ticker(ticker)
-            info = stock.info
+            info = (ctx or DangerContext(self, ticker)).info
             
             # Check for SPAC indicators in name/description
             name = info.get('longName', '').lower()
@@ -197,7 +330,7 @@ class DangerZone:
         except Exception as e:
             return False, f"SPAC check failed: {e}"
     
-    def check_pump_pattern(self, ticker: str) -> tuple[bool, str]:
+    def check_pump_pattern(self, ticker: str, ctx: Optional[DangerContext] = None) -> tuple[bool, str]:
         """
         Check for pump & dump pattern:
         - Massive volume spike (5x+ avg)
@@ -207,8 +340,7 @@ class DangerZone:
         WHY DEADLY: You're the exit liquidity. Coordinated manipulation.
         """
         try:
-            stock = yf.Ticker(ticker)
-            hist = stock.history(period='1mo')
+            hist = (ctx or DangerContext(self, ticker)).hist_1mo
             
             if len(hist) < 10:
                 return False, "Insufficient data"
@@ -228,7 +360,7 @@ class DangerZone:
         except Exception as e:
             return False, f"Pump check failed: {e}"
     
-    def check_social_sentiment(self, ticker: str) -> tuple[bool, str]:
+    def check_social_sentiment(self, ticker: str, ctx: Optional[DangerContext] = None) -> tuple[bool, str]:
         """
         Check for extreme meme/social sentiment (>90% bullish).
         
@@ -250,7 +382,7 @@ class DangerZone:
         except Exception as e:
             return False, f"Sentiment check failed: {e}"
     
-    def check_insider_sells(self, ticker: str) -> tuple[bool, str]:
+    def check_insider_sells(self, ticker: str, ctx: Optional[DangerContext] = None) -> tuple[bool, str]:
         """
         Check for insider selling on "good news" (analyst upgrades, etc).
         
@@ -261,20 +393,7 @@ class DangerZone:
             # Look for insider SELLS within 7 days of positive news
             
             # Check database for recent insider transactions
-            conn = sqlite3.connect(self.db.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                SELECT transaction_type, shares, value, transaction_date
-                FROM insider_transactions
-                WHERE ticker = ?
-                AND transaction_date > datetime('now', '-14 days')
-                ORDER BY transaction_date DESC
-                LIMIT 5
-            ''', (ticker,))
-            
-            recent_transactions = cursor.fetchall()
-            conn.close()
+            recent_transactions = (ctx or DangerContext(self, ticker)).insider_transactions
             
             if recent_transactions:
                 sells = [t for t in recent_transactions if 'sale' in t[0].lower()]
@@ -287,7 +406,7 @@ class DangerZone:
         except Exception as e:
             return False, f"Insider check failed: {e}"
     
-    def check_recent_offering(self, ticker: str) -> tuple[bool, str]:
+    def check_recent_offering(self, ticker: str, ctx: Optional[DangerContext] = None) -> tuple[bool, str]:
         """
         Check for recent dilution (ATM offering, secondary offering).
         
@@ -298,8 +417,7 @@ class DangerZone:
             # This would check SEC 8-K filings for ATM/secondary offerings
             # For now, check if recent price drop + volume spike
             
-            stock = yf.Ticker(ticker)
-            hist = stock.history(period='1mo')
+            hist = (ctx or DangerContext(self, ticker)).hist_1mo
             
             if len(hist) < 10:
                 return False, "Insufficient data"
@@ -319,15 +437,14 @@ class DangerZone:
         except Exception as e:
             return False, f"Offering check failed: {e}"
     
-    def check_market_cap(self, ticker: str) -> tuple[bool, str]:
+    def check_market_cap(self, ticker: str, ctx: Optional[DangerContext] = None) -> tuple[bool, str]:
         """
         Check for penny stock manipulation risk (market cap < $50M, low float).
         
         WHY DEADLY: Easy to manipulate, illiquid, you can't exit when you need to.
         """
         try:
-            stock = yf.Ticker(ticker)
-            info = stock.info
+            info = (ctx or DangerContext(self, ticker)).info
             
             market_cap = info.get('marketCap', 0)
             shares_outstanding = info.get('sharesOutstanding', 0)
@@ -346,15 +463,14 @@ class DangerZone:
         except Exception as e:
             return False, f"Market cap check failed: {e}"
     
-    def check_bounce_quality(self, ticker: str) -> tuple[bool, str]:
+    def check_bounce_quality(self, ticker: str, ctx: Optional[DangerContext] = None) -> tuple[bool, str]:
         """
         Check for dead cat bounce (first bounce after crash, no volume).
         
         WHY DEADLY: Looks like recovery, but it's a trap. More downside coming.
         """
         try:
-            stock = yf.Ticker(ticker)
-            hist = stock.history(period='3mo')
+            hist = (ctx or DangerContext(self, ticker)).hist_3mo
             
             if len(hist) < 30:
                 return False, "Insufficient data"
@@ -378,7 +494,7 @@ class DangerZone:
         except Exception as e:
             return False, f"Bounce check failed: {e}"
     
-    def check_institutional_support(self, ticker: str) -> tuple[bool, str]:
+    def check_institutional_support(self, ticker: str, ctx: Optional[DangerContext] = None) -> tuple[bool, str]:
         """
         Check for institutional support (13F holdings).
         
@@ -386,8 +502,7 @@ class DangerZone:
         Smart money avoids for a reason.
         """
         try:
-            stock = yf.Ticker(ticker)
-            info = stock.info
+            info = (ctx or DangerContext(self, ticker)).info
             
             # Check for institutional holders
             institutional_pct = info.get('heldPercentInstitutions', 0)
@@ -400,15 +515,15 @@ class DangerZone:
         except Exception as e:
             return False, f"Institutional check failed: {e}"
     
-    def check_earnings_trap(self, ticker: str) -> tuple[bool, str]:
+    def check_earnings_trap(self, ticker: str, ctx: Optional[DangerContext] = None) -> tuple[bool, str]:
         """
         Check for earnings trap (extreme bullish sentiment pre-earnings).
         
         WHY DEADLY: "Gonna crush earnings!" → Sell the news. Every time.
         """
         try:
-            stock = yf.Ticker(ticker)
-            calendar = stock.calendar
+            ctx = ctx or DangerContext(self, ticker)
+            calendar = ctx.calendar
             
             if calendar is None or len(calendar) == 0:
                 return False, "No earnings date available"
@@ -417,7 +532,7 @@ class DangerZone:
             # (This is simplified - would need actual earnings date parsing)
             # For now, just check if recent high + volume suggesting anticipation
             
-            hist = stock.history(period='1mo')
+            hist = (ctx or DangerContext(self, ticker)).hist_1mo
             if len(hist) < 10:
                 return False, "Insufficient data"
             
@@ -434,7 +549,7 @@ class DangerZone:
         except Exception as e:
             return False, f"Earnings check failed: {e}"
     
-    def check_short_squeeze_bait(self, ticker: str) -> tuple[bool, str]:
+    def check_short_squeeze_bait(self, ticker: str, ctx: Optional[DangerContext] = None) -> tuple[bool, str]:
         """
         Check for short squeeze bait (high SI but weak fundamentals).
         
@@ -442,8 +557,7 @@ class DangerZone:
         Retail gets trapped, shorts eventually win.
         """
         try:
-            stock = yf.Ticker(ticker)
-            info = stock.info
+            info = (ctx or DangerContext(self, ticker)).info
             
             short_pct = info.get('shortPercentOfFloat', 0)
             
@@ -463,6 +577,33 @@ class DangerZone:
     
     # ==================== HELPER FUNCTIONS ====================
     
+    def _load_insider_transactions(self, tickers: List[str]) -> Dict[str, List[tuple]]:
+        """
+        Last 14 days of insider transactions (newest 5 per ticker) for a
+        whole ticker list in one query.
+        """
+        transactions = {}
+        conn = sqlite3.connect(self.db.db_path)
+        cursor = conn.cursor()
+    
+        for i in range(0, len(tickers), 500):
+            chunk = tickers[i:i + 500]
+            cursor.execute(f'''
+                SELECT ticker, transaction_type, shares, value, transaction_date
+                FROM insider_transactions
+                WHERE ticker IN ({",".join("?" * len(chunk))})
+                AND transaction_date > datetime('now', '-14 days')
+                ORDER BY ticker, transaction_date DESC
+            ''', chunk)
+    
+            for ticker, *row in cursor.fetchall():
+                rows = transactions.setdefault(ticker, [])
+                if len(rows) < 5:
+                    rows.append(tuple(row))
+    
+        conn.close()
+        return transactions
+    
     def calculate_safe_date(self, ticker: str, dangers: List[str]) -> Optional[str]:
         """
         Calculate when it might be safe to revisit this ticker.
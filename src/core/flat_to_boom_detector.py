@@ -37,7 +37,7 @@ class FlatToBoomDetector:
         self.catalyst_window_days = 90
         
     def detect(self, ticker: str, insider_buys: List[Dict], 
-               catalysts: List[Dict]) -> Dict:
+               catalysts: List[Dict], hist: Optional[pd.DataFrame] = None) -> Dict:
         """
         Main detection method
         
@@ -45,14 +45,16 @@ class FlatToBoomDetector:
             ticker: Stock symbol
             insider_buys: List of Form 4 buys with {'date', 'value', 'role'}
             catalysts: List of catalysts with {'date', 'type', 'days_away'}
+            hist: 1y daily history if the caller already has it
             
         Returns:
             Dict with detection results and score
         """
         try:
             # Get price data
-            stock = yf.Ticker(ticker)
-            hist = stock.history(period="1y")
+            if hist is None:
+                stock = yf.Ticker(ticker)
+                hist = stock.history(period="1y")
             
             if hist.empty:
                 return self._empty_result(ticker, "No price data")
@@ -284,13 +286,16 @@ class ChaseVsCatchFilter:
         self.chase_threshold_5d = 0.20  # +20% in 5 days
         self.near_high_threshold = 0.95  # Within 5% of 52-week high
         
-    def is_chasing(self, ticker: str) -> Dict:
+    def is_chasing(self, ticker: str, hist: Optional[pd.DataFrame] = None) -> Dict:
         """
         Returns True if entering now would be CHASING (late)
+        
+        hist: 1y daily history if the caller already has it
         """
         try:
-            stock = yf.Ticker(ticker)
-            hist = stock.history(period="1y")
+            if hist is None:
+                stock = yf.Ticker(ticker)
+                hist = stock.history(period="1y")
             
             if hist.empty or len(hist) < 5:
                 return {'is_chasing': False, 'reason': 'Insufficient data'}
@@ -342,7 +347,8 @@ class ChaseVsCatchFilter:
             return {'is_chasing': False, 'reason': f'Error: {str(e)}'}
     
     def is_catching(self, ticker: str, flat_to_boom_score: float,
-                    has_insider: bool, has_catalyst: bool) -> Dict:
+                    has_insider: bool, has_catalyst: bool,
+                    hist: Optional[pd.DataFrame] = None) -> Dict:
         """
         Returns True if this is a CATCHING opportunity (our edge)
         
@@ -352,7 +358,7 @@ class ChaseVsCatchFilter:
         - Has upcoming catalyst
         - NOT chasing (not extended)
         """
-        chase_check = self.is_chasing(ticker)
+        chase_check = self.is_chasing(ticker, hist)
         
         if chase_check['is_chasing']:
             return {
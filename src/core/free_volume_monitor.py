@@ -8,12 +8,25 @@ STILL NO MOCK DATA - Uses real Yahoo Finance data
 If data unavailable: Shows "NO DATA" (never fakes it)
 """
 
+import os
+import sys
 import yfinance as yf
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 import pandas as pd
 
+# Shared streaming quote pipeline
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'wolfpack'))
+from utils.quote_stream import (QuoteBus, QuoteStream, VolumeSpikeDetector, DailyReference,
+                                default_stream_url, WEBSOCKETS_AVAILABLE)
+from utils.fundamentals_cache import get_fundamentals_cache
+from utils.volume_profile import get_volume_profiles
+
+SPIKE_RATIO = 5.0  # Volume ratio that counts as a spike
+ALERT_WORKERS = 2  # Float / market cap lookups for alerts run off the quote bus thread
+
 class FreeVolumeMonitor:
     """
     Real-time volume monitoring using FREE yfinance.
@@ -24,6 +37,9 @@ class FreeVolumeMonitor:
         print("✅ Using yfinance (FREE - no API key required)")
         self.cache = {}
         self.cache_ttl = 60  # 1 minute cache
+        
+        # Nightly time-of-day volume curves (O(1) lookups, no API calls)
+        self.profiles = get_volume_profiles()
     
     def _get_cached(self, key: str) -> Optional[Dict]:
         """Get cached data if fresh."""
@@ -63,13 +79,20 @@ class FreeVolumeMonitor:
             current_volume = hist_1d['Volume'].sum()
             current_price = hist_1d['Close'].iloc[-1]
             
-            # Get 20-day average volume
-            hist_20d = stock.history(period='1mo')
-            if len(hist_20d) < 5:
-                return None
+            # Average daily volume: from the nightly profile if we have one,
+            # else the last month of daily bars (exclude today)
+            avg_volume = self.profiles.avg_daily_volume(ticker)
+            if not avg_volume:
+                hist_20d = stock.history(period='1mo')
+                if len(hist_20d) < 5:
+                    return None
+                avg_volume = hist_20d['Volume'][:-1].mean()
             
-            # Calculate average daily volume (exclude today)
-            avg_volume = hist_20d['Volume'][:-1].mean()
+            # Ratio vs normal volume by this minute of the session
+            # (full-day average outside the session / without a profile)
+            volume_ratio = self.profiles.relative_volume(ticker, current_volume, avg_daily_volume=avg_volume)
+            if volume_ratio is None:
+                volume_ratio = current_volume / avg_volume if avg_volume > 0 else 0
             
             # Get stock info
             info = stock.info
@@ -81,12 +104,12 @@ class FreeVolumeMonitor:
                 'ticker': ticker,
                 'current_volume': int(current_volume),
                 'avg_volume': int(avg_volume),
-                'volume_ratio': current_volume / avg_volume if avg_volume > 0 else 0,
+                'volume_ratio': volume_ratio,
                 'price': float(current_price),
                 'float_m': float_shares / 1e6 if float_shares else 0,
                 'timestamp': datetime.now().isoformat(),
                 'market_cap': info.get('marketCap', 0) / 1e6,
-                'is_spike': (current_volume / avg_volume) > 5.0 if avg_volume > 0 else False
+                'is_spike': volume_ratio > SPIKE_RATIO
             }
             
             self._set_cache(cache_key, data)
@@ -203,11 +226,15 @@ class FreeVolumeMonitor:
         """Print brief info for elevated volume."""
         print(f"   ${data['ticker']}: {data['volume_ratio']:.1f}x @ ${data['price']:.2f}")
     
-    def monitor_continuous(self, tickers: List[str], interval_minutes: int = 5):
+    def monitor_continuous(self, tickers: List[str], interval_minutes: int = 5, stream: bool = True):
         """
         Continuously monitor for volume spikes.
-        Scans every N minutes.
+        Streams trades when a quote stream is configured (stream=True),
+        otherwise scans every N minutes.
         """
+        if stream and WEBSOCKETS_AVAILABLE and default_stream_url():
+            return self.monitor_stream(tickers)
+        
         print("="*80)
         print("🔄 CONTINUOUS VOLUME MONITORING")
         print("="*80)
@@ -242,6 +269,76 @@ class FreeVolumeMonitor:
             print("\n\n✋ Monitoring stopped by user")
             print(f"Total scans: {scan_count}")
 
+    
+    def monitor_stream(self, tickers: List[str], url: Optional[str] = None, status_seconds: int = 60):
+        """
+        Event-driven volume monitoring: today's volume is seeded from one
+        bulk daily download, then every streamed trade adds to it and a
+        spike alerts the moment the ratio (vs normal volume by this minute)
+        crosses 5x. References are reloaded at each new session.
+        """
+        print("="*80)
+        print("📡 STREAMING VOLUME MONITORING")
+        print("="*80)
+        print(f"Tickers: {len(tickers)}")
+        print("Press Ctrl+C to stop")
+        print()
+        
+        reference = DailyReference(tickers)
+        fundamentals = get_fundamentals_cache()
+        spikes = []
+        alerts = ThreadPoolExecutor(max_workers=ALERT_WORKERS)
+        
+        def report_spike(tick, volume, ratio):
+            info = fundamentals.get_info(tick.ticker, fields=['floatShares', 'sharesOutstanding', 'marketCap'])
+            float_shares = info.get('floatShares') or info.get('sharesOutstanding') or 0
+            data = {
+                'ticker': tick.ticker,
+                'current_volume': int(volume),
+                'avg_volume': int(reference.get(tick.ticker, 'avg_volume', 0)),
+                'volume_ratio': ratio,
+                'price': tick.price,
+                'float_m': float_shares / 1e6,
+                'timestamp': datetime.now().isoformat(),
+                'market_cap': (info.get('marketCap') or 0) / 1e6,
+                'is_spike': True
+            }
+            spikes.append(data)
+            self._print_alert(data, '🚀🚀' if ratio > 10 else '🚀')
+        
+        def on_spike(tick, volume, ratio):
+            # Bus thread - the fundamentals lookup happens on the pool
+            alerts.submit(report_spike, tick, volume, ratio)
+        
+        detector = VolumeSpikeDetector(
+            reference.field('avg_volume'),
+            ratio=SPIKE_RATIO,
+            baseline=reference.field('volume'),
+            on_spike=on_spike,
+            profiles=self.profiles
+        )
+        bus = QuoteBus().start()
+        bus.subscribe(detector)
+        quotes = QuoteStream(bus, list(reference), url=url).start()
+        
+        try:
+            while True:
+                time.sleep(status_seconds)
+                if reference.refresh():
+                    detector.rebase(reference.field('avg_volume'), reference.field('volume'))
+                    print(f"📅 New session - reference bars reloaded for {len(reference)} tickers")
+                print(f"⏱️  {datetime.now().strftime('%H:%M:%S')} | {quotes.stats['ticks']:,} ticks | "
+                      f"{len(spikes)} spike(s) today", flush=True)
+        except KeyboardInterrupt:
+            print("\n\n✋ Monitoring stopped by user")
+            print(f"Spikes detected: {len(spikes)}")
+        finally:
+            quotes.stop()
+            bus.stop()
+            alerts.shutdown(wait=False)
+        
+        return spikes
+
 
 def main():
     """Run the volume monitor."""
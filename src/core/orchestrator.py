@@ -18,11 +18,14 @@ THIS MODULE CONNECTS EVERYTHING.
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'wolfpack'))
 
 from core.master_watchlist import MASTER_WATCHLIST, get_top_5, get_all_tickers
 from core.convergence_engine import ConvergenceEngine
 from core.adaptive_multi_scanner import AdaptiveMultiScanner
 from layer1_hunter.rgc_setup_scanner import RGCSetupScanner
+from utils.task_graph import TaskGraph
+from utils.cassette import install_from_env
 from datetime import datetime
 import json
 
@@ -59,6 +62,10 @@ class WolfPackOrchestrator:
         1. Multi-scanner finds candidates
         2. Convergence engine scores them
         3. Output ranked watchlist
+        
+        Steps run on the same task graph as the master scanner: the report
+        and the tier split both start as soon as scoring is done, and each
+        step is timed.
         """
         print("="*80)
         print("🐺 WOLF PACK ORCHESTRATOR - FULL SYSTEM SCAN")
@@ -66,19 +73,37 @@ class WolfPackOrchestrator:
         print(f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print()
         
-        # Step 1: Run convergence on master watchlist
-        print("📍 STEP 1: Convergence Scoring")
-        print("-" * 80)
-        results = self.modules['convergence'].scan_all()
+        convergence = self.modules['convergence']
         
-        # Step 2: Print top results
-        print("\n📍 STEP 2: Top Candidates")
-        print("-" * 80)
-        self.modules['convergence'].print_results(results)
+        def score():
+            # Step 1: Run convergence on master watchlist
+            print("📍 STEP 1: Convergence Scoring")
+            print("-" * 80)
+            return convergence.scan_all()
+        
+        def report(results):
+            # Step 2: Print top results
+            print("\n📍 STEP 2: Top Candidates")
+            print("-" * 80)
+            convergence.print_results(results)
         
-        # Step 3: Extract actionable tickers
-        tier1 = [r for r in results if r.get('total_score', 0) >= 50]
-        tier2 = [r for r in results if 35 <= r.get('total_score', 0) < 50]
+        def split_tiers(results):
+            # Step 3: Extract actionable tickers
+            tier1 = [r for r in results if r.get('total_score', 0) >= 50]
+            tier2 = [r for r in results if 35 <= r.get('total_score', 0) < 50]
+            return tier1, tier2
+        
+        graph = TaskGraph()
+        graph.add('convergence', score)
+        graph.add('report', report, inputs=['convergence'])
+        graph.add('tiers', split_tiers, inputs=['convergence'])
+        # Stream scan_all progress live - split_tiers never prints, so report
+        # has nothing to interleave with
+        nodes = graph.run(buffer_output=False)
+        graph.print_timings(nodes)
+        
+        results = nodes['convergence'].value if nodes['convergence'].ok else []
+        tier1, tier2 = nodes['tiers'].value if nodes['tiers'].ok else ([], [])
         
         print("\n📍 STEP 3: Actionable Tickers")
         print("-" * 80)
@@ -247,6 +272,8 @@ def main():
     """
     Main orchestrator entry point.
     """
+    install_from_env()  # CASSETTE_MODE=record|replay
+    
     orchestrator = WolfPackOrchestrator()
     
     # Show system architecture
@@ -14,16 +14,26 @@ This is PRODUCTION CODE.
 """
 
 import os
+import sys
 import time
-import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 import json
 from dotenv import load_dotenv
 
+# Shared pooled HTTP client
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'wolfpack'))
+from utils.http_client import get_http_client
+from utils.quote_stream import (QuoteBus, QuoteStream, VolumeSpikeDetector, DailyReference,
+                                WEBSOCKETS_AVAILABLE, FINNHUB_STREAM_URL)
+from utils.volume_profile import get_volume_profiles
+
 # Load real API keys
 load_dotenv()
 
+ALERT_WORKERS = 2  # Finnhub lookups for spike alerts run off the quote bus thread
+
 class RealTimeVolumeMonitor:
     """
     Real-time volume spike detection using actual APIs.
@@ -45,28 +55,18 @@ class RealTimeVolumeMonitor:
         if not self.alpha_vantage_key:
             print("⚠️  WARNING: No Alpha Vantage key - historical data limited")
         
-        # Rate limiting (respect API limits)
-        self.last_request_time = {}
-        self.request_delays = {
-            'polygon': 0.1,      # 5 calls/min free tier
-            'finnhub': 1.0,      # 60 calls/min free tier
-            'alphavantage': 12.0 # 25 calls/day free tier
-        }
+        # Pooled keep-alive connections (one session per provider).
+        # Rate limiting (Polygon 5/min, Finnhub 60/min, Alpha Vantage 5/min)
+        # is a token bucket shared with every other process using the keys.
+        self.http = get_http_client()
+        
+        # Nightly time-of-day volume curves (O(1) lookups, no API calls)
+        self.profiles = get_volume_profiles()
         
         # Cache (avoid repeated calls)
         self.cache = {}
         self.cache_ttl = 300  # 5 minutes
     
-    def _respect_rate_limit(self, api: str):
-        """Wait if needed to respect rate limits."""
-        if api in self.last_request_time:
-            elapsed = time.time() - self.last_request_time[api]
-            delay = self.request_delays.get(api, 1.0)
-            if elapsed < delay:
-                time.sleep(delay - elapsed)
-        
-        self.last_request_time[api] = time.time()
-    
     def _get_cached(self, key: str) -> Optional[Dict]:
         """Get cached data if fresh."""
         if key in self.cache:
@@ -93,15 +93,13 @@ class RealTimeVolumeMonitor:
         if cached:
             return cached
         
-        self._respect_rate_limit('polygon')
-        
         try:
             # Polygon aggregate bars endpoint (free tier)
             today = datetime.now().strftime('%Y-%m-%d')
             url = f"https://api.polygon.io/v2/aggs/ticker/{ticker}/range/1/day/{today}/{today}"
             params = {'apiKey': self.polygon_key}
             
-            response = requests.get(url, params=params, timeout=10)
+            response = self.http.get(url, params=params, timeout=10)
             
             if response.status_code == 200:
                 data = response.json()
@@ -144,8 +142,6 @@ class RealTimeVolumeMonitor:
         if cached:
             return cached.get('avg_volume')
         
-        self._respect_rate_limit('finnhub')
-        
         try:
             url = "https://finnhub.io/api/v1/stock/metric"
             params = {
@@ -154,7 +150,7 @@ class RealTimeVolumeMonitor:
                 'token': self.finnhub_key
             }
             
-            response = requests.get(url, params=params, timeout=10)
+            response = self.http.get(url, params=params, timeout=10)
             
             if response.status_code == 200:
                 data = response.json()
@@ -185,8 +181,6 @@ class RealTimeVolumeMonitor:
         if cached:
             return cached
         
-        self._respect_rate_limit('finnhub')
-        
         try:
             url = "https://finnhub.io/api/v1/stock/profile2"
             params = {
@@ -194,7 +188,7 @@ class RealTimeVolumeMonitor:
                 'token': self.finnhub_key
             }
             
-            response = requests.get(url, params=params, timeout=10)
+            response = self.http.get(url, params=params, timeout=10)
             
             if response.status_code == 200:
                 data = response.json()
@@ -230,14 +224,17 @@ class RealTimeVolumeMonitor:
         
         current_volume = current_data['volume']
         
-        # Get average volume
-        avg_volume = self.get_average_volume_finnhub(ticker)
+        # Get average volume (nightly profile first - no API call)
+        avg_volume = self.profiles.avg_daily_volume(ticker) or self.get_average_volume_finnhub(ticker)
         if not avg_volume or avg_volume == 0:
             print(" ⚠️  No average volume data")
             return None
         
-        # Calculate ratio
-        volume_ratio = current_volume / avg_volume
+        # Calculate ratio vs normal volume by this minute of the session
+        # (full-day average outside the session / without a profile)
+        volume_ratio = self.profiles.relative_volume(ticker, current_volume, avg_daily_volume=avg_volume)
+        if volume_ratio is None:
+            volume_ratio = current_volume / avg_volume
         
         # Get stock info
         info = self.get_stock_info_finnhub(ticker)
@@ -305,11 +302,15 @@ class RealTimeVolumeMonitor:
         
         return spikes
     
-    def monitor_continuous(self, tickers: List[str], interval_seconds: int = 300):
+    def monitor_continuous(self, tickers: List[str], interval_seconds: int = 300, stream: bool = True):
         """
         Continuously monitor for volume spikes.
-        Scans every N seconds.
+        Streams Finnhub trades when possible (stream=True), otherwise
+        scans every N seconds.
         """
+        if stream and WEBSOCKETS_AVAILABLE and (self.finnhub_key or os.getenv('QUOTE_STREAM_URL')):
+            return self.monitor_stream(tickers)
+        
         print("="*80)
         print("🔄 CONTINUOUS VOLUME MONITORING")
         print("="*80)
@@ -342,6 +343,82 @@ class RealTimeVolumeMonitor:
             print("\n\n✋ Monitoring stopped by user")
             print(f"Total scans: {scan_count}")
 
+    
+    def monitor_stream(self, tickers: List[str], url: Optional[str] = None, status_seconds: int = 60):
+        """
+        Event-driven volume monitoring over the Finnhub trade websocket.
+        
+        Average and today's volume come from one bulk daily download; every
+        streamed trade adds to today's volume and a spike alerts as soon as
+        it is 5x normal for this minute, instead of waiting for the next scan.
+        References are reloaded at each new session.
+        """
+        url = url or os.getenv('QUOTE_STREAM_URL') or FINNHUB_STREAM_URL.format(token=self.finnhub_key)
+        
+        print("="*80)
+        print("📡 STREAMING VOLUME MONITORING")
+        print("="*80)
+        print(f"Tickers: {len(tickers)}")
+        print("Press Ctrl+C to stop")
+        print()
+        
+        reference = DailyReference(tickers)
+        spikes = []
+        alerts = ThreadPoolExecutor(max_workers=ALERT_WORKERS)
+        
+        def report_spike(tick, volume, ratio):
+            info = self.get_stock_info_finnhub(tick.ticker)
+            float_shares = info.get('shareOutstanding', 0) if info else 0
+            spike = {
+                'ticker': tick.ticker,
+                'current_volume': volume,
+                'avg_volume': reference.get(tick.ticker, 'avg_volume', 0),
+                'volume_ratio': ratio,
+                'price': tick.price,
+                'float_m': float_shares / 1e6 if float_shares else 0,
+                'timestamp': datetime.now().isoformat(),
+                'is_spike': True
+            }
+            spikes.append(spike)
+            print(f"\n🚨 ${spike['ticker']}: {ratio:.1f}x VOLUME SPIKE!")
+            print(f"   Current Volume: {volume:,.0f} | Avg: {spike['avg_volume']:,.0f}")
+            print(f"   Price: ${tick.price:.2f} | Float: {spike['float_m']:.2f}M")
+            if spike['float_m'] < 10 and tick.price < 5:
+                print("   ⚠️  MOVABLE: Low float + low price = explosive potential")
+        
+        def on_spike(tick, volume, ratio):
+            # Bus thread - the Finnhub lookup happens on the pool
+            alerts.submit(report_spike, tick, volume, ratio)
+        
+        detector = VolumeSpikeDetector(
+            reference.field('avg_volume'),
+            ratio=5.0,
+            baseline=reference.field('volume'),
+            on_spike=on_spike,
+            profiles=self.profiles
+        )
+        bus = QuoteBus().start()
+        bus.subscribe(detector)
+        quotes = QuoteStream(bus, list(reference), url=url).start()
+        
+        try:
+            while True:
+                time.sleep(status_seconds)
+                if reference.refresh():
+                    detector.rebase(reference.field('avg_volume'), reference.field('volume'))
+                    print(f"📅 New session - reference bars reloaded for {len(reference)} tickers")
+                print(f"⏱️  {datetime.now().strftime('%H:%M:%S')} | {quotes.stats['ticks']:,} ticks | "
+                      f"{len(spikes)} spike(s) today", flush=True)
+        except KeyboardInterrupt:
+            print("\n\n✋ Monitoring stopped by user")
+            print(f"Spikes detected: {len(spikes)}")
+        finally:
+            quotes.stop()
+            bus.stop()
+            alerts.shutdown(wait=False)
+        
+        return spikes
+
 
 def main():
     """Test the real-time volume monitor."""
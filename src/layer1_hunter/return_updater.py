@@ -5,10 +5,14 @@ Calculates 1d, 3d, 5d, 10d returns after events
 Run daily to update pending returns
 """
 
+import os
+import sys
 import sqlite3
-import yfinance as yf
 from datetime import datetime, timedelta
-import time
+
+# Shared local bar store
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'wolfpack'))
+from utils.bar_store import get_bar_store
 
 DB_PATH = 'wolf_pack_events.db'
 
@@ -32,13 +36,11 @@ def calculate_returns(ticker, event_date, event_price):
     """Calculate returns for 1d, 3d, 5d, 10d after event"""
     
     try:
-        stock = yf.Ticker(ticker)
-        
-        # Get historical data starting from event date
+        # Get historical data starting from event date (local bar store)
         start_date = event_date - timedelta(days=1)
         end_date = datetime.now()
         
-        hist = stock.history(start=start_date, end=end_date)
+        hist = get_bar_store().get_bars(ticker, start=start_date, end=end_date)
         
         if len(hist) < 2:
             return None
@@ -114,6 +116,10 @@ def update_returns():
     
     print(f"Found {len(pending)} events to update\n")
     
+    # Fill any bar-store gaps for every event ticker in one bulk call
+    oldest = min(datetime.fromisoformat(e[2]) for e in pending) - timedelta(days=1)
+    get_bar_store().update([e[1] for e in pending], start=oldest)
+    
     updated = 0
     
     for event_id, ticker, event_date_str, event_price in pending:
@@ -138,9 +144,6 @@ def update_returns():
                     ret_str += f"10d:{returns['return_10d']:+.1f}%"
                 
                 print(f"✅ {ticker:6} | {days_since:2}d ago | {ret_str}")
-        
-        # Rate limit
-        time.sleep(0.5)
     
     conn.close()
     
@@ -17,6 +17,8 @@ This finds:
 6. Compressed stocks waking up
 """
 
+import os
+import sys
 import yfinance as yf
 import pandas as pd
 import numpy as np
@@ -29,6 +31,14 @@ from datetime import datetime, timedelta
 import warnings
 warnings.filterwarnings('ignore')
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'wolfpack'))
+from utils.cassette import install_from_env
+
+from utils.market_data import get_market_data_service, PERIOD_DAYS
+from utils.fundamentals_cache import get_fundamentals_cache
+from utils.task_graph import TaskGraph
+from concurrent.futures import ThreadPoolExecutor
+
 # ============================================
 # CONFIGURATION
 # ============================================
@@ -69,22 +79,65 @@ MIN_MOVE_PCT = 5.0
 MIN_VOLUME_MULT = 2.5
 MAX_PRICE = 50
 
+SEC_8K_FEED = 'https://www.sec.gov/cgi-bin/browse-edgar?action=getcurrent&type=8-K&company=&dateb=&owner=include&count=30&output=atom'
+QUOTE_FIELDS = ['regularMarketPrice', 'postMarketPrice', 'preMarketPrice', 'marketCap']
+FETCH_WORKERS = 8
+
+# ============================================
+# SHARED INPUTS (fetched once per master scan)
+# ============================================
+
+def load_universe_bars(period='6mo'):
+    """Daily bars for the whole universe - one bulk download"""
+    market_data = get_market_data_service()
+    market_data.prefetch(SCAN_UNIVERSE, period=period)
+    return {ticker: market_data.get_history(ticker, period=period) for ticker in SCAN_UNIVERSE}
+
+
+def load_quotes():
+    """Regular / pre / post-market quotes for the universe (cached .info, fetched concurrently)"""
+    fundamentals = get_fundamentals_cache()
+    
+    def lookup(ticker):
+        try:
+            return fundamentals.get_info(ticker, fields=QUOTE_FIELDS)
+        except Exception:
+            return {}
+    
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+        return dict(zip(SCAN_UNIVERSE, executor.map(lookup, SCAN_UNIVERSE)))
+
+
+def fetch_sec_feed():
+    """Raw SEC current 8-K atom feed"""
+    req = urllib.request.Request(SEC_8K_FEED, headers={'User-Agent': 'Wolf Pack Scanner alex@example.com'})
+    response = urllib.request.urlopen(req, timeout=15)
+    return response.read().decode('utf-8')
+
+
+def _trailing(hist, period):
+    """Last `period` of a longer history (same window yfinance would return)"""
+    if hist.empty:
+        return hist
+    return hist[hist.index > hist.index[-1] - timedelta(days=PERIOD_DAYS[period])]
+
+
 # ============================================
 # SCAN FUNCTIONS
 # ============================================
 
-def scan_extended_hours():
+def scan_extended_hours(quotes=None):
     """Scan pre-market and after-hours"""
     print("\n" + "🌙"*20)
     print("EXTENDED HOURS SCAN")
     print("🌙"*20)
     
+    quotes = quotes if quotes is not None else load_quotes()
     movers = []
     
     for ticker in SCAN_UNIVERSE:
         try:
-            stock = yf.Ticker(ticker)
-            info = stock.info
+            info = quotes.get(ticker, {})
             
             reg_price = info.get('regularMarketPrice', 0)
             post_price = info.get('postMarketPrice', 0)
@@ -136,18 +189,18 @@ def scan_extended_hours():
     return movers
 
 
-def scan_volume_spikes():
+def scan_volume_spikes(bars=None):
     """Find unusual volume"""
     print("\n" + "📊"*20)
     print("VOLUME SPIKE SCAN")
     print("📊"*20)
     
+    bars = bars if bars is not None else load_universe_bars()
     spikes = []
     
     for ticker in SCAN_UNIVERSE:
         try:
-            stock = yf.Ticker(ticker)
-            hist = stock.history(period='1mo')
+            hist = _trailing(bars[ticker], '1mo')
             
             if len(hist) < 10:
                 continue
@@ -186,18 +239,18 @@ def scan_volume_spikes():
     return spikes
 
 
-def scan_day_movers():
+def scan_day_movers(bars=None):
     """Get biggest movers of the day"""
     print("\n" + "📈"*20)
     print("TODAY'S BIGGEST MOVERS")
     print("📈"*20)
     
+    bars = bars if bars is not None else load_universe_bars()
     movers = []
     
     for ticker in SCAN_UNIVERSE:
         try:
-            stock = yf.Ticker(ticker)
-            hist = stock.history(period='2d')
+            hist = bars[ticker].tail(2)
             
             if len(hist) < 1:
                 continue
@@ -224,18 +277,18 @@ def scan_day_movers():
     return movers
 
 
-def scan_compressed_waking():
+def scan_compressed_waking(bars=None):
     """Find beaten down stocks showing life"""
     print("\n" + "🎯"*20)
     print("COMPRESSED STOCKS WAKING UP")
     print("🎯"*20)
     
+    bars = bars if bars is not None else load_universe_bars()
     candidates = []
     
     for ticker in SCAN_UNIVERSE:
         try:
-            stock = yf.Ticker(ticker)
-            hist = stock.history(period='6mo')
+            hist = _trailing(bars[ticker], '6mo')
             
             if len(hist) < 60:
                 continue
@@ -339,18 +392,16 @@ def scan_earnings():
     return earnings
 
 
-def scan_sec_filings():
+def scan_sec_filings(feed=None):
     """Check SEC 8-K filings"""
     print("\n" + "📄"*20)
     print("SEC 8-K FILINGS (Last 2 Hours)")
     print("📄"*20)
     
-    url = 'https://www.sec.gov/cgi-bin/browse-edgar?action=getcurrent&type=8-K&company=&dateb=&owner=include&count=30&output=atom'
+    companies = []
     
     try:
-        req = urllib.request.Request(url, headers={'User-Agent': 'Wolf Pack Scanner alex@example.com'})
-        response = urllib.request.urlopen(req, timeout=15)
-        data = response.read().decode('utf-8')
+        data = feed if feed is not None else fetch_sec_feed()
         
         root = ET.fromstring(data)
         ns = {'atom': 'http://www.w3.org/2005/Atom'}
@@ -363,10 +414,13 @@ def scan_sec_filings():
             match = re.search(r'8-K(?:/A)? - (.+?) \((\d+)\)', title)
             if match:
                 company = match.group(1).strip()[:40]
+                companies.append(company)
                 print(f"  • {company}")
                 
     except Exception as e:
         print(f"Error: {e}")
+    
+    return companies
 
 
 def run_master_scan():
@@ -378,15 +432,26 @@ def run_master_scan():
     print(f"        {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print("🐺" * 35)
     
-    # Run all scans
+    # Run all scans - each scan starts as soon as its inputs are fetched,
+    # independent scans run in parallel
+    graph = TaskGraph()
+    graph.add('bars', load_universe_bars)
+    graph.add('quotes', load_quotes)
+    graph.add('sec_feed', fetch_sec_feed)
+    graph.add('extended', scan_extended_hours, inputs=['quotes'])
+    graph.add('volume', scan_volume_spikes, inputs=['bars'])
+    graph.add('movers', scan_day_movers, inputs=['bars'])
+    graph.add('compressed', scan_compressed_waking, inputs=['bars'])
+    graph.add('earnings', scan_earnings)
+    graph.add('sec', scan_sec_filings, inputs=['sec_feed'])
+    
+    nodes = graph.run()
+    graph.print_timings(nodes)
+    
+    # A failed scan reports nothing instead of stopping the others
     results = {}
-    
-    results['extended'] = scan_extended_hours()
-    results['volume'] = scan_volume_spikes()
-    results['movers'] = scan_day_movers()
-    results['compressed'] = scan_compressed_waking()
-    results['earnings'] = scan_earnings()
-    scan_sec_filings()
+    for name in ['extended', 'volume', 'movers', 'compressed', 'earnings']:
+        results[name] = nodes[name].value if nodes[name].ok else []
     
     # Summary
     print("\n")
@@ -439,4 +504,6 @@ def run_master_scan():
 
 
 if __name__ == "__main__":
+    # CASSETTE_MODE=record|replay runs the whole scan against a recorded cassette
+    install_from_env()
     run_master_scan()
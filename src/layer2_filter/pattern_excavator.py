@@ -11,12 +11,188 @@ What signals were there that we missed?
 This module finds the patterns so we catch the NEXT one.
 """
 
-import yfinance as yf
+import os
+import sys
+import warnings
 from datetime import datetime, timedelta
-from typing import List, Dict
+from typing import List, Dict, Optional
+import numpy as np
 import pandas as pd
 import json
 
+# Shared utilities (local bar store, cached fundamentals, vectorized indicators)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'wolfpack'))
+from utils.bar_store import get_bar_store
+from utils.fundamentals_cache import get_fundamentals_cache
+from utils.screener import panel_to_arrays
+from utils.indicators import batch_rsi
+
+# Reusable dataset of every big run found by PatternExcavator.excavate()
+DATASET_PATH = os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'big_mover_runs.csv')
+
+MAX_RUN_BARS = 126       # A run must peak within ~6 months of its bottom
+TROUGH_WINDOW = 20       # Bottom = lowest low of the prior 20 bars
+PRE_RUN_WINDOW = 30      # Bars ending at the bottom used for pre-run features
+WINDOW_CELLS = 8_000_000 # Max (tickers x bars x window) cells per chunk
+
+
+# =============================================================================
+# VECTORIZED RUN ENGINE
+# =============================================================================
+
+def find_runs(arrays: Dict, min_gain_pct: float = 200, max_run_bars: int = MAX_RUN_BARS,
+              trough_window: int = TROUGH_WINDOW) -> pd.DataFrame:
+    """
+    Every bottom-to-peak run of at least min_gain_pct in (ticker x day) arrays.
+    
+    A bar is a bottom when its low is the rolling minimum of the last
+    trough_window lows; its run is the forward maximum high over the next
+    max_run_bars bars. Bottoms that share a peak are one run (the lowest
+    bottom wins), and runs that overlap (one starts before the previous
+    peaked) are one move reported by its biggest gain.
+    
+    Args:
+        arrays: utils.screener.panel_to_arrays() output
+    
+    Returns:
+        DataFrame with row (index into arrays), ticker, start, peak (column
+        indexes), bottom_price, peak_price, gain_pct, run_bars
+    """
+    low, high = arrays['Low'], arrays['High']
+    n, t = low.shape
+    columns = ['row', 'ticker', 'start', 'peak', 'bottom_price', 'peak_price', 'gain_pct', 'run_bars']
+    if n == 0 or t < 2:
+        return pd.DataFrame(columns=columns)
+    
+    # Future highs, padded so every bar has a full forward window
+    future = np.concatenate([high[:, 1:], np.full((n, max_run_bars), np.nan)], axis=1)
+    chunk = max(1, WINDOW_CELLS // (t * max(max_run_bars, trough_window)))
+    
+    hits = []
+    with warnings.catch_warnings(), np.errstate(invalid='ignore', divide='ignore'):
+        warnings.simplefilter('ignore', RuntimeWarning)
+        
+        for first in range(0, n, chunk):
+            rows = slice(first, first + chunk)
+            
+            # Trailing rolling minimum of lows (bottoms)
+            padded = np.concatenate([np.full((low[rows].shape[0], trough_window - 1), np.nan), low[rows]], axis=1)
+            rolling_min = np.nanmin(np.lib.stride_tricks.sliding_window_view(padded, trough_window, axis=1), axis=-1)
+            is_bottom = (low[rows] <= rolling_min) & (low[rows] > 0)
+            
+            # Forward maximum of highs and where it happens
+            windows = np.lib.stride_tricks.sliding_window_view(future[rows], max_run_bars, axis=1)[:, :t]
+            filled = np.where(np.isnan(windows), -np.inf, windows)
+            offset = filled.argmax(axis=-1)
+            forward_max = np.take_along_axis(filled, offset[..., None], axis=-1)[..., 0]
+            
+            gain = (forward_max / low[rows] - 1) * 100
+            r, c = np.nonzero(is_bottom & (gain >= min_gain_pct))
+            if len(r):
+                hits.append(pd.DataFrame({
+                    'row': r + first,
+                    'start': c,
+                    'peak': c + 1 + offset[r, c],
+                    'bottom_price': low[rows][r, c],
+                    'peak_price': forward_max[r, c],
+                }))
+    
+    if not hits:
+        return pd.DataFrame(columns=columns)
+    
+    runs = pd.concat(hits, ignore_index=True)
+    
+    # One run per (ticker, peak): keep the lowest bottom
+    runs = runs.loc[runs.groupby(['row', 'peak'])['bottom_price'].idxmin()]
+    runs = runs.sort_values(['row', 'start']).reset_index(drop=True)
+    
+    # Runs that start before the previous run in the same ticker peaked are
+    # one move: keep its biggest gain (the earliest bottom's forward window
+    # can stop short of the real peak after a long base)
+    previous_peak = runs.groupby('row')['peak'].cummax().groupby(runs['row']).shift()
+    move = (previous_peak.isna() | (runs['start'] > previous_peak)).cumsum()
+    gain = runs['peak_price'] / runs['bottom_price']
+    runs = runs.loc[gain.groupby(move).idxmax()].reset_index(drop=True)
+    
+    runs['ticker'] = [arrays['tickers'][i] for i in runs['row']]
+    runs['gain_pct'] = (runs['peak_price'] / runs['bottom_price'] - 1) * 100
+    runs['run_bars'] = runs['peak'] - runs['start']
+    return runs[columns]
+
+
+def row_dates(panel: pd.DataFrame, tickers: List[str]) -> np.ndarray:
+    """
+    (ticker x day) dates matching panel_to_arrays(): each ticker's missing
+    days are pushed to the left the same way its bars are.
+    """
+    closes = panel.xs('Close', axis=1, level=1).reindex(columns=tickers)
+    valid = closes.notna().to_numpy().T
+    order = np.argsort(valid, axis=1, kind='stable')
+    return panel.index.to_numpy()[order]
+
+
+def extract_pre_run_features(arrays: Dict, runs: pd.DataFrame, dates: np.ndarray,
+                             window: int = PRE_RUN_WINDOW) -> pd.DataFrame:
+    """
+    Pre-run feature vectors for every run at once.
+    
+    Features come from the `window` bars ending at each run's bottom (the
+    same window analyze_pre_run_characteristics() uses) plus RSI at the
+    bottom and drawdown from the prior 1y high.
+    
+    Args:
+        arrays: utils.screener.panel_to_arrays() output the runs came from
+        runs: find_runs() output
+        dates: row_dates() for the same panel
+    """
+    if runs.empty:
+        return runs.copy()
+    
+    rows = runs['row'].to_numpy()
+    start = runs['start'].to_numpy()
+    close, high, low, volume = arrays['Close'], arrays['High'], arrays['Low'], arrays['Volume']
+    
+    def gather(values: np.ndarray, bars: int) -> np.ndarray:
+        cols = start[:, None] + np.arange(-bars + 1, 1)
+        out = values[rows[:, None], np.clip(cols, 0, None)]
+        return np.where(cols >= 0, out, np.nan)
+    
+    with warnings.catch_warnings(), np.errstate(invalid='ignore', divide='ignore'):
+        warnings.simplefilter('ignore', RuntimeWarning)
+        
+        pre_close = gather(close, window)
+        pre_high = gather(high, window)
+        pre_low = gather(low, window)
+        pre_volume = gather(volume, window)
+        
+        # First/last valid volume in each window (windows are left-padded with NaN)
+        valid = ~np.isnan(pre_volume)
+        first_volume = pre_volume[np.arange(len(rows)), valid.argmax(axis=1)]
+        last_volume = pre_volume[:, -1]
+        
+        returns = np.diff(pre_close, axis=1) / pre_close[:, :-1]
+        year_high = np.nanmax(gather(high, 252), axis=1)
+        rsi = batch_rsi(close)[rows, start]
+        
+        bottom = runs['bottom_price'].to_numpy()
+        features = runs.copy()
+        features['bottom_date'] = pd.to_datetime(dates[rows, start]).strftime('%Y-%m-%d')
+        features['peak_date'] = pd.to_datetime(dates[rows, runs['peak'].to_numpy()]).strftime('%Y-%m-%d')
+        features['avg_price_at_bottom'] = np.nanmean(pre_close, axis=1)
+        features['was_under_5'] = bottom < 5.0
+        features['was_under_2'] = bottom < 2.0
+        features['was_under_1'] = bottom < 1.0
+        features['avg_volume_before'] = np.nanmean(pre_volume, axis=1)
+        features['volume_increasing'] = last_volume > first_volume
+        features['volume_trend'] = np.nanmean(pre_volume[:, -5:], axis=1) / features['avg_volume_before']
+        features['pre_range_pct'] = (np.nanmax(pre_high, axis=1) / np.nanmin(pre_low, axis=1) - 1) * 100
+        features['pre_volatility_pct'] = np.nanstd(returns, axis=1, ddof=1) * 100
+        features['drawdown_from_1y_high_pct'] = (bottom / year_high - 1) * 100
+        features['rsi_at_bottom'] = rsi
+    
+    return features.drop(columns=['row', 'start', 'peak'])
+
+
 class PatternExcavator:
     """
     Dig through past massive winners to find the patterns
@@ -25,6 +201,64 @@ class PatternExcavator:
     def __init__(self):
         self.winners = []
         self.patterns = {}
+        self.dataset = None
+        self.bar_store = get_bar_store()
+        self.fundamentals = get_fundamentals_cache()
+    
+    def excavate(self, tickers: Optional[List[str]] = None, start: str = '2000-01-01',
+                 min_gain_pct: float = 200, max_run_bars: int = MAX_RUN_BARS,
+                 with_fundamentals: bool = True) -> pd.DataFrame:
+        """
+        Find every big run in the local bar store and build the pre-run dataset
+        
+        Reads straight from disk (no network) so thousands of tickers of
+        history take one query and a few array passes.
+        
+        Args:
+            tickers: Tickers to search (None = everything in the bar store)
+            start: Earliest bar to read
+            with_fundamentals: Add float / sector / industry (cached .info)
+        
+        Returns:
+            One row per run (see find_runs / extract_pre_run_features), also
+            kept on self.dataset for extract_common_patterns()
+        """
+        panel = self.bar_store.read_panel(tickers, start=start)
+        if panel.empty:
+            print("⚠️  No bars in the local store - run the recorder/updater first")
+            self.dataset = pd.DataFrame()
+            return self.dataset
+        
+        arrays = panel_to_arrays(panel)
+        print(f"🔍 Searching {len(arrays['tickers'])} tickers x {len(panel.index)} days for {min_gain_pct}%+ runs...")
+        
+        runs = find_runs(arrays, min_gain_pct=min_gain_pct, max_run_bars=max_run_bars)
+        dataset = extract_pre_run_features(arrays, runs, row_dates(panel, arrays['tickers']))
+        
+        if with_fundamentals and not dataset.empty:
+            info = {
+                t: self.fundamentals.get_info(t, fields=['floatShares', 'marketCap', 'sector', 'industry'])
+                for t in dataset['ticker'].unique()
+            }
+            dataset['float'] = [info[t].get('floatShares', 0) or 0 for t in dataset['ticker']]
+            dataset['float_m'] = dataset['float'] / 1_000_000
+            dataset['market_cap_at_bottom'] = [info[t].get('marketCap', 0) for t in dataset['ticker']]
+            dataset['sector'] = [info[t].get('sector', 'Unknown') for t in dataset['ticker']]
+            dataset['industry'] = [info[t].get('industry', 'Unknown') for t in dataset['ticker']]
+        
+        print(f"   Found {len(dataset)} runs in {dataset['ticker'].nunique() if len(dataset) else 0} tickers")
+        self.dataset = dataset
+        return dataset
+    
+    def save_dataset(self, path: str = DATASET_PATH):
+        """Write the excavated runs for reuse (scanner research, backtests)"""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.dataset.to_csv(path, index=False)
+    
+    def load_dataset(self, path: str = DATASET_PATH) -> pd.DataFrame:
+        """Load a previously saved run dataset"""
+        self.dataset = pd.read_csv(path)
+        return self.dataset
     
     def find_massive_gainers(self, lookback_months=6, min_gain_pct=200) -> List[Dict]:
         """
@@ -42,18 +276,14 @@ class PatternExcavator:
             # Need to find 100+ more programmatically
         ]
         
+        # One bulk read; the bar store only fetches days it doesn't have
+        histories = self.bar_store.get_many(known_winners, period='1y')
+        six_months_ago = datetime.now() - timedelta(days=30 * lookback_months)
+        
         winners = []
         
-        for ticker in known_winners:
+        for ticker, hist in histories.items():
             try:
-                stock = yf.Ticker(ticker)
-                hist = stock.history(period='1y')
-                
-                if len(hist) < 2:
-                    continue
-                
-                # Get price 6 months ago
-                six_months_ago = datetime.now() - timedelta(days=180)
                 recent_data = hist[hist.index >= six_months_ago]
                 
                 if len(recent_data) < 2:
@@ -72,7 +302,7 @@ class PatternExcavator:
                         'high_price': high_price,
                         'current_price': current_price,
                         'max_gain_pct': gain_from_start,
-                        'timeframe': '6 months',
+                        'timeframe': f'{lookback_months} months',
                     })
                     
             except Exception as e:
@@ -91,9 +321,8 @@ class PatternExcavator:
         print(f"\n📊 ANALYZING {ticker} PRE-RUN CHARACTERISTICS...")
         
         try:
-            stock = yf.Ticker(ticker)
-            info = stock.info
-            hist = stock.history(period='1y')
+            info = self.fundamentals.get_info(ticker, fields=['floatShares', 'marketCap', 'sector', 'industry'])
+            hist = self.bar_store.get_history(ticker, period='1y')
             
             # Find the bottom (before the run)
             low_price = hist['Low'].min()
@@ -171,15 +400,21 @@ class PatternExcavator:
         
         return catalysts
     
-    def extract_common_patterns(self) -> Dict:
+    def extract_common_patterns(self, dataset: Optional[pd.DataFrame] = None) -> Dict:
         """
         After analyzing multiple winners, what are the COMMON patterns?
         
         This is what we build the scanner around
+        
+        dataset: excavate() output (defaults to self.dataset). Without one,
+        each winner is analyzed one at a time.
         """
         print("\n🧠 EXTRACTING COMMON PATTERNS...")
         
-        if not self.winners:
+        dataset = self.dataset if dataset is None else dataset
+        use_dataset = dataset is not None and not dataset.empty
+        
+        if not self.winners and not use_dataset:
             return {}
         
         patterns = {
@@ -191,11 +426,14 @@ class PatternExcavator:
         }
         
         # Analyze all winners
-        all_chars = []
-        for winner in self.winners:
-            chars = self.analyze_pre_run_characteristics(winner['ticker'])
-            if chars:
-                all_chars.append(chars)
+        if use_dataset:
+            all_chars = dataset.to_dict('records')
+        else:
+            all_chars = []
+            for winner in self.winners:
+                chars = self.analyze_pre_run_characteristics(winner['ticker'])
+                if chars:
+                    all_chars.append(chars)
         
         if not all_chars:
             return patterns
@@ -211,6 +449,14 @@ class PatternExcavator:
         sectors = [c.get('sector') for c in all_chars if c.get('sector')]
         patterns['most_common_sectors'] = list(set(sectors))
         
+        # Run-level medians (dataset only)
+        if use_dataset:
+            patterns['runs_analyzed'] = len(dataset)
+            for column in ['gain_pct', 'run_bars', 'pre_range_pct', 'volume_trend', 'rsi_at_bottom',
+                           'drawdown_from_1y_high_pct']:
+                if column in dataset:
+                    patterns[f'median_{column}'] = float(dataset[column].median())
+        
         self.patterns = patterns
         return patterns
     
@@ -289,6 +535,12 @@ class PatternExcavator:
 if __name__ == "__main__":
     excavator = PatternExcavator()
     
+    # Every big run in the local bar store (full history, no network)
+    dataset = excavator.excavate()
+    if not dataset.empty:
+        excavator.save_dataset()
+        print(f"   Dataset saved to {DATASET_PATH}")
+    
     # Find winners
     winners = excavator.find_massive_gainers(lookback_months=6, min_gain_pct=200)
     
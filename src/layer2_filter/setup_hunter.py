@@ -10,14 +10,29 @@ We find tickers with RGC's SAME SETUP before it moved.
 THE HUNTER, NOT THE HISTORIAN.
 """
 
-import yfinance as yf
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import pandas as pd
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import requests
 from bs4 import BeautifulSoup
 import json
 
+# Shared utilities (bulk price history, cached .info)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'wolfpack'))
+from utils.market_data import get_market_data_service
+from utils.fundamentals_cache import get_fundamentals_cache
+
+# Every .info field any hunt reads - one cached lookup per ticker covers all hunts
+INFO_FIELDS = [
+    'currentPrice', 'regularMarketPrice', 'floatShares', 'sector',
+    'averageVolume', 'volume', 'longBusinessSummary', 'marketCap',
+]
+
+LOOKUP_WORKERS = 8
+
 class SetupHunter:
     """
     Finds tickers with the SAME SETUP as past winners BEFORE they moved.
@@ -29,6 +44,15 @@ class SetupHunter:
     def __init__(self):
         self.patterns = self._load_winning_patterns()
         self.universe = self._load_expanded_universe()
+        self.market_data = get_market_data_service()
+        self.fundamentals = get_fundamentals_cache()
+        
+        # Result key -> per-ticker matcher, evaluated together in scan_all_setups
+        self.hunts = {
+            'rgc_setups': self._match_rgc_setup,
+            'phase3_catalysts': self._match_phase3_catalyst,
+            'beaten_down_catalyst': self._match_beaten_down,
+        }
         
     def _load_winning_patterns(self) -> Dict[str, Dict]:
         """
@@ -95,7 +119,35 @@ class SetupHunter:
             'CGEM', 'NRIX', 'ANIK', 'ETON', 'HRTX', 'CASI', 'PGEN'
         ]
     
-    def hunt_rgc_setups(self) -> List[Dict[str, Any]]:
+    def load_universe_data(self, workers: int = LOOKUP_WORKERS) -> Dict[str, Dict]:
+        """
+        Load everything the hunts need for the whole universe once.
+        
+        Price history is one bulk 1y download; .info lookups (the slow,
+        I/O-bound part) run concurrently through the fundamentals cache.
+        
+        Returns:
+            {'info': {ticker: info}, 'high_52w': {ticker: float}}
+        """
+        panel = self.market_data.get_panel(self.universe, period='1y')
+        if panel.empty:
+            high_52w = {}
+        else:
+            highs = panel.xs('High', axis=1, level=1).max()
+            high_52w = {t: float(h) for t, h in highs.items() if pd.notna(h)}
+        
+        def lookup(ticker):
+            try:
+                return self.fundamentals.get_info(ticker, fields=INFO_FIELDS)
+            except Exception:
+                return {}
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            infos = dict(zip(self.universe, executor.map(lookup, self.universe)))
+        
+        return {'info': infos, 'high_52w': high_52w}
+    
+    def hunt_rgc_setups(self, data: Optional[Dict] = None) -> List[Dict[str, Any]]:
         """
         Find tickers with RGC's setup BEFORE it moved 20,000%.
         
@@ -109,61 +161,67 @@ class SetupHunter:
         print("🎯 HUNTING FOR RGC-LIKE SETUPS...")
         print("   Under $1, float <30M, biotech, Phase 3 catalyst")
         
-        pattern = self.patterns['rgc_pattern']['criteria']
+        data = data or self.load_universe_data()
         matches = []
         
         for ticker in self.universe:
-            try:
-                stock = yf.Ticker(ticker)
-                info = stock.info
-                
-                # Price check
-                price = info.get('currentPrice', info.get('regularMarketPrice', 999))
-                if price > pattern['max_price']:
-                    continue
-                
-                # Float check
-                float_shares = info.get('floatShares', 999_999_999)
-                if float_shares > pattern['max_float']:
-                    continue
-                
-                # Sector check
-                sector = info.get('sector', '')
-                if 'bio' not in sector.lower() and 'health' not in sector.lower():
-                    continue
-                
-                # Volume spike check
-                avg_volume = info.get('averageVolume', 1)
-                recent_volume = info.get('volume', 0)
-                volume_spike = recent_volume / avg_volume if avg_volume > 0 else 0
-                
-                if volume_spike < pattern['min_volume_spike']:
-                    continue
-                
-                # Calculate setup score
-                score = self._calculate_setup_score(ticker, pattern, {
-                    'price': price,
-                    'float': float_shares,
-                    'volume_spike': volume_spike
-                })
-                
-                matches.append({
-                    'ticker': ticker,
-                    'setup': 'RGC Pattern',
-                    'price': price,
-                    'float_m': float_shares / 1_000_000,
-                    'volume_spike': f"{volume_spike:.1f}x",
-                    'score': score,
-                    'why': f"Under ${pattern['max_price']}, {float_shares/1_000_000:.1f}M float, {volume_spike:.1f}x volume"
-                })
-                
-            except Exception as e:
-                continue
-        
-        matches.sort(key=lambda x: x['score'], reverse=True)
-        return matches
+            match = self._match_rgc_setup(ticker, data)
+            if match:
+                matches.append(match)
+        
+        return self._rank('rgc_setups', matches)
+    
+    def _match_rgc_setup(self, ticker: str, data: Dict) -> Optional[Dict[str, Any]]:
+        """RGC criteria for one ticker (None = no match)"""
+        pattern = self.patterns['rgc_pattern']['criteria']
+        
+        try:
+            info = data['info'].get(ticker, {})
+            
+            # Price check
+            price = info.get('currentPrice', info.get('regularMarketPrice', 999))
+            if price > pattern['max_price']:
+                return None
+            
+            # Float check
+            float_shares = info.get('floatShares', 999_999_999)
+            if float_shares > pattern['max_float']:
+                return None
+            
+            # Sector check
+            sector = info.get('sector', '')
+            if 'bio' not in sector.lower() and 'health' not in sector.lower():
+                return None
+            
+            # Volume spike check
+            avg_volume = info.get('averageVolume', 1)
+            recent_volume = info.get('volume', 0)
+            volume_spike = recent_volume / avg_volume if avg_volume > 0 else 0
+            
+            if volume_spike < pattern['min_volume_spike']:
+                return None
+            
+            # Calculate setup score
+            score = self._calculate_setup_score(ticker, pattern, {
+                'price': price,
+                'float': float_shares,
+                'volume_spike': volume_spike
+            })
+            
+            return {
+                'ticker': ticker,
+                'setup': 'RGC Pattern',
+                'price': price,
+                'float_m': float_shares / 1_000_000,
+                'volume_spike': f"{volume_spike:.1f}x",
+                'score': score,
+                'why': f"Under ${pattern['max_price']}, {float_shares/1_000_000:.1f}M float, {volume_spike:.1f}x volume"
+            }
+            
+        except Exception as e:
+            return None
     
-    def hunt_phase3_catalysts(self) -> List[Dict[str, Any]]:
+    def hunt_phase3_catalysts(self, data: Optional[Dict] = None) -> List[Dict[str, Any]]:
         """
         Find biotechs with Phase 3 trials completing in next 90 days.
         
@@ -178,34 +236,42 @@ class SetupHunter:
         # TODO: Parse biotech news for trial readout dates
         
         # For now, scan for biotechs with Phase 3 mentions + low price
+        data = data or self.load_universe_data()
         matches = []
         
         for ticker in self.universe:
-            try:
-                stock = yf.Ticker(ticker)
-                info = stock.info
-                
-                price = info.get('currentPrice', info.get('regularMarketPrice', 999))
-                if price > 5.0:  # Phase 3 biotechs under $5
-                    continue
-                
-                # Check business summary for "Phase 3"
-                summary = info.get('longBusinessSummary', '').lower()
-                if 'phase 3' in summary or 'phase iii' in summary:
-                    matches.append({
-                        'ticker': ticker,
-                        'setup': 'Phase 3 Catalyst',
-                        'price': price,
-                        'market_cap': info.get('marketCap', 0) / 1_000_000,
-                        'why': 'Phase 3 program active, under $5'
-                    })
-                
-            except Exception as e:
-                continue
+            match = self._match_phase3_catalyst(ticker, data)
+            if match:
+                matches.append(match)
         
-        return matches
+        return self._rank('phase3_catalysts', matches)
+    
+    def _match_phase3_catalyst(self, ticker: str, data: Dict) -> Optional[Dict[str, Any]]:
+        """Phase 3 criteria for one ticker (None = no match)"""
+        try:
+            info = data['info'].get(ticker, {})
+            
+            price = info.get('currentPrice', info.get('regularMarketPrice', 999))
+            if price > 5.0:  # Phase 3 biotechs under $5
+                return None
+            
+            # Check business summary for "Phase 3"
+            summary = info.get('longBusinessSummary', '').lower()
+            if 'phase 3' in summary or 'phase iii' in summary:
+                return {
+                    'ticker': ticker,
+                    'setup': 'Phase 3 Catalyst',
+                    'price': price,
+                    'market_cap': info.get('marketCap', 0) / 1_000_000,
+                    'why': 'Phase 3 program active, under $5'
+                }
+            
+        except Exception as e:
+            pass
+        
+        return None
     
-    def hunt_beaten_down_with_catalyst(self) -> List[Dict[str, Any]]:
+    def hunt_beaten_down_with_catalyst(self, data: Optional[Dict] = None) -> List[Dict[str, Any]]:
         """
         Find tickers down 50%+ from high with catalyst ahead.
         
@@ -214,51 +280,55 @@ class SetupHunter:
         """
         print("🎯 HUNTING FOR BEATEN-DOWN TICKERS WITH CATALYSTS...")
         
+        data = data or self.load_universe_data()
         matches = []
         
         for ticker in self.universe:
-            try:
-                stock = yf.Ticker(ticker)
-                info = stock.info
-                hist = stock.history(period='1y')
-                
-                if hist.empty:
-                    continue
-                
-                # Calculate drawdown from 52-week high
-                current_price = info.get('currentPrice', info.get('regularMarketPrice', 0))
-                high_52w = hist['High'].max()
-                
-                if high_52w == 0:
-                    continue
-                
-                drawdown_pct = ((high_52w - current_price) / high_52w) * 100
-                
-                if drawdown_pct < 50:  # Want 50%+ drawdown
-                    continue
-                
-                # Check for upcoming catalyst (earnings, FDA date, etc.)
-                # TODO: Integrate earnings calendar API
-                # TODO: Check FDA PDUFA calendar
-                # TODO: Parse news for catalyst mentions
-                
-                matches.append({
-                    'ticker': ticker,
-                    'setup': 'Beaten-Down + Catalyst',
-                    'price': current_price,
-                    'high_52w': high_52w,
-                    'drawdown_pct': f"{drawdown_pct:.1f}%",
-                    'sector': info.get('sector', 'Unknown'),
-                    'why': f"Down {drawdown_pct:.0f}% from high, potential recovery"
-                })
-                
-            except Exception as e:
-                continue
-        
-        matches.sort(key=lambda x: float(x['drawdown_pct'].rstrip('%')), reverse=True)
-        return matches
+            match = self._match_beaten_down(ticker, data)
+            if match:
+                matches.append(match)
+        
+        return self._rank('beaten_down_catalyst', matches)
     
-    def hunt_insider_buying_clusters(self) -> List[Dict[str, Any]]:
+    def _match_beaten_down(self, ticker: str, data: Dict) -> Optional[Dict[str, Any]]:
+        """Beaten-down criteria for one ticker (None = no match)"""
+        try:
+            info = data['info'].get(ticker, {})
+            high_52w = data['high_52w'].get(ticker)
+            
+            if high_52w is None:
+                return None
+            
+            # Calculate drawdown from 52-week high
+            current_price = info.get('currentPrice', info.get('regularMarketPrice', 0))
+            
+            if high_52w == 0:
+                return None
+            
+            drawdown_pct = ((high_52w - current_price) / high_52w) * 100
+            
+            if drawdown_pct < 50:  # Want 50%+ drawdown
+                return None
+            
+            # Check for upcoming catalyst (earnings, FDA date, etc.)
+            # TODO: Integrate earnings calendar API
+            # TODO: Check FDA PDUFA calendar
+            # TODO: Parse news for catalyst mentions
+            
+            return {
+                'ticker': ticker,
+                'setup': 'Beaten-Down + Catalyst',
+                'price': current_price,
+                'high_52w': high_52w,
+                'drawdown_pct': f"{drawdown_pct:.1f}%",
+                'sector': info.get('sector', 'Unknown'),
+                'why': f"Down {drawdown_pct:.0f}% from high, potential recovery"
+            }
+            
+        except Exception as e:
+            return None
+    
+    def hunt_insider_buying_clusters(self, data: Optional[Dict] = None) -> List[Dict[str, Any]]:
         """
         Find tickers with RECENT insider buying clusters.
         
@@ -276,6 +346,14 @@ class SetupHunter:
         print("   ⚠️ TODO: Integrate SEC Form 4 real-time scraping")
         return []
     
+    def _rank(self, hunt: str, matches: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Order a hunt's matches the way its report expects"""
+        if hunt == 'rgc_setups':
+            matches.sort(key=lambda x: x['score'], reverse=True)
+        elif hunt == 'beaten_down_catalyst':
+            matches.sort(key=lambda x: float(x['drawdown_pct'].rstrip('%')), reverse=True)
+        return matches
+    
     def _calculate_setup_score(self, ticker: str, pattern: Dict, data: Dict) -> int:
         """
         Calculate how well ticker matches pattern setup.
@@ -317,6 +395,9 @@ class SetupHunter:
         2. Phase 3 catalysts in next 90 days
         3. Beaten-down with catalyst ahead
         4. Insider buying clusters
+        
+        The universe is loaded once and every hunt's criteria are checked
+        in a single pass over it, so a full run costs one universe fetch.
         """
         print("\n" + "="*70)
         print("🐺 SETUP HUNTER - FORWARD-LOOKING PATTERN SCANNER")
@@ -324,19 +405,28 @@ class SetupHunter:
         print("We don't study what DID happen. We find what WILL happen.")
         print()
         
-        results = {}
-        
-        # Hunt for each pattern type
-        results['rgc_setups'] = self.hunt_rgc_setups()
-        print()
-        
-        results['phase3_catalysts'] = self.hunt_phase3_catalysts()
-        print()
-        
-        results['beaten_down_catalyst'] = self.hunt_beaten_down_with_catalyst()
-        print()
-        
-        results['insider_buying'] = self.hunt_insider_buying_clusters()
+        # One universe load shared by every hunt
+        print(f"📥 Loading {len(self.universe)} tickers (one bulk history fetch + cached fundamentals)...")
+        data = self.load_universe_data()
+        
+        results = {hunt: [] for hunt in self.hunts}
+        
+        # Insider lookups are I/O-bound - run them while the criteria pass runs
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            insider = executor.submit(self.hunt_insider_buying_clusters, data)
+            
+            # Single pass: every hunt's criteria against each ticker
+            for ticker in self.universe:
+                for hunt, match_ticker in self.hunts.items():
+                    match = match_ticker(ticker, data)
+                    if match:
+                        results[hunt].append(match)
+            
+            results['insider_buying'] = insider.result()
+        
+        for hunt in self.hunts:
+            self._rank(hunt, results[hunt])
+            print(f"🎯 {hunt}: {len(results[hunt])} matches")
         print()
         
         return results
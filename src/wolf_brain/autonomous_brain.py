@@ -36,7 +36,7 @@ import threading
 from datetime import datetime, timedelta, time as dtime
 from typing import Dict, List, Optional, Tuple, Any
 import argparse
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import random
 
 # ============ DEPENDENCIES ============
@@ -73,6 +73,15 @@ try:
 except ImportError:
     print("[WARN] pip install python-dotenv (will use environment variables)")
 
+# Shared utilities (batched market data)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'wolfpack'))
+from utils.market_data import get_market_data_service
+from utils.fundamentals_cache import get_fundamentals_cache
+from utils.http_client import get_http_client, run_concurrently
+from utils.rate_limiter import Priority
+from utils.cassette import install as install_cassette, install_from_env
+from utils.shared_quotes import get_live_quote
+
 # Load strategy modules
 sys.path.insert(0, os.path.dirname(__file__))
 try:
@@ -113,6 +122,14 @@ print(f"   Alpha Vantage: {'✅' if ALPHAVANTAGE_KEY else '❌'}")
 print(f"   Polygon: {'✅' if POLYGON_KEY else '❌'}")
 print(f"   SEC Edgar: {'✅' if SEC_USER_AGENT else '❌'}")
 
+# 4AM premarket scanner
+PREMARKET_MIN_GAP = 5.0            # % gap that gets a ticker deep research
+PREMARKET_RESEARCH_WORKERS = 8     # Gappers researched in parallel
+
+# Tiered universe (universe_scanner.UniverseTiers)
+TIER_TICK_SECONDS = 60             # Due tiers are refreshed this often while sleeping
+MARKET_HOURS_RESEARCH = 20         # Hot/warm names researched per market-hours scan
+
 # Ollama
 OLLAMA_URL = "http://localhost:11434"
 OLLAMA_MODEL = "fenrir:latest"
@@ -289,6 +306,10 @@ class AutonomousBrain:
         # MOMENTUM TRACKING - Track tickers across multiple scans for sustained runners
         self.momentum_tracker = {}  # {ticker: [scan_data1, scan_data2, ...]}
         self.sustained_runners = []  # Tickers with sustained strength across multiple scans
+        self.price_context = {}  # {ticker: day's history/fundamentals behind live quotes}
+        
+        # TIERED UNIVERSE - hot/warm/cold cadences instead of rescanning fixed lists
+        self.universe_tiers = self._init_universe_tiers()
         
         # Strategy modules
         if MODULES_AVAILABLE:
@@ -659,29 +680,37 @@ Be decisive. Give clear recommendations. If unsure, say WATCH not BUY.
             'confidence': 0.5
         }
         
-        # Get price data (yfinance)
-        research['price_data'] = self._get_price_data(ticker)
-        
-        # Get news (Finnhub + NewsAPI + Polygon)
-        research['news'] = self._get_news(ticker)
-        
-        # Get insider activity (Finnhub/SEC)
-        research['insider_activity'] = self._check_insider_activity(ticker)
-        
-        # Get additional data from Polygon (if API key available)
+        # Hit every source at once - total time is the slowest provider,
+        # not the sum of all of them
+        sources = {
+            'price_data': lambda: self._get_price_data(ticker),       # yfinance
+            'news': lambda: self._get_news(ticker),                   # Finnhub + NewsAPI + Polygon
+            'insider_activity': lambda: self._check_insider_activity(ticker),  # Finnhub/SEC
+        }
         if POLYGON_KEY:
-            research['polygon_data'] = self._get_polygon_data(ticker)
-            
-        # Get fundamentals from Alpha Vantage (if API key available)
+            sources['polygon_data'] = lambda: self._get_polygon_data(ticker)
         if ALPHAVANTAGE_KEY:
-            research['fundamentals'] = self._get_alpha_vantage_data(ticker)
-            
-        # Get SEC insider data
+            sources['fundamentals'] = lambda: self._get_alpha_vantage_data(ticker)
         if SEC_USER_AGENT:
-            sec_data = self._get_sec_insider_data(ticker)
-            if sec_data:
-                research['insider_activity'] = research['insider_activity'] or {}
-                research['insider_activity'].update(sec_data)
+            sources['sec_data'] = lambda: self._get_sec_insider_data(ticker)
+        
+        fetched = run_concurrently(sources)
+        for source, value in fetched.items():
+            if isinstance(value, Exception):
+                log.debug(f"{source} error for {ticker}: {value}")
+                fetched[source] = None
+        
+        research['price_data'] = fetched['price_data']
+        research['news'] = fetched['news'] or []
+        research['insider_activity'] = fetched['insider_activity']
+        research['polygon_data'] = fetched.get('polygon_data')
+        research['fundamentals'] = fetched.get('fundamentals')
+        
+        # Merge SEC insider data
+        sec_data = fetched.get('sec_data')
+        if sec_data:
+            research['insider_activity'] = research['insider_activity'] or {}
+            research['insider_activity'].update(sec_data)
         
         # Brain analysis
         if research['price_data']:
@@ -705,56 +734,81 @@ Be decisive. Give clear recommendations. If unsure, say WATCH not BUY.
         return research
     
     def _get_price_data(self, ticker: str) -> Optional[Dict]:
-        """Get price data from yfinance"""
+        """
+        Get price data: the live quote from the shared table when a feeder
+        is running, else yfinance. History/fundamentals are fetched once a day.
+        """
+        live = get_live_quote(ticker)
+        context = self.price_context.get(ticker)
+        if live and context and context['date'] == datetime.now().date():
+            return self._price_data_from(context, live['price'], live['change_pct'], live['volume'])
+        
         if not YF_AVAILABLE:
             return None
         
         try:
-            stock = yf.Ticker(ticker)
-            hist = stock.history(period='3mo')
+            hist = get_market_data_service().get_history(ticker, period='3mo')
             
             if hist.empty:
                 return None
             
-            info = stock.info
-            current = hist['Close'].iloc[-1]
-            
-            # Calculate metrics
-            high_52w = info.get('fiftyTwoWeekHigh', hist['High'].max())
-            low_52w = info.get('fiftyTwoWeekLow', hist['Low'].min())
-            off_high = (high_52w - current) / high_52w * 100
-            
-            # Volume analysis
-            avg_vol = hist['Volume'].mean()
-            curr_vol = hist['Volume'].iloc[-1]
-            rel_vol = curr_vol / avg_vol if avg_vol > 0 else 1
-            
-            # Trend
-            ma_20 = hist['Close'].rolling(20).mean().iloc[-1] if len(hist) >= 20 else current
-            ma_50 = hist['Close'].rolling(50).mean().iloc[-1] if len(hist) >= 50 else current
-            
-            return {
-                'price': float(current),
-                'change_1d': float((current - hist['Close'].iloc[-2]) / hist['Close'].iloc[-2] * 100) if len(hist) > 1 else 0,
-                'change_5d': float((current - hist['Close'].iloc[-5]) / hist['Close'].iloc[-5] * 100) if len(hist) > 5 else 0,
-                'high_52w': float(high_52w),
-                'low_52w': float(low_52w),
-                'off_high_pct': float(off_high),
-                'volume': int(curr_vol),
-                'avg_volume': int(avg_vol),
-                'rel_volume': float(rel_vol),
-                'ma_20': float(ma_20),
-                'ma_50': float(ma_50),
-                'above_ma20': current > ma_20,
-                'above_ma50': current > ma_50,
+            info = get_fundamentals_cache().get_info(
+                ticker, fields=['fiftyTwoWeekHigh', 'fiftyTwoWeekLow', 'marketCap', 'floatShares', 'shortPercentOfFloat']
+            )
+            closes = hist['Close']
+            context = {
+                'date': datetime.now().date(),
+                'high_52w': info.get('fiftyTwoWeekHigh', hist['High'].max()),
+                'low_52w': info.get('fiftyTwoWeekLow', hist['Low'].min()),
+                'close_5d': closes.iloc[-5] if len(hist) > 5 else None,
+                'avg_volume': hist['Volume'].mean(),
+                'ma_20': closes.rolling(20).mean().iloc[-1] if len(hist) >= 20 else None,
+                'ma_50': closes.rolling(50).mean().iloc[-1] if len(hist) >= 50 else None,
                 'market_cap': info.get('marketCap', 0),
                 'float_shares': info.get('floatShares', 0),
                 'short_pct': info.get('shortPercentOfFloat', 0) * 100 if info.get('shortPercentOfFloat') else 0
             }
+            self.price_context[ticker] = context
+            
+            # Quote table missed (no feeder, or stale): today's bar is the quote
+            current = closes.iloc[-1]
+            change_1d = (current - closes.iloc[-2]) / closes.iloc[-2] * 100 if len(hist) > 1 else 0
+            curr_vol = hist['Volume'].iloc[-1]
+            if live:
+                current, change_1d, curr_vol = live['price'], live['change_pct'], live['volume']
+            return self._price_data_from(context, current, change_1d, curr_vol)
         except Exception as e:
             log.error(f"Price data error {ticker}: {e}")
             return None
     
+    @staticmethod
+    def _price_data_from(context: Dict, current: float, change_1d: float, curr_vol: float) -> Dict:
+        """Price metrics for a quote against the day's context"""
+        high_52w = context['high_52w']
+        close_5d = context['close_5d']
+        avg_vol = context['avg_volume']
+        ma_20 = context['ma_20'] if context['ma_20'] is not None else current
+        ma_50 = context['ma_50'] if context['ma_50'] is not None else current
+        
+        return {
+            'price': float(current),
+            'change_1d': float(change_1d),
+            'change_5d': float((current - close_5d) / close_5d * 100) if close_5d else 0,
+            'high_52w': float(high_52w),
+            'low_52w': float(context['low_52w']),
+            'off_high_pct': float((high_52w - current) / high_52w * 100),
+            'volume': int(curr_vol),
+            'avg_volume': int(avg_vol),
+            'rel_volume': float(curr_vol / avg_vol) if avg_vol > 0 else 1,
+            'ma_20': float(ma_20),
+            'ma_50': float(ma_50),
+            'above_ma20': current > ma_20,
+            'above_ma50': current > ma_50,
+            'market_cap': context['market_cap'],
+            'float_shares': context['float_shares'],
+            'short_pct': context['short_pct']
+        }
+    
     def _get_news(self, ticker: str) -> List[Dict]:
         """Get recent news for ticker from ALL available APIs"""
         news = []
@@ -763,7 +817,7 @@ Be decisive. Give clear recommendations. If unsure, say WATCH not BUY.
         if FINNHUB_KEY:
             try:
                 url = f"https://finnhub.io/api/v1/company-news?symbol={ticker}&from={(datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d')}&to={datetime.now().strftime('%Y-%m-%d')}&token={FINNHUB_KEY}"
-                r = requests.get(url, timeout=5)
+                r = get_http_client().get(url, timeout=5, priority=Priority.LOW)
                 if r.status_code == 200:
                     for item in r.json()[:5]:
                         news.append({
@@ -779,7 +833,7 @@ Be decisive. Give clear recommendations. If unsure, say WATCH not BUY.
         if NEWSAPI_KEY and len(news) < 3:
             try:
                 url = f"https://newsapi.org/v2/everything?q={ticker}&sortBy=publishedAt&pageSize=5&apiKey={NEWSAPI_KEY}"
-                r = requests.get(url, timeout=5)
+                r = get_http_client().get(url, timeout=5, priority=Priority.LOW)
                 if r.status_code == 200:
                     for item in r.json().get('articles', [])[:3]:
                         news.append({
@@ -795,7 +849,7 @@ Be decisive. Give clear recommendations. If unsure, say WATCH not BUY.
         if POLYGON_KEY and len(news) < 3:
             try:
                 url = f"https://api.polygon.io/v2/reference/news?ticker={ticker}&limit=5&apiKey={POLYGON_KEY}"
-                r = requests.get(url, timeout=5)
+                r = get_http_client().get(url, timeout=5, priority=Priority.LOW)
                 if r.status_code == 200:
                     for item in r.json().get('results', [])[:3]:
                         news.append({
@@ -825,7 +879,7 @@ Be decisive. Give clear recommendations. If unsure, say WATCH not BUY.
         try:
             # Get ticker details
             url = f"https://api.polygon.io/v3/reference/tickers/{ticker}?apiKey={POLYGON_KEY}"
-            r = requests.get(url, timeout=5)
+            r = get_http_client().get(url, timeout=5, priority=Priority.LOW)
             if r.status_code == 200:
                 data = r.json().get('results', {})
                 return {
@@ -849,7 +903,7 @@ Be decisive. Give clear recommendations. If unsure, say WATCH not BUY.
         try:
             # Company overview
             url = f"https://www.alphavantage.co/query?function=OVERVIEW&symbol={ticker}&apikey={ALPHAVANTAGE_KEY}"
-            r = requests.get(url, timeout=5)
+            r = get_http_client().get(url, timeout=5, priority=Priority.LOW)
             if r.status_code == 200:
                 data = r.json()
                 if 'Symbol' in data:
@@ -886,7 +940,7 @@ Be decisive. Give clear recommendations. If unsure, say WATCH not BUY.
             
             if FINNHUB_KEY:
                 url = f"https://finnhub.io/api/v1/stock/insider-transactions?symbol={ticker}&token={FINNHUB_KEY}"
-                r = requests.get(url, timeout=5)
+                r = get_http_client().get(url, timeout=5, priority=Priority.LOW)
                 if r.status_code == 200:
                     transactions = r.json().get('data', [])
                     buys = sum(1 for t in transactions if t.get('transactionCode') == 'P')
@@ -912,7 +966,7 @@ Be decisive. Give clear recommendations. If unsure, say WATCH not BUY.
             # Use Finnhub insider sentiment as proxy
             if FINNHUB_KEY:
                 url = f"https://finnhub.io/api/v1/stock/insider-sentiment?symbol={ticker}&from={(datetime.now() - timedelta(days=90)).strftime('%Y-%m-%d')}&to={datetime.now().strftime('%Y-%m-%d')}&token={FINNHUB_KEY}"
-                r = requests.get(url, timeout=5)
+                r = get_http_client().get(url, timeout=5, priority=Priority.LOW)
                 if r.status_code == 200:
                     data = r.json().get('data', [])
                     if data:
@@ -1040,7 +1094,8 @@ If BUY, explain why and give specific prices.
                 log.info(f"🔥 FDA CATALYST TODAY: {ticker} - {drug} ({notes})")
                 todays_fda_plays.append(ticker)
         
-        # PHASE 2: Scan ALL sectors for gaps
+        # PHASE 2: Build the scan universe - priority names first, then
+        # every sector list and the full scanner universe (no cap)
         scan_targets = []
         
         # Priority 1: FDA plays today
@@ -1055,10 +1110,10 @@ If BUY, explain why and give specific prices.
         # Priority 4: Low float biotech (biggest runners)
         scan_targets.extend(UNIVERSE.get('low_float_biotech', []))
         
-        # Priority 5: Hot sectors
-        scan_targets.extend(UNIVERSE.get('defense_space', [])[:5])
-        scan_targets.extend(UNIVERSE.get('nuclear', [])[:3])
-        scan_targets.extend(UNIVERSE.get('ai_quantum', [])[:3])
+        # Priority 5: Every other sector
+        for tickers in UNIVERSE.values():
+            scan_targets.extend(tickers)
+        scan_targets.extend(self._get_scanner_universe())
         
         # Remove duplicates, keep order
         seen = set()
@@ -1070,34 +1125,33 @@ If BUY, explain why and give specific prices.
         
         log.info(f"📊 Scanning {len(unique_targets)} targets...")
         
-        # PHASE 3: Check each ticker for gap
-        for ticker in unique_targets[:50]:  # Limit to 50 for speed
-            try:
-                gap_data = self._check_premarket_gap(ticker)
-                
-                if gap_data and gap_data['gap_pct'] >= 5:  # 5%+ gap
-                    log.info(f"🚀 GAP DETECTED: {ticker} +{gap_data['gap_pct']:.1f}%")
-                    
-                    # Full research on gapper
-                    research = self.research_ticker(ticker)
-                    
-                    # Classify: RUNNER or FADER?
-                    classification = self._classify_runner_vs_fader(ticker, gap_data, research)
-                    
-                    research['gap_data'] = gap_data
-                    research['classification'] = classification
-                    
-                    if classification['verdict'] == 'RUNNER':
-                        runners.append(research)
-                        log.info(f"✅ RUNNER CANDIDATE: {ticker} - {classification['reason']}")
-                    else:
-                        faders.append(research)
-                        log.info(f"⚠️  FADE CANDIDATE: {ticker} - {classification['reason']}")
+        # PHASE 3: Bulk quote sweep - whole universe in two batched downloads
+        gappers = self._sweep_premarket_gaps(unique_targets, min_gap=PREMARKET_MIN_GAP)
+        log.info(f"🔎 Sweep found {len(gappers)} gappers (+{PREMARKET_MIN_GAP:.0f}%)")
+        
+        # PHASE 4: Deep research on the gappers, in parallel
+        with ThreadPoolExecutor(max_workers=PREMARKET_RESEARCH_WORKERS) as executor:
+            futures = {executor.submit(self._research_gapper, ticker): ticker for ticker in gappers}
+            
+            for future in as_completed(futures):
+                ticker = futures[future]
+                try:
+                    research = future.result()
+                except Exception as e:
+                    log.debug(f"Scan error {ticker}: {e}")
+                    continue
                 
-                time.sleep(0.2)  # Rate limit
+                if research is None:
+                    continue
                 
-            except Exception as e:
-                log.debug(f"Scan error {ticker}: {e}")
+                classification = research['classification']
+                log.info(f"🚀 GAP DETECTED: {ticker} +{research['gap_data']['gap_pct']:.1f}%")
+                if classification['verdict'] == 'RUNNER':
+                    runners.append(research)
+                    log.info(f"✅ RUNNER CANDIDATE: {ticker} - {classification['reason']}")
+                else:
+                    faders.append(research)
+                    log.info(f"⚠️  FADE CANDIDATE: {ticker} - {classification['reason']}")
         
         # Sort runners by conviction
         runners.sort(key=lambda x: x.get('confidence', 0), reverse=True)
@@ -1120,21 +1174,177 @@ If BUY, explain why and give specific prices.
         
         return runners
     
+    def _init_universe_tiers(self):
+        """
+        Hot/warm/cold scheduler over UNIVERSE + the UniverseManager universe,
+        with FDA_CALENDAR dates as catalysts. UNIVERSE starts warm, so the
+        first hunt covers the whole watchlist. None if unavailable.
+        """
+        try:
+            from universe_scanner import UniverseManager, UniverseTiers
+            
+            manager = UniverseManager()
+            for sector, tickers in UNIVERSE.items():
+                manager.add_dynamic_tickers(f'brain_{sector}', tickers)
+            
+            tiers = UniverseTiers(manager)
+            tiers.seed([t for tickers in UNIVERSE.values() for t in tickers], 'warm')
+            for ticker, info in FDA_CALENDAR.items():
+                tiers.set_catalyst(ticker, info['date'])
+            
+            log.info(f"🌡️  Universe tiers: {tiers.summary()}")
+            return tiers
+        except Exception as e:
+            log.debug(f"Universe tiers unavailable: {e}")
+            return None
+    
+    def _tiered_scan_targets(self) -> Optional[List[str]]:
+        """
+        Hot then warm tickers for a hunt, None without tiers (or if both
+        are empty). Doesn't spend tier budget - _sleep_with_tier_refresh
+        already refreshes due names between hunts, including cold ones,
+        and promotes any that start moving.
+        """
+        if not self.universe_tiers:
+            return None
+        self._sync_tier_positions()
+        targets = self.universe_tiers.members('hot') + self.universe_tiers.members('warm')
+        return targets or None
+    
+    def _sync_tier_positions(self):
+        """Held positions stay hot; closed ones are released"""
+        held = set(self.positions)
+        for ticker in held - self.universe_tiers.pinned:
+            self.universe_tiers.pin(ticker)
+        for ticker in self.universe_tiers.pinned - held:
+            self.universe_tiers.unpin(ticker)
+    
+    def _refresh_universe_tiers(self):
+        """One refresh round: bulk-refresh due tickers, log tier changes"""
+        self._sync_tier_positions()
+        self.universe_tiers.sync()
+        
+        # Premarket moves only show up in extended-hours prints
+        status = self.get_market_status()
+        measure = self._measure_premarket_gaps if status.startswith('PREMARKET') else None
+        changes = self.universe_tiers.refresh(measure=measure)
+        
+        for ticker, (before, after) in changes.items():
+            if after == 'hot':
+                log.info(f"🔥 {ticker} promoted {before} → hot")
+            else:
+                log.debug(f"   {ticker}: {before} → {after}")
+    
+    def _measure_premarket_gaps(self, tickers: List[str]) -> Dict[str, Tuple[float, Optional[float]]]:
+        """Premarket gap for every ticker (bulk sweep, no minimum)"""
+        gaps = self._sweep_premarket_gaps(tickers, min_gap=float('-inf'))
+        return {ticker: (gap, None) for ticker, gap in gaps.items()}
+    
+    def _sleep_with_tier_refresh(self, seconds: float):
+        """
+        Sleep until the next cycle, refreshing due tiers every
+        TIER_TICK_SECONDS so hot names keep their short cadence while
+        cold names wait their turn.
+        """
+        if not self.universe_tiers or self.get_market_status() in ('OVERNIGHT', 'CLOSED_WEEKEND'):
+            time.sleep(seconds)
+            return
+        
+        deadline = time.time() + seconds
+        while self.running and time.time() < deadline:
+            try:
+                self._refresh_universe_tiers()
+            except Exception as e:
+                log.debug(f"Tier refresh error: {e}")
+            time.sleep(max(0, min(TIER_TICK_SECONDS, deadline - time.time())))
+    
+    def _get_scanner_universe(self) -> List[str]:
+        """Full UniverseManager ticker list (sorted), empty if unavailable"""
+        try:
+            from universe_scanner import UniverseManager
+            return sorted(UniverseManager().get_full_universe())
+        except Exception as e:
+            log.debug(f"Universe manager unavailable: {e}")
+            return []
+    
+    def _sweep_premarket_gaps(self, tickers: List[str], min_gap: float = PREMARKET_MIN_GAP) -> Dict[str, float]:
+        """
+        Phase one of the 4AM scan: bulk quote sweep.
+        
+        One batched daily download (previous closes) and one batched
+        extended-hours intraday download (latest premarket print) cover the
+        whole universe. Same gap math as _check_premarket_gap, with the last
+        premarket bar standing in for preMarketPrice.
+        
+        Returns:
+            {ticker: gap_pct} for tickers gapping at least min_gap, in input order
+        """
+        market_data = get_market_data_service()
+        daily = market_data.get_panel(tickers, period='5d')
+        intraday = market_data.get_panel(tickers, period='1d', interval='5m', prepost=True)
+        
+        daily_tickers = set(daily.columns.get_level_values(0)) if not daily.empty else set()
+        intraday_tickers = set(intraday.columns.get_level_values(0)) if not intraday.empty else set()
+        
+        gappers = {}
+        for ticker in tickers:
+            if ticker not in daily_tickers:
+                continue
+            
+            closes = daily[ticker]['Close'].dropna()
+            if len(closes) < 2:
+                continue
+            
+            prev_close = closes.iloc[-2]
+            latest = closes.iloc[-1]
+            
+            if ticker in intraday_tickers:
+                premarket = intraday[ticker]['Close'].dropna()
+                if len(premarket) > 0 and premarket.iloc[-1] > 0:
+                    latest = premarket.iloc[-1]
+            
+            if prev_close <= 0:
+                continue
+            
+            gap_pct = ((latest - prev_close) / prev_close) * 100
+            if gap_pct >= min_gap:
+                gappers[ticker] = gap_pct
+        
+        return gappers
+    
+    def _research_gapper(self, ticker: str) -> Optional[Dict]:
+        """
+        Phase two of the 4AM scan: confirm the gap (float, market cap,
+        preMarketPrice), then full research and runner/fader classification.
+        
+        Returns:
+            research dict with gap_data and classification, or None if the gap
+            didn't hold up
+        """
+        gap_data = self._check_premarket_gap(ticker)
+        if not gap_data or gap_data['gap_pct'] < PREMARKET_MIN_GAP:
+            return None
+        
+        research = self.research_ticker(ticker)
+        classification = self._classify_runner_vs_fader(ticker, gap_data, research)
+        
+        research['gap_data'] = gap_data
+        research['classification'] = classification
+        return research
+    
     def _check_premarket_gap(self, ticker: str) -> Optional[Dict]:
         """Check if ticker has premarket gap"""
         try:
-            stock = yf.Ticker(ticker)
-            
-            # Get yesterday's close and current price
-            hist = stock.history(period='5d')
+            # Get yesterday's close and current price (from the bulk sweep cache)
+            hist = get_market_data_service().get_history(ticker, period='5d')
             if len(hist) < 2:
                 return None
             
             prev_close = hist['Close'].iloc[-2]
             current = hist['Close'].iloc[-1]
             
-            # Try to get premarket price (if available)
-            info = stock.info
+            # Try to get premarket price (if available) - cached for under a minute
+            info = get_fundamentals_cache().get_info(ticker, fields=['preMarketPrice', 'floatShares', 'marketCap'])
             premarket_price = info.get('preMarketPrice', current)
             
             if premarket_price and premarket_price > 0:
@@ -1362,7 +1572,7 @@ If BUY, explain why and give specific prices.
     
     # ============ REAL PREMARKET GAINER SCANNER ============
     
-    def scan_real_premarket_gainers(self) -> List[Dict]:
+    def scan_real_premarket_gainers(self, tickers: Optional[List[str]] = None) -> List[Dict]:
         """
         🔥 HUNT THE REAL MOVERS - NOT JUST WATCHLIST
         
@@ -1373,6 +1583,9 @@ If BUY, explain why and give specific prices.
         1. Yahoo Finance screener
         2. Finnhub (if available)
         3. Cross-reference with our watchlist
+        
+        tickers: scan only these (e.g. the hot and warm tiers) instead of
+        every UNIVERSE sector
         """
         log.info("=" * 60)
         log.info("🔥 REAL PREMARKET GAINER SCANNER")
@@ -1399,9 +1612,12 @@ If BUY, explain why and give specific prices.
         ]
         
         # Build ticker list from ALL sectors
-        for sector in priority_order:
-            if sector in UNIVERSE:
-                hot_sectors.extend(UNIVERSE[sector])
+        if tickers is not None:
+            hot_sectors.extend(tickers)
+        else:
+            for sector in priority_order:
+                if sector in UNIVERSE:
+                    hot_sectors.extend(UNIVERSE[sector])
         
         # Remove duplicates while keeping priority order
         seen = set()
@@ -1419,6 +1635,8 @@ If BUY, explain why and give specific prices.
         for ticker in hot_sectors:
             try:
                 gap = self._check_premarket_gap(ticker)
+                if gap and self.universe_tiers:
+                    self.universe_tiers.record(ticker, gap.get('gap_pct'), gap.get('relative_volume'))
                 if gap and gap.get('gap_pct', 0) >= 3:  # 3%+ gap
                     gainers.append({
                         'ticker': ticker,
@@ -1664,17 +1882,22 @@ The pack hunts at 4 AM.
         
         opportunities = []
         
-        # Quick scan of all sectors
+        # Hot names first, then warm (tiers keep these current between cycles)
         all_tickers = []
-        for sector, tickers in UNIVERSE.items():
-            all_tickers.extend(tickers[:5])  # Top 5 from each
+        if self.universe_tiers:
+            all_tickers = self.universe_tiers.members('hot') + self.universe_tiers.members('warm')
         
-        # Remove duplicates
-        all_tickers = list(set(all_tickers))
+        # Quick scan of all sectors
+        if not all_tickers:
+            for sector, tickers in UNIVERSE.items():
+                all_tickers.extend(tickers[:5])  # Top 5 from each
+            
+            # Remove duplicates
+            all_tickers = list(set(all_tickers))
         
         # Parallel scanning for speed
         with ThreadPoolExecutor(max_workers=5) as executor:
-            results = list(executor.map(self.research_ticker, all_tickers[:20]))
+            results = list(executor.map(self.research_ticker, all_tickers[:MARKET_HOURS_RESEARCH]))
         
         for research in results:
             if research and research['decision'] == 'BUY':
@@ -2736,9 +2959,9 @@ Keep it brief - key learnings only.
 
 """
         
-        # Scan for gainers
+        # Scan for gainers - the hot and warm tiers
         try:
-            gainers = self.scan_real_premarket_gainers()
+            gainers = self.scan_real_premarket_gainers(tickers=self._tiered_scan_targets())
             
             if gainers:
                 hunt_entry += f"📊 FOUND {len(gainers)} STOCKS GAPPING 3%+:\n\n"
@@ -2854,7 +3077,7 @@ Keep it brief - key learnings only.
                     sleep_time = 3600  # 1 hour overnight/weekend
                 
                 log.info(f"💤 Sleeping {sleep_time//60} minutes until next cycle...")
-                time.sleep(sleep_time)
+                self._sleep_with_tier_refresh(sleep_time)
                 
             except KeyboardInterrupt:
                 log.info("🛑 Shutdown requested")
@@ -2876,9 +3099,22 @@ def main():
     parser.add_argument('--report', action='store_true', help='Generate INTEL REPORT now')
     parser.add_argument('--gainers', action='store_true', help='Scan for real premarket gainers')
     parser.add_argument('--analyze', type=str, help='Analyze a specific ticker')
+    parser.add_argument('--record', type=str, metavar='CASSETTE', help='Record every API response to a cassette')
+    parser.add_argument('--replay', type=str, metavar='CASSETTE', help='Run offline from a recorded cassette')
+    parser.add_argument('--latency', type=str, default='0',
+                        help="Replay latency per response in seconds, or 'recorded'")
     
     args = parser.parse_args()
     
+    if args.record or args.replay:
+        latency = args.latency if args.latency == 'recorded' else float(args.latency)
+        cassette = install_cassette(args.record or args.replay,
+                                    mode='record' if args.record else 'replay',
+                                    latency=latency)
+        log.info(f"📼 Cassette {cassette.mode}: {cassette.path}")
+    else:
+        install_from_env()  # CASSETTE_MODE=record|replay
+    
     print("""
     ╔══════════════════════════════════════════════════════════════╗
     ║                                                              ║
@@ -14,10 +14,11 @@ IMPROVEMENTS FROM ORIGINAL:
 Author: Wolf Pack Trading System
 """
 
-import yfinance as yf
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
+import hashlib
 import json
 import os
 import sys
@@ -31,6 +32,16 @@ except ImportError:
     print("⚠️  biotech_catalyst_scanner not found, using fallback")
     BiotechCatalystScanner = None
 
+# Shared utilities (cached fundamentals, batched price history)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'wolfpack'))
+from utils.fundamentals_cache import get_fundamentals_cache
+from utils.market_data import get_market_data_service
+
+# .info fields the scorers read
+INFO_FIELDS = ["floatShares", "sharesOutstanding", "marketCap", "totalRevenue", "shortPercentOfFloat"]
+
+SCAN_WORKERS = 8
+
 
 class PrePopScorer:
     """Scores stocks on 6 pre-explosion factors"""
@@ -38,8 +49,28 @@ class PrePopScorer:
     def __init__(self, db_path: str = "../../data/wolf_brain/autonomous_memory.db"):
         self.db_path = db_path
         self.biotech_scanner = BiotechCatalystScanner() if BiotechCatalystScanner else None
+        self.fundamentals = get_fundamentals_cache()
+        self.market_data = get_market_data_service()
+    
+    def load_inputs(self, ticker: str) -> Dict:
+        """
+        Everything the six _score_* components read, fetched once:
+        info snapshot, 3mo bars (float/compression) and 1y bars (uncertainty)
+        """
+        return {
+            "info": self.fundamentals.get_info(ticker, fields=INFO_FIELDS),
+            "hist": self.market_data.get_history(ticker, period="3mo"),
+            "year_hist": self.market_data.get_history(ticker, period="1y"),
+        }
     
-    def score_stock(self, ticker: str) -> Dict:
+    def get_catalysts(self) -> List[Dict]:
+        """Upcoming catalysts (90 days) - one lookup shared by every ticker"""
+        if not self.biotech_scanner:
+            return []
+        return self.biotech_scanner.get_upcoming_catalysts(days_ahead=90)
+    
+    def score_stock(self, ticker: str, inputs: Optional[Dict] = None,
+                    catalysts: Optional[List[Dict]] = None, verbose: bool = True) -> Dict:
         """
         Score a stock on all 6 factors:
         1. Float/Liquidity (amplification potential)
@@ -48,14 +79,19 @@ class PrePopScorer:
         4. Technical Compression (coiled spring)
         5. Insider Buying (smart money)
         6. Short Squeeze (additional fuel)
+        
+        inputs / catalysts: load_inputs() / get_catalysts() output when the
+        caller already has them (scan_universe shares them)
         """
-        print(f"🔍 Scoring {ticker}...")
+        if verbose:
+            print(f"🔍 Scoring {ticker}...")
         
         # Get stock data
         try:
-            stock = yf.Ticker(ticker)
-            info = stock.info
-            hist = stock.history(period="3mo")
+            if inputs is None:
+                inputs = self.load_inputs(ticker)
+            info = inputs["info"]
+            hist = inputs["hist"]
             
             if hist.empty:
                 return {"ticker": ticker, "error": "No data"}
@@ -77,11 +113,11 @@ class PrePopScorer:
         scores["float"] = float_score
         
         # 2. Catalyst Timing
-        catalyst_score = self._score_catalyst(ticker)
+        catalyst_score = self._score_catalyst(ticker, catalysts)
         scores["catalyst"] = catalyst_score
         
         # 3. Uncertainty Discount
-        uncertainty_score = self._score_uncertainty(info, stock, current_price)
+        uncertainty_score = self._score_uncertainty(info, inputs["year_hist"], current_price)
         scores["uncertainty"] = uncertainty_score
         
         # 4. Technical Compression
@@ -140,10 +176,11 @@ class PrePopScorer:
             "description": desc
         }
     
-    def _score_catalyst(self, ticker: str) -> Dict:
+    def _score_catalyst(self, ticker: str, catalysts: Optional[List[Dict]] = None) -> Dict:
         """Binary catalyst timing"""
         if self.biotech_scanner:
-            catalysts = self.biotech_scanner.get_upcoming_catalysts(days_ahead=90)
+            if catalysts is None:
+                catalysts = self.get_catalysts()
             ticker_catalyst = next((c for c in catalysts if c["ticker"] == ticker), None)
             
             if ticker_catalyst:
@@ -179,7 +216,7 @@ class PrePopScorer:
             "timing": "NO KNOWN CATALYST"
         }
     
-    def _score_uncertainty(self, info: Dict, stock: any, current_price: float) -> Dict:
+    def _score_uncertainty(self, info: Dict, year_hist: any, current_price: float) -> Dict:
         """High uncertainty = big discount = big upside"""
         market_cap = info.get("marketCap", 0)
         revenue = info.get("totalRevenue", 0)
@@ -188,7 +225,6 @@ class PrePopScorer:
         rev_ratio = revenue / market_cap if market_cap > 0 and revenue else 0
         
         # Distance from 52-week high
-        year_hist = stock.history(period="1y")
         if not year_hist.empty:
             high_52w = year_hist['High'].max()
             pct_from_high = ((current_price - high_52w) / high_52w) * 100
@@ -304,52 +340,135 @@ class PrePopScorer:
         else:
             return "❌ D (PASS)"
     
-    def scan_universe(self, tickers: List[str]) -> List[Dict]:
-        """Scan multiple tickers and rank"""
+    def scan_universe(self, tickers: List[str], workers: int = SCAN_WORKERS,
+                      skip_unchanged: bool = True) -> List[Dict]:
+        """
+        Scan multiple tickers in parallel and rank
+        
+        Price history comes from one bulk download and the catalyst calendar
+        from one lookup; workers only fetch (cached) fundamentals. Tickers whose
+        inputs match the last scan reuse that result instead of being rescored,
+        and all new results are written in one transaction.
+        """
         print(f"\n{'🐺'*20}")
         print(f"PRE-POP SCANNER - Scanning {len(tickers)} tickers")
         print(f"{'🐺'*20}\n")
         
+        tickers = list(dict.fromkeys(tickers))
+        self.market_data.prefetch(tickers, period="1y")
+        catalysts = self.get_catalysts()
+        previous = self._load_fingerprints() if skip_unchanged else {}
+        
+        def scan(ticker):
+            inputs = self.load_inputs(ticker)
+            fingerprint = self._fingerprint(ticker, inputs, catalysts)
+            cached = previous.get(ticker)
+            if cached and cached[0] == fingerprint:
+                return cached[1], fingerprint, False
+            return self.score_stock(ticker, inputs, catalysts, verbose=False), fingerprint, True
+        
         results = []
-        for ticker in tickers:
-            try:
-                result = self.score_stock(ticker)
-                if "error" not in result:
-                    results.append(result)
-                    self._store_result(result)
-            except Exception as e:
-                print(f"  ❌ {ticker}: {e}")
+        fresh = []
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(scan, t): t for t in tickers}
+            for future in as_completed(futures):
+                ticker = futures[future]
+                try:
+                    result, fingerprint, rescored = future.result()
+                except Exception as e:
+                    print(f"  ❌ {ticker}: {e}")
+                    continue
+                
+                if "error" in result:
+                    print(f"  ❌ {ticker}: {result['error']}")
+                    continue
+                
+                results.append(result)
+                if rescored:
+                    fresh.append((result, fingerprint))
+                    print(f"🔍 {ticker}: {result['total_score']} {result['grade']}")
+                else:
+                    print(f"⏭️  {ticker}: unchanged since last scan ({result['total_score']})")
+        
+        self._store_results(fresh)
         
         # Sort by score
         results.sort(key=lambda x: x.get("total_score", 0), reverse=True)
         
         return results
     
+    def _fingerprint(self, ticker: str, inputs: Dict, catalysts: List[Dict]) -> str:
+        """Hash of every input the score depends on (latest bar, info, catalyst)"""
+        hist = inputs["hist"]
+        year_hist = inputs["year_hist"]
+        if hist.empty:
+            return ""
+        
+        last = hist.iloc[-1]
+        parts = {
+            "bar": [str(hist.index[-1]), float(last["Close"]), float(last["Volume"]), len(hist)],
+            "year_high": float(year_hist["High"].max()) if not year_hist.empty else None,
+            "info": {k: inputs["info"].get(k) for k in INFO_FIELDS},
+            "catalyst": next((c for c in catalysts if c.get("ticker") == ticker), None),
+        }
+        encoded = json.dumps(parts, sort_keys=True, default=str)
+        return hashlib.sha1(encoded.encode()).hexdigest()
+    
+    def _init_tables(self, c):
+        c.execute('''CREATE TABLE IF NOT EXISTS prepop_scans (
+            id INTEGER PRIMARY KEY,
+            timestamp TEXT,
+            ticker TEXT,
+            price REAL,
+            total_score REAL,
+            catalyst_score REAL,
+            float_score REAL,
+            uncertainty_score REAL,
+            compression_score REAL,
+            insider_score REAL,
+            squeeze_score REAL,
+            catalyst_details TEXT,
+            grade TEXT
+        )''')
+        
+        # Last inputs/result per ticker (lets scan_universe skip unchanged tickers)
+        c.execute('''CREATE TABLE IF NOT EXISTS prepop_fingerprints (
+            ticker TEXT PRIMARY KEY,
+            fingerprint TEXT,
+            result TEXT,
+            updated_at TEXT
+        )''')
+    
+    def _load_fingerprints(self) -> Dict[str, tuple]:
+        """ticker -> (fingerprint, result) from the last scan"""
+        try:
+            conn = sqlite3.connect(self.db_path)
+            c = conn.cursor()
+            self._init_tables(c)
+            rows = c.execute("SELECT ticker, fingerprint, result FROM prepop_fingerprints").fetchall()
+            conn.close()
+            return {ticker: (fingerprint, json.loads(result)) for ticker, fingerprint, result in rows}
+        except Exception as e:
+            print(f"  ⚠️  Could not load previous scan: {e}")
+            return {}
+    
     def _store_result(self, result: Dict):
         """Store scan result in database"""
+        self._store_results([(result, None)])
+    
+    def _store_results(self, results: List[tuple]):
+        """Store (result, fingerprint) pairs in one transaction"""
+        if not results:
+            return
+        
         try:
             conn = sqlite3.connect(self.db_path)
             c = conn.cursor()
+            self._init_tables(c)
             
-            c.execute('''CREATE TABLE IF NOT EXISTS prepop_scans (
-                id INTEGER PRIMARY KEY,
-                timestamp TEXT,
-                ticker TEXT,
-                price REAL,
-                total_score REAL,
-                catalyst_score REAL,
-                float_score REAL,
-                uncertainty_score REAL,
-                compression_score REAL,
-                insider_score REAL,
-                squeeze_score REAL,
-                catalyst_details TEXT,
-                grade TEXT
-            )''')
-            
-            c.execute("""INSERT INTO prepop_scans VALUES (
+            c.executemany("""INSERT INTO prepop_scans VALUES (
                 NULL, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
-            )""", (
+            )""", [(
                 result["scan_time"],
                 result["ticker"],
                 result["price"],
@@ -362,12 +481,18 @@ class PrePopScorer:
                 result["squeeze"]["score"],
                 json.dumps(result["catalyst"]),
                 result["grade"]
-            ))
+            ) for result, _ in results])
+            
+            c.executemany(
+                "INSERT OR REPLACE INTO prepop_fingerprints VALUES (?, ?, ?, ?)",
+                [(result["ticker"], fingerprint, json.dumps(result, default=float), result["scan_time"])
+                 for result, fingerprint in results if fingerprint]
+            )
             
             conn.commit()
             conn.close()
         except Exception as e:
-            print(f"  ⚠️  Could not store result: {e}")
+            print(f"  ⚠️  Could not store results: {e}")
     
     def print_results(self, results: List[Dict], top_n: int = 10):
         """Print formatted results"""
@@ -30,6 +30,10 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 import logging
+import warnings
+
+import numpy as np
+import pandas as pd
 
 try:
     import yfinance as yf
@@ -37,8 +41,119 @@ try:
 except ImportError:
     YF_AVAILABLE = False
 
+# Shared utilities (batched bars, vectorized indicators)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', 'wolfpack'))
+from utils.market_data import get_market_data_service
+from utils.screener import panel_to_arrays
+from utils.indicators import batch_atr, batch_bollinger_bands
+
 log = logging.getLogger('wolf_brain')
 
+# Universe-wide compression scan
+HISTORY_PERIOD = '6mo'      # Enough bars for ATR / bandwidth percentiles
+SQUEEZE_LOOKBACK = 100      # Bars an ATR / bandwidth reading is ranked against
+SQUEEZE_PERCENTILE = 20     # Bottom 20% = squeezed
+
+
+def _percentile_rank(values: np.ndarray, lookback: int) -> np.ndarray:
+    """
+    Percentile (0-100) of each ticker's reading at the prior bar (column -2)
+    within its own previous `lookback` readings. NaN if there is no history.
+    """
+    if values.shape[1] < 2:
+        return np.full(values.shape[0], np.nan)
+    current = values[:, -2]
+    window = values[:, -(lookback + 1):-1]
+    valid = ~np.isnan(window)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        at_or_below = ((window <= current[:, None]) & valid).sum(axis=1)
+        rank = at_or_below / valid.sum(axis=1) * 100
+    return np.where(np.isnan(current), np.nan, rank)
+
+
+def compute_compression(arrays: Dict, days: int = 20, min_bars: int = 10) -> pd.DataFrame:
+    """
+    Compression metrics for every ticker at once.
+    
+    Args:
+        arrays: utils.screener.panel_to_arrays() output (ticker x day,
+                right-aligned; column -1 = today)
+        days: Bars in the compression window, today included (today is
+              excluded from the metrics - we want PRIOR compression)
+        
+    Returns:
+        DataFrame indexed by ticker with the same fields check_compression()
+        reports, plus atr_percentile, bb_bandwidth, bandwidth_percentile,
+        bb_squeeze and today's open/close/volume for check_breakout().
+    """
+    close, high, low = arrays['Close'], arrays['High'], arrays['Low']
+    opens, volume, bars = arrays['Open'], arrays['Volume'], arrays['bars']
+    n = len(arrays['tickers'])
+    
+    with warnings.catch_warnings(), np.errstate(invalid='ignore', divide='ignore'):
+        warnings.simplefilter('ignore', RuntimeWarning)
+        
+        # Prior window: the `days` most recent bars minus today
+        prior = slice(-days, -1)
+        prior_high, prior_low = high[:, prior], low[:, prior]
+        prior_volume = volume[:, prior]
+        
+        window_high = np.nanmax(prior_high, axis=1)
+        window_low = np.nanmin(prior_low, axis=1)
+        range_pct = np.where(window_low > 0, (window_high - window_low) / window_low * 100, 0.0)
+        
+        avg_volume = np.nanmean(prior_volume, axis=1)
+        prior_bars = np.minimum(bars, days) - 1
+        recent_vol = np.where(prior_bars >= 5, np.nanmean(prior_volume[:, -5:], axis=1), avg_volume)
+        vol_declining = recent_vol < avg_volume
+        
+        daily_ranges = (prior_high - prior_low) / prior_low * 100
+        avg_daily_range = np.nanmean(daily_ranges, axis=1)
+        
+        # Consecutive flat (<3% range) days counting back from yesterday
+        flat = (daily_ranges < 3)[:, ::-1]
+        flat_days = np.cumprod(flat, axis=1).sum(axis=1)
+        
+        # ATR and Bollinger bandwidth, ranked against their own history
+        atr = batch_atr(high, low, close, 14)
+        bands = batch_bollinger_bands(close, 20, 2)
+        bandwidth = (bands['upper'] - bands['lower']) / bands['middle'] * 100
+        atr_percentile = _percentile_rank(atr, SQUEEZE_LOOKBACK)
+        bandwidth_percentile = _percentile_rank(bandwidth, SQUEEZE_LOOKBACK)
+        
+        last = lambda values: values[:, -1] if values.shape[1] else np.full(n, np.nan)
+        prev = lambda values: values[:, -2] if values.shape[1] > 1 else np.full(n, np.nan)
+    
+    # Compression score (0-100, higher = better compression) - same rules as before
+    score = np.select([range_pct < 5, range_pct < 10, range_pct < 15], [40, 25, 10], default=0)
+    score += np.select([avg_daily_range < 2, avg_daily_range < 4, avg_daily_range < 6], [30, 20, 10], default=0)
+    score += np.where(vol_declining, 20, 0)
+    score += np.minimum(flat_days * 2, 10)
+    
+    # Squeeze: both bandwidth and ATR in the bottom of their own range
+    bb_squeeze = (bandwidth_percentile <= SQUEEZE_PERCENTILE) & (atr_percentile <= SQUEEZE_PERCENTILE)
+    
+    enough = np.minimum(bars, days) >= min_bars
+    table = pd.DataFrame({
+        'is_compressed': enough & ((score >= 50) | bb_squeeze),
+        'compression_score': score,
+        'range_pct': range_pct,
+        'avg_daily_range': avg_daily_range,
+        'avg_volume': avg_volume,
+        'flat_days': flat_days,
+        'vol_declining': vol_declining,
+        'high': window_high,
+        'low': window_low,
+        'atr_percentile': atr_percentile,
+        'bb_bandwidth': prev(bandwidth),
+        'bandwidth_percentile': bandwidth_percentile,
+        'bb_squeeze': bb_squeeze,
+        'today_open': last(opens),
+        'today_close': last(close),
+        'today_volume': last(volume),
+    }, index=pd.Index(arrays['tickers'], name='ticker'))
+    return table[enough]
+
 
 class CompressionBreakoutStrategy:
     """
@@ -69,81 +184,49 @@ class CompressionBreakoutStrategy:
         """
         if not YF_AVAILABLE:
             return None
-            
+        
         try:
-            stock = yf.Ticker(ticker)
-            hist = stock.history(period=f'{days}d')
-            
-            if len(hist) < 10:
+            table = self.scan_compression([ticker], days=days)
+            if ticker not in table.index:
                 return None
-            
-            # Exclude today - we want PRIOR compression
-            prior_hist = hist[:-1] if len(hist) > 1 else hist
-            
-            # Calculate range during compression period
-            high = prior_hist['High'].max()
-            low = prior_hist['Low'].min()
-            range_pct = (high - low) / low * 100 if low > 0 else 0
-            
-            # Average volume during compression
-            avg_volume = prior_hist['Volume'].mean()
-            
-            # Check for declining volume (sleeping)
-            recent_vol = prior_hist['Volume'].tail(5).mean() if len(prior_hist) >= 5 else avg_volume
-            vol_declining = recent_vol < avg_volume
-            
-            # Calculate "flatness score" (lower = more compressed)
-            daily_ranges = ((prior_hist['High'] - prior_hist['Low']) / prior_hist['Low'] * 100)
-            avg_daily_range = daily_ranges.mean()
-            
-            # Compression score (0-100, higher = better compression)
-            compression_score = 0
-            
-            if range_pct < 5:
-                compression_score += 40
-            elif range_pct < 10:
-                compression_score += 25
-            elif range_pct < 15:
-                compression_score += 10
-                
-            if avg_daily_range < 2:
-                compression_score += 30
-            elif avg_daily_range < 4:
-                compression_score += 20
-            elif avg_daily_range < 6:
-                compression_score += 10
-                
-            if vol_declining:
-                compression_score += 20
-                
-            # Count consecutive flat days
-            flat_days = 0
-            for i in range(len(daily_ranges) - 1, -1, -1):
-                if daily_ranges.iloc[i] < 3:  # Less than 3% daily range
-                    flat_days += 1
-                else:
-                    break
-            
-            compression_score += min(flat_days * 2, 10)  # Bonus for consecutive flat days
-            
-            return {
-                'ticker': ticker,
-                'is_compressed': compression_score >= 50,
-                'compression_score': compression_score,
-                'range_pct': range_pct,
-                'avg_daily_range': avg_daily_range,
-                'avg_volume': avg_volume,
-                'flat_days': flat_days,
-                'vol_declining': vol_declining,
-                'high': high,
-                'low': low,
-            }
+            return self._compression_dict(ticker, table.loc[ticker])
             
         except Exception as e:
             log.debug(f"Compression check error {ticker}: {e}")
             return None
     
-    def check_breakout(self, ticker: str, compression_data: Dict) -> Optional[Dict]:
+    def scan_compression(self, tickers: List[str], days: int = 20) -> pd.DataFrame:
+        """
+        Vectorized check_compression() for a whole universe: one bulk
+        download (cached by the market data service), one array pass.
+        
+        Also flags Bollinger bandwidth + ATR squeezes (both in the bottom
+        SQUEEZE_PERCENTILE of their last SQUEEZE_LOOKBACK bars) as compressed.
+        """
+        panel = get_market_data_service().get_panel(tickers, period=HISTORY_PERIOD)
+        return compute_compression(panel_to_arrays(panel, tickers), days=days)
+    
+    @staticmethod
+    def _compression_dict(ticker: str, row: pd.Series) -> Dict:
+        """check_compression()-style dict from a compute_compression() row"""
+        return {
+            'ticker': ticker,
+            'is_compressed': bool(row['is_compressed']),
+            'compression_score': int(row['compression_score']),
+            'range_pct': float(row['range_pct']),
+            'avg_daily_range': float(row['avg_daily_range']),
+            'avg_volume': float(row['avg_volume']),
+            'flat_days': int(row['flat_days']),
+            'vol_declining': bool(row['vol_declining']),
+            'high': float(row['high']),
+            'low': float(row['low']),
+            'atr_percentile': float(row['atr_percentile']),
+            'bb_bandwidth': float(row['bb_bandwidth']),
+            'bb_squeeze': bool(row['bb_squeeze']),
+        }
+    
+    def check_breakout(self, ticker: str, compression_data: Dict,
+                       today: Optional[Dict] = None) -> Optional[Dict]:
         """
         Check if the compressed stock is NOW breaking out
         
@@ -151,21 +234,25 @@ class CompressionBreakoutStrategy:
         - Gap up 5%+ from compression range
         - Volume 5x+ average (waking up!)
         - Breaking above compression high
+        
+        today: {'open', 'close', 'volume'} if the caller already has today's
+        bar (scan_for_setups passes it from the shared arrays)
         """
-        if not YF_AVAILABLE:
+        if not YF_AVAILABLE and today is None:
             return None
             
         try:
-            stock = yf.Ticker(ticker)
-            
             # Get today's data
-            today = stock.history(period='1d')
-            if today.empty:
-                return None
+            if today is None:
+                bar = yf.Ticker(ticker).history(period='1d')
+                if bar.empty:
+                    return None
+                today = {'open': bar['Open'].iloc[-1], 'close': bar['Close'].iloc[-1],
+                         'volume': bar['Volume'].iloc[-1]}
             
-            current_price = today['Close'].iloc[-1]
-            today_volume = today['Volume'].iloc[-1]
-            today_open = today['Open'].iloc[-1]
+            current_price = today['close']
+            today_volume = today['volume']
+            today_open = today['open']
             
             # Calculate gap from compression high
             compression_high = compression_data['high']
@@ -272,15 +359,19 @@ class CompressionBreakoutStrategy:
         """
         setups = []
         
-        for ticker in tickers:
+        # Step 1: Compression for the whole universe at once; only tickers
+        # that pass the mask go on to the breakout / entry checks
+        table = self.scan_compression(tickers)
+        candidates = table[table['is_compressed']]
+        
+        for ticker, row in candidates.iterrows():
             try:
-                # Step 1: Check compression
-                compression = self.check_compression(ticker)
-                if not compression or not compression['is_compressed']:
-                    continue
+                compression = self._compression_dict(ticker, row)
                 
-                # Step 2: Check breakout
-                breakout = self.check_breakout(ticker, compression)
+                # Step 2: Check breakout (today's bar is already in the arrays)
+                today = {'open': row['today_open'], 'close': row['today_close'],
+                         'volume': row['today_volume']}
+                breakout = self.check_breakout(ticker, compression, today)
                 if not breakout or not breakout['is_breakout']:
                     continue
                 
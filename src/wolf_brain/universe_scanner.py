@@ -26,11 +26,17 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 import json
 from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
 import time
 
+import pandas as pd
+
 # Add wolfpack to path for shared utilities
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'wolfpack'))
-from utils.indicators import calculate_rsi, calculate_sma, calculate_volume_ratio
+from utils.indicators import calculate_volume_ratio
+from utils.single_flight import get_single_flight
+from utils.market_data import get_market_data_service
+from utils.screener import panel_to_arrays, compute_features
 
 try:
     import yfinance as yf
@@ -145,6 +151,292 @@ class UniverseManager:
         self.dynamic_universe[category] = tickers
 
 
+# ============ TIERED SCHEDULING ============
+
+# Per-tier cadence. interval = seconds between refreshes of one ticker,
+# budget = ticker refreshes per minute the tier may spend. Totals ~52/min,
+# the same load as rescanning 100 names every 2 minutes, but covers
+# 60 hot + 150 warm + ~2,900 cold names.
+TIER_SETTINGS = {
+    'hot': {'interval': 120, 'budget': 30},
+    'warm': {'interval': 900, 'budget': 10},
+    'cold': {'interval': 14400, 'budget': 12},
+}
+TIER_ORDER = ['hot', 'warm', 'cold']
+
+# Promotion rules (any one is enough)
+HOT_MOVE_PCT = 5.0           # |day move| or premarket gap
+HOT_VOLUME_RATIO = 3.0
+HOT_CATALYST_DAYS = 2        # catalyst today / within 2 days
+WARM_MOVE_PCT = 2.0
+WARM_VOLUME_RATIO = 1.5
+WARM_CATALYST_DAYS = 14
+
+# A promoted ticker keeps its tier at least this long before it can drop
+TIER_HOLD_SECONDS = 30 * 60
+
+
+class UniverseTiers:
+    """
+    Hot / warm / cold scheduling on top of UniverseManager.
+    
+    - hot: held positions, the manager's hot list, big movers, volume
+      spikes and catalysts within days - refreshed every couple of minutes
+    - warm: moderate movers and catalysts within two weeks
+    - cold: everything else - refreshed a few times a day
+    
+    Tickers move between tiers as metrics come in (refresh() or record()
+    from any scan). Promotion is immediate; demotion waits TIER_HOLD_SECONDS
+    so a name doesn't flap on one quiet print. Each tier draws from its own
+    per-minute budget, so hot names are never starved by a large cold tier.
+    
+    Usage:
+        tiers = UniverseTiers(UniverseManager())
+        tiers.pin('MU')                         # held position
+        tiers.set_catalyst('VNDA', '2026-02-21')
+        tiers.seed(watchlist, 'warm')           # start known names warm
+        due = tiers.due()                       # hot first, within budget
+        tiers.record('MU', move_pct=6.2, volume_ratio=3.4)
+        tiers.refresh()                         # bulk refresh of due names
+    """
+    
+    def __init__(self, manager: Optional[UniverseManager] = None, settings: Optional[Dict] = None):
+        self.manager = manager or UniverseManager()
+        self.settings = {tier: dict(cfg) for tier, cfg in (settings or TIER_SETTINGS).items()}
+        self.market_data = get_market_data_service()
+        
+        self.pinned = set()
+        self.catalysts = {}      # ticker -> date
+        self.metrics = {}        # ticker -> {'move_pct', 'volume_ratio', 'updated'}
+        self.tiers = {}          # ticker -> tier
+        self.tier_since = {}     # ticker -> when it entered its tier
+        self.last_refresh = {}   # ticker -> timestamp
+        
+        self._tokens = {tier: float(cfg['budget']) for tier, cfg in self.settings.items()}
+        self._token_time = time.time()
+        self._lock = threading.Lock()
+        
+        self.sync()
+    
+    def sync(self):
+        """Pick up tickers added to / blacklisted in the manager"""
+        universe = set(self.manager.get_full_universe()) | set(self.manager.hot_list)
+        universe -= set(self.manager.blacklist)
+        
+        with self._lock:
+            for ticker in list(self.tiers):
+                if ticker not in universe and ticker not in self.pinned:
+                    self._forget(ticker)
+            for ticker in universe:
+                if ticker not in self.tiers:
+                    self._classify(ticker)
+    
+    def add(self, tickers: List[str], category: str = 'dynamic'):
+        """Add tickers to the manager's dynamic universe and schedule them"""
+        existing = self.manager.dynamic_universe.get(category, [])
+        self.manager.add_dynamic_tickers(category, list(dict.fromkeys(existing + list(tickers))))
+        self.sync()
+    
+    def pin(self, ticker: str):
+        """Keep a ticker hot (held position)"""
+        self.manager.add_to_hot_list(ticker)
+        with self._lock:
+            self.pinned.add(ticker)
+            self._classify(ticker)
+    
+    def unpin(self, ticker: str):
+        """Position closed - let the ticker cool off on its own metrics"""
+        if ticker in self.manager.hot_list:
+            self.manager.hot_list.remove(ticker)
+        with self._lock:
+            self.pinned.discard(ticker)
+            self._classify(ticker)
+    
+    def seed(self, tickers: List[str], tier: str = 'warm'):
+        """
+        Start tickers in at least `tier` (e.g. the watchlist), so they don't
+        wait for the cold cadence before their first refresh. They drop
+        back on their own metrics after TIER_HOLD_SECONDS.
+        """
+        now = time.time()
+        with self._lock:
+            for ticker in tickers:
+                current = self.tiers.get(ticker)
+                if current is None or TIER_ORDER.index(tier) < TIER_ORDER.index(current):
+                    self.tiers[ticker] = tier
+                    self.tier_since[ticker] = now
+    
+    def set_catalyst(self, ticker: str, when):
+        """Catalyst date (date, datetime or 'YYYY-MM-DD')"""
+        if isinstance(when, str):
+            when = datetime.strptime(when[:10], '%Y-%m-%d').date()
+        elif isinstance(when, datetime):
+            when = when.date()
+        with self._lock:
+            self.catalysts[ticker] = when
+            self._classify(ticker)
+    
+    def record(self, ticker: str, move_pct: Optional[float] = None,
+               volume_ratio: Optional[float] = None) -> str:
+        """
+        Fresh metrics from any scan. Marks the ticker refreshed and
+        re-tiers it.
+        
+        Returns:
+            The ticker's tier afterwards
+        """
+        now = time.time()
+        with self._lock:
+            metrics = self.metrics.setdefault(ticker, {})
+            if move_pct is not None and not pd.isna(move_pct):
+                metrics['move_pct'] = float(move_pct)
+            if volume_ratio is not None and not pd.isna(volume_ratio):
+                metrics['volume_ratio'] = float(volume_ratio)
+            metrics['updated'] = now
+            self.last_refresh[ticker] = now
+            return self._classify(ticker, now)
+    
+    def due(self, tiers: Optional[List[str]] = None, now: Optional[float] = None) -> List[str]:
+        """
+        Tickers whose tier interval has passed, stalest first, hot tier
+        first, each tier capped by its remaining budget. Budget is spent
+        here, so call it once per refresh round.
+        """
+        now = now if now is not None else time.time()
+        
+        with self._lock:
+            self._refill(now)
+            due = []
+            for tier in tiers or TIER_ORDER:
+                interval = self.settings[tier]['interval']
+                stale = [
+                    t for t, current in self.tiers.items()
+                    if current == tier and now - self.last_refresh.get(t, 0) >= interval
+                ]
+                stale.sort(key=lambda t: self.last_refresh.get(t, 0))
+                take = stale[:int(self._tokens[tier])]
+                self._tokens[tier] -= len(take)
+                due.extend(take)
+        
+        return due
+    
+    def refresh(self, tiers: Optional[List[str]] = None, measure=None) -> Dict[str, Tuple[str, str]]:
+        """
+        Refresh due tickers and re-tier them.
+        
+        Args:
+            measure: callable(tickers) -> {ticker: (move_pct, volume_ratio)}.
+                     Default: one uncached bulk download of recent daily
+                     bars (day move + volume ratio).
+        
+        Returns:
+            {ticker: (old_tier, new_tier)} for tickers that changed tier
+        """
+        due = self.due(tiers)
+        if not due:
+            return {}
+        
+        measured = (measure or self._measure_daily)(due)
+        
+        changes = {}
+        for ticker in due:
+            before = self.tiers.get(ticker)
+            move_pct, volume_ratio = measured.get(ticker, (None, None))
+            after = self.record(ticker, move_pct, volume_ratio)
+            if before != after:
+                changes[ticker] = (before, after)
+        
+        return changes
+    
+    def _measure_daily(self, tickers: List[str]) -> Dict[str, Tuple[Optional[float], Optional[float]]]:
+        """Day move and volume ratio from one bulk daily-bar download"""
+        start = (datetime.now() - timedelta(days=45)).strftime('%Y-%m-%d')
+        bars = self.market_data.download_range(tickers, start=start)
+        
+        measured = {}
+        for ticker, hist in bars.items():
+            if hist is None or len(hist) < 2:
+                continue
+            closes = hist['Close'].dropna()
+            volumes = hist['Volume'].dropna()
+            move_pct = volume_ratio = None
+            if len(closes) >= 2 and closes.iloc[-2] > 0:
+                move_pct = (closes.iloc[-1] / closes.iloc[-2] - 1) * 100
+            if len(volumes) >= 2:
+                volume_ratio = calculate_volume_ratio(volumes.iloc[-1], volumes.iloc[-21:-1].mean())
+            measured[ticker] = (move_pct, volume_ratio)
+        
+        return measured
+    
+    def tier_of(self, ticker: str) -> Optional[str]:
+        return self.tiers.get(ticker)
+    
+    def members(self, tier: str) -> List[str]:
+        """Tickers currently in a tier"""
+        return sorted(t for t, current in self.tiers.items() if current == tier)
+    
+    def summary(self) -> Dict[str, int]:
+        """Ticker count per tier"""
+        counts = {tier: 0 for tier in TIER_ORDER}
+        for tier in self.tiers.values():
+            counts[tier] += 1
+        return counts
+    
+    # ==================== INTERNALS ====================
+    
+    def _signal_tier(self, ticker: str, today) -> str:
+        """Tier the latest metrics / catalyst / pin call for"""
+        if ticker in self.pinned or ticker in self.manager.hot_list:
+            return 'hot'
+        
+        metrics = self.metrics.get(ticker, {})
+        move = abs(metrics.get('move_pct', 0.0))
+        volume_ratio = metrics.get('volume_ratio', 0.0)
+        
+        catalyst = self.catalysts.get(ticker)
+        days_out = (catalyst - today).days if catalyst else None
+        
+        if move >= HOT_MOVE_PCT or volume_ratio >= HOT_VOLUME_RATIO:
+            return 'hot'
+        if days_out is not None and 0 <= days_out <= HOT_CATALYST_DAYS:
+            return 'hot'
+        if move >= WARM_MOVE_PCT or volume_ratio >= WARM_VOLUME_RATIO:
+            return 'warm'
+        if days_out is not None and 0 <= days_out <= WARM_CATALYST_DAYS:
+            return 'warm'
+        return 'cold'
+    
+    def _classify(self, ticker: str, now: Optional[float] = None) -> str:
+        """Promote immediately, demote only after TIER_HOLD_SECONDS (caller holds the lock)"""
+        now = now if now is not None else time.time()
+        target = self._signal_tier(ticker, datetime.fromtimestamp(now).date())
+        current = self.tiers.get(ticker)
+        
+        if current is None or TIER_ORDER.index(target) < TIER_ORDER.index(current):
+            self.tiers[ticker] = target
+            self.tier_since[ticker] = now
+        elif target != current and now - self.tier_since.get(ticker, 0) >= TIER_HOLD_SECONDS:
+            self.tiers[ticker] = target
+            self.tier_since[ticker] = now
+        
+        return self.tiers[ticker]
+    
+    def _refill(self, now: float):
+        """Top up each tier's budget for the time since the last call (caller holds the lock)"""
+        elapsed = max(0.0, now - self._token_time)
+        self._token_time = now
+        for tier, cfg in self.settings.items():
+            self._tokens[tier] = min(float(cfg['budget']), self._tokens[tier] + elapsed * cfg['budget'] / 60)
+    
+    def _forget(self, ticker: str):
+        for table in (self.tiers, self.tier_since, self.last_refresh, self.metrics, self.catalysts):
+            table.pop(ticker, None)
+
+
+# Return horizons for day / week / month change (bars back, iloc[-n])
+FETCH_HORIZONS = (2, 5, 20)
+
+
 class TickerDataFetcher:
     """
     Fetches ticker data using yfinance
@@ -154,10 +446,17 @@ class TickerDataFetcher:
         """Initialize with optional caching"""
         self.cache = {}
         self.cache_duration = timedelta(minutes=cache_duration_minutes)
+        
+        # Concurrent lookups of the same ticker share one fetch
+        self.inflight = get_single_flight('universe_scanner.ticker_data')
     
-    def get_ticker_data(self, ticker: str, use_cache: bool = True) -> Dict:
+    def get_ticker_data(self, ticker: str, use_cache: bool = True,
+                        hist: Optional[pd.DataFrame] = None, features: Optional[pd.Series] = None) -> Dict:
         """
         Get comprehensive data for a ticker
+        
+        hist / features: bars and screener row already computed by
+        fetch_multiple() (skips the per-ticker history download and math)
         """
         # Check cache
         if use_cache and ticker in self.cache:
@@ -165,6 +464,11 @@ class TickerDataFetcher:
             if datetime.now() - cached_time < self.cache_duration:
                 return cached_data
         
+        return self.inflight.do(ticker, self._fetch_ticker_data, ticker, hist, features)
+    
+    def _fetch_ticker_data(self, ticker: str, hist: Optional[pd.DataFrame] = None,
+                           features: Optional[pd.Series] = None) -> Dict:
+        """Uncached fetch behind get_ticker_data()"""
         if not YF_AVAILABLE:
             return self._get_mock_data(ticker)
         
@@ -173,34 +477,40 @@ class TickerDataFetcher:
             info = stock.info
             
             # Get price history
-            hist = stock.history(period='3mo')
+            if hist is None:
+                hist = stock.history(period='3mo')
             
             if hist.empty:
                 return self._get_mock_data(ticker)
             
-            current_price = hist['Close'].iloc[-1]
-            high_52w = info.get('fiftyTwoWeekHigh', hist['High'].max())
-            low_52w = info.get('fiftyTwoWeekLow', hist['Low'].min())
+            # Price/volume features - same vectorized screener as fetch_multiple()
+            if features is None:
+                panel = pd.concat({ticker: hist}, axis=1)
+                features = compute_features(panel_to_arrays(panel), horizons=FETCH_HORIZONS).iloc[0]
+            
+            current_price = features['price']
+            high_52w = info.get('fiftyTwoWeekHigh', features['high'])
+            low_52w = info.get('fiftyTwoWeekLow', features['low'])
             
             # Calculate metrics
             drawdown = (high_52w - current_price) / high_52w if high_52w > 0 else 0
             
             # Volume analysis
-            avg_volume = hist['Volume'].mean()
-            current_volume = hist['Volume'].iloc[-1]
+            avg_volume = features['avg_volume']
+            current_volume = features['volume']
             relative_volume = calculate_volume_ratio(current_volume, avg_volume)
             
-            # Price change
-            day_change = (hist['Close'].iloc[-1] - hist['Close'].iloc[-2]) / hist['Close'].iloc[-2] if len(hist) > 1 else 0
-            week_change = (hist['Close'].iloc[-1] - hist['Close'].iloc[-5]) / hist['Close'].iloc[-5] if len(hist) > 5 else 0
-            month_change = (hist['Close'].iloc[-1] - hist['Close'].iloc[-20]) / hist['Close'].iloc[-20] if len(hist) > 20 else 0
+            # Price change (1 day, 5 bars, 20 bars)
+            day_change = features['change_2d'] / 100
+            week_change = features['change_5d'] / 100
+            month_change = features['change_20d'] / 100
             
-            # Technical indicators - using unified indicators
-            ma_50 = calculate_sma(hist['Close'], 50)
+            # Technical indicators
+            ma_50 = features['sma_50'] if not pd.isna(features['sma_50']) else None
             above_50ma = current_price > ma_50 if ma_50 else False
             
-            # RSI calculation (14-day) - using unified indicators
-            rsi = calculate_rsi(hist['Close'])
+            # RSI calculation (14-day)
+            rsi = features['rsi']
             
             # Chart health classification
             chart_health = self._classify_chart_health(hist)
@@ -221,7 +531,7 @@ class TickerDataFetcher:
                 'month_change_pct': float(month_change * 100),
                 'rsi': float(rsi) if not pd.isna(rsi) else 50,
                 'above_50ma': above_50ma,
-                'ma_50': float(ma_50),
+                'ma_50': float(ma_50) if ma_50 else 0.0,
                 'chart_health': chart_health,
                 'sector': info.get('sector', 'Unknown'),
                 'industry': info.get('industry', 'Unknown'),
@@ -315,12 +625,27 @@ class TickerDataFetcher:
     def fetch_multiple(self, tickers: List[str], max_workers: int = 10) -> Dict[str, Dict]:
         """
         Fetch data for multiple tickers in parallel
+        
+        History comes from one bulk download and price/volume features from
+        one vectorized screener pass; workers only fetch per-ticker info.
         """
         results = {}
         
+        panel = pd.DataFrame()
+        features = pd.DataFrame()
+        if YF_AVAILABLE:
+            panel = get_market_data_service().get_panel(tickers, period='3mo')
+            features = compute_features(panel_to_arrays(panel, tickers), horizons=FETCH_HORIZONS)
+        
+        def fetch(ticker):
+            if ticker not in features.index:
+                return self.get_ticker_data(ticker)
+            hist = panel[ticker].dropna(how='all')
+            return self.get_ticker_data(ticker, hist=hist, features=features.loc[ticker])
+        
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
             future_to_ticker = {
-                executor.submit(self.get_ticker_data, ticker): ticker
+                executor.submit(fetch, ticker): ticker
                 for ticker in tickers
             }
             
@@ -336,13 +661,6 @@ class TickerDataFetcher:
         return results
 
 
-# Need pandas for RSI calculation
-try:
-    import pandas as pd
-except ImportError:
-    print("⚠️  pandas not installed")
-
-
 class UniverseScanner:
     """
     Scans the universe for trading opportunities
@@ -45,6 +45,10 @@ def load_env():
 
 load_env()
 
+# Shared utilities (live quotes from quote_feeder.py)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'wolfpack'))
+from utils.shared_quotes import get_live_quote
+
 # Setup logging (ASCII only for Windows compatibility)
 LOG_DIR = os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'wolf_brain', 'logs')
 os.makedirs(LOG_DIR, exist_ok=True)
@@ -429,9 +433,15 @@ class DataFetcher:
     def __init__(self):
         self.cache = {}
         self.cache_time = {}
+        self.context = {}  # ticker -> the day's history/info behind live quotes
     
     def get_ticker_data(self, ticker: str, use_cache: bool = True) -> Dict:
-        """Get basic data for a ticker"""
+        """Get basic data for a ticker (live quote from the shared table first)"""
+        live = get_live_quote(ticker)
+        context = self.context.get(ticker)
+        if live and context and context['date'] == datetime.now().date():
+            return self._ticker_data(ticker, context, live['price'], live['change_pct'], live['volume'])
+        
         # Check cache (5 min)
         if use_cache and ticker in self.cache:
             if datetime.now() - self.cache_time.get(ticker, datetime.min) < timedelta(minutes=5):
@@ -446,21 +456,23 @@ class DataFetcher:
             if hist.empty:
                 return {'error': 'No data'}
             
-            current = hist['Close'].iloc[-1]
-            high_52w = info.get('fiftyTwoWeekHigh', hist['High'].max())
-            avg_vol = hist['Volume'].mean()
-            
-            data = {
-                'ticker': ticker,
-                'price': float(current),
-                'change_pct': float((current - hist['Close'].iloc[-2]) / hist['Close'].iloc[-2] * 100) if len(hist) > 1 else 0,
-                'off_high_pct': float((high_52w - current) / high_52w * 100) if high_52w > 0 else 0,
-                'rel_volume': float(hist['Volume'].iloc[-1] / avg_vol) if avg_vol > 0 else 1,
+            context = {
+                'date': datetime.now().date(),
+                'high_52w': info.get('fiftyTwoWeekHigh', hist['High'].max()),
+                'avg_volume': hist['Volume'].mean(),
                 'float': info.get('floatShares', 0),
                 'short_pct': (info.get('shortPercentOfFloat', 0) or 0) * 100,
                 'market_cap': info.get('marketCap', 0)
             }
+            self.context[ticker] = context
             
+            current = hist['Close'].iloc[-1]
+            change_pct = float((current - hist['Close'].iloc[-2]) / hist['Close'].iloc[-2] * 100) if len(hist) > 1 else 0
+            volume = hist['Volume'].iloc[-1]
+            if live:
+                current, change_pct, volume = live['price'], live['change_pct'], live['volume']
+            
+            data = self._ticker_data(ticker, context, current, change_pct, volume)
             self.cache[ticker] = data
             self.cache_time[ticker] = datetime.now()
             return data
@@ -468,6 +480,21 @@ class DataFetcher:
         except Exception as e:
             return {'error': str(e), 'ticker': ticker}
     
+    @staticmethod
+    def _ticker_data(ticker: str, context: Dict, current: float, change_pct: float, volume: float) -> Dict:
+        high_52w = context['high_52w']
+        avg_vol = context['avg_volume']
+        return {
+            'ticker': ticker,
+            'price': float(current),
+            'change_pct': change_pct,
+            'off_high_pct': float((high_52w - current) / high_52w * 100) if high_52w > 0 else 0,
+            'rel_volume': float(volume / avg_vol) if avg_vol > 0 else 1,
+            'float': context['float'],
+            'short_pct': context['short_pct'],
+            'market_cap': context['market_cap']
+        }
+    
     def scan_watchlist(self, tickers: List[str]) -> List[Dict]:
         """Scan a list of tickers"""
         results = []
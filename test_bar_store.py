@@ -0,0 +1,115 @@
+"""
+Bar store test - split/dividend detection on the daily bar cache
+Offline: the market data service is replaced with a scripted fake.
+"""
+import sys
+import os
+import time
+import tempfile
+from datetime import date, timedelta
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'wolfpack'))
+
+from utils.bar_store import BarStore
+
+
+class FakeMarketData:
+    """download_range() with a bar every calendar day; close(day) decides each price"""
+
+    def __init__(self, close):
+        self.close = close
+        self.calls = []
+
+    def download_range(self, tickers, start, end=None, interval='1d'):
+        self.calls.append((tuple(tickers), start, end))
+        days = list(pd.date_range(start, end, inclusive='left'))
+        frames = {}
+        for ticker in tickers:
+            closes = [self.close(d.date()) for d in days]
+            frames[ticker] = pd.DataFrame(
+                {'Open': closes, 'High': closes, 'Low': closes, 'Close': closes,
+                 'Volume': [1_000_000] * len(days)},
+                index=pd.DatetimeIndex(days, name='Date'),
+            )
+        return frames
+
+
+def make_store(close):
+    path = os.path.join(tempfile.mkdtemp(), 'bar_store.db')
+    store = BarStore(db_path=path, refresh_ttl=0)
+    store.market_data = FakeMarketData(close)
+    return store
+
+
+def set_updated_at(store, ticker, when):
+    conn = store._connect()
+    conn.execute('UPDATE bar_coverage SET updated_at = ? WHERE ticker = ?', (when, ticker))
+    conn.commit()
+    conn.close()
+
+
+def full_refetches(store):
+    return [call for call in store.market_data.calls if call[1] <= (date.today() - timedelta(days=30)).isoformat()]
+
+
+def test_intraday_move_is_not_a_split():
+    """Today's partial bar moving 1% must not wipe the history"""
+    store = make_store(lambda d: 100.0)
+    store.update(['MU'], start=date.today() - timedelta(days=60))
+    initial = len(store.market_data.calls)
+
+    store.market_data.close = lambda d: 101.0 if d == date.today() else 100.0
+    store.update(['MU'], start=date.today() - timedelta(days=60))
+
+    assert len(store.market_data.calls) == initial + 1, "expected one refresh of today only"
+    assert not full_refetches(store)[initial:], "intraday move triggered a full refetch"
+
+
+def test_partial_bar_settling_is_not_a_split():
+    """Yesterday's bar stored mid-session, settled 2% higher - still not a split"""
+    yesterday = date.today() - timedelta(days=1)
+    store = make_store(lambda d: 100.0)
+    store.update(['MU'], start=date.today() - timedelta(days=60), end=date.today())
+    set_updated_at(store, 'MU', time.time() - 86400)   # last written yesterday
+    initial = len(store.market_data.calls)
+
+    store.market_data.close = lambda d: 102.0 if d >= yesterday else 100.0
+    store.update(['MU'], start=date.today() - timedelta(days=60))
+
+    assert not full_refetches(store)[initial:], "settling a partial bar triggered a full refetch"
+
+
+def test_split_refetches_history():
+    """A 2:1 split halves every settled close - the store must reload in full"""
+    store = make_store(lambda d: 100.0)
+    store.update(['MU'], start=date.today() - timedelta(days=60), end=date.today() - timedelta(days=2))
+    set_updated_at(store, 'MU', time.time() - 3 * 86400)
+    initial = len(store.market_data.calls)
+
+    store.market_data.close = lambda d: 50.0
+    store.update(['MU'], start=date.today() - timedelta(days=60))
+
+    assert full_refetches(store)[initial:], "split was not detected"
+    hist = store.get_bars('MU', start=date.today() - timedelta(days=60))
+    assert (hist['Close'] == 50.0).all(), "stale pre-split closes left on disk"
+
+
+if __name__ == '__main__':
+    print("=" * 60)
+    print("BAR STORE - ADJUSTMENT DETECTION")
+    print("=" * 60)
+
+    failed = 0
+    for test in (test_intraday_move_is_not_a_split,
+                 test_partial_bar_settling_is_not_a_split,
+                 test_split_refetches_history):
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {test.__name__}: {e}")
+
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,72 @@
+"""
+Pattern excavator test - find_runs() on overlapping runs
+Offline: scripted (ticker x day) arrays instead of the bar store.
+"""
+import sys
+import os
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src', 'layer2_filter'))
+
+from pattern_excavator import find_runs
+
+
+def make_arrays(paths):
+    """{ticker: closes} -> panel_to_arrays()-style dict, lows/highs 1% around the close"""
+    closes = np.array(list(paths.values()), dtype=float)
+    return {
+        'tickers': list(paths),
+        'Close': closes,
+        'High': closes * 1.01,
+        'Low': closes * 0.99,
+        'Volume': np.full(closes.shape, 1e6),
+    }
+
+
+def base_then_rally(base_bars):
+    """Slide to $1, sit flat for base_bars, rally to $4 over 60 bars, fade"""
+    slide = np.linspace(2.0, 1.0, 40)
+    base = np.full(base_bars, 1.0)
+    rally = np.linspace(1.0, 4.0, 61)[1:]
+    fade = np.linspace(4.0, 3.0, 40)
+    return np.concatenate([slide, base, rally, fade])
+
+
+def test_long_base_reports_the_full_run():
+    """The earliest base bottom can't see the peak - the run must not be truncated"""
+    long_base = find_runs(make_arrays({'LONG': base_then_rally(100)}))
+    short_base = find_runs(make_arrays({'SHORT': base_then_rally(20)}))
+
+    assert len(long_base) == 1, f"expected one run, got {len(long_base)}"
+    assert len(short_base) == 1
+    top = 4.0 * 1.01
+    assert np.isclose(long_base['peak_price'].iloc[0], top), \
+        f"long base peaked at {long_base['peak_price'].iloc[0]:.2f}, not the {top:.2f} top"
+    assert np.isclose(long_base['gain_pct'].iloc[0], short_base['gain_pct'].iloc[0]), \
+        "same move reported differently depending on the base length"
+
+
+def test_separate_moves_are_both_kept():
+    path = np.concatenate([base_then_rally(20), np.linspace(3.0, 1.0, 150), base_then_rally(20)])
+    runs = find_runs(make_arrays({'TWICE': path}))
+    assert len(runs) == 2, f"expected two runs, got {len(runs)}"
+    assert (runs['start'].iloc[1] > runs['peak'].iloc[0]), "second run overlaps the first"
+
+
+if __name__ == '__main__':
+    print("=" * 60)
+    print("PATTERN EXCAVATOR - RUN DETECTION")
+    print("=" * 60)
+
+    failed = 0
+    for test in (test_long_base_reports_the_full_run,
+                 test_separate_moves_are_both_kept):
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {test.__name__}: {e}")
+
+    sys.exit(1 if failed else 0)
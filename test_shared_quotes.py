@@ -0,0 +1,145 @@
+"""
+Shared quotes test - seqlock reads, staleness and the feeder's day rollover
+Offline: a private table name, and the feeder's reference is a plain dict.
+"""
+import sys
+import os
+import time
+import threading
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'wolfpack'))
+
+from utils.shared_quotes import SharedQuoteTable, QuoteFeeder
+from utils.quote_stream import Tick
+
+
+def make_table():
+    return SharedQuoteTable.create(name=f'wolfpack_quotes_test_{os.getpid()}', capacity=16)
+
+
+class FakeReference:
+    """DailyReference without the download"""
+
+    def __init__(self, data):
+        self.data = data
+
+    def get(self, ticker, name, default=None):
+        return self.data.get(ticker, {}).get(name, default)
+
+    def field(self, name):
+        return {ticker: ref[name] for ticker, ref in self.data.items()}
+
+
+def test_reads_are_never_torn():
+    """A writer hammering one slot; every field a reader sees must come from the same write"""
+    table = make_table()
+    reader = SharedQuoteTable.attach(table.name)
+    stop = threading.Event()
+
+    def writer():
+        i = 1
+        while not stop.is_set():
+            value = float(i)
+            table.write('MU', value, prev_close=value, open=value, high=value, low=value, volume=value)
+            i += 1
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    try:
+        torn = reads = 0
+        deadline = time.time() + 1.0
+        while time.time() < deadline:
+            quote = reader.read('MU')
+            if quote is None:
+                continue
+            reads += 1
+            values = {quote[f] for f in ('price', 'prev_close', 'open', 'high', 'low')} | {float(quote['volume'])}
+            if len(values) != 1:
+                torn += 1
+    finally:
+        stop.set()
+        thread.join()
+        reader.close()
+        table.close()
+
+    assert reads, "reader never saw a quote"
+    assert torn == 0, f"{torn} of {reads} reads mixed two writes"
+
+
+def test_stale_quote_is_a_miss():
+    """Polling: a quote the feeder hasn't rewritten within max_age is stale"""
+    table = make_table()
+    try:
+        table.write('KTOS', 50.0, prev_close=49.0)
+        time.sleep(0.2)
+        assert table.read('KTOS', max_age=0.1) is None, "stale quote returned"
+        assert table.read('KTOS')['price'] == 50.0
+        assert table.read('RKLB') is None, "unknown ticker returned a quote"
+    finally:
+        table.close()
+
+
+def test_old_trade_on_live_stream_is_fresh():
+    """A thin name's last trade is old, but the connected stream vouches it's current"""
+    table = make_table()
+    try:
+        traded = time.time() - 600
+        table.write('SMR', 20.0, prev_close=19.0, timestamp=traded)
+        time.sleep(0.2)
+        assert table.read('SMR', max_age=0.1) is None
+
+        table.heartbeat(streaming=True)
+        quote = table.read('SMR', max_age=0.1)
+        assert quote is not None, "quote on a connected stream judged by its trade time"
+        assert quote['timestamp'] == datetime.fromtimestamp(traded).isoformat(), "trade time lost"
+    finally:
+        table.close()
+
+
+def test_rollover_resets_the_session():
+    """New market date: new prev close, volume from zero, open/high/low from the first trade"""
+    table = make_table()
+    try:
+        feeder = QuoteFeeder(table, ['MU'])
+        feeder.reference = FakeReference({'MU': {'prev_close': 100.0, 'avg_volume': 1e6, 'volume': 0.0}})
+        now = time.time()
+        feeder(Tick('MU', 105.0, size=500, timestamp=now, received=now))
+        feeder(Tick('MU', 95.0, size=500, timestamp=now, received=now))
+        assert table.read('MU')['volume'] == 1000
+
+        # Next morning: the reloaded reference settles yesterday at 96
+        feeder.reference = FakeReference({'MU': {'prev_close': 96.0, 'avg_volume': 1e6, 'volume': 0.0}})
+        feeder.new_session()
+        quote = table.read('MU')
+        assert quote['prev_close'] == 96.0, "prev close not reloaded"
+        assert quote['volume'] == 0, "volume carried into the new session"
+
+        feeder(Tick('MU', 98.0, size=200, timestamp=now, received=now))
+        quote = table.read('MU')
+        assert quote['volume'] == 200
+        assert (quote['open'], quote['high'], quote['low']) == (98.0, 98.0, 98.0), \
+            "open/high/low carried into the new session"
+        assert round(quote['change_pct'], 4) == round(2 / 96 * 100, 4)
+    finally:
+        table.close()
+
+
+if __name__ == '__main__':
+    print("=" * 60)
+    print("SHARED QUOTES - SEQLOCK / STALE / ROLLOVER")
+    print("=" * 60)
+
+    failed = 0
+    for test in (test_reads_are_never_torn,
+                 test_stale_quote_is_a_miss,
+                 test_old_trade_on_live_stream_is_fresh,
+                 test_rollover_resets_the_session):
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {test.__name__}: {e}")
+
+    sys.exit(1 if failed else 0)
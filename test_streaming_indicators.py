@@ -0,0 +1,128 @@
+"""
+Streaming indicators test - every Streaming* class against its calculate_* function
+Offline: a fixed random-walk series; each indicator is serialized to JSON
+and restored halfway through the series.
+"""
+import sys
+import os
+import json
+import math
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'wolfpack'))
+
+from utils.indicators import (
+    calculate_sma, calculate_rsi, calculate_bollinger_bands, calculate_atr,
+    calculate_macd, calculate_volatility,
+    StreamingSMA, StreamingEMA, StreamingRSI, StreamingBollingerBands,
+    StreamingATR, StreamingMACD, StreamingVolatility, StreamingIndicatorSet,
+    restore_indicator,
+)
+
+BARS = 160
+TOLERANCE = 1e-9
+
+
+def make_bars():
+    rng = np.random.default_rng(13)
+    close = 50 * np.exp(np.cumsum(rng.normal(0, 0.02, BARS)))
+    high = close * (1 + rng.uniform(0, 0.03, BARS))
+    low = close * (1 - rng.uniform(0, 0.03, BARS))
+    return pd.Series(close), pd.Series(high), pd.Series(low)
+
+
+CLOSE, HIGH, LOW = make_bars()
+
+
+def same(streamed, batch):
+    if isinstance(batch, dict):
+        return streamed.keys() == batch.keys() and all(same(streamed[k], batch[k]) for k in batch)
+    if batch is None or streamed is None:
+        return batch is None and streamed is None
+    return math.isclose(streamed, batch, rel_tol=TOLERANCE, abs_tol=TOLERANCE)
+
+
+def check(indicator, feed, batch):
+    """
+    Feed every bar, restoring from JSON halfway; after each bar the
+    streamed value must match batch(i) on bars [0, i].
+    """
+    for i in range(BARS):
+        if i == BARS // 2:
+            indicator = restore_indicator(json.loads(json.dumps(indicator.serialize())))
+        streamed = feed(indicator, i)
+        expected = batch(i)
+        assert same(streamed, expected), \
+            f"{type(indicator).__name__} bar {i}: streamed {streamed}, batch {expected}"
+
+
+def test_sma():
+    check(StreamingSMA(20), lambda ind, i: ind.update(CLOSE[i]),
+          lambda i: calculate_sma(CLOSE[:i + 1], 20))
+
+
+def test_ema():
+    ewm = CLOSE.ewm(span=10).mean()
+    check(StreamingEMA(10), lambda ind, i: ind.update(CLOSE[i]), lambda i: float(ewm[i]))
+
+
+def test_rsi():
+    check(StreamingRSI(14), lambda ind, i: ind.update(CLOSE[i]),
+          lambda i: calculate_rsi(CLOSE[:i + 1], 14))
+
+
+def test_bollinger_bands():
+    check(StreamingBollingerBands(20, 2), lambda ind, i: ind.update(CLOSE[i]),
+          lambda i: calculate_bollinger_bands(CLOSE[:i + 1], 20, 2))
+
+
+def test_atr():
+    check(StreamingATR(14), lambda ind, i: ind.update(HIGH[i], LOW[i], CLOSE[i]),
+          lambda i: calculate_atr(HIGH[:i + 1], LOW[:i + 1], CLOSE[:i + 1], 14))
+
+
+def test_macd():
+    check(StreamingMACD(12, 26, 9), lambda ind, i: ind.update(CLOSE[i]),
+          lambda i: calculate_macd(CLOSE[:i + 1], 12, 26, 9))
+
+
+def test_volatility():
+    check(StreamingVolatility(20), lambda ind, i: ind.update(CLOSE[i]),
+          lambda i: calculate_volatility(CLOSE[:i + 1], 20))
+
+
+def test_indicator_set():
+    def batch(i):
+        close, high, low = CLOSE[:i + 1], HIGH[:i + 1], LOW[:i + 1]
+        return {
+            'price': float(CLOSE[i]),
+            'rsi': calculate_rsi(close, 14),
+            'sma_20': calculate_sma(close, 20),
+            'sma_50': calculate_sma(close, 50),
+            'bollinger': calculate_bollinger_bands(close, 20, 2),
+            'atr': calculate_atr(high, low, close, 14),
+            'macd': calculate_macd(close, 12, 26, 9),
+            'volatility': calculate_volatility(close, 20),
+        }
+
+    check(StreamingIndicatorSet(), lambda ind, i: ind.update(CLOSE[i], HIGH[i], LOW[i]), batch)
+
+
+if __name__ == '__main__':
+    print("=" * 60)
+    print("STREAMING INDICATORS - BATCH PARITY")
+    print("=" * 60)
+
+    failed = 0
+    for test in (test_sma, test_ema, test_rsi, test_bollinger_bands, test_atr,
+                 test_macd, test_volatility, test_indicator_set):
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {test.__name__}: {e}")
+
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,86 @@
+"""
+Tick buffer test - batched flushing writes every tick exactly once
+Offline: the sink is an in-memory list instead of tick_history.
+"""
+import sys
+import os
+import time
+import threading
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'wolfpack'))
+
+from utils.tick_buffer import TickBuffers
+
+
+class SlowSink:
+    """Stands in for the SQLite executemany - slow enough for flushes to overlap"""
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.rows = []
+        self.lock = threading.Lock()
+
+    def __call__(self, batch):
+        time.sleep(self.delay)
+        with self.lock:
+            self.rows.extend(batch)
+
+
+def test_concurrent_flushes_write_once():
+    """Flusher thread + explicit flush() (SafePositionMonitor.flush_db) must not duplicate rows"""
+    sink = SlowSink()
+    ticks = TickBuffers(capacity=64)
+    ticks.start_flusher(sink, interval=0.01)
+
+    now = time.time()
+    for i in range(10):
+        ticks.record('MU', now + i, 100.0 + i, size=100)
+
+    flushers = [threading.Thread(target=ticks.flush) for _ in range(4)]
+    for thread in flushers:
+        thread.start()
+    for thread in flushers:
+        thread.join()
+    ticks.stop_flusher()
+
+    assert len(sink.rows) == 10, f"expected 10 rows, wrote {len(sink.rows)}"
+    assert len(set(sink.rows)) == 10, "duplicate rows written"
+
+
+def test_stop_flusher_writes_the_rest():
+    sink = SlowSink(delay=0)
+    ticks = TickBuffers(capacity=64)
+    ticks.start_flusher(sink, interval=60)
+    ticks.record('KTOS', time.time(), 50.0, size=10)
+    ticks.stop_flusher()
+    assert len(sink.rows) == 1, "final flush on shutdown missed buffered ticks"
+
+
+def test_overrun_is_counted():
+    sink = SlowSink(delay=0)
+    ticks = TickBuffers(capacity=8)
+    ticks.start_flusher(sink, interval=60)
+    for i in range(20):
+        ticks.record('MU', float(i), 100.0)
+    ticks.stop_flusher()
+    assert len(sink.rows) == 8
+    assert ticks.stats['overrun'] == 12
+
+
+if __name__ == '__main__':
+    print("=" * 60)
+    print("TICK BUFFERS - FLUSHING")
+    print("=" * 60)
+
+    failed = 0
+    for test in (test_concurrent_flushes_write_once,
+                 test_stop_flusher_writes_the_rest,
+                 test_overrun_is_counted):
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {test.__name__}: {e}")
+
+    sys.exit(1 if failed else 0)
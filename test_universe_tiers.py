@@ -0,0 +1,86 @@
+"""
+Universe tiers test - due-list budgets and what the hunt scans
+Offline: tier refreshes use a scripted measure instead of downloads.
+"""
+import sys
+import os
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src', 'wolf_brain'))
+
+from universe_scanner import UniverseManager, UniverseTiers, TIER_SETTINGS
+from autonomous_brain import AutonomousBrain
+
+
+def make_tiers(watchlist=()):
+    manager = UniverseManager()
+    tiers = UniverseTiers(manager)
+    tiers.seed(list(watchlist), 'warm')
+    return tiers
+
+
+def quiet(tickers):
+    return {t: (0.1, 1.0) for t in tickers}
+
+
+def test_due_spends_each_tier_budget():
+    """due() is hot first and capped by each tier's per-minute budget"""
+    tiers = make_tiers()
+    tiers.pin('MU')
+    due = tiers.due()
+
+    assert due[0] == 'MU', "hot tier should come first"
+    cold = [t for t in due if tiers.tier_of(t) == 'cold']
+    assert len(cold) == TIER_SETTINGS['cold']['budget'], f"cold budget not applied ({len(cold)})"
+    again = [t for t in tiers.due() if tiers.tier_of(t) == 'cold']
+    assert again == [], "cold budget should be spent until it refills"
+
+
+def test_seed_starts_watchlist_warm():
+    tiers = make_tiers(['KTOS', 'RKLB'])
+    assert tiers.tier_of('KTOS') == 'warm'
+    assert 'RKLB' in tiers.members('warm')
+
+
+def test_hunt_targets_survive_sleep_loop_refresh():
+    """The sleep-loop refresh spends the budget; the next hunt must still get its tickers"""
+    watchlist = ['KTOS', 'RKLB', 'IONQ', 'SMR']
+    tiers = make_tiers(watchlist)
+    brain = SimpleNamespace(universe_tiers=tiers, positions={'MU': {}})
+    brain._sync_tier_positions = lambda: AutonomousBrain._sync_tier_positions(brain)
+
+    # Several refresh rounds, as _sleep_with_tier_refresh does between hunts
+    for _ in range(3):
+        tiers.refresh(measure=quiet)
+
+    targets = AutonomousBrain._tiered_scan_targets(brain)
+    assert targets, "hunt got no tickers after a refresh round"
+    assert targets[0] == 'MU', "held position should lead the hunt"
+    assert set(watchlist) <= set(targets), "seeded watchlist missing from the first hunt"
+
+
+def test_refresh_promotes_mover():
+    tiers = make_tiers()
+    changes = tiers.refresh(tiers=['cold'], measure=lambda ts: {t: (8.0, 4.0) for t in ts})
+    assert changes, "nothing refreshed"
+    assert all(after == 'hot' for _, after in changes.values()), "a big mover should be promoted to hot"
+
+
+if __name__ == '__main__':
+    print("=" * 60)
+    print("UNIVERSE TIERS - DUE LIST / HUNT TARGETS")
+    print("=" * 60)
+
+    failed = 0
+    for test in (test_due_spends_each_tier_budget,
+                 test_seed_starts_watchlist_warm,
+                 test_hunt_targets_survive_sleep_loop_refresh,
+                 test_refresh_promotes_mover):
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {test.__name__}: {e}")
+
+    sys.exit(1 if failed else 0)
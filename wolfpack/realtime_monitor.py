@@ -7,11 +7,14 @@ Detects moves >3% and triggers immediate investigation
 
 import yfinance as yf
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, time as dtime
 import pytz
 from config import ALL_TICKERS, TICKER_TO_SECTOR
 from wolfpack_db_v2 import init_v2_database, log_realtime_move, get_recent_moves
 from catalyst_fetcher import fetch_catalysts
+from utils.quote_stream import (QuoteBus, QuoteStream, MoveDetector, VolumeSpikeDetector,
+                                DailyReference, default_stream_url, WEBSOCKETS_AVAILABLE)
 
 # Constants
 SCAN_INTERVAL_SECONDS = 120  # Check every 2 minutes
@@ -19,6 +22,7 @@ MOVE_THRESHOLD = 3.0  # Alert on >3% moves
 MARKET_OPEN = dtime(9, 30)   # 9:30 AM ET
 MARKET_CLOSE = dtime(16, 0)   # 4:00 PM ET
 ET_TIMEZONE = pytz.timezone('America/New_York')
+INVESTIGATION_WORKERS = 4  # Catalyst lookups run off the quote stream thread
 
 class RealTimeMonitor:
     """Monitors stocks during market hours and triggers alerts"""
@@ -92,31 +96,12 @@ class RealTimeMonitor:
             
             # Check if this is a big move
             if abs(move_pct) >= MOVE_THRESHOLD:
-                # Avoid duplicate alerts for same move
-                alert_key = f"{ticker}_{now.strftime('%Y%m%d')}"
-                
-                if alert_key not in self.alerted_today:
-                    self.alerted_today.add(alert_key)
-                    
-                    sector = TICKER_TO_SECTOR[ticker]
-                    
-                    move_info = {
-                        'ticker': ticker,
-                        'sector': sector,
-                        'price': price,
-                        'prev_close': prev_close,
-                        'move_pct': move_pct,
-                        'volume': data['volume'],
-                        'timestamp': data['timestamp']
-                    }
-                    
-                    moves_detected.append(move_info)
-                    
-                    # Log to database immediately
-                    log_realtime_move(move_info)
-                    
+                move_info = self.record_move(ticker, price, prev_close, move_pct,
+                                             data['volume'], data['timestamp'])
+                if move_info:
                     # Trigger catalyst investigation
                     self.investigate_move(move_info)
+                    moves_detected.append(move_info)
         
         if moves_detected:
             print(f"🚨 DETECTED {len(moves_detected)} BIG MOVES:")
@@ -126,6 +111,28 @@ class RealTimeMonitor:
         else:
             print("  ✅ No big moves detected")
     
+    def record_move(self, ticker, price, prev_close, move_pct, volume, timestamp):
+        """Log a big move once per ticker per day; returns move_info or None if already alerted"""
+        # Avoid duplicate alerts for same move
+        alert_key = f"{ticker}_{timestamp.strftime('%Y%m%d')}"
+        if alert_key in self.alerted_today:
+            return None
+        self.alerted_today.add(alert_key)
+        
+        move_info = {
+            'ticker': ticker,
+            'sector': TICKER_TO_SECTOR.get(ticker, 'Unknown'),
+            'price': price,
+            'prev_close': prev_close,
+            'move_pct': move_pct,
+            'volume': volume,
+            'timestamp': timestamp
+        }
+        
+        # Log to database immediately
+        log_realtime_move(move_info)
+        return move_info
+    
     def investigate_move(self, move_info):
         """Trigger catalyst investigation for a detected move"""
         
@@ -175,10 +182,69 @@ class RealTimeMonitor:
             print("\n\n🛑 Monitor stopped by user")
             self.running = False
 
+    def run_streaming(self, url=None):
+        """
+        Event-driven monitoring: every trade on the quote stream is checked
+        against yesterday's close as it arrives, instead of re-downloading
+        every ticker on a timer.
+        """
+        print("\n" + "🐺"*40)
+        print("WOLF PACK V2 - REAL-TIME MARKET MONITOR (STREAMING)")
+        print(f"Streaming {len(ALL_TICKERS)} stocks")
+        print("Alert threshold: ±{:.1f}%".format(MOVE_THRESHOLD))
+        print("🐺"*40 + "\n")
+        
+        # Yesterday's close + today's volume so far, from one bulk download
+        # (reloaded at each new session)
+        reference = DailyReference(ALL_TICKERS)
+        print(f"📊 Reference closes loaded for {len(reference)}/{len(ALL_TICKERS)} tickers")
+        
+        investigations = ThreadPoolExecutor(max_workers=INVESTIGATION_WORKERS)
+        
+        def on_move(tick, move_pct):
+            move_info = self.record_move(tick.ticker, tick.price, reference.get(tick.ticker, 'prev_close'), move_pct,
+                                         volumes.volume.get(tick.ticker, 0), datetime.now(ET_TIMEZONE))
+            if not move_info:
+                return
+            direction = "📈" if move_pct > 0 else "📉"
+            print(f"🚨 {direction} {tick.ticker:6} {move_pct:+.1f}% @ ${tick.price:.2f} ({move_info['sector']}) "
+                  f"[{tick.latency * 1000:.0f}ms]", flush=True)
+            investigations.submit(self.investigate_move, move_info)
+        
+        # Running day volume per ticker (no averages = counts only, never alerts)
+        volumes = VolumeSpikeDetector({}, baseline=reference.field('volume'))
+        moves = MoveDetector(reference.field('prev_close'), threshold_pct=MOVE_THRESHOLD, on_move=on_move)
+        
+        bus = QuoteBus().start()
+        bus.subscribe(volumes)
+        bus.subscribe(moves)
+        stream = QuoteStream(bus, list(reference), url=url).start()
+        
+        self.running = True
+        try:
+            while self.running:
+                time.sleep(60)
+                if reference.refresh():
+                    moves.rebase(reference.field('prev_close'))
+                    volumes.rebase({}, reference.field('volume'))
+                    print(f"📅 New session - reference closes reloaded for {len(reference)} tickers", flush=True)
+                print(f"  📡 {stream.stats['ticks']:,} ticks | {len(self.alerted_today)} alerts today"
+                      f"{'' if stream.connected.is_set() else ' | reconnecting...'}", flush=True)
+        except KeyboardInterrupt:
+            print("\n\n🛑 Monitor stopped by user")
+            self.running = False
+        finally:
+            stream.stop()
+            bus.stop()
+            investigations.shutdown(wait=False)
+
 if __name__ == '__main__':
     # Initialize V2 database
     init_v2_database()
     
-    # Start monitoring
+    # Start monitoring (quote stream if one is configured, else polling)
     monitor = RealTimeMonitor()
-    monitor.run()
+    if WEBSOCKETS_AVAILABLE and default_stream_url():
+        monitor.run_streaming()
+    else:
+        monitor.run()
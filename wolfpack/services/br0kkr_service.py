@@ -5,16 +5,25 @@ Tracks Form 4 insider transactions, 13D activist filings, cluster buys
 The Smart Money Layer
 """
 
-import requests
 import re
+import sys
+import time
+import sqlite3
+import threading
 import xml.etree.ElementTree as ET
 from datetime import datetime, timedelta
+from pathlib import Path
 from typing import List, Dict, Optional
 from dataclasses import dataclass
 from enum import Enum
 import os
 from dotenv import load_dotenv
 
+# Shared pooled HTTP client (keep-alive connection to SEC EDGAR)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.http_client import get_http_client
+from utils.cik_index import get_cik_index
+
 # Load environment variables
 load_dotenv()
 
@@ -238,52 +247,13 @@ def fetch_recent_form4_rss(max_items: int = 100) -> List[Dict]:
     """
     Fetch recent Form 4 filings from SEC EDGAR RSS feed
     Returns list of raw filing metadata
+
+    Goes through the filing store: only entries not seen before are
+    parsed, and an unchanged feed costs one 304.
     """
-    try:
-        response = requests.get(EDGAR_RSS_FORM4, headers=SEC_HEADERS, timeout=15)
-        response.raise_for_status()
-        
-        # Parse ATOM feed
-        root = ET.fromstring(response.content)
-        ns = {'atom': 'http://www.w3.org/2005/Atom'}
-        
-        filings = []
-        for entry in root.findall('atom:entry', ns)[:max_items]:
-            filing = {}
-            
-            # Title usually contains: "4 - Company Name (Ticker)"
-            title = entry.find('atom:title', ns)
-            if title is not None:
-                filing['title'] = title.text
-                
-                # Extract ticker from title (format varies)
-                ticker_match = re.search(r'\(([A-Z]{1,5})\)', title.text)
-                if ticker_match:
-                    filing['ticker'] = ticker_match.group(1)
-            
-            # Filing date
-            updated = entry.find('atom:updated', ns)
-            if updated is not None:
-                filing['filing_date'] = updated.text[:10]
-            
-            # Link to filing
-            link = entry.find('atom:link', ns)
-            if link is not None:
-                filing['url'] = link.get('href')
-            
-            # Summary contains insider name and transaction details
-            summary = entry.find('atom:summary', ns)
-            if summary is not None:
-                filing['summary'] = summary.text
-            
-            if filing.get('ticker'):
-                filings.append(filing)
-        
-        return filings
-    
-    except Exception as e:
-        print(f"Error fetching Form 4 RSS: {e}")
-        return []
+    store = get_filing_store()
+    store.ingest('4', EDGAR_RSS_FORM4)
+    return store.recent_filings('4', limit=max_items)
 
 
 def parse_form4_summary(summary: str) -> Dict:
@@ -358,53 +328,56 @@ def fetch_form4_transactions(tickers: List[str] = None, days_back: int = 14) ->
         days_back: How many days back to fetch
     
     Returns:
-        List of InsiderTransaction objects
+        List of InsiderTransaction objects (buys with a dollar value only)
     """
-    raw_filings = fetch_recent_form4_rss(max_items=200)
+    store = get_filing_store()
+    store.ingest('4', EDGAR_RSS_FORM4)
+    return store.insider_buys(tickers=tickers, days_back=days_back)
+
+
+def build_cluster_buy(ticker: str, transactions: List[InsiderTransaction],
+                      window_days: int = 14) -> Optional[ClusterBuy]:
+    """
+    Cluster for one ticker's buys, or None if they don't form one
+    (fewer than 2 buys, or spread wider than window_days)
+    """
+    # Sort by date
+    ticker_transactions = sorted(transactions, key=lambda x: x.transaction_date)
     
-    cutoff_date = (datetime.now() - timedelta(days=days_back)).strftime('%Y-%m-%d')
-    transactions = []
+    # Need at least 2 transactions for a cluster
+    if len(ticker_transactions) < 2:
+        return None
     
-    for filing in raw_filings:
-        ticker = filing.get('ticker')
-        filing_date = filing.get('filing_date', '')
-        
-        # Filter by ticker if specified
-        if tickers and ticker not in tickers:
-            continue
-        
-        # Filter by date
-        if filing_date < cutoff_date:
-            continue
-        
-        # Parse transaction details
-        parsed = parse_form4_summary(filing.get('summary', ''))
-        
-        # Only track actual buys (not awards/grants)
-        if parsed['transaction_type'] != TransactionType.BUY:
-            continue
-        
-        # Skip if no value data
-        if parsed['total_value'] == 0:
-            continue
-        
-        transaction = InsiderTransaction(
-            ticker=ticker,
-            company_name=filing.get('title', '').split('(')[0].strip(),
-            insider_name=parsed['insider_name'] or 'Unknown',
-            insider_role=parsed['insider_role'],
-            transaction_date=filing_date,  # Approximate (actual transaction date in XML)
-            shares=parsed['shares'],
-            price_per_share=parsed['price'],
-            total_value=parsed['total_value'],
-            transaction_type=parsed['transaction_type'],
-            filing_date=filing_date,
-            filing_url=filing.get('url', ''),
-        )
-        
-        transactions.append(transaction)
+    # Check if transactions are within window
+    date_range_start = ticker_transactions[0].transaction_date
+    date_range_end = ticker_transactions[-1].transaction_date
+    
+    date_start = datetime.strptime(date_range_start, '%Y-%m-%d')
+    date_end = datetime.strptime(date_range_end, '%Y-%m-%d')
+    
+    if (date_end - date_start).days > window_days:
+        return None
+    
+    # Calculate cluster metrics
+    unique_insiders = len(set(t.insider_name for t in ticker_transactions))
+    total_value = sum(t.total_value for t in ticker_transactions)
     
-    return transactions
+    has_ceo = any(t.insider_role == InsiderRole.CEO for t in ticker_transactions)
+    has_cfo = any(t.insider_role == InsiderRole.CFO for t in ticker_transactions)
+    has_director = any(t.insider_role == InsiderRole.DIRECTOR for t in ticker_transactions)
+    
+    return ClusterBuy(
+        ticker=ticker,
+        company_name=ticker_transactions[0].company_name,
+        transactions=ticker_transactions,
+        total_value=total_value,
+        unique_insiders=unique_insiders,
+        date_range_start=date_range_start,
+        date_range_end=date_range_end,
+        has_ceo=has_ceo,
+        has_cfo=has_cfo,
+        has_director=has_director,
+    )
 
 
 def detect_cluster_buys(transactions: List[InsiderTransaction], window_days: int = 14) -> List[ClusterBuy]:
@@ -428,45 +401,9 @@ def detect_cluster_buys(transactions: List[InsiderTransaction], window_days: int
     clusters = []
     
     for ticker, ticker_transactions in by_ticker.items():
-        # Sort by date
-        ticker_transactions.sort(key=lambda x: x.transaction_date)
-        
-        # Need at least 2 transactions for a cluster
-        if len(ticker_transactions) < 2:
-            continue
-        
-        # Check if transactions are within window
-        date_range_start = ticker_transactions[0].transaction_date
-        date_range_end = ticker_transactions[-1].transaction_date
-        
-        date_start = datetime.strptime(date_range_start, '%Y-%m-%d')
-        date_end = datetime.strptime(date_range_end, '%Y-%m-%d')
-        
-        if (date_end - date_start).days > window_days:
-            continue
-        
-        # Calculate cluster metrics
-        unique_insiders = len(set(t.insider_name for t in ticker_transactions))
-        total_value = sum(t.total_value for t in ticker_transactions)
-        
-        has_ceo = any(t.insider_role == InsiderRole.CEO for t in ticker_transactions)
-        has_cfo = any(t.insider_role == InsiderRole.CFO for t in ticker_transactions)
-        has_director = any(t.insider_role == InsiderRole.DIRECTOR for t in ticker_transactions)
-        
-        cluster = ClusterBuy(
-            ticker=ticker,
-            company_name=ticker_transactions[0].company_name,
-            transactions=ticker_transactions,
-            total_value=total_value,
-            unique_insiders=unique_insiders,
-            date_range_start=date_range_start,
-            date_range_end=date_range_end,
-            has_ceo=has_ceo,
-            has_cfo=has_cfo,
-            has_director=has_director,
-        )
-        
-        clusters.append(cluster)
+        cluster = build_cluster_buy(ticker, ticker_transactions, window_days)
+        if cluster:
+            clusters.append(cluster)
     
     # Sort by score (highest first)
     clusters.sort(key=lambda c: c.get_score(), reverse=True)
@@ -479,44 +416,9 @@ def fetch_recent_13d_rss(max_items: int = 50) -> List[Dict]:
     Fetch recent 13D filings from SEC EDGAR RSS feed
     13D = Activist filing (intent to influence)
     """
-    try:
-        response = requests.get(EDGAR_RSS_13D, headers=SEC_HEADERS, timeout=15)
-        response.raise_for_status()
-        
-        root = ET.fromstring(response.content)
-        ns = {'atom': 'http://www.w3.org/2005/Atom'}
-        
-        filings = []
-        for entry in root.findall('atom:entry', ns)[:max_items]:
-            filing = {}
-            
-            title = entry.find('atom:title', ns)
-            if title is not None:
-                filing['title'] = title.text
-                ticker_match = re.search(r'\(([A-Z]{1,5})\)', title.text)
-                if ticker_match:
-                    filing['ticker'] = ticker_match.group(1)
-            
-            updated = entry.find('atom:updated', ns)
-            if updated is not None:
-                filing['filing_date'] = updated.text[:10]
-            
-            link = entry.find('atom:link', ns)
-            if link is not None:
-                filing['url'] = link.get('href')
-            
-            summary = entry.find('atom:summary', ns)
-            if summary is not None:
-                filing['summary'] = summary.text
-            
-            if filing.get('ticker'):
-                filings.append(filing)
-        
-        return filings
-    
-    except Exception as e:
-        print(f"Error fetching 13D RSS: {e}")
-        return []
+    store = get_filing_store()
+    store.ingest('13D', EDGAR_RSS_13D)
+    return store.recent_filings('13D', limit=max_items)
 
 
 def parse_13d_filing(filing: Dict) -> Optional[ActivistFiling]:
@@ -563,24 +465,504 @@ def fetch_activist_filings(days_back: int = 30) -> List[ActivistFiling]:
     """
     Fetch recent 13D activist filings
     """
-    raw_filings = fetch_recent_13d_rss(max_items=100)
+    store = get_filing_store()
+    store.ingest('13D', EDGAR_RSS_13D)
+    activist_filings = store.activist_filings(days_back=days_back)
     
-    cutoff_date = (datetime.now() - timedelta(days=days_back)).strftime('%Y-%m-%d')
+    # Sort by score (highest first)
+    activist_filings.sort(key=lambda a: a.get_score(), reverse=True)
     
-    activist_filings = []
-    for filing in raw_filings:
-        filing_date = filing.get('filing_date', '')
-        if filing_date < cutoff_date:
+    return activist_filings
+
+
+# =============================================================================
+# FILING STORE (incremental EDGAR ingestion)
+# =============================================================================
+
+FILING_STORE_PATH = os.getenv(
+    'EDGAR_FILING_STORE_PATH',
+    str(Path(__file__).resolve().parents[2] / 'data' / 'edgar_filings.db')
+)
+
+# Cached cluster results kept in memory (least recently used dropped first)
+MAX_CACHED_CLUSTERS = 4096
+
+ATOM_NS = {'atom': 'http://www.w3.org/2005/Atom'}
+ACCESSION_RE = re.compile(r'(\d{10}-\d{2}-\d{6})')
+FOLDER_ACCESSION_RE = re.compile(r'/(\d{18})/')
+
+
+def extract_accession(*texts: str) -> Optional[str]:
+    """Accession number (0001234567-26-000123) from an entry id or filing URL"""
+    for text in texts:
+        if not text:
             continue
+        match = ACCESSION_RE.search(text)
+        if match:
+            return match.group(1)
+        match = FOLDER_ACCESSION_RE.search(text)
+        if match:
+            digits = match.group(1)
+            return f"{digits[:10]}-{digits[10:12]}-{digits[12:]}"
+    return None
+
+
+def parse_feed_entry(entry) -> Dict:
+    """Raw filing dict from one EDGAR atom <entry>"""
+    filing = {}
+    
+    entry_id = entry.find('atom:id', ATOM_NS)
+    link = entry.find('atom:link', ATOM_NS)
+    filing['url'] = link.get('href') if link is not None else ''
+    filing['accession'] = extract_accession(
+        entry_id.text if entry_id is not None else '', filing['url']
+    )
+    
+    # Title usually contains: "4 - Company Name (0000723125) (Issuer)"
+    title = entry.find('atom:title', ATOM_NS)
+    if title is not None and title.text:
+        filing['title'] = title.text
         
-        parsed = parse_13d_filing(filing)
-        if parsed:
-            activist_filings.append(parsed)
+        ticker_match = re.search(r'\(([A-Z]{1,5})\)', title.text)
+        if ticker_match:
+            filing['ticker'] = ticker_match.group(1)
+        elif '(Reporting)' not in title.text and '(Filed by)' not in title.text:
+            # Issuer/subject entries carry the company CIK - map it locally
+            cik_match = re.search(r'\((\d{10})\)', title.text)
+            if cik_match:
+                ticker = get_cik_index().ticker_for(cik_match.group(1))
+                if ticker:
+                    filing['ticker'] = ticker
+    
+    updated = entry.find('atom:updated', ATOM_NS)
+    if updated is not None and updated.text:
+        filing['updated'] = updated.text
+        filing['filing_date'] = updated.text[:10]
+    
+    summary = entry.find('atom:summary', ATOM_NS)
+    if summary is not None:
+        filing['summary'] = summary.text
+    
+    return filing
+
+
+class FilingStore:
+    """
+    Local store of EDGAR filings keyed by accession number.
     
-    # Sort by score (highest first)
-    activist_filings.sort(key=lambda a: a.get_score(), reverse=True)
+    Each feed keeps a watermark (newest <updated> seen) and the ETag /
+    Last-Modified of its last response. A poll sends a conditional GET;
+    a 304 costs nothing, and a 200 only parses entries whose accession
+    number is not already stored. Parsed Form 4 / 13D fields are stored
+    with the filing, so reads never re-parse.
     
-    return activist_filings
+    Cluster buys are cached per ticker and recomputed only for tickers
+    whose buy set changed since the last call. The cache holds at most
+    MAX_CACHED_CLUSTERS results.
+    """
+    
+    def __init__(self, db_path: str = FILING_STORE_PATH):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        
+        # (ticker, window_days, cutoff) -> (signature, ClusterBuy or None),
+        # oldest use first
+        self._clusters: Dict[tuple, tuple] = {}
+        
+        self.stats = {'polls': 0, 'not_modified': 0, 'entries_seen': 0, 'entries_parsed': 0,
+                      'tickers_resolved': 0, 'clusters_recomputed': 0, 'clusters_cached': 0}
+        
+        self._create_tables()
+    
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=30)
+    
+    def _create_tables(self):
+        """Create filing and feed-state tables"""
+        os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+        
+        conn = self._connect()
+        cursor = conn.cursor()
+        
+        cursor.execute('PRAGMA journal_mode=WAL')
+        
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS edgar_filings (
+                accession TEXT PRIMARY KEY,
+                form TEXT NOT NULL,
+                ticker TEXT,
+                title TEXT,
+                filing_date TEXT,
+                updated TEXT,
+                url TEXT,
+                summary TEXT,
+                
+                -- Form 4 (parse_form4_summary)
+                insider_name TEXT,
+                insider_role TEXT,
+                transaction_type TEXT,
+                shares INTEGER,
+                price REAL,
+                total_value REAL,
+                
+                -- 13D (parse_13d_filing)
+                filer_name TEXT,
+                ownership_pct REAL,
+                
+                ingested_at REAL NOT NULL
+            )
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_edgar_filings_form_date
+            ON edgar_filings(form, filing_date)
+        ''')
+        
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS edgar_feed_state (
+                feed TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                watermark TEXT,
+                checked_at REAL
+            )
+        ''')
+        
+        conn.commit()
+        conn.close()
+    
+    # ==================== INGESTION ====================
+    
+    def ingest(self, form: str, feed_url: str) -> int:
+        """
+        Poll one EDGAR feed and store filings not seen before.
+        
+        Returns:
+            int: Number of new filings stored (0 on 304 / nothing new / error)
+        """
+        conn = self._connect()
+        cursor = conn.cursor()
+        cursor.execute(
+            'SELECT etag, last_modified, watermark FROM edgar_feed_state WHERE feed = ?', (feed_url,)
+        )
+        etag, last_modified, watermark = cursor.fetchone() or (None, None, None)
+        
+        headers = dict(SEC_HEADERS)
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        
+        with self._lock:
+            self.stats['polls'] += 1
+        
+        try:
+            response = get_http_client().get(feed_url, headers=headers, timeout=15)
+            if response.status_code == 304:
+                with self._lock:
+                    self.stats['not_modified'] += 1
+                cursor.execute('UPDATE edgar_feed_state SET checked_at = ? WHERE feed = ?',
+                               (time.time(), feed_url))
+                conn.commit()
+                conn.close()
+                return 0
+            response.raise_for_status()
+            root = ET.fromstring(response.content)
+        except Exception as e:
+            print(f"Error fetching {form} feed: {e}")
+            conn.close()
+            return 0
+        
+        # Cheap pass: accession + timestamp only. The feed is newest first,
+        # so stop at the first entry older than the watermark.
+        candidates = []
+        newest = watermark
+        for entry in root.findall('atom:entry', ATOM_NS):
+            updated_elem = entry.find('atom:updated', ATOM_NS)
+            updated = updated_elem.text if updated_elem is not None else ''
+            if watermark and updated and updated < watermark:
+                break
+            if updated and (newest is None or updated > newest):
+                newest = updated
+            
+            entry_id = entry.find('atom:id', ATOM_NS)
+            link = entry.find('atom:link', ATOM_NS)
+            accession = extract_accession(
+                entry_id.text if entry_id is not None else '',
+                link.get('href') if link is not None else ''
+            )
+            if accession:
+                candidates.append((accession, entry))
+        
+        with self._lock:
+            self.stats['entries_seen'] += len(candidates)
+        
+        # accession -> stored ticker (None if first seen via a reporting-owner entry)
+        known: Dict[str, Optional[str]] = {}
+        accessions = list({accession for accession, _ in candidates})
+        for i in range(0, len(accessions), 500):
+            chunk = accessions[i:i + 500]
+            cursor.execute(
+                f'SELECT accession, ticker FROM edgar_filings WHERE accession IN ({",".join("?" * len(chunk))})',
+                chunk
+            )
+            known.update(cursor.fetchall())
+        
+        # Full parse only for new accessions. One filing shows up once per
+        # party (issuer + reporting owner) - keep the entry that has a ticker.
+        # A stored filing without a ticker picks it up from a later issuer entry.
+        new_filings: Dict[str, Dict] = {}
+        resolved: Dict[str, Dict] = {}
+        parsed = 0
+        for accession, entry in candidates:
+            if accession in known:
+                if known[accession] or accession in resolved:
+                    continue
+                parsed += 1
+                filing = parse_feed_entry(entry)
+                if filing.get('ticker'):
+                    resolved[accession] = filing
+                continue
+            parsed += 1
+            filing = parse_feed_entry(entry)
+            current = new_filings.get(accession)
+            if current is None or (not current.get('ticker') and filing.get('ticker')):
+                new_filings[accession] = filing
+        
+        with self._lock:
+            self.stats['entries_parsed'] += parsed
+            self.stats['tickers_resolved'] += len(resolved)
+        
+        now = time.time()
+        rows = [self._to_row(form, accession, filing, now) for accession, filing in new_filings.items()]
+        cursor.executemany('''
+            INSERT OR IGNORE INTO edgar_filings (
+                accession, form, ticker, title, filing_date, updated, url, summary,
+                insider_name, insider_role, transaction_type, shares, price, total_value,
+                filer_name, ownership_pct, ingested_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', rows)
+        # ingested_at moves too, so cluster caches see the ticker's buy set change.
+        # 13D filer/ownership parsed from the filer's entry may be missing - fill them.
+        updates = []
+        for accession, filing in resolved.items():
+            activist = parse_13d_filing(filing) if form == '13D' else None
+            updates.append((
+                filing['ticker'],
+                activist.filer_name if activist else None,
+                activist.ownership_pct if activist else None,
+                now, accession,
+            ))
+        cursor.executemany('''
+            UPDATE edgar_filings
+            SET ticker = ?, filer_name = COALESCE(filer_name, ?), ownership_pct = COALESCE(ownership_pct, ?),
+                ingested_at = ?
+            WHERE accession = ? AND ticker IS NULL
+        ''', updates)
+        
+        cursor.execute('''
+            INSERT OR REPLACE INTO edgar_feed_state (feed, etag, last_modified, watermark, checked_at)
+            VALUES (?, ?, ?, ?, ?)
+        ''', (feed_url, response.headers.get('ETag'), response.headers.get('Last-Modified'), newest, now))
+        
+        conn.commit()
+        conn.close()
+        return len(rows)
+    
+    @staticmethod
+    def _to_row(form: str, accession: str, filing: Dict, now: float) -> tuple:
+        insider_name = insider_role = transaction_type = None
+        shares = price = total_value = None
+        filer_name = ownership_pct = None
+        
+        if form == '4':
+            parsed = parse_form4_summary(filing.get('summary', ''))
+            insider_name = parsed['insider_name']
+            insider_role = parsed['insider_role'].name
+            transaction_type = parsed['transaction_type'].name
+            shares = parsed['shares']
+            price = parsed['price']
+            total_value = parsed['total_value']
+        elif form == '13D':
+            parsed = parse_13d_filing(filing)
+            if parsed:
+                filer_name = parsed.filer_name
+                ownership_pct = parsed.ownership_pct
+        
+        return (
+            accession, form, filing.get('ticker'), filing.get('title'), filing.get('filing_date'),
+            filing.get('updated'), filing.get('url'), filing.get('summary'),
+            insider_name, insider_role, transaction_type, shares, price, total_value,
+            filer_name, ownership_pct, now,
+        )
+    
+    # ==================== READS ====================
+    
+    def recent_filings(self, form: str, limit: int = 100) -> List[Dict]:
+        """Newest stored filings with a ticker, as raw filing dicts"""
+        conn = self._connect()
+        cursor = conn.cursor()
+        cursor.execute('''
+            SELECT title, ticker, filing_date, url, summary
+            FROM edgar_filings
+            WHERE form = ? AND ticker IS NOT NULL
+            ORDER BY updated DESC
+            LIMIT ?
+        ''', (form, limit))
+        filings = [
+            {'title': title, 'ticker': ticker, 'filing_date': filing_date, 'url': url, 'summary': summary}
+            for title, ticker, filing_date, url, summary in cursor.fetchall()
+        ]
+        conn.close()
+        return filings
+    
+    def insider_buys(self, tickers: List[str] = None, days_back: int = 14) -> List[InsiderTransaction]:
+        """Stored Form 4 purchases (with a dollar value) since the cutoff"""
+        cutoff_date = (datetime.now() - timedelta(days=days_back)).strftime('%Y-%m-%d')
+        
+        query = '''
+            SELECT ticker, title, insider_name, insider_role, shares, price, total_value,
+                   filing_date, url
+            FROM edgar_filings
+            WHERE form = '4' AND transaction_type = 'BUY' AND total_value > 0
+            AND ticker IS NOT NULL AND filing_date >= ?
+        '''
+        params: list = [cutoff_date]
+        if tickers:
+            query += f' AND ticker IN ({",".join("?" * len(tickers))})'
+            params.extend(tickers)
+        query += ' ORDER BY updated DESC'
+        
+        conn = self._connect()
+        cursor = conn.cursor()
+        cursor.execute(query, params)
+        rows = cursor.fetchall()
+        conn.close()
+        
+        return [
+            InsiderTransaction(
+                ticker=ticker,
+                company_name=(title or '').split('(')[0].strip(),
+                insider_name=insider_name or 'Unknown',
+                insider_role=InsiderRole[insider_role] if insider_role else InsiderRole.UNKNOWN,
+                transaction_date=filing_date,  # Approximate (actual transaction date in XML)
+                shares=shares or 0,
+                price_per_share=price or 0.0,
+                total_value=total_value or 0.0,
+                transaction_type=TransactionType.BUY,
+                filing_date=filing_date,
+                filing_url=url or '',
+            )
+            for ticker, title, insider_name, insider_role, shares, price, total_value, filing_date, url in rows
+        ]
+    
+    def activist_filings(self, days_back: int = 30) -> List[ActivistFiling]:
+        """Stored 13D filings since the cutoff"""
+        cutoff_date = (datetime.now() - timedelta(days=days_back)).strftime('%Y-%m-%d')
+        
+        conn = self._connect()
+        cursor = conn.cursor()
+        cursor.execute('''
+            SELECT ticker, title, filer_name, filing_date, url, ownership_pct
+            FROM edgar_filings
+            WHERE form = '13D' AND ticker IS NOT NULL AND filing_date >= ?
+            ORDER BY updated DESC
+        ''', (cutoff_date,))
+        rows = cursor.fetchall()
+        conn.close()
+        
+        filings = []
+        for ticker, title, filer_name, filing_date, url, ownership_pct in rows:
+            filer_name = filer_name or 'Unknown'
+            is_known, tier = identify_activist_tier(filer_name)
+            filings.append(ActivistFiling(
+                ticker=ticker,
+                company_name=(title or '').split('(')[0].split('-')[-1].strip(),
+                filer_name=filer_name,
+                filing_type="13D",
+                filing_date=filing_date,
+                filing_url=url or '',
+                ownership_pct=ownership_pct,
+                is_known_activist=is_known,
+                activist_tier=tier,
+            ))
+        return filings
+    
+    def cluster_buys(self, tickers: List[str] = None, days_back: int = 14,
+                     window_days: int = 14) -> List[ClusterBuy]:
+        """
+        Cluster buys over stored Form 4 purchases.
+        
+        One aggregate query gives each ticker's buy-set signature; only
+        tickers whose signature changed are reloaded and re-clustered.
+        """
+        cutoff_date = (datetime.now() - timedelta(days=days_back)).strftime('%Y-%m-%d')
+        
+        query = '''
+            SELECT ticker, COUNT(*), MAX(ingested_at), MIN(filing_date)
+            FROM edgar_filings
+            WHERE form = '4' AND transaction_type = 'BUY' AND total_value > 0
+            AND ticker IS NOT NULL AND filing_date >= ?
+        '''
+        params: list = [cutoff_date]
+        if tickers:
+            query += f' AND ticker IN ({",".join("?" * len(tickers))})'
+            params.extend(tickers)
+        query += ' GROUP BY ticker'
+        
+        conn = self._connect()
+        cursor = conn.cursor()
+        cursor.execute(query, params)
+        signatures = {ticker: (count, ingested, first) for ticker, count, ingested, first in cursor.fetchall()}
+        conn.close()
+        
+        clusters = []
+        stale = []
+        with self._lock:
+            for ticker, signature in signatures.items():
+                cached = self._clusters.pop((ticker, window_days, cutoff_date), None)
+                if cached and cached[0] == signature:
+                    self._clusters[(ticker, window_days, cutoff_date)] = cached
+                    self.stats['clusters_cached'] += 1
+                    if cached[1]:
+                        clusters.append(cached[1])
+                else:
+                    stale.append(ticker)
+        
+        if stale:
+            by_ticker: Dict[str, List[InsiderTransaction]] = {}
+            for t in self.insider_buys(stale, days_back=days_back):
+                by_ticker.setdefault(t.ticker, []).append(t)
+            
+            with self._lock:
+                for ticker in stale:
+                    cluster = build_cluster_buy(ticker, by_ticker.get(ticker, []), window_days)
+                    self._clusters[(ticker, window_days, cutoff_date)] = (signatures[ticker], cluster)
+                    self.stats['clusters_recomputed'] += 1
+                    if cluster:
+                        clusters.append(cluster)
+        
+        with self._lock:
+            # Keys carry the cutoff date, so past days age out here too
+            while len(self._clusters) > MAX_CACHED_CLUSTERS:
+                del self._clusters[next(iter(self._clusters))]
+        
+        # Sort by score (highest first)
+        clusters.sort(key=lambda c: c.get_score(), reverse=True)
+        return clusters
+
+
+# Process-wide shared instance
+_filing_store: Optional[FilingStore] = None
+_filing_store_lock = threading.Lock()
+
+
+def get_filing_store() -> FilingStore:
+    """Get the shared FilingStore for this process"""
+    global _filing_store
+    with _filing_store_lock:
+        if _filing_store is None:
+            _filing_store = FilingStore()
+        return _filing_store
 
 
 # =============================================================================
@@ -704,7 +1086,8 @@ def scan_institutional_activity(
     transactions = fetch_form4_transactions(tickers=tickers, days_back=days_back)
     
     print("🔍 Detecting cluster buys...")
-    clusters = detect_cluster_buys(transactions, window_days=days_back)
+    # Cached per ticker - only tickers with new buys are re-clustered
+    clusters = get_filing_store().cluster_buys(tickers=tickers, days_back=days_back, window_days=days_back)
     
     print("🔍 Scanning 13D activist filings...")
     activists = fetch_activist_filings(days_back=days_back * 2)  # Wider window for activists
@@ -752,7 +1135,7 @@ def get_recent_8k_filings(count: int = 20) -> List[Dict]:
     url = f'{SEC_BASE_URL}/cgi-bin/browse-edgar?action=getcurrent&type=8-K&output=atom'
     
     try:
-        response = requests.get(url, headers=SEC_HEADERS, timeout=10)
+        response = get_http_client().get(url, headers=SEC_HEADERS, timeout=10)
         response.raise_for_status()
         
         root = ET.fromstring(response.content)
@@ -836,31 +1219,13 @@ def scan_8k_catalysts(count: int = 20) -> List[Dict]:
 # =============================================================================
 
 def get_cik_from_ticker(ticker: str) -> Optional[str]:
-    """Get CIK number from ticker symbol"""
-    url = f"{SEC_BASE_URL}/cgi-bin/browse-edgar"
-    params = {
-        'action': 'getcompany',
-        'CIK': ticker,
-        'type': '8-K',
-        'dateb': '',
-        'owner': 'include',
-        'count': '1',
-        'output': 'atom'
-    }
-    
-    try:
-        response = requests.get(url, params=params, headers=SEC_HEADERS, timeout=10)
-        # Extract CIK from response
-        if 'CIK=' in response.text:
-            start = response.text.find('CIK=') + 4
-            end = response.text.find('&', start)
-            if end == -1:
-                end = response.text.find('"', start)
-            return response.text[start:end].zfill(10)
-    except Exception as e:
-        print(f"Error getting CIK for {ticker}: {e}")
-    
-    return None
+    """Get CIK number from ticker symbol (local index - no SEC round trip)"""
+    return get_cik_index().cik_for(ticker)
+
+
+def get_company_name(ticker: str) -> Optional[str]:
+    """Get SEC-registered company name from ticker symbol"""
+    return get_cik_index().company_name(ticker)
 
 
 def get_company_filings(ticker: str, filing_type: str = '8-K', count: int = 10) -> List[Dict]:
@@ -889,7 +1254,7 @@ def get_company_filings(ticker: str, filing_type: str = '8-K', count: int = 10)
     }
     
     try:
-        response = requests.get(url, params=params, headers=SEC_HEADERS, timeout=10)
+        response = get_http_client().get(url, params=params, headers=SEC_HEADERS, timeout=10)
         root = ET.fromstring(response.content)
         ns = {'atom': 'http://www.w3.org/2005/Atom'}
         
@@ -929,10 +1294,11 @@ def get_recent_filings(ticker: str, filing_type: str = '8-K', count: int = 10) -
     - 4: Insider trading (use Form 4 functions above instead)
     """
     
+    # EDGAR accepts tickers here, but a CIK from the local index is exact
     search_url = f"{SEC_BASE_URL}/cgi-bin/browse-edgar"
     search_params = {
         'action': 'getcompany',
-        'CIK': ticker,
+        'CIK': get_cik_from_ticker(ticker) or ticker,
         'type': filing_type,
         'dateb': '',
         'owner': 'include',
@@ -941,7 +1307,7 @@ def get_recent_filings(ticker: str, filing_type: str = '8-K', count: int = 10) -
     }
     
     try:
-        response = requests.get(search_url, params=search_params, headers=SEC_HEADERS, timeout=10)
+        response = get_http_client().get(search_url, params=search_params, headers=SEC_HEADERS, timeout=10)
         
         if response.status_code != 200:
             return []
@@ -15,6 +15,7 @@ Data Source: Finnhub API (60 calls/min free tier)
 """
 
 import os
+import sys
 import requests
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
@@ -22,6 +23,9 @@ from dataclasses import dataclass
 from enum import Enum
 from dotenv import load_dotenv
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.http_client import get_http_client
+
 load_dotenv()
 
 # =============================================================================
@@ -85,6 +89,7 @@ class FinnhubClient:
         
         self.api_key = api_key
         self.base_url = FINNHUB_BASE_URL
+        self.http = get_http_client()
     
     def _make_request(self, endpoint: str, params: Dict = None) -> Optional[Dict]:
         """Make API request to Finnhub"""
@@ -94,7 +99,7 @@ class FinnhubClient:
         params['token'] = self.api_key
         
         try:
-            response = requests.get(
+            response = self.http.get(
                 f"{self.base_url}/{endpoint}",
                 params=params,
                 timeout=10
@@ -23,11 +23,11 @@ from dataclasses import dataclass, asdict
 from typing import List, Dict, Optional
 from enum import Enum
 import statistics
-import yfinance as yf
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from database import get_connection, log_trade, update_trade_outcome
+from utils.bar_store import get_bar_store
 
 # =============================================================================
 # DATA MODELS
@@ -362,6 +362,11 @@ class LearningEngine:
         
         print(f"Updating {len(trades)} trade outcomes...\n")
         
+        # Fill any bar-store gaps for every traded ticker in one bulk call
+        bars = get_bar_store()
+        oldest = min(datetime.fromisoformat(t[2]) for t in trades)
+        bars.update([t[1] for t in trades], start=oldest)
+        
         for trade_id, ticker, timestamp, action, entry_price, shares in trades:
             trade_date = datetime.fromisoformat(timestamp)
             days_since = (datetime.now() - trade_date).days
@@ -372,8 +377,7 @@ class LearningEngine:
             print(f"📈 {ticker} - {action} @ ${entry_price:.2f} ({days_since} days ago)")
             
             try:
-                stock = yf.Ticker(ticker)
-                hist = stock.history(start=trade_date.strftime('%Y-%m-%d'), period='1mo')
+                hist = bars.get_bars(ticker, start=trade_date.strftime('%Y-%m-%d'))
                 
                 if len(hist) == 0:
                     print(f"  ⚠️  No price data available")
@@ -13,6 +13,7 @@ Data Source: NewsAPI (100 requests/day free tier)
 """
 
 import os
+import sys
 import requests
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
@@ -20,6 +21,9 @@ from dataclasses import dataclass
 from enum import Enum
 from dotenv import load_dotenv
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.http_client import get_http_client
+
 load_dotenv()
 
 # =============================================================================
@@ -135,6 +139,7 @@ class NewsService:
         
         self.api_key = api_key
         self.base_url = NEWSAPI_BASE_URL
+        self.http = get_http_client()
     
     def fetch_news(
         self,
@@ -175,7 +180,7 @@ class NewsService:
         }
         
         try:
-            response = requests.get(url, params=params, timeout=10)
+            response = self.http.get(url, params=params, timeout=10)
             response.raise_for_status()
             data = response.json()
             
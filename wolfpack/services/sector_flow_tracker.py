@@ -16,13 +16,16 @@ Edge: Know which sectors are HOT vs COLD. Avoid traps (quantum basket dump).
 Ride sector waves (defense +12% = hunt defense names).
 """
 
-import yfinance as yf
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 import json
 import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.market_data import get_market_data_service
 
 
 # =============================================================================
@@ -140,6 +143,7 @@ class SectorFlowTracker:
         self.cache_path = cache_path
         self.sectors = [etf.value for etf in SectorETF]
         self.last_flow: Optional[SectorFlow] = None
+        self.market_data = get_market_data_service()
         
     def fetch_sector_data(self, lookback_days: int = 30) -> List[SectorSnapshot]:
         """
@@ -148,10 +152,12 @@ class SectorFlowTracker:
         """
         snapshots = []
         
+        # One bulk download for every sector ETF
+        self.market_data.prefetch(self.sectors, period="2mo")
+        
         for ticker in self.sectors:
             try:
-                etf = yf.Ticker(ticker)
-                hist = etf.history(period="2mo")  # Get 2 months for volume avg
+                hist = self.market_data.get_history(ticker, period="2mo")  # Get 2 months for volume avg
                 
                 if len(hist) < 20:
                     continue
@@ -242,11 +248,10 @@ class SectorFlowTracker:
         try:
             # IWM = Russell 2000 (small caps)
             # SPY = S&P 500 (large caps)
-            iwm = yf.Ticker("IWM")
-            spy = yf.Ticker("SPY")
+            self.market_data.prefetch(["IWM", "SPY"], period="1mo")
             
-            iwm_hist = iwm.history(period="1mo")
-            spy_hist = spy.history(period="1mo")
+            iwm_hist = self.market_data.get_history("IWM", period="1mo")
+            spy_hist = self.market_data.get_history("SPY", period="1mo")
             
             if len(iwm_hist) < 20 or len(spy_hist) < 20:
                 return 0.0
@@ -1,13 +1,111 @@
 """
-WolfPack Utilities - Unified Technical Indicators & Order Execution
-Consolidates all duplicate indicator calculations and order execution into one place.
+WolfPack Utilities - Unified Technical Indicators, Market Data, HTTP & Order Execution
+Consolidates all duplicate indicator calculations, data fetching, API access and order execution into one place.
 """
 
 from .indicators import (
     calculate_rsi,
     calculate_volume_ratio,
     calculate_sma,
-    calculate_price_change_pct
+    calculate_price_change_pct,
+    StreamingSMA,
+    StreamingEMA,
+    StreamingRSI,
+    StreamingBollingerBands,
+    StreamingATR,
+    StreamingMACD,
+    StreamingVolatility,
+    StreamingIndicatorSet,
+    restore_indicator,
+    calculate_indicators_batch,
+    latest_indicators
+)
+
+from .market_data import (
+    MarketDataService,
+    get_market_data_service
+)
+
+from .screener import (
+    screen_universe,
+    screen_panel,
+    compute_features,
+    apply_setup_rules,
+    panel_to_arrays
+)
+
+from .bar_store import (
+    BarStore,
+    get_bar_store
+)
+
+from .volume_profile import (
+    VolumeProfileStore,
+    get_volume_profiles
+)
+
+from .fundamentals_cache import (
+    FundamentalsCache,
+    get_fundamentals_cache
+)
+
+from .http_client import (
+    HttpClient,
+    get_http_client,
+    run_concurrently
+)
+
+from .rate_limiter import (
+    TokenBucket,
+    Priority,
+    RateLimitTimeout,
+    get_rate_limiter
+)
+
+from .single_flight import (
+    SingleFlight,
+    get_single_flight
+)
+
+from .task_graph import (
+    TaskGraph,
+    NodeResult
+)
+
+from .quote_stream import (
+    Tick,
+    QuoteBus,
+    QuoteStream,
+    SimulatedFeedServer,
+    MoveDetector,
+    VolumeSpikeDetector,
+    StopMonitor,
+    DailyReference
+)
+
+from .tick_buffer import (
+    TickRing,
+    TickBuffers
+)
+
+from .shared_quotes import (
+    SharedQuoteTable,
+    QuoteFeeder,
+    get_shared_quotes,
+    get_live_quote,
+    get_live_price
+)
+
+from .cik_index import (
+    CikIndex,
+    get_cik_index
+)
+
+from .cassette import (
+    Cassette,
+    CassetteMiss,
+    use_cassette,
+    install_from_env
 )
 
 from .order_execution import (
@@ -26,6 +124,67 @@ __all__ = [
     'calculate_volume_ratio',
     'calculate_sma',
     'calculate_price_change_pct',
+    'StreamingSMA',
+    'StreamingEMA',
+    'StreamingRSI',
+    'StreamingBollingerBands',
+    'StreamingATR',
+    'StreamingMACD',
+    'StreamingVolatility',
+    'StreamingIndicatorSet',
+    'restore_indicator',
+    'calculate_indicators_batch',
+    'latest_indicators',
+    # Market Data
+    'MarketDataService',
+    'get_market_data_service',
+    'BarStore',
+    'get_bar_store',
+    'FundamentalsCache',
+    'get_fundamentals_cache',
+    'VolumeProfileStore',
+    'get_volume_profiles',
+    'screen_universe',
+    'screen_panel',
+    'compute_features',
+    'apply_setup_rules',
+    'panel_to_arrays',
+    # HTTP
+    'HttpClient',
+    'get_http_client',
+    'run_concurrently',
+    'TokenBucket',
+    'Priority',
+    'RateLimitTimeout',
+    'get_rate_limiter',
+    'SingleFlight',
+    'get_single_flight',
+    'CikIndex',
+    'get_cik_index',
+    # Scheduling
+    'TaskGraph',
+    'NodeResult',
+    # Streaming Quotes
+    'Tick',
+    'QuoteBus',
+    'QuoteStream',
+    'SimulatedFeedServer',
+    'MoveDetector',
+    'VolumeSpikeDetector',
+    'StopMonitor',
+    'DailyReference',
+    'TickRing',
+    'TickBuffers',
+    'SharedQuoteTable',
+    'QuoteFeeder',
+    'get_shared_quotes',
+    'get_live_quote',
+    'get_live_price',
+    # Record / Replay
+    'Cassette',
+    'CassetteMiss',
+    'use_cassette',
+    'install_from_env',
     # Order Execution
     'UnifiedOrderExecutor',
     'OrderRequest',
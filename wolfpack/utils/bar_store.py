@@ -0,0 +1,396 @@
+"""
+Persistent Daily Bar Store
+Local SQLite cache of daily OHLCV bars - history is fetched once, then only
+the missing days are appended.
+
+Replaces full-history re-downloads in:
+- wolfpack/wolfpack_recorder.py (get_stock_data)
+- wolfpack/wolfpack_updater.py (calculate_forward_return)
+- src/layer1_hunter/return_updater.py (calculate_returns)
+- wolfpack/services/learning_engine.py (LearningEngine.update_all_outcomes)
+
+Every script reads the same data/bar_store.db, so the nightly record and
+update jobs see identical bars. Missing ranges are fetched in bulk through
+the shared MarketDataService.
+
+Usage:
+    from utils.bar_store import get_bar_store
+
+    bars = get_bar_store()
+    bars.update(ALL_TICKERS, period='1y')        # one bulk call for the gaps
+    hist = bars.get_history('MU', period='1y')   # answered from disk
+    hist = bars.get_bars('MU', start='2026-01-02', end='2026-01-20')
+    panel = bars.read_panel(start='2021-01-01')  # every stored ticker, disk only
+"""
+
+import os
+import time
+import sqlite3
+import threading
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import pandas as pd
+
+from .market_data import (
+    CACHE_TTL_SECONDS,
+    OHLCV_COLUMNS,
+    PERIOD_DAYS,
+    get_market_data_service,
+)
+
+
+DEFAULT_DB_PATH = os.getenv(
+    'BAR_STORE_PATH',
+    os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'bar_store.db')
+)
+
+# Adjusted closes are rewritten by yfinance after splits/dividends. If a
+# settled overlapping bar moves by more than this, the stored history is refetched.
+ADJUSTMENT_TOLERANCE = 0.005
+
+# Extra calendar days re-requested ahead of a forward gap, so the download
+# always overlaps at least one completed session (long weekends included)
+OVERLAP_DAYS = 5
+
+DateLike = Union[str, date, datetime, pd.Timestamp]
+
+
+def _to_date(value: DateLike) -> date:
+    """Normalize str/datetime/Timestamp to a date"""
+    if isinstance(value, str):
+        return datetime.strptime(value[:10], '%Y-%m-%d').date()
+    if isinstance(value, datetime):
+        return value.date()
+    return value
+
+
+def period_start(period: str, today: Optional[date] = None) -> date:
+    """First calendar date covered by a yfinance-style period"""
+    today = today or date.today()
+    days = PERIOD_DAYS.get(period)
+    if days is None:
+        return date(1970, 1, 1)
+    return today - timedelta(days=days)
+
+
+class BarStore:
+    """
+    On-disk daily bar cache keyed by ticker.
+
+    Tables:
+        daily_bars   - one row per (ticker, date)
+        bar_coverage - date range already requested from the network, so
+                       holidays/weekends are not re-fetched forever
+    """
+
+    def __init__(self, db_path: str = DEFAULT_DB_PATH, refresh_ttl: int = CACHE_TTL_SECONDS):
+        """
+        Args:
+            db_path: SQLite file for the store
+            refresh_ttl: Seconds before today's (possibly partial) bar is refetched
+        """
+        self.db_path = db_path
+        self.refresh_ttl = refresh_ttl
+        self.market_data = get_market_data_service()
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self._init_database()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def _init_database(self):
+        conn = self._connect()
+        cursor = conn.cursor()
+
+        # WAL lets the recorder write while other scripts read
+        cursor.execute('PRAGMA journal_mode=WAL')
+
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS daily_bars (
+            ticker TEXT NOT NULL,
+            date TEXT NOT NULL,
+            open REAL,
+            high REAL,
+            low REAL,
+            close REAL,
+            volume INTEGER,
+            PRIMARY KEY (ticker, date)
+        ) WITHOUT ROWID
+        ''')
+
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS bar_coverage (
+            ticker TEXT PRIMARY KEY,
+            first_date TEXT NOT NULL,
+            checked_through TEXT NOT NULL,
+            updated_at REAL NOT NULL
+        )
+        ''')
+
+        conn.commit()
+        conn.close()
+
+    # ==================== READS ====================
+
+    def get_bars(self, ticker: str, start: DateLike, end: Optional[DateLike] = None) -> pd.DataFrame:
+        """
+        Daily bars for [start, end) - same range semantics as
+        yf.Ticker(ticker).history(start=..., end=...).
+
+        Only the part of the range not already on disk hits the network.
+        """
+        start_d = _to_date(start)
+        end_d = _to_date(end) if end is not None else date.today() + timedelta(days=1)
+
+        self.update([ticker], start=start_d, end=end_d)
+        return self._read(ticker, start_d, end_d)
+
+    def get_history(self, ticker: str, period: str = '1y') -> pd.DataFrame:
+        """Drop-in replacement for yf.Ticker(ticker).history(period=...)"""
+        return self.get_bars(ticker, start=period_start(period))
+
+    def get_many(self, tickers: List[str], period: str = '1y') -> Dict[str, pd.DataFrame]:
+        """Bulk read: fill gaps for all tickers in one pass, then read from disk"""
+        start_d = period_start(period)
+        end_d = date.today() + timedelta(days=1)
+        self.update(tickers, start=start_d, end=end_d)
+        return {t: self._read(t, start_d, end_d) for t in dict.fromkeys(tickers)}
+
+    def read_panel(self, tickers: Optional[List[str]] = None, start: DateLike = '1970-01-01',
+                   end: Optional[DateLike] = None) -> pd.DataFrame:
+        """
+        Disk-only bulk read - no network, no gap filling.
+
+        Returns:
+            (date x (ticker, field)) panel, the same layout as
+            MarketDataService.get_panel(). tickers=None reads every ticker.
+        """
+        start_d = _to_date(start)
+        end_d = _to_date(end) if end is not None else date.today() + timedelta(days=1)
+
+        query = ('SELECT ticker, date, open, high, low, close, volume FROM daily_bars '
+                 'WHERE date >= ? AND date < ?')
+        params = [start_d.isoformat(), end_d.isoformat()]
+
+        conn = self._connect()
+        if tickers is None:
+            frames = [pd.read_sql_query(query, conn, params=params)]
+        else:
+            tickers = list(dict.fromkeys(tickers))
+            frames = []
+            for i in range(0, len(tickers), 500):
+                chunk = tickers[i:i + 500]
+                frames.append(pd.read_sql_query(
+                    query + f' AND ticker IN ({",".join("?" * len(chunk))})',
+                    conn, params=params + chunk
+                ))
+        conn.close()
+
+        bars = pd.concat(frames, ignore_index=True)
+        if bars.empty:
+            return pd.DataFrame()
+
+        bars['date'] = pd.to_datetime(bars['date'])
+        bars.columns = ['ticker', 'Date'] + OHLCV_COLUMNS
+        panel = bars.set_index(['Date', 'ticker']).unstack('ticker')
+        return panel.swaplevel(0, 1, axis=1).sort_index(axis=1).sort_index()
+
+    def _read(self, ticker: str, start_d: date, end_d: date) -> pd.DataFrame:
+        conn = self._connect()
+        df = pd.read_sql_query(
+            '''
+            SELECT date, open, high, low, close, volume
+            FROM daily_bars
+            WHERE ticker = ? AND date >= ? AND date < ?
+            ORDER BY date
+            ''',
+            conn,
+            params=(ticker, start_d.isoformat(), end_d.isoformat()),
+        )
+        conn.close()
+
+        if df.empty:
+            return pd.DataFrame(columns=OHLCV_COLUMNS)
+
+        df['date'] = pd.to_datetime(df['date'])
+        df = df.set_index('date')
+        df.index.name = 'Date'
+        df.columns = OHLCV_COLUMNS
+        return df
+
+    # ==================== WRITES ====================
+
+    def update(self, tickers: Iterable[str], start: Optional[DateLike] = None,
+               end: Optional[DateLike] = None, period: Optional[str] = None) -> int:
+        """
+        Make sure every ticker has bars for [start, end) on disk.
+
+        Tickers missing the same range are grouped into one bulk download,
+        so a nightly run over the universe is usually a single call for
+        "yesterday until today".
+
+        Returns:
+            int: Number of tickers that needed a download
+        """
+        if start is None:
+            start = period_start(period or '1y')
+        start_d = _to_date(start)
+        end_d = _to_date(end) if end is not None else date.today() + timedelta(days=1)
+        end_d = min(end_d, date.today() + timedelta(days=1))  # nothing to fetch past today
+
+        tickers = [t for t in dict.fromkeys(tickers) if t]
+
+        with self._lock:
+            coverage = self._load_coverage(tickers)
+
+            # (fetch_start, fetch_end) -> tickers needing exactly that range
+            groups: Dict[Tuple[date, date], List[str]] = {}
+            for ticker in tickers:
+                for gap in self._missing_ranges(coverage.get(ticker), start_d, end_d):
+                    groups.setdefault(gap, []).append(ticker)
+
+            needed = set()
+            for (gap_start, gap_end), group in groups.items():
+                needed.update(group)
+                self._fetch_and_store(group, gap_start, gap_end, coverage)
+
+        return len(needed)
+
+    def _missing_ranges(self, cov: Optional[Tuple[date, date, float]],
+                        start_d: date, end_d: date) -> List[Tuple[date, date]]:
+        """Sub-ranges of [start_d, end_d) not yet requested from the network"""
+        if start_d >= end_d:
+            return []
+        if cov is None:
+            return [(start_d, end_d)]
+
+        first, checked_through, updated_at = cov
+        gaps = []
+
+        if start_d < first:
+            gaps.append((start_d, first))
+
+        today = date.today()
+        if end_d > checked_through:
+            # Re-request the last checked day too - it may have been partial -
+            # plus a few settled sessions to check adjustments against
+            last_checked = min(checked_through - timedelta(days=1), today)
+            gaps.append((max(last_checked - timedelta(days=OVERLAP_DAYS), first), end_d))
+        elif end_d > today and time.time() - updated_at > self.refresh_ttl:
+            gaps.append((today, end_d))
+
+        return gaps
+
+    def _fetch_and_store(self, tickers: List[str], start_d: date, end_d: date,
+                         coverage: Dict[str, Tuple[date, date, float]]):
+        frames = self.market_data.download_range(tickers, start_d.isoformat(), end_d.isoformat())
+
+        conn = self._connect()
+        cursor = conn.cursor()
+        now = time.time()
+
+        for ticker, df in frames.items():
+            cov = coverage.get(ticker)
+
+            if cov and not df.empty and self._adjustment_changed(cursor, ticker, df, cov[2]):
+                # Split/dividend re-adjusted the history - refetch it in full
+                cursor.execute('DELETE FROM daily_bars WHERE ticker = ?', (ticker,))
+                cursor.execute('DELETE FROM bar_coverage WHERE ticker = ?', (ticker,))
+                conn.commit()
+                full_start = min(cov[0], start_d)
+                full = self.market_data.download_range([ticker], full_start.isoformat(), end_d.isoformat())
+                if ticker not in full:
+                    coverage.pop(ticker, None)
+                    continue
+                df = full[ticker]
+                cov = None
+                start_d_ticker = full_start
+            else:
+                start_d_ticker = start_d
+
+            rows = [
+                (
+                    ticker,
+                    idx.strftime('%Y-%m-%d'),
+                    float(bar['Open']) if pd.notna(bar['Open']) else None,
+                    float(bar['High']) if pd.notna(bar['High']) else None,
+                    float(bar['Low']) if pd.notna(bar['Low']) else None,
+                    float(bar['Close']) if pd.notna(bar['Close']) else None,
+                    int(bar['Volume']) if pd.notna(bar['Volume']) else 0,
+                )
+                for idx, bar in df.iterrows()
+                if pd.notna(bar.get('Close'))
+            ]
+            cursor.executemany('''
+                INSERT OR REPLACE INTO daily_bars (ticker, date, open, high, low, close, volume)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', rows)
+
+            first = min(cov[0], start_d_ticker) if cov else start_d_ticker
+            checked_through = max(cov[1], end_d) if cov else end_d
+            cursor.execute('''
+                INSERT OR REPLACE INTO bar_coverage (ticker, first_date, checked_through, updated_at)
+                VALUES (?, ?, ?, ?)
+            ''', (ticker, first.isoformat(), checked_through.isoformat(), now))
+            coverage[ticker] = (first, checked_through, now)
+
+        conn.commit()
+        conn.close()
+
+    @staticmethod
+    def _adjustment_changed(cursor: sqlite3.Cursor, ticker: str, df: pd.DataFrame,
+                            updated_at: float) -> bool:
+        """
+        True if freshly fetched bars disagree with stored bars for the same days.
+
+        Only settled bars are compared: days before the last write to this
+        ticker (and before today). A bar stored on its own trading day was
+        partial, so an ordinary intraday move is not mistaken for a split.
+        """
+        settled_before = min(date.fromtimestamp(updated_at), date.today()).isoformat()
+        cursor.execute(
+            'SELECT date, close FROM daily_bars WHERE ticker = ? AND date >= ? AND date <= ? AND date < ?',
+            (ticker, df.index[0].strftime('%Y-%m-%d'), df.index[-1].strftime('%Y-%m-%d'), settled_before)
+        )
+        stored = dict(cursor.fetchall())
+        if not stored:
+            return False
+
+        for idx, close in df['Close'].items():
+            old = stored.get(idx.strftime('%Y-%m-%d'))
+            if old and pd.notna(close) and abs(float(close) - old) / old > ADJUSTMENT_TOLERANCE:
+                return True
+        return False
+
+    def _load_coverage(self, tickers: List[str]) -> Dict[str, Tuple[date, date, float]]:
+        conn = self._connect()
+        cursor = conn.cursor()
+        coverage = {}
+        for i in range(0, len(tickers), 500):
+            chunk = tickers[i:i + 500]
+            cursor.execute(
+                'SELECT ticker, first_date, checked_through, updated_at FROM bar_coverage '
+                f'WHERE ticker IN ({",".join("?" * len(chunk))})',
+                chunk
+            )
+            for ticker, first, through, updated_at in cursor.fetchall():
+                coverage[ticker] = (_to_date(first), _to_date(through), updated_at)
+        conn.close()
+        return coverage
+
+
+# Process-wide shared instance
+_store: Optional[BarStore] = None
+_store_lock = threading.Lock()
+
+
+def get_bar_store() -> BarStore:
+    """Get the shared BarStore for this process"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = BarStore()
+        return _store
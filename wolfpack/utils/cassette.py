@@ -0,0 +1,468 @@
+"""
+HTTP Record / Replay Cassettes
+Saves every outbound data response to a compressed on-disk cassette and
+serves scans from it offline.
+
+Hooks (installed process-wide, nothing to change at call sites):
+- requests.Session.request - HttpClient (Finnhub, Polygon, NewsAPI, Alpha
+  Vantage, SEC), bare requests.get/post, Ollama (/api/tags, /api/generate)
+- yfinance YfData.get / post - every yf.download / yf.Ticker call,
+  whichever transport yfinance uses
+- urllib.request.urlopen - SEC feed in src/layer1_hunter/wolf_pack_scanner.py
+
+Modes:
+    record - requests go out as normal; each response is stored by request key
+    replay - responses come from the cassette; nothing touches the network.
+             A request with no recording raises CassetteMiss (a requests
+             ConnectionError, so existing error handling treats it as offline).
+             HttpClient skips the shared rate limits while replaying.
+
+Requests are keyed by method, URL, query params and body. API keys, tokens
+and yfinance's crumb are left out of the key, so a cassette recorded with
+one set of keys replays with another (or none). Bodies are zlib-compressed
+in one SQLite file (default data/cassettes/default.db).
+
+Enable with environment variables (read by install_from_env(), which the
+entry points call: autonomous_brain, wolf_pack, orchestrator, wolf_pack_scanner):
+    CASSETTE_MODE=record|replay
+    CASSETTE_PATH=data/cassettes/4am.db
+    CASSETTE_LATENCY=0.05        # seconds per replayed response,
+                                 # or 'recorded' to replay the real latency
+
+Usage:
+    CASSETTE_MODE=record CASSETTE_PATH=data/cassettes/4am.db \\
+        python src/wolf_brain/autonomous_brain.py --scan
+    CASSETTE_MODE=replay CASSETTE_PATH=data/cassettes/4am.db \\
+        python src/wolf_brain/autonomous_brain.py --scan
+
+    from utils.cassette import use_cassette
+
+    with use_cassette('data/cassettes/4am.db', mode='replay', latency='recorded'):
+        brain.scan_premarket_runners()
+"""
+
+import io
+import os
+import json
+import time
+import zlib
+import atexit
+import hashlib
+import inspect
+import sqlite3
+import tempfile
+import threading
+import urllib.request
+import urllib.response
+from contextlib import contextmanager
+from email.message import Message
+from typing import Dict, Optional, Union
+from urllib.parse import urlsplit, parse_qsl, urlencode
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+
+DEFAULT_PATH = os.getenv(
+    'CASSETTE_PATH',
+    os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'cassettes', 'default.db')
+)
+
+MODES = ('record', 'replay')
+
+# Query/body fields never used in the request key
+VOLATILE_PARAMS = {'token', 'apikey', 'apiKey', 'api_key', 'crumb'}
+
+# Headers that describe the wire encoding, not the (already decoded) body
+DROP_HEADERS = {'content-encoding', 'transfer-encoding', 'content-length'}
+
+
+class CassetteMiss(requests.exceptions.ConnectionError):
+    """Replay mode: no recorded response for this request"""
+    pass
+
+
+def request_key(method: str, url: str, params=None, body=None) -> str:
+    """
+    Canonical request string: METHOD scheme://host/path?sorted-params [body]
+    """
+    parts = urlsplit(url)
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)]
+
+    if isinstance(params, dict):
+        query.extend((k, v) for k, v in params.items() if v is not None)
+    elif params:
+        query.extend(params)
+
+    query = sorted(
+        (str(k), str(v)) for k, v in query if k not in VOLATILE_PARAMS
+    )
+    key = f"{method.upper()} {parts.scheme}://{(parts.hostname or '').lower()}"
+    if parts.port:
+        key += f":{parts.port}"
+    key += parts.path
+    if query:
+        key += '?' + urlencode(query)
+
+    if body is not None:
+        if isinstance(body, (dict, list)):
+            body = json.dumps(body, sort_keys=True, default=str)
+        elif isinstance(body, bytes):
+            body = body.decode('utf-8', errors='replace')
+        key += ' ' + hashlib.sha1(str(body).encode('utf-8')).hexdigest()
+
+    return key
+
+
+class Cassette:
+    """
+    One cassette file.
+
+    record() / play() are thread-safe; each call opens its own connection
+    (WAL mode), so yf.download's worker threads can record in parallel.
+    """
+
+    def __init__(self, path: str = DEFAULT_PATH, mode: str = 'replay',
+                 latency: Union[float, str] = 0.0):
+        """
+        Args:
+            path: SQLite cassette file
+            mode: 'record' or 'replay'
+            latency: Seconds to sleep per replayed response,
+                     or 'recorded' to sleep the recorded round-trip time
+        """
+        if mode not in MODES:
+            raise ValueError(f"Cassette mode must be one of {MODES}, got {mode!r}")
+
+        self.path = path
+        self.mode = mode
+        self.latency = latency
+        self._lock = threading.Lock()
+
+        self.stats = {'recorded': 0, 'replayed': 0, 'misses': 0}
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._init_database()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)
+
+    def _init_database(self):
+        conn = self._connect()
+        cursor = conn.cursor()
+
+        cursor.execute('PRAGMA journal_mode=WAL')
+
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS responses (
+            key TEXT PRIMARY KEY,
+            status INTEGER NOT NULL,
+            reason TEXT,
+            url TEXT,
+            headers TEXT,
+            encoding TEXT,
+            body BLOB,
+            elapsed REAL,
+            recorded_at TEXT
+        )
+        ''')
+
+        conn.commit()
+        conn.close()
+
+    # ==================== STORAGE ====================
+
+    def record(self, key: str, status: int, body: bytes, headers: Optional[Dict] = None,
+               url: str = '', reason: str = '', encoding: Optional[str] = None,
+               elapsed: float = 0.0):
+        """Store (or overwrite) the response for a request key"""
+        headers = {
+            k: v for k, v in (headers or {}).items()
+            if k.lower() not in DROP_HEADERS
+        }
+
+        conn = self._connect()
+        conn.execute('''
+            INSERT OR REPLACE INTO responses
+            (key, status, reason, url, headers, encoding, body, elapsed, recorded_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, datetime('now'))
+        ''', (key, status, reason, url, json.dumps(headers), encoding,
+              zlib.compress(body or b''), elapsed))
+        conn.commit()
+        conn.close()
+
+        with self._lock:
+            self.stats['recorded'] += 1
+
+    def play(self, key: str) -> Dict:
+        """
+        Recorded response for a request key.
+
+        Raises:
+            CassetteMiss: if the key was never recorded
+        """
+        conn = self._connect()
+        cursor = conn.cursor()
+        cursor.execute('''
+            SELECT status, reason, url, headers, encoding, body, elapsed
+            FROM responses WHERE key = ?
+        ''', (key,))
+        row = cursor.fetchone()
+        conn.close()
+
+        if row is None:
+            with self._lock:
+                self.stats['misses'] += 1
+            raise CassetteMiss(f"Not in cassette {os.path.basename(self.path)}: {key}")
+
+        status, reason, url, headers, encoding, body, elapsed = row
+
+        delay = (elapsed or 0.0) if self.latency == 'recorded' else float(self.latency or 0.0)
+        if delay > 0:
+            time.sleep(delay)
+
+        with self._lock:
+            self.stats['replayed'] += 1
+
+        return {
+            'status': status,
+            'reason': reason or '',
+            'url': url or '',
+            'headers': json.loads(headers or '{}'),
+            'encoding': encoding,
+            'body': zlib.decompress(body) if body else b'',
+        }
+
+    def __len__(self) -> int:
+        conn = self._connect()
+        count = conn.execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+        conn.close()
+        return count
+
+    # ==================== RESPONSE HELPERS ====================
+
+    def record_response(self, key: str, response, elapsed: float):
+        """Store a requests / curl_cffi response object"""
+        try:
+            self.record(
+                key,
+                status=response.status_code,
+                body=response.content,
+                headers=dict(response.headers),
+                url=str(response.url),
+                reason=getattr(response, 'reason', '') or '',
+                encoding=getattr(response, 'encoding', None),
+                elapsed=elapsed,
+            )
+        except Exception as e:
+            print(f"Cassette record error for {key}: {e}")
+
+    def play_response(self, key: str) -> requests.Response:
+        """Recorded response rebuilt as a requests.Response"""
+        recorded = self.play(key)
+
+        response = requests.Response()
+        response.status_code = recorded['status']
+        response.reason = recorded['reason']
+        response.url = recorded['url']
+        response.headers = CaseInsensitiveDict(recorded['headers'])
+        response.encoding = recorded['encoding']
+        response._content = recorded['body']
+        response.from_cassette = True
+        return response
+
+
+# =============================================================================
+# PROCESS-WIDE HOOKS
+# =============================================================================
+
+_active: Optional[Cassette] = None
+_originals: Dict[str, object] = {}
+_install_lock = threading.Lock()
+
+# Set while a hooked call is running, so the layer underneath it
+# (yfinance -> requests.Session) doesn't record the same request twice
+_local = threading.local()
+
+_SESSION_SIGNATURE = inspect.signature(requests.Session.request)
+
+
+def _hooked(call, key: str):
+    """Run the original call in record mode, or serve it in replay mode"""
+    cassette = _active
+    if cassette is None or getattr(_local, 'busy', False):
+        return call()
+
+    if cassette.mode == 'replay':
+        return cassette.play_response(key)
+
+    _local.busy = True
+    try:
+        start = time.monotonic()
+        response = call()
+        cassette.record_response(key, response, time.monotonic() - start)
+        return response
+    finally:
+        _local.busy = False
+
+
+def _session_request(self, *args, **kwargs):
+    original = _originals['session_request']
+    bound = _SESSION_SIGNATURE.bind(self, *args, **kwargs).arguments
+    body = bound.get('json') if bound.get('json') is not None else bound.get('data')
+    key = request_key(bound['method'], bound['url'], bound.get('params'), body)
+    return _hooked(lambda: original(self, *args, **kwargs), key)
+
+
+def _yf_get(self, url, params=None, timeout=30):
+    original = _originals['yf_get']
+    key = request_key('GET', url, params)
+    return _hooked(lambda: original(self, url, params=params, timeout=timeout), key)
+
+
+def _yf_post(self, url, body=None, params=None, timeout=30, data=None):
+    original = _originals['yf_post']
+    key = request_key('POST', url, params, body if body is not None else data)
+    return _hooked(
+        lambda: original(self, url, body=body, params=params, timeout=timeout, data=data), key
+    )
+
+
+def _urlopen(url, data=None, *args, **kwargs):
+    original = _originals['urlopen']
+    cassette = _active
+    if cassette is None or getattr(_local, 'busy', False):
+        return original(url, data, *args, **kwargs)
+
+    full_url = url.full_url if isinstance(url, urllib.request.Request) else url
+    body = data if data is not None else getattr(url, 'data', None)
+    method = url.get_method() if isinstance(url, urllib.request.Request) else ('POST' if body else 'GET')
+    key = request_key(method, full_url, body=body)
+
+    if cassette.mode == 'replay':
+        recorded = cassette.play(key)
+        headers = Message()
+        for name, value in recorded['headers'].items():
+            headers[name] = value
+        return urllib.response.addinfourl(
+            io.BytesIO(recorded['body']), headers, recorded['url'] or full_url, recorded['status']
+        )
+
+    _local.busy = True
+    try:
+        start = time.monotonic()
+        response = original(url, data, *args, **kwargs)
+        payload = response.read()
+        cassette.record(
+            key, status=response.status, body=payload, headers=dict(response.headers.items()),
+            url=response.geturl(), reason=getattr(response, 'reason', ''),
+            elapsed=time.monotonic() - start,
+        )
+        # The body has been consumed - hand back a replayable copy
+        return urllib.response.addinfourl(
+            io.BytesIO(payload), response.headers, response.geturl(), response.status
+        )
+    finally:
+        _local.busy = False
+
+
+def _print_summary():
+    cassette = _active
+    if cassette is not None:
+        s = cassette.stats
+        print(f"📼 Cassette {cassette.mode} ({os.path.basename(cassette.path)}): "
+              f"{s['recorded']} recorded, {s['replayed']} replayed, {s['misses']} misses")
+
+
+atexit.register(_print_summary)
+
+
+def install(path: str = DEFAULT_PATH, mode: str = 'replay',
+            latency: Union[float, str] = 0.0) -> Cassette:
+    """
+    Activate a cassette for the whole process.
+
+    Returns:
+        Cassette: the active cassette (its .stats count recorded / replayed / misses)
+    """
+    global _active
+    cassette = Cassette(path, mode=mode, latency=latency)
+
+    with _install_lock:
+        if not _originals:
+            _originals['session_request'] = requests.Session.request
+            requests.Session.request = _session_request
+
+            _originals['urlopen'] = urllib.request.urlopen
+            urllib.request.urlopen = _urlopen
+
+            try:
+                import yfinance as yf
+                from yfinance.data import YfData
+
+                _originals['yf_get'] = YfData.get
+                _originals['yf_post'] = YfData.post
+                YfData.get = _yf_get
+                YfData.post = _yf_post
+
+                # Cold timezone cache, so every tz lookup goes through the
+                # cassette and recordings replay on any machine
+                yf.set_tz_cache_location(tempfile.mkdtemp(prefix='yf-cassette-'))
+            except ImportError:
+                pass
+
+        _active = cassette
+
+    return cassette
+
+
+def uninstall():
+    """Deactivate the cassette and restore the original network calls"""
+    global _active
+    with _install_lock:
+        _active = None
+        if not _originals:
+            return
+
+        requests.Session.request = _originals.pop('session_request')
+        urllib.request.urlopen = _originals.pop('urlopen')
+        if 'yf_get' in _originals:
+            from yfinance.data import YfData
+            YfData.get = _originals.pop('yf_get')
+            YfData.post = _originals.pop('yf_post')
+
+
+def get_active_cassette() -> Optional[Cassette]:
+    """The installed cassette, or None when running live"""
+    return _active
+
+
+@contextmanager
+def use_cassette(path: str = DEFAULT_PATH, mode: str = 'replay',
+                 latency: Union[float, str] = 0.0):
+    """Record or replay for the duration of a with-block"""
+    cassette = install(path, mode=mode, latency=latency)
+    try:
+        yield cassette
+    finally:
+        uninstall()
+
+
+def install_from_env() -> Optional[Cassette]:
+    """
+    Install a cassette if CASSETTE_MODE is set (record / replay).
+    Safe to call more than once - later calls keep the active cassette.
+    """
+    mode = os.getenv('CASSETTE_MODE', '').strip().lower()
+    if mode not in MODES:
+        return None
+    if _active is not None:
+        return _active
+
+    latency = os.getenv('CASSETTE_LATENCY', '0').strip().lower()
+    if latency != 'recorded':
+        latency = float(latency or 0)
+
+    cassette = install(DEFAULT_PATH, mode=mode, latency=latency)
+    print(f"📼 Cassette {mode}: {cassette.path}")
+    return cassette
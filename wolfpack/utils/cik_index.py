@@ -0,0 +1,313 @@
+"""
+SEC Ticker -> CIK Index
+Persistent ticker / CIK / company-name map, loaded in bulk from SEC's
+company_tickers.json and queried in memory.
+
+Replaces the per-call browse-edgar scrape in:
+- wolfpack/services/br0kkr_service.py (get_cik_from_ticker, used by
+  get_company_filings / get_recent_filings / get_8k_filings /
+  get_10k_filings / get_10q_filings)
+
+The whole mapping (~10k companies) is one download, stored in
+data/cik_index.db and refreshed every CIK_INDEX_REFRESH_HOURS (default 24).
+Lookups never touch the network unless a ticker is missing from the
+bulk file, in which case the old browse-edgar lookup runs once and the
+answer is saved.
+
+Usage:
+    from utils.cik_index import get_cik_index
+
+    index = get_cik_index()
+    cik = index.cik_for('MU')          # '0000723125'
+    name = index.company_name('MU')    # 'MICRON TECHNOLOGY INC'
+    ticker = index.ticker_for('723125')
+"""
+
+import os
+import time
+import sqlite3
+import threading
+from typing import Dict, Optional, Tuple
+
+from .http_client import get_http_client
+
+
+DEFAULT_DB_PATH = os.getenv(
+    'CIK_INDEX_PATH',
+    os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'cik_index.db')
+)
+
+REFRESH_SECONDS = int(float(os.getenv('CIK_INDEX_REFRESH_HOURS', 24)) * 3600)
+
+# Failed refreshes are retried after this long, not on every lookup
+RETRY_SECONDS = 15 * 60
+
+SEC_BASE_URL = os.getenv('SEC_EDGAR_BASE_URL', 'https://www.sec.gov')
+COMPANY_TICKERS_URL = os.getenv('SEC_COMPANY_TICKERS_URL', f'{SEC_BASE_URL}/files/company_tickers.json')
+
+# Same identity br0kkr_service sends - SEC requires a User-Agent
+SEC_HEADERS = {
+    'User-Agent': os.getenv('SEC_USER_AGENT', 'Wolf Pack Trading tyr@wolfpacktrading.com'),
+    'Accept-Encoding': 'gzip, deflate',
+}
+
+
+def normalize_ticker(ticker: str) -> str:
+    """SEC uses dashes for share classes (BRK-B), brokers often use dots"""
+    return ticker.strip().upper().replace('.', '-')
+
+
+def normalize_cik(cik) -> str:
+    """10-digit zero-padded CIK string"""
+    return str(int(str(cik).strip())).zfill(10)
+
+
+class CikIndex:
+    """
+    In-memory ticker <-> CIK map backed by SQLite.
+
+    Loaded from disk on first use; refreshed from SEC when older than
+    refresh_seconds. A failed refresh keeps the existing map.
+    """
+
+    def __init__(self, db_path: str = DEFAULT_DB_PATH, refresh_seconds: int = REFRESH_SECONDS):
+        self.db_path = db_path
+        self.refresh_seconds = refresh_seconds
+        self.http = get_http_client()
+
+        # ticker -> (cik, name)
+        self._by_ticker: Dict[str, Tuple[str, str]] = {}
+        # cik -> ticker (first ticker listed for the company)
+        self._by_cik: Dict[str, str] = {}
+        # ticker -> time a fallback lookup found nothing
+        self._misses: Dict[str, float] = {}
+        self._refreshed_at = 0.0
+        self._last_attempt = 0.0
+        self._loaded = False
+        self._lock = threading.RLock()
+
+        self.stats = {'lookups': 0, 'hits': 0, 'fallback_lookups': 0, 'refreshes': 0}
+
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self._init_database()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def _init_database(self):
+        conn = self._connect()
+        cursor = conn.cursor()
+
+        cursor.execute('PRAGMA journal_mode=WAL')
+
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS cik_index (
+            ticker TEXT PRIMARY KEY,
+            cik TEXT NOT NULL,
+            name TEXT,
+            source TEXT DEFAULT 'bulk'
+        )
+        ''')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_cik_index_cik ON cik_index(cik)')
+
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS cik_index_meta (
+            key TEXT PRIMARY KEY,
+            value REAL NOT NULL
+        )
+        ''')
+
+        conn.commit()
+        conn.close()
+
+    # ==================== PUBLIC API ====================
+
+    def cik_for(self, ticker: str) -> Optional[str]:
+        """10-digit CIK for a ticker, or None if SEC doesn't know it"""
+        entry = self.lookup(ticker)
+        return entry[0] if entry else None
+
+    def company_name(self, ticker: str) -> Optional[str]:
+        entry = self.lookup(ticker)
+        return entry[1] if entry else None
+
+    def ticker_for(self, cik) -> Optional[str]:
+        """Reverse lookup - ticker for a CIK (e.g. from a Form 4 feed)"""
+        self._ensure_fresh()
+        try:
+            key = normalize_cik(cik)
+        except ValueError:
+            return None
+        with self._lock:
+            return self._by_cik.get(key)
+
+    def lookup(self, ticker: str) -> Optional[Tuple[str, str]]:
+        """(cik, company_name) for a ticker"""
+        self._ensure_fresh()
+        key = normalize_ticker(ticker)
+
+        with self._lock:
+            self.stats['lookups'] += 1
+            entry = self._by_ticker.get(key)
+            if entry:
+                self.stats['hits'] += 1
+                return entry
+
+            missed_at = self._misses.get(key)
+            if missed_at and time.time() - missed_at < self.refresh_seconds:
+                return None
+
+        # Not in the bulk file (new listing, odd symbol) - ask EDGAR once
+        entry = self._fallback_lookup(key)
+        if not entry:
+            with self._lock:
+                self._misses[key] = time.time()
+        else:
+            self._save_entries({key: entry}, source='lookup')
+            with self._lock:
+                self._by_ticker[key] = entry
+                self._by_cik.setdefault(entry[0], key)
+        return entry
+
+    def refresh(self) -> int:
+        """
+        Reload the full mapping from SEC.
+
+        Returns:
+            int: Number of tickers loaded (0 if the download failed)
+        """
+        with self._lock:
+            self._last_attempt = time.time()
+
+        try:
+            response = self.http.get(COMPANY_TICKERS_URL, headers=SEC_HEADERS, timeout=30)
+            response.raise_for_status()
+            payload = response.json()
+        except Exception as e:
+            print(f"CIK index refresh error: {e}")
+            return 0
+
+        rows = payload.values() if isinstance(payload, dict) else payload
+        entries = {}
+        for row in rows:
+            try:
+                ticker = normalize_ticker(row['ticker'])
+                entries[ticker] = (normalize_cik(row['cik_str']), row.get('title', ''))
+            except (KeyError, TypeError, ValueError):
+                continue
+
+        if not entries:
+            return 0
+
+        now = time.time()
+        self._save_entries(entries, source='bulk', refreshed_at=now)
+
+        with self._lock:
+            # Keep one-off lookups for tickers the bulk file doesn't list
+            extra = {t: e for t, e in self._by_ticker.items() if t not in entries}
+            self._by_ticker = {**entries, **extra}
+            self._by_cik = {}
+            for ticker, (cik, _) in self._by_ticker.items():
+                self._by_cik.setdefault(cik, ticker)
+            self._misses.clear()
+            self._refreshed_at = now
+            self.stats['refreshes'] += 1
+
+        return len(entries)
+
+    def __len__(self) -> int:
+        self._ensure_fresh()
+        with self._lock:
+            return len(self._by_ticker)
+
+    # ==================== INTERNALS ====================
+
+    def _ensure_fresh(self):
+        with self._lock:
+            if not self._loaded:
+                self._load_from_disk()
+                self._loaded = True
+
+            now = time.time()
+            if now - self._refreshed_at < self.refresh_seconds:
+                return
+            if now - self._last_attempt < RETRY_SECONDS:
+                return  # Refresh already running or recently failed
+            self._last_attempt = now
+
+        self.refresh()
+
+    def _load_from_disk(self):
+        conn = self._connect()
+        cursor = conn.cursor()
+        # Bulk rows in SEC's order first, so the primary ticker wins the reverse map
+        cursor.execute("SELECT ticker, cik, name FROM cik_index ORDER BY source = 'lookup', rowid")
+        rows = cursor.fetchall()
+        cursor.execute("SELECT value FROM cik_index_meta WHERE key = 'refreshed_at'")
+        meta = cursor.fetchone()
+        conn.close()
+
+        self._by_ticker = {ticker: (cik, name or '') for ticker, cik, name in rows}
+        self._by_cik = {}
+        for ticker, (cik, _) in self._by_ticker.items():
+            self._by_cik.setdefault(cik, ticker)
+        self._refreshed_at = meta[0] if meta else 0.0
+
+    def _save_entries(self, entries: Dict[str, Tuple[str, str]], source: str,
+                      refreshed_at: Optional[float] = None):
+        conn = self._connect()
+        cursor = conn.cursor()
+        cursor.executemany('''
+            INSERT OR REPLACE INTO cik_index (ticker, cik, name, source)
+            VALUES (?, ?, ?, ?)
+        ''', [(ticker, cik, name, source) for ticker, (cik, name) in entries.items()])
+        if refreshed_at is not None:
+            cursor.execute('''
+                INSERT OR REPLACE INTO cik_index_meta (key, value)
+                VALUES ('refreshed_at', ?)
+            ''', (refreshed_at,))
+        conn.commit()
+        conn.close()
+
+    def _fallback_lookup(self, ticker: str) -> Optional[Tuple[str, str]]:
+        """Old browse-edgar scrape, only for tickers missing from the bulk file"""
+        with self._lock:
+            self.stats['fallback_lookups'] += 1
+
+        params = {
+            'action': 'getcompany',
+            'CIK': ticker,
+            'type': '8-K',
+            'dateb': '',
+            'owner': 'include',
+            'count': '1',
+            'output': 'atom'
+        }
+        try:
+            response = self.http.get(f"{SEC_BASE_URL}/cgi-bin/browse-edgar", params=params,
+                                     headers=SEC_HEADERS, timeout=10)
+            text = response.text
+            if 'CIK=' in text:
+                start = text.find('CIK=') + 4
+                end = text.find('&', start)
+                if end == -1:
+                    end = text.find('"', start)
+                return normalize_cik(text[start:end]), ''
+        except Exception as e:
+            print(f"Error getting CIK for {ticker}: {e}")
+
+        return None
+
+
+# Process-wide shared instance
+_index: Optional[CikIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_cik_index() -> CikIndex:
+    """Get the shared CikIndex for this process"""
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = CikIndex()
+        return _index
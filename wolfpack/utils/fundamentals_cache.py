@@ -0,0 +1,295 @@
+"""
+Fundamentals Cache
+Persistent cache for yfinance .info with per-field TTLs.
+
+stock.info is the slowest yfinance call and was fetched repeatedly for the
+same ticker by:
+- src/core/danger_zone.py (the DangerZone.check_* methods)
+- src/wolf_brain/prepop_scanner.py (PrePopScorer.score_stock)
+- src/core/convergence_engine_v2.py (score_float / score_insider_ownership /
+  score_short_interest / score_ticker)
+- src/wolf_brain/autonomous_brain.py (_check_premarket_gap)
+
+One .info fetch fills every field. Slow-moving fields (float, shares
+outstanding, ownership) stay fresh for a day; live prices expire within a
+minute; everything else uses CACHE_TTL_SECONDS. The cache is stored in
+data/fundamentals_cache.db so it survives restarts.
+
+Usage:
+    from utils.fundamentals_cache import get_fundamentals_cache
+
+    fundamentals = get_fundamentals_cache()
+    info = fundamentals.get_info('MU', fields=['floatShares', 'marketCap'])
+    float_shares = info.get('floatShares', 0)
+"""
+
+import os
+import json
+import time
+import sqlite3
+import threading
+from typing import Any, Dict, List, Optional
+
+try:
+    import yfinance as yf
+    YF_AVAILABLE = True
+except ImportError:
+    YF_AVAILABLE = False
+
+from .market_data import CACHE_TTL_SECONDS
+
+
+DEFAULT_DB_PATH = os.getenv(
+    'FUNDAMENTALS_CACHE_PATH',
+    os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'fundamentals_cache.db')
+)
+
+ONE_MINUTE = 60
+ONE_DAY = 24 * 60 * 60
+
+# Field-level TTLs (seconds). Anything not listed uses CACHE_TTL_SECONDS.
+FIELD_TTLS = {
+    # Share structure / ownership - changes at most with filings
+    'floatShares': ONE_DAY,
+    'sharesOutstanding': ONE_DAY,
+    'impliedSharesOutstanding': ONE_DAY,
+    'heldPercentInsiders': ONE_DAY,
+    'heldPercentInstitutions': ONE_DAY,
+    'shortPercentOfFloat': ONE_DAY,
+    'sharesShort': ONE_DAY,
+    'shortRatio': ONE_DAY,
+
+    # Company profile
+    'longName': ONE_DAY,
+    'shortName': ONE_DAY,
+    'longBusinessSummary': ONE_DAY,
+    'sector': ONE_DAY,
+    'industry': ONE_DAY,
+    'firstTradeDateEpochUtc': ONE_DAY,
+    'totalRevenue': ONE_DAY,
+    'fiftyTwoWeekHigh': ONE_DAY,
+    'fiftyTwoWeekLow': ONE_DAY,
+
+    # Live prices - stale within a minute
+    'preMarketPrice': ONE_MINUTE,
+    'preMarketChangePercent': ONE_MINUTE,
+    'postMarketPrice': ONE_MINUTE,
+    'currentPrice': ONE_MINUTE,
+    'regularMarketPrice': ONE_MINUTE,
+    'regularMarketVolume': ONE_MINUTE,
+    'regularMarketChangePercent': ONE_MINUTE,
+    'bid': ONE_MINUTE,
+    'ask': ONE_MINUTE,
+}
+
+
+class FundamentalsCache:
+    """
+    Two-level (memory + SQLite) cache of per-ticker .info fields.
+
+    A field is fresh if it was fetched within its TTL. A field that was
+    missing from the last full fetch is also treated as fresh ("known
+    missing") until that fetch is older than the field's TTL, so tickers
+    without e.g. floatShares don't trigger a refetch on every call.
+    """
+
+    def __init__(self, db_path: str = DEFAULT_DB_PATH, default_ttl: int = CACHE_TTL_SECONDS,
+                 field_ttls: Optional[Dict[str, int]] = None):
+        """
+        Args:
+            db_path: SQLite file for the cache
+            default_ttl: TTL for fields not in field_ttls
+            field_ttls: Per-field TTL overrides (defaults to FIELD_TTLS)
+        """
+        self.db_path = db_path
+        self.default_ttl = default_ttl
+        self.field_ttls = dict(FIELD_TTLS if field_ttls is None else field_ttls)
+
+        # ticker -> {field: (value, fetched_at)}
+        self._fields: Dict[str, Dict[str, tuple]] = {}
+        # ticker -> time of last full .info fetch
+        self._fetched_at: Dict[str, float] = {}
+        self._loaded = set()
+        self._lock = threading.Lock()
+
+        self.stats = {'requests': 0, 'cache_hits': 0, 'fetches': 0}
+
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self._init_database()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def _init_database(self):
+        conn = self._connect()
+        cursor = conn.cursor()
+
+        cursor.execute('PRAGMA journal_mode=WAL')
+
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS info_fields (
+            ticker TEXT NOT NULL,
+            field TEXT NOT NULL,
+            value TEXT,
+            fetched_at REAL NOT NULL,
+            PRIMARY KEY (ticker, field)
+        ) WITHOUT ROWID
+        ''')
+
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS info_fetches (
+            ticker TEXT PRIMARY KEY,
+            fetched_at REAL NOT NULL
+        )
+        ''')
+
+        conn.commit()
+        conn.close()
+
+    # ==================== PUBLIC API ====================
+
+    def ttl_for(self, field: str) -> int:
+        """TTL in seconds for a field"""
+        return self.field_ttls.get(field, self.default_ttl)
+
+    def get_info(self, ticker: str, fields: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Cached replacement for yf.Ticker(ticker).info.
+
+        Args:
+            ticker: Stock symbol
+            fields: Fields the caller needs. Only these decide whether a
+                    refetch is required. None = every cached field.
+
+        Returns:
+            dict of field -> value (fields yfinance didn't return are absent,
+            so info.get(field, default) works exactly like before)
+        """
+        with self._lock:
+            self.stats['requests'] += 1
+
+        self._load_from_disk(ticker)
+
+        if self._is_fresh(ticker, fields):
+            with self._lock:
+                self.stats['cache_hits'] += 1
+        else:
+            self.refresh(ticker)
+
+        return self._snapshot(ticker)
+
+    def get(self, ticker: str, field: str, default: Any = None) -> Any:
+        """Single field lookup"""
+        return self.get_info(ticker, fields=[field]).get(field, default)
+
+    def refresh(self, ticker: str) -> Dict[str, Any]:
+        """Force a fresh .info fetch for a ticker and persist it"""
+        if not YF_AVAILABLE:
+            return self._snapshot(ticker)
+
+        try:
+            info = yf.Ticker(ticker).info or {}
+        except Exception as e:
+            print(f"yfinance info error for {ticker}: {e}")
+            return self._snapshot(ticker)
+
+        now = time.time()
+        with self._lock:
+            self.stats['fetches'] += 1
+            self._fields[ticker] = {field: (value, now) for field, value in info.items()}
+            self._fetched_at[ticker] = now
+
+        self._save_to_disk(ticker, info, now)
+        return dict(info)
+
+    def invalidate(self, ticker: str):
+        """Forget everything cached for a ticker"""
+        with self._lock:
+            self._fields.pop(ticker, None)
+            self._fetched_at.pop(ticker, None)
+
+        conn = self._connect()
+        conn.execute('DELETE FROM info_fields WHERE ticker = ?', (ticker,))
+        conn.execute('DELETE FROM info_fetches WHERE ticker = ?', (ticker,))
+        conn.commit()
+        conn.close()
+
+    # ==================== INTERNALS ====================
+
+    def _is_fresh(self, ticker: str, fields: Optional[List[str]]) -> bool:
+        now = time.time()
+        with self._lock:
+            cached = self._fields.get(ticker)
+            fetched_at = self._fetched_at.get(ticker)
+            if not cached or fetched_at is None:
+                return False
+
+            for field in (fields if fields is not None else list(cached)):
+                if field in cached:
+                    age = now - cached[field][1]
+                else:
+                    age = now - fetched_at  # known missing as of the last fetch
+                if age >= self.ttl_for(field):
+                    return False
+
+        return True
+
+    def _snapshot(self, ticker: str) -> Dict[str, Any]:
+        with self._lock:
+            return {field: value for field, (value, _) in self._fields.get(ticker, {}).items()}
+
+    def _load_from_disk(self, ticker: str):
+        """Pull a ticker's persisted fields into memory once per process"""
+        with self._lock:
+            if ticker in self._loaded:
+                return
+            self._loaded.add(ticker)
+
+        conn = self._connect()
+        cursor = conn.cursor()
+        cursor.execute('SELECT fetched_at FROM info_fetches WHERE ticker = ?', (ticker,))
+        row = cursor.fetchone()
+        if row:
+            cursor.execute('SELECT field, value, fetched_at FROM info_fields WHERE ticker = ?', (ticker,))
+            fields = {field: (json.loads(value), fetched) for field, value, fetched in cursor.fetchall()}
+        conn.close()
+
+        if row:
+            with self._lock:
+                # Don't clobber a fetch made by another thread in the meantime
+                if self._fetched_at.get(ticker, 0) < row[0]:
+                    self._fields[ticker] = fields
+                    self._fetched_at[ticker] = row[0]
+
+    def _save_to_disk(self, ticker: str, info: Dict[str, Any], fetched_at: float):
+        rows = [
+            (ticker, field, json.dumps(value, default=str), fetched_at)
+            for field, value in info.items()
+        ]
+        conn = self._connect()
+        cursor = conn.cursor()
+        cursor.execute('DELETE FROM info_fields WHERE ticker = ?', (ticker,))
+        cursor.executemany('''
+            INSERT INTO info_fields (ticker, field, value, fetched_at)
+            VALUES (?, ?, ?, ?)
+        ''', rows)
+        cursor.execute('''
+            INSERT OR REPLACE INTO info_fetches (ticker, fetched_at)
+            VALUES (?, ?)
+        ''', (ticker, fetched_at))
+        conn.commit()
+        conn.close()
+
+
+# Process-wide shared instance
+_cache: Optional[FundamentalsCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_fundamentals_cache() -> FundamentalsCache:
+    """Get the shared FundamentalsCache for this process"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = FundamentalsCache()
+        return _cache
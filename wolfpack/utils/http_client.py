@@ -0,0 +1,269 @@
+"""
+Shared HTTP Client
+Pooled, per-provider HTTP layer for Finnhub, Polygon, NewsAPI, Alpha Vantage
+and SEC EDGAR, with an asyncio front end.
+
+Replaces bare requests.get(...) calls (new TLS connection every time) in:
+- data_fetcher.py (DataFetcher)
+- src/core/realtime_volume_monitor.py (RealTimeVolumeMonitor)
+- wolfpack/services/earnings_service.py (FinnhubClient._make_request)
+- wolfpack/services/news_service.py (NewsService.fetch_news)
+- wolfpack/services/br0kkr_service.py (SEC fetchers)
+- src/wolf_brain/autonomous_brain.py (AutonomousBrain._get_* helpers)
+
+Each provider gets one keep-alive requests.Session with its own connection
+pool, a cap on in-flight requests, a default timeout and its shared
+cross-process rate limit (utils/rate_limiter.py). The sync get()/post()
+wrappers return plain requests.Response objects, so existing callers keep
+working unchanged. The async aget()/fetch_all() API runs requests on a shared
+worker pool, so calls to several providers overlap and take about as long as
+the slowest one.
+
+Usage:
+    from utils.http_client import get_http_client
+    from utils.rate_limiter import Priority
+
+    http = get_http_client()
+    r = http.get(url, params=params, timeout=10)      # drop-in for requests.get
+    r = http.get(url, priority=Priority.HIGH)          # jumps the rate-limit queue
+    r = http.get(url, max_wait=60)                     # wait longer than the timeout for a token
+    r.rate_limit_wait                                  # seconds spent waiting
+
+    results = http.fetch_all({                          # concurrent
+        'quote': 'https://finnhub.io/api/v1/quote?symbol=MU&token=...',
+        'news': ('https://newsapi.org/v2/everything', {'params': {...}}),
+    })
+    if not isinstance(results['quote'], Exception):
+        quote = results['quote'].json()
+"""
+
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .cassette import get_active_cassette
+from .rate_limiter import Priority, get_rate_limiter
+
+
+# Per-provider connection settings.
+#   hosts           - hostnames routed to this provider
+#   max_concurrency - in-flight requests allowed at once (also the pool size)
+#   timeout         - default timeout in seconds when the caller passes none
+PROVIDERS = {
+    'finnhub': {'hosts': ('finnhub.io',), 'max_concurrency': 10, 'timeout': 10},
+    'polygon': {'hosts': ('api.polygon.io',), 'max_concurrency': 5, 'timeout': 10},
+    'newsapi': {'hosts': ('newsapi.org',), 'max_concurrency': 4, 'timeout': 10},
+    'alphavantage': {'hosts': ('www.alphavantage.co', 'alphavantage.co'), 'max_concurrency': 2, 'timeout': 15},
+    'sec': {'hosts': ('sec.gov', 'www.sec.gov', 'data.sec.gov', 'efts.sec.gov'), 'max_concurrency': 8, 'timeout': 15},
+    'default': {'hosts': (), 'max_concurrency': 8, 'timeout': 10},
+}
+
+RequestSpec = Union[str, Tuple[str, Dict[str, Any]]]
+
+
+def run_sync(coro):
+    """
+    Run a coroutine to completion from synchronous code.
+
+    Works whether or not the calling thread already has a running event
+    loop (in that case the coroutine runs on a helper thread).
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+def run_concurrently(tasks: Dict[str, Callable[[], Any]]) -> Dict[str, Any]:
+    """
+    Run blocking callables at the same time and collect their results.
+
+    Returns:
+        {name: result} - an exception raised by a task is returned as its result
+    """
+    async def _gather():
+        names = list(tasks)
+        results = await asyncio.gather(
+            *(asyncio.to_thread(tasks[name]) for name in names),
+            return_exceptions=True
+        )
+        return dict(zip(names, results))
+
+    if not tasks:
+        return {}
+    return run_sync(_gather())
+
+
+class HttpClient:
+    """
+    Thread-safe pooled HTTP client, one Session per provider.
+
+    Concurrency limits are enforced with a semaphore per provider, so they
+    hold across threads, sync callers and async callers alike.
+    """
+
+    def __init__(self, providers: Optional[Dict[str, Dict]] = None, max_workers: Optional[int] = None):
+        """
+        Args:
+            providers: Provider settings (defaults to PROVIDERS)
+            max_workers: Worker threads for the async API
+                         (default: enough for every provider at full concurrency)
+        """
+        self.providers = {name: dict(cfg) for name, cfg in (providers or PROVIDERS).items()}
+        self.providers.setdefault('default', dict(PROVIDERS['default']))
+
+        self._host_map = {
+            host: name
+            for name, cfg in self.providers.items()
+            for host in cfg.get('hosts', ())
+        }
+        self._sessions: Dict[str, requests.Session] = {}
+        self._limits = {
+            name: threading.BoundedSemaphore(cfg['max_concurrency'])
+            for name, cfg in self.providers.items()
+        }
+        self._lock = threading.Lock()
+
+        workers = max_workers or sum(cfg['max_concurrency'] for cfg in self.providers.values())
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='http')
+
+        self.stats = {name: {'requests': 0, 'errors': 0, 'rate_limit_wait': 0.0} for name in self.providers}
+
+    # ==================== SYNC API ====================
+
+    def provider_for(self, url: str) -> str:
+        """Provider name for a URL (by hostname), 'default' if unknown"""
+        host = (urlparse(url).hostname or '').lower()
+        return self._host_map.get(host, 'default')
+
+    def session(self, provider: str) -> requests.Session:
+        """Keep-alive session for a provider (created on first use)"""
+        with self._lock:
+            session = self._sessions.get(provider)
+            if session is None:
+                pool_size = self.providers[provider]['max_concurrency']
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+                session = requests.Session()
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                self._sessions[provider] = session
+            return session
+
+    def request(self, method: str, url: str, provider: Optional[str] = None,
+                priority: Priority = Priority.NORMAL, max_wait: Optional[float] = None,
+                **kwargs) -> requests.Response:
+        """
+        Pooled, rate-limited equivalent of requests.request(method, url, **kwargs).
+
+        Args:
+            priority: Rate-limit priority (HIGH for position monitoring,
+                      LOW for background research)
+            max_wait: Longest wait for a rate-limit token in seconds
+                      (default: the request timeout)
+
+        Raises the same requests exceptions as requests.request, so existing
+        try/except blocks keep working - including RateLimitTimeout, a
+        RequestException, when no token comes within max_wait. The returned
+        response carries `rate_limit_wait` - seconds spent waiting for a token.
+        """
+        provider = provider if provider in self.providers else self.provider_for(url)
+        kwargs.setdefault('timeout', self.providers[provider]['timeout'])
+        if max_wait is None:
+            timeout = kwargs['timeout']
+            max_wait = max(timeout) if isinstance(timeout, tuple) else timeout
+
+        # Replayed responses never reach the provider - don't spend (or wait
+        # on) the shared production buckets for them
+        cassette = get_active_cassette()
+        replaying = cassette is not None and cassette.mode == 'replay'
+        limiter = None if replaying else get_rate_limiter(provider)
+        waited = limiter.acquire(priority, timeout=max_wait) if limiter else 0.0
+
+        with self._limits[provider]:
+            with self._lock:
+                self.stats[provider]['requests'] += 1
+                self.stats[provider]['rate_limit_wait'] += waited
+            try:
+                response = self.session(provider).request(method, url, **kwargs)
+            except requests.exceptions.RequestException:
+                with self._lock:
+                    self.stats[provider]['errors'] += 1
+                raise
+
+        response.rate_limit_wait = waited
+        return response
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """Drop-in for requests.get"""
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        """Drop-in for requests.post"""
+        return self.request('POST', url, **kwargs)
+
+    # ==================== ASYNC API ====================
+
+    async def arequest(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Async request - runs on the shared worker pool"""
+        loop = asyncio.get_running_loop()
+        call = functools.partial(self.request, method, url, **kwargs)
+        return await loop.run_in_executor(self._executor, call)
+
+    async def aget(self, url: str, **kwargs) -> requests.Response:
+        return await self.arequest('GET', url, **kwargs)
+
+    async def gather(self, requests_by_name: Dict[str, RequestSpec]) -> Dict[str, Any]:
+        """
+        Issue several GETs concurrently.
+
+        Args:
+            requests_by_name: {name: url} or {name: (url, kwargs)}
+
+        Returns:
+            {name: Response or the exception raised for that request}
+        """
+        names = list(requests_by_name)
+        calls = []
+        for name in names:
+            spec = requests_by_name[name]
+            url, kwargs = (spec, {}) if isinstance(spec, str) else spec
+            calls.append(self.aget(url, **kwargs))
+
+        results = await asyncio.gather(*calls, return_exceptions=True)
+        return dict(zip(names, results))
+
+    def fetch_all(self, requests_by_name: Dict[str, RequestSpec]) -> Dict[str, Any]:
+        """Synchronous wrapper around gather()"""
+        if not requests_by_name:
+            return {}
+        return run_sync(self.gather(requests_by_name))
+
+    def close(self):
+        """Close every pooled connection"""
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+
+# Process-wide shared instance
+_client: Optional[HttpClient] = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    """Get the shared HttpClient for this process"""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = HttpClient()
+        return _client
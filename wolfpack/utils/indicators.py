@@ -10,9 +10,13 @@ Consolidates RSI, volume, SMA calculations from:
 - src/wolf_brain/autonomous_brain.py
 """
 
+import math
+import warnings
+from collections import deque
+
 import pandas as pd
 import numpy as np
-from typing import Union
+from typing import Optional, Union
 
 
 def calculate_rsi(prices: Union[pd.Series, list], period: int = 14) -> float:
@@ -296,3 +300,677 @@ def calculate_volatility(prices: Union[pd.Series, list], period: int = 20) -> fl
     volatility = returns.rolling(window=period).std().iloc[-1] * 100
     
     return float(volatility) if not pd.isna(volatility) else None
+
+
+# =============================================================================
+# STREAMING INDICATORS
+# =============================================================================
+# Stateful versions of the batch functions above for realtime loops: each
+# update() takes one new bar (or tick) and costs O(1) instead of rebuilding a
+# Series and rescanning the window. Results match the batch functions to
+# floating-point tolerance. serialize() returns plain JSON-safe dicts and
+# restore_indicator() rebuilds the object, so state survives restarts.
+#
+#     rsi = StreamingRSI(14)
+#     for price in closes:
+#         rsi.update(price)
+#     rsi.value                       # == calculate_rsi(closes)
+#
+#     json.dump(rsi.serialize(), f)
+#     rsi = restore_indicator(json.load(f))
+
+class _RollingSum:
+    """
+    Fixed-window running sum.
+    
+    Recomputed exactly once per full window (amortized O(1)) so rounding
+    error never builds up, and tracks the count of non-zero values so an
+    all-zero window sums to exactly 0.
+    """
+    
+    def __init__(self, period: int):
+        self.period = period
+        self.values = deque(maxlen=period)
+        self.total = 0.0
+        self.nonzero = 0
+        self.since_resync = 0
+    
+    def push(self, x: float):
+        if len(self.values) == self.period:
+            old = self.values[0]
+            self.total -= old
+            self.nonzero -= old != 0
+        self.values.append(x)
+        self.total += x
+        self.nonzero += x != 0
+        
+        self.since_resync += 1
+        if self.since_resync >= self.period:
+            self.total = math.fsum(self.values)
+            self.since_resync = 0
+    
+    @property
+    def full(self) -> bool:
+        return len(self.values) == self.period
+    
+    @property
+    def mean(self) -> float:
+        if not self.nonzero:
+            return 0.0
+        return self.total / len(self.values)
+    
+    def state(self) -> dict:
+        return {'period': self.period, 'values': list(self.values)}
+    
+    @classmethod
+    def from_state(cls, state: dict) -> '_RollingSum':
+        rolling = cls(state['period'])
+        for x in state['values']:
+            rolling.push(x)
+        return rolling
+
+
+class _RollingVariance:
+    """
+    Fixed-window mean / sample variance (Welford, with removal).
+    
+    Adding x_new and dropping x_old is one combined Welford step; the
+    window is re-summed once per full window to keep drift bounded.
+    """
+    
+    def __init__(self, period: int):
+        self.period = period
+        self.values = deque(maxlen=period)
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.since_resync = 0
+    
+    def push(self, x: float):
+        if len(self.values) == self.period:
+            old = self.values[0]
+            self.values.append(x)
+            new_mean = self.mean + (x - old) / self.period
+            self.m2 += (x - old) * (x - new_mean + old - self.mean)
+            self.mean = new_mean
+        else:
+            self.values.append(x)
+            delta = x - self.mean
+            self.mean += delta / len(self.values)
+            self.m2 += delta * (x - self.mean)
+        
+        self.since_resync += 1
+        if self.since_resync >= self.period:
+            self._resync()
+    
+    def _resync(self):
+        n = len(self.values)
+        self.mean = math.fsum(self.values) / n
+        self.m2 = math.fsum((v - self.mean) ** 2 for v in self.values)
+        self.since_resync = 0
+    
+    @property
+    def full(self) -> bool:
+        return len(self.values) == self.period
+    
+    @property
+    def std(self) -> float:
+        """Sample standard deviation (ddof=1, same as pandas .std())"""
+        n = len(self.values)
+        if n < 2:
+            return float('nan')
+        return math.sqrt(max(self.m2, 0.0) / (n - 1))
+    
+    def state(self) -> dict:
+        return {'period': self.period, 'values': list(self.values)}
+    
+    @classmethod
+    def from_state(cls, state: dict) -> '_RollingVariance':
+        rolling = cls(state['period'])
+        rolling.values.extend(state['values'])
+        if rolling.values:
+            rolling._resync()
+        return rolling
+
+
+class StreamingIndicator:
+    """
+    Base class for streaming indicators.
+    
+    Subclasses list their constructor args in PARAMS and any other scalar
+    state in STATE; _RollingSum / _RollingVariance / nested indicator
+    attributes are listed in WINDOWS / CHILDREN.
+    """
+    
+    PARAMS = ()
+    STATE = ()
+    WINDOWS = ()
+    CHILDREN = ()
+    
+    def serialize(self) -> dict:
+        """JSON-safe snapshot of the full state"""
+        state = {'type': type(self).__name__}
+        state['params'] = {name: getattr(self, name) for name in self.PARAMS}
+        for name in self.STATE:
+            state[name] = getattr(self, name)
+        for name in self.WINDOWS:
+            state[name] = getattr(self, name).state()
+        for name in self.CHILDREN:
+            state[name] = getattr(self, name).serialize()
+        return state
+    
+    @classmethod
+    def restore(cls, state: dict) -> 'StreamingIndicator':
+        """Rebuild an indicator from serialize() output"""
+        indicator = cls(**state['params'])
+        for name in cls.STATE:
+            setattr(indicator, name, state[name])
+        for name in cls.WINDOWS:
+            window = getattr(indicator, name)
+            setattr(indicator, name, type(window).from_state(state[name]))
+        for name in cls.CHILDREN:
+            setattr(indicator, name, restore_indicator(state[name]))
+        return indicator
+
+
+class StreamingSMA(StreamingIndicator):
+    """
+    Streaming Simple Moving Average - matches calculate_sma()
+    
+    Examples:
+        >>> sma = StreamingSMA(20)
+        >>> for price in closes:
+        ...     sma.update(price)
+        >>> sma.value   # None until 20 prices
+    """
+    
+    PARAMS = ('period',)
+    WINDOWS = ('window',)
+    
+    def __init__(self, period: int):
+        self.period = period
+        self.window = _RollingSum(period)
+    
+    def update(self, price: float) -> Optional[float]:
+        self.window.push(float(price))
+        return self.value
+    
+    @property
+    def value(self) -> Optional[float]:
+        if not self.window.full:
+            return None
+        return self.window.total / self.period
+
+
+class StreamingEMA(StreamingIndicator):
+    """
+    Streaming Exponential Moving Average - same as pandas ewm(span).mean()
+    
+    pandas' default adjust=True EMA is a weighted mean over all history;
+    keeping the weighted numerator and the weight sum makes it O(1).
+    """
+    
+    PARAMS = ('span',)
+    STATE = ('numerator', 'denominator', 'count')
+    
+    def __init__(self, span: int):
+        self.span = span
+        self.decay = 1 - 2 / (span + 1)
+        self.numerator = 0.0
+        self.denominator = 0.0
+        self.count = 0
+    
+    def update(self, price: float) -> float:
+        self.numerator = float(price) + self.decay * self.numerator
+        self.denominator = 1.0 + self.decay * self.denominator
+        self.count += 1
+        return self.value
+    
+    @property
+    def value(self) -> Optional[float]:
+        if not self.count:
+            return None
+        return self.numerator / self.denominator
+
+
+class StreamingRSI(StreamingIndicator):
+    """
+    Streaming RSI - matches calculate_rsi()
+    
+    calculate_rsi() averages gains/losses over a simple rolling window, so
+    that is the default here. wilder=True switches to Wilder's smoothing
+    (avg = (avg * (period - 1) + x) / period) used by most charting tools.
+    
+    Examples:
+        >>> rsi = StreamingRSI(14)
+        >>> for price in closes:
+        ...     rsi.update(price)
+        >>> is_oversold(rsi.value)
+    """
+    
+    PARAMS = ('period', 'wilder')
+    STATE = ('prev_price', 'count', 'avg_gain', 'avg_loss')
+    WINDOWS = ('gains', 'losses')
+    
+    def __init__(self, period: int = 14, wilder: bool = False):
+        self.period = period
+        self.wilder = wilder
+        self.gains = _RollingSum(period)
+        self.losses = _RollingSum(period)
+        self.prev_price = None
+        self.count = 0          # Price changes seen
+        self.avg_gain = 0.0     # Wilder averages
+        self.avg_loss = 0.0
+    
+    def update(self, price: float) -> float:
+        price = float(price)
+        if self.prev_price is not None:
+            delta = price - self.prev_price
+            gain, loss = max(delta, 0.0), max(-delta, 0.0)
+            self.count += 1
+            
+            if self.wilder and self.count > self.period:
+                self.avg_gain = (self.avg_gain * (self.period - 1) + gain) / self.period
+                self.avg_loss = (self.avg_loss * (self.period - 1) + loss) / self.period
+            else:
+                self.gains.push(gain)
+                self.losses.push(loss)
+                if self.wilder and self.count == self.period:
+                    self.avg_gain, self.avg_loss = self.gains.mean, self.losses.mean
+        self.prev_price = price
+        return self.value
+    
+    @property
+    def value(self) -> float:
+        if self.count < self.period:
+            return 50.0  # Neutral if insufficient data
+        
+        if self.wilder:
+            gain, loss = self.avg_gain, self.avg_loss
+        else:
+            gain, loss = self.gains.mean, self.losses.mean
+        
+        if loss == 0:
+            return 100.0 if gain > 0 else 50.0
+        return 100 - (100 / (1 + gain / loss))
+
+
+class StreamingBollingerBands(StreamingIndicator):
+    """Streaming Bollinger Bands - matches calculate_bollinger_bands()"""
+    
+    PARAMS = ('period', 'std_dev')
+    WINDOWS = ('window',)
+    
+    def __init__(self, period: int = 20, std_dev: int = 2):
+        self.period = period
+        self.std_dev = std_dev
+        self.window = _RollingVariance(period)
+    
+    def update(self, price: float) -> dict:
+        self.window.push(float(price))
+        return self.value
+    
+    @property
+    def value(self) -> dict:
+        if not self.window.full:
+            return {'upper': None, 'middle': None, 'lower': None}
+        
+        middle = self.window.mean
+        width = self.window.std * self.std_dev
+        if math.isnan(width):
+            return {'upper': None, 'middle': middle, 'lower': None}
+        return {'upper': middle + width, 'middle': middle, 'lower': middle - width}
+
+
+class StreamingATR(StreamingIndicator):
+    """
+    Streaming Average True Range - matches calculate_atr()
+    
+    Like calculate_atr() this averages true range over a simple rolling
+    window by default; wilder=True uses Wilder's smoothing instead. For
+    tick data without a bar range, pass the price as high, low and close.
+    """
+    
+    PARAMS = ('period', 'wilder')
+    STATE = ('prev_close', 'count', 'atr')
+    WINDOWS = ('ranges',)
+    
+    def __init__(self, period: int = 14, wilder: bool = False):
+        self.period = period
+        self.wilder = wilder
+        self.ranges = _RollingSum(period)
+        self.prev_close = None
+        self.count = 0          # Bars seen
+        self.atr = 0.0          # Wilder average
+    
+    def update(self, high: float, low: float, close: float) -> Optional[float]:
+        high, low, close = float(high), float(low), float(close)
+        true_range = high - low
+        if self.prev_close is not None:
+            true_range = max(true_range, abs(high - self.prev_close), abs(low - self.prev_close))
+        self.count += 1
+        
+        if self.wilder and self.count > self.period:
+            self.atr = (self.atr * (self.period - 1) + true_range) / self.period
+        else:
+            self.ranges.push(true_range)
+            if self.count == self.period:
+                self.atr = self.ranges.mean
+        self.prev_close = close
+        return self.value
+    
+    @property
+    def value(self) -> Optional[float]:
+        if self.count < self.period + 1:
+            return None
+        return self.atr if self.wilder else self.ranges.mean
+
+
+class StreamingMACD(StreamingIndicator):
+    """Streaming MACD - matches calculate_macd()"""
+    
+    PARAMS = ('fast', 'slow', 'signal')
+    STATE = ('count',)
+    CHILDREN = ('ema_fast', 'ema_slow', 'ema_signal')
+    
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        self.fast = fast
+        self.slow = slow
+        self.signal = signal
+        self.ema_fast = StreamingEMA(fast)
+        self.ema_slow = StreamingEMA(slow)
+        self.ema_signal = StreamingEMA(signal)
+        self.count = 0
+    
+    def update(self, price: float) -> dict:
+        macd_line = self.ema_fast.update(price) - self.ema_slow.update(price)
+        self.ema_signal.update(macd_line)
+        self.count += 1
+        return self.value
+    
+    @property
+    def value(self) -> dict:
+        if self.count < self.slow + self.signal:
+            return {'macd': None, 'signal': None, 'histogram': None}
+        
+        macd_line = self.ema_fast.value - self.ema_slow.value
+        signal_line = self.ema_signal.value
+        return {'macd': macd_line, 'signal': signal_line, 'histogram': macd_line - signal_line}
+
+
+class StreamingVolatility(StreamingIndicator):
+    """Streaming volatility (std of returns, %) - matches calculate_volatility()"""
+    
+    PARAMS = ('period',)
+    STATE = ('prev_price',)
+    WINDOWS = ('returns',)
+    
+    def __init__(self, period: int = 20):
+        self.period = period
+        self.returns = _RollingVariance(period)
+        self.prev_price = None
+    
+    def update(self, price: float) -> Optional[float]:
+        price = float(price)
+        if self.prev_price is not None:
+            if self.prev_price != 0:
+                self.returns.push(price / self.prev_price - 1)
+            else:
+                self.returns.push(float('nan'))
+        self.prev_price = price
+        return self.value
+    
+    @property
+    def value(self) -> Optional[float]:
+        if not self.returns.full:
+            return None
+        volatility = self.returns.std * 100
+        return None if math.isnan(volatility) else volatility
+
+
+class StreamingIndicatorSet(StreamingIndicator):
+    """
+    The usual indicator bundle for one ticker, fed one bar at a time.
+    
+    Examples:
+        >>> indicators = StreamingIndicatorSet()
+        >>> for bar in bars:
+        ...     indicators.update(bar['Close'], bar['High'], bar['Low'])
+        >>> indicators.snapshot()['rsi']
+    """
+    
+    CHILDREN = ('rsi', 'sma_20', 'sma_50', 'bollinger', 'atr', 'macd', 'volatility')
+    STATE = ('last_price',)
+    
+    def __init__(self):
+        self.rsi = StreamingRSI(14)
+        self.sma_20 = StreamingSMA(20)
+        self.sma_50 = StreamingSMA(50)
+        self.bollinger = StreamingBollingerBands(20, 2)
+        self.atr = StreamingATR(14)
+        self.macd = StreamingMACD(12, 26, 9)
+        self.volatility = StreamingVolatility(20)
+        self.last_price = None
+    
+    def update(self, close: float, high: Optional[float] = None, low: Optional[float] = None) -> dict:
+        """Feed one bar (or one tick: high/low default to the price)"""
+        high = close if high is None else high
+        low = close if low is None else low
+        
+        self.rsi.update(close)
+        self.sma_20.update(close)
+        self.sma_50.update(close)
+        self.bollinger.update(close)
+        self.atr.update(high, low, close)
+        self.macd.update(close)
+        self.volatility.update(close)
+        self.last_price = float(close)
+        return self.snapshot()
+    
+    def snapshot(self) -> dict:
+        return {
+            'price': self.last_price,
+            'rsi': self.rsi.value,
+            'sma_20': self.sma_20.value,
+            'sma_50': self.sma_50.value,
+            'bollinger': self.bollinger.value,
+            'atr': self.atr.value,
+            'macd': self.macd.value,
+            'volatility': self.volatility.value
+        }
+
+
+STREAMING_INDICATORS = {
+    cls.__name__: cls for cls in (
+        StreamingSMA, StreamingEMA, StreamingRSI, StreamingBollingerBands,
+        StreamingATR, StreamingMACD, StreamingVolatility, StreamingIndicatorSet
+    )
+}
+
+
+def restore_indicator(state: dict) -> StreamingIndicator:
+    """
+    Rebuild any streaming indicator from its serialize() output
+    
+    Examples:
+        >>> saved = json.dumps(rsi.serialize())
+        >>> rsi = restore_indicator(json.loads(saved))
+    """
+    return STREAMING_INDICATORS[state['type']].restore(state)
+
+
+# =============================================================================
+# BATCH INDICATORS (TICKERS x BARS)
+# =============================================================================
+# The same indicators for a whole universe at once. Inputs are 2-D arrays,
+# one row per ticker and one column per bar, with missing bars as NaN on the
+# left of each row (utils.screener.panel_to_arrays() builds these). Every
+# function returns a matrix of the same shape, so column -1 is each ticker's
+# current value and [i, j] is ticker i's indicator as of bar j. Values match
+# the single-series functions above at every bar.
+#
+#     arrays = panel_to_arrays(panel)
+#     table = latest_indicators(arrays['Close'], arrays['High'], arrays['Low'],
+#                               tickers=arrays['tickers'])
+#     table.loc['MU', 'rsi_14']
+
+def _as_matrix(values) -> np.ndarray:
+    matrix = np.asarray(values, dtype=float)
+    return matrix.reshape(1, -1) if matrix.ndim == 1 else matrix
+
+
+def _rolling(values: np.ndarray, period: int, reducer) -> np.ndarray:
+    """Apply reducer over trailing windows; NaN until a full window of data"""
+    out = np.full(values.shape, np.nan)
+    if values.shape[1] < period:
+        return out
+    windows = np.lib.stride_tricks.sliding_window_view(values, period, axis=1)
+    out[:, period - 1:] = reducer(windows)
+    return out
+
+
+def _bars_seen(values: np.ndarray) -> np.ndarray:
+    """Number of valid bars up to and including each column"""
+    return np.cumsum(~np.isnan(values), axis=1)
+
+
+def batch_sma(close, period: int) -> np.ndarray:
+    """Rolling SMA for every ticker - matches calculate_sma()"""
+    close = _as_matrix(close)
+    return _rolling(close, period, lambda w: w.mean(axis=-1))
+
+
+def batch_ema(close, span: int) -> np.ndarray:
+    """
+    EMA for every ticker - same as pandas ewm(span).mean() (adjust=True)
+    
+    One vector update per bar; leading NaNs are skipped so each ticker's
+    EMA starts at its own first bar.
+    """
+    close = _as_matrix(close)
+    decay = 1 - 2 / (span + 1)
+    numerator = np.zeros(close.shape[0])
+    denominator = np.zeros(close.shape[0])
+    out = np.full(close.shape, np.nan)
+    
+    for j in range(close.shape[1]):
+        column = close[:, j]
+        valid = ~np.isnan(column)
+        numerator = np.where(valid, np.nan_to_num(column) + decay * numerator, numerator)
+        denominator = np.where(valid, 1.0 + decay * denominator, denominator)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            out[:, j] = np.where(denominator > 0, numerator / denominator, np.nan)
+    return out
+
+
+def batch_rsi(close, period: int = 14) -> np.ndarray:
+    """Rolling RSI for every ticker - matches calculate_rsi() (50 = insufficient data)"""
+    close = _as_matrix(close)
+    delta = np.diff(close, axis=1, prepend=np.nan)
+    with np.errstate(invalid='ignore'):
+        gains = np.where(delta > 0, delta, 0.0)
+        losses = np.where(delta < 0, -delta, 0.0)
+    
+    avg_gain = _rolling(gains, period, lambda w: w.mean(axis=-1))
+    avg_loss = _rolling(losses, period, lambda w: w.mean(axis=-1))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        rsi = 100 - 100 / (1 + avg_gain / avg_loss)
+    
+    enough = _bars_seen(close) >= period + 1
+    return np.where(enough & ~np.isnan(rsi), rsi, 50.0)
+
+
+def batch_bollinger_bands(close, period: int = 20, std_dev: int = 2) -> dict:
+    """Rolling Bollinger Bands for every ticker - matches calculate_bollinger_bands()"""
+    close = _as_matrix(close)
+    middle = batch_sma(close, period)
+    std = _rolling(close, period, lambda w: w.std(axis=-1, ddof=1))
+    return {'upper': middle + std * std_dev, 'middle': middle, 'lower': middle - std * std_dev}
+
+
+def batch_atr(high, low, close, period: int = 14) -> np.ndarray:
+    """Rolling ATR for every ticker - matches calculate_atr()"""
+    high, low, close = _as_matrix(high), _as_matrix(low), _as_matrix(close)
+    prev_close = np.roll(close, 1, axis=1)
+    prev_close[:, 0] = np.nan
+    
+    ranges = np.stack([high - low, np.abs(high - prev_close), np.abs(low - prev_close)])
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        true_range = np.nanmax(ranges, axis=0)
+    
+    atr = _rolling(true_range, period, lambda w: w.mean(axis=-1))
+    return np.where(_bars_seen(close) >= period + 1, atr, np.nan)
+
+
+def batch_macd(close, fast: int = 12, slow: int = 26, signal: int = 9) -> dict:
+    """MACD for every ticker - matches calculate_macd()"""
+    close = _as_matrix(close)
+    macd_line = batch_ema(close, fast) - batch_ema(close, slow)
+    signal_line = batch_ema(macd_line, signal)
+    
+    enough = _bars_seen(close) >= slow + signal
+    macd_line = np.where(enough, macd_line, np.nan)
+    signal_line = np.where(enough, signal_line, np.nan)
+    return {'macd': macd_line, 'signal': signal_line, 'histogram': macd_line - signal_line}
+
+
+def batch_volatility(close, period: int = 20) -> np.ndarray:
+    """Rolling volatility (std of returns, %) for every ticker - matches calculate_volatility()"""
+    close = _as_matrix(close)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        returns = np.diff(close, axis=1, prepend=np.nan) / np.roll(close, 1, axis=1)
+    return _rolling(returns, period, lambda w: w.std(axis=-1, ddof=1)) * 100
+
+
+def calculate_indicators_batch(close, high=None, low=None) -> dict:
+    """
+    Every indicator for every ticker and bar in one call
+    
+    Args:
+        close: (tickers x bars) closing prices, NaN-padded on the left
+        high, low: Same shape; default to close (ATR becomes close-to-close)
+        
+    Returns:
+        dict of (tickers x bars) matrices: sma_20, sma_50, sma_200, rsi_14,
+        bb_upper/bb_middle/bb_lower, atr_14, macd/macd_signal/macd_histogram,
+        volatility_20
+    """
+    close = _as_matrix(close)
+    high = close if high is None else _as_matrix(high)
+    low = close if low is None else _as_matrix(low)
+    
+    bands = batch_bollinger_bands(close)
+    macd = batch_macd(close)
+    return {
+        'sma_20': batch_sma(close, 20),
+        'sma_50': batch_sma(close, 50),
+        'sma_200': batch_sma(close, 200),
+        'rsi_14': batch_rsi(close, 14),
+        'bb_upper': bands['upper'],
+        'bb_middle': bands['middle'],
+        'bb_lower': bands['lower'],
+        'atr_14': batch_atr(high, low, close, 14),
+        'macd': macd['macd'],
+        'macd_signal': macd['signal'],
+        'macd_histogram': macd['histogram'],
+        'volatility_20': batch_volatility(close, 20)
+    }
+
+
+def latest_indicators(close, high=None, low=None, tickers=None) -> pd.DataFrame:
+    """
+    Current (last bar) indicator values for every ticker
+    
+    Returns:
+        DataFrame indexed by ticker, one column per indicator plus price.
+        Insufficient data is NaN (RSI: 50), like the None/50 defaults of the
+        single-series functions.
+    """
+    close = _as_matrix(close)
+    matrices = calculate_indicators_batch(close, high, low)
+    table = {'price': close[:, -1] if close.shape[1] else np.full(close.shape[0], np.nan)}
+    for name, matrix in matrices.items():
+        table[name] = matrix[:, -1] if matrix.shape[1] else np.full(matrix.shape[0], np.nan)
+    
+    index = pd.Index(list(tickers) if tickers is not None else range(close.shape[0]), name='ticker')
+    return pd.DataFrame(table, index=index)
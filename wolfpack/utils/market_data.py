@@ -0,0 +1,347 @@
+"""
+Unified Market Data Service
+Single source of truth for OHLCV history across all scanners.
+
+Replaces per-ticker yf.Ticker(t).history(...) round trips in:
+- wolfpack/wolf_pack.py (WolfPack._scan_market_v2)
+- wolfpack/services/sector_flow_tracker.py (SectorFlowTracker.fetch_sector_data)
+- src/wolf_brain/autonomous_brain.py (AutonomousBrain._get_price_data)
+- src/core/convergence_engine_v2.py (ConvergenceEngine.score_*)
+- src/core/danger_zone.py (DangerZone.check_*)
+
+Tickers are grouped into multi-symbol yf.download() batches, so a 100-ticker
+morning scan costs one or two round trips instead of hundreds. Results are
+kept in memory for CACHE_TTL_SECONDS and shorter periods are sliced out of
+longer cached ones (a '1mo' read is served from a cached '6mo' download).
+
+Usage:
+    from utils.market_data import get_market_data_service
+
+    market_data = get_market_data_service()
+    market_data.prefetch(tickers, period='6mo')       # one bulk download
+    hist = market_data.get_history('MU', period='6mo')  # served from memory
+    panel = market_data.get_panel(tickers, period='1mo')  # (ticker, field) columns
+"""
+
+import os
+import time
+import threading
+from datetime import timedelta
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+try:
+    import yfinance as yf
+    YF_AVAILABLE = True
+except ImportError:
+    YF_AVAILABLE = False
+
+
+# wolfpack/config.py loads wolfpack/.env first, so read the setting from there
+try:
+    from config import CACHE_TTL_SECONDS
+except ImportError:
+    # Another config module shadows wolfpack/config.py (e.g. fenrir/)
+    CACHE_TTL_SECONDS = int(os.getenv('CACHE_TTL_SECONDS', 300))
+
+# Tickers per yf.download() call
+DEFAULT_BATCH_SIZE = 100
+
+OHLCV_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume']
+
+# Calendar days covered by each yfinance period (used to slice cached data)
+PERIOD_DAYS = {
+    '1d': 1,
+    '5d': 5,
+    '1mo': 31,
+    '2mo': 62,
+    '3mo': 92,
+    '6mo': 183,
+    '1y': 366,
+    '2y': 731,
+    '5y': 1827,
+    '10y': 3653,
+    'max': None,
+}
+
+
+def _period_covers(cached_period: str, wanted_period: str) -> bool:
+    """True if data downloaded for cached_period also contains wanted_period"""
+    if cached_period == wanted_period:
+        return True
+    if cached_period not in PERIOD_DAYS or wanted_period not in PERIOD_DAYS:
+        return False
+    cached_days = PERIOD_DAYS[cached_period]
+    wanted_days = PERIOD_DAYS[wanted_period]
+    if cached_days is None:
+        return True
+    if wanted_days is None:
+        return False
+    return cached_days >= wanted_days
+
+
+def _slice_period(df: pd.DataFrame, period: str) -> pd.DataFrame:
+    """Trim a history frame to the trailing window of a yfinance period"""
+    days = PERIOD_DAYS.get(period)
+    if df.empty or days is None:
+        return df
+    cutoff = df.index[-1] - timedelta(days=days)
+    return df[df.index > cutoff]
+
+
+class MarketDataService:
+    """
+    Shared, batched OHLCV loader.
+
+    Thread-safe: scanners running in a ThreadPoolExecutor can all read from
+    one instance. Call prefetch() with the whole universe before fanning out
+    so every worker is served from memory.
+    """
+
+    def __init__(self, batch_size: int = DEFAULT_BATCH_SIZE, cache_ttl: int = CACHE_TTL_SECONDS):
+        """
+        Args:
+            batch_size: Tickers per bulk download
+            cache_ttl: Seconds a downloaded frame stays fresh
+        """
+        self.batch_size = batch_size
+        self.cache_ttl = cache_ttl
+
+        # ticker -> {(period, interval, prepost): (DataFrame, fetched_at)}
+        self._frames: Dict[str, Dict[Tuple[str, str, bool], Tuple[pd.DataFrame, float]]] = {}
+        self._lock = threading.Lock()
+
+        self.stats = {
+            'requests': 0,
+            'cache_hits': 0,
+            'bulk_downloads': 0,
+            'tickers_downloaded': 0,
+        }
+
+    # ==================== PUBLIC API ====================
+
+    def prefetch(self, tickers: List[str], period: str = '6mo', interval: str = '1d',
+                 prepost: bool = False) -> int:
+        """
+        Bulk-download every ticker that is not already cached.
+
+        Args:
+            prepost: Include pre/post-market bars (intraday intervals only)
+
+        Returns:
+            int: Number of tickers actually downloaded
+        """
+        missing = []
+        seen = set()
+        for ticker in tickers:
+            if not ticker or ticker in seen:
+                continue
+            seen.add(ticker)
+            if self._lookup(ticker, period, interval, prepost) is None:
+                missing.append(ticker)
+
+        for i in range(0, len(missing), self.batch_size):
+            self._download_batch(missing[i:i + self.batch_size], period, interval, prepost)
+
+        return len(missing)
+
+    def get_history(self, ticker: str, period: str = '6mo', interval: str = '1d',
+                    prepost: bool = False) -> pd.DataFrame:
+        """
+        Drop-in replacement for yf.Ticker(ticker).history(period, interval).
+
+        Returns:
+            DataFrame with Open/High/Low/Close/Volume (empty if unavailable)
+        """
+        with self._lock:
+            self.stats['requests'] += 1
+
+        df = self._lookup(ticker, period, interval, prepost)
+        if df is None:
+            self._download_batch([ticker], period, interval, prepost)
+            df = self._lookup(ticker, period, interval, prepost)
+        else:
+            with self._lock:
+                self.stats['cache_hits'] += 1
+
+        return df.copy() if df is not None else pd.DataFrame(columns=OHLCV_COLUMNS)
+
+    def get_panel(self, tickers: List[str], period: str = '6mo', interval: str = '1d',
+                  prepost: bool = False) -> pd.DataFrame:
+        """
+        Aligned multi-ticker panel.
+
+        Returns:
+            DataFrame indexed by timestamp with (ticker, field) MultiIndex
+            columns. Tickers with no data are left out.
+        """
+        self.prefetch(tickers, period, interval, prepost)
+
+        frames = {}
+        for ticker in dict.fromkeys(tickers):
+            df = self._lookup(ticker, period, interval, prepost)
+            if df is not None and not df.empty:
+                frames[ticker] = df
+
+        if not frames:
+            return pd.DataFrame()
+
+        return pd.concat(frames, axis=1).sort_index()
+
+    def download_range(self, tickers: List[str], start: str, end: Optional[str] = None,
+                       interval: str = '1d') -> Dict[str, pd.DataFrame]:
+        """
+        Bulk-download an explicit date range (start inclusive, end exclusive).
+
+        Not cached in memory - used by the on-disk bar store, which does its
+        own bookkeeping of what has already been fetched.
+
+        Returns:
+            {ticker: DataFrame} for every ticker in a successful batch
+            (empty frame if the ticker had no bars in range)
+        """
+        results = {}
+        if not YF_AVAILABLE:
+            return results
+
+        for i in range(0, len(tickers), self.batch_size):
+            batch = tickers[i:i + self.batch_size]
+            try:
+                data = yf.download(
+                    batch,
+                    start=start,
+                    end=end,
+                    interval=interval,
+                    group_by='ticker',
+                    auto_adjust=True,
+                    threads=True,
+                    progress=False,
+                )
+                with self._lock:
+                    self.stats['bulk_downloads'] += 1
+                    self.stats['tickers_downloaded'] += len(batch)
+            except Exception as e:
+                print(f"Bulk download error ({len(batch)} tickers): {e}")
+                continue
+
+            if data is None or data.empty:
+                # Nothing came back for the whole batch - treat as a failed
+                # fetch rather than "no bars", so callers can retry later
+                continue
+
+            for ticker in batch:
+                results[ticker] = self._extract(data, ticker)
+
+        return results
+
+    def invalidate(self, ticker: Optional[str] = None):
+        """Drop cached frames (all of them, or just one ticker's)"""
+        with self._lock:
+            if ticker is None:
+                self._frames.clear()
+            else:
+                self._frames.pop(ticker, None)
+
+    # ==================== INTERNALS ====================
+
+    def _lookup(self, ticker: str, period: str, interval: str,
+                prepost: bool = False) -> Optional[pd.DataFrame]:
+        """Find a fresh cached frame covering this period, or None"""
+        now = time.time()
+        with self._lock:
+            cached = self._frames.get(ticker)
+            if not cached:
+                return None
+
+            exact = cached.get((period, interval, prepost))
+            if exact and now - exact[1] < self.cache_ttl:
+                return exact[0]
+
+            for (p, i, pp), (df, fetched_at) in cached.items():
+                if i != interval or pp != prepost or now - fetched_at >= self.cache_ttl:
+                    continue
+                if _period_covers(p, period):
+                    return _slice_period(df, period)
+
+        return None
+
+    def _store(self, ticker: str, period: str, interval: str, prepost: bool, df: pd.DataFrame):
+        with self._lock:
+            self._frames.setdefault(ticker, {})[(period, interval, prepost)] = (df, time.time())
+
+    def _download_batch(self, tickers: List[str], period: str, interval: str, prepost: bool = False):
+        """One yf.download() call for a batch; per-ticker fallback on failure"""
+        if not YF_AVAILABLE or not tickers:
+            return
+
+        try:
+            data = yf.download(
+                tickers,
+                period=period,
+                interval=interval,
+                prepost=prepost,
+                group_by='ticker',
+                auto_adjust=True,
+                threads=True,
+                progress=False,
+            )
+            with self._lock:
+                self.stats['bulk_downloads'] += 1
+                self.stats['tickers_downloaded'] += len(tickers)
+        except Exception as e:
+            print(f"Bulk download error ({len(tickers)} tickers): {e}")
+            data = None
+
+        for ticker in tickers:
+            df = self._extract(data, ticker)
+            if df is None:
+                df = self._fetch_single(ticker, period, interval, prepost)
+            self._store(ticker, period, interval, prepost, df)
+
+    @staticmethod
+    def _extract(data: Optional[pd.DataFrame], ticker: str) -> Optional[pd.DataFrame]:
+        """Pull one ticker's OHLCV frame out of a yf.download() result"""
+        if data is None or data.empty:
+            return None
+
+        try:
+            if isinstance(data.columns, pd.MultiIndex):
+                if ticker not in data.columns.get_level_values(0):
+                    return pd.DataFrame(columns=OHLCV_COLUMNS)
+                df = data[ticker]
+            else:
+                df = data
+        except KeyError:
+            return pd.DataFrame(columns=OHLCV_COLUMNS)
+
+        columns = [c for c in OHLCV_COLUMNS if c in df.columns]
+        return df[columns].dropna(how='all')
+
+    @staticmethod
+    def _fetch_single(ticker: str, period: str, interval: str, prepost: bool = False) -> pd.DataFrame:
+        """Legacy single-ticker path, used only when a bulk call fails"""
+        try:
+            hist = yf.Ticker(ticker).history(period=period, interval=interval, prepost=prepost)
+            if interval.endswith(('d', 'wk', 'mo')) and getattr(hist.index, 'tz', None) is not None:
+                # Match yf.download(), which returns tz-naive daily bars
+                hist.index = hist.index.tz_localize(None)
+            columns = [c for c in OHLCV_COLUMNS if c in hist.columns]
+            return hist[columns]
+        except Exception as e:
+            print(f"yfinance error for {ticker}: {e}")
+            return pd.DataFrame(columns=OHLCV_COLUMNS)
+
+
+# Process-wide shared instance
+_service: Optional[MarketDataService] = None
+_service_lock = threading.Lock()
+
+
+def get_market_data_service() -> MarketDataService:
+    """Get the shared MarketDataService for this process"""
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = MarketDataService()
+        return _service
@@ -0,0 +1,626 @@
+"""
+Streaming Quote Pipeline
+Websocket trade feed -> in-process event bus -> move / volume / stop detectors.
+
+Replaces sleep-timer polling loops in:
+- wolfpack/realtime_monitor.py (RealTimeMonitor.check_for_moves)
+- src/core/free_volume_monitor.py (FreeVolumeMonitor.monitor_continuous)
+- src/core/realtime_volume_monitor.py (RealTimeVolumeMonitor.monitor_continuous)
+- safe_position_monitor.py (SafePositionMonitor.monitor_loop)
+
+QuoteStream holds one websocket open (Finnhub trade protocol by default),
+subscribes to the watchlist and publishes every trade to a QuoteBus as a
+Tick. The bus hands ticks to subscribers on its own dispatcher thread, so a
+slow or broken handler never stalls the socket - but it does delay every
+other subscriber, so alert callbacks hand network work (news, LLM,
+Discord) to an executor. Detectors are plain bus subscribers and fire at
+most once per ticker per day, the same as the polling monitors'
+alerted_today sets. DailyReference reloads prev close / average volume at
+each new session, for monitors that run for days.
+
+SimulatedFeedServer speaks the same protocol on localhost with random-walk
+trades, for load tests and offline runs (QUOTE_STREAM_URL points monitors
+at it).
+
+Usage:
+    from utils.quote_stream import QuoteBus, QuoteStream, MoveDetector
+
+    reference = DailyReference(tickers)
+    moves = MoveDetector(reference.field('prev_close'), threshold_pct=5.0, on_move=alert)
+    bus = QuoteBus()
+    bus.subscribe(moves)
+    bus.start()
+    stream = QuoteStream(bus, tickers)     # QUOTE_STREAM_URL or Finnhub
+    stream.start()
+    while running:                         # status loop, never a bus handler
+        time.sleep(60)
+        if reference.refresh():            # new session
+            moves.rebase(reference.field('prev_close'))
+    stream.stop(); bus.stop()
+
+    # Offline
+    server = SimulatedFeedServer({'MU': 100.0, 'KTOS': 50.0}, ticks_per_second=500)
+    url = server.start()                   # ws://127.0.0.1:<port>
+    server.inject('MU', 108.0, size=50_000)
+"""
+
+import asyncio
+import json
+import os
+import queue
+import random
+import threading
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, Iterable, List, Optional
+from zoneinfo import ZoneInfo
+
+try:
+    import websockets
+    WEBSOCKETS_AVAILABLE = True
+except ImportError:
+    WEBSOCKETS_AVAILABLE = False
+
+
+FINNHUB_STREAM_URL = 'wss://ws.finnhub.io?token={token}'
+
+RECONNECT_MIN_SECONDS = 1
+RECONNECT_MAX_SECONDS = 30
+BUS_QUEUE_SIZE = 100_000
+REFERENCE_DAYS = 20          # Days averaged into avg_volume
+MARKET_TZ = ZoneInfo('America/New_York')
+
+
+@dataclass
+class Tick:
+    """One trade print"""
+    ticker: str
+    price: float
+    size: float = 0.0
+    timestamp: float = 0.0     # Exchange time (epoch seconds)
+    received: float = 0.0      # Local time the tick came off the socket
+
+    @property
+    def latency(self) -> float:
+        return self.received - self.timestamp if self.timestamp else 0.0
+
+
+def default_stream_url() -> Optional[str]:
+    """QUOTE_STREAM_URL, else the Finnhub feed if FINNHUB_API_KEY is set"""
+    url = os.getenv('QUOTE_STREAM_URL')
+    if url:
+        return url
+    token = os.getenv('FINNHUB_API_KEY')
+    return FINNHUB_STREAM_URL.format(token=token) if token else None
+
+
+def market_date() -> date:
+    """Today in the exchange's time zone - when references and detectors roll over"""
+    return datetime.now(MARKET_TZ).date()
+
+
+def parse_message(raw, received: Optional[float] = None) -> List[Tick]:
+    """Finnhub trade message -> ticks (pings and other messages -> [])"""
+    try:
+        message = json.loads(raw)
+    except (TypeError, ValueError):
+        return []
+    if not isinstance(message, dict) or message.get('type') != 'trade':
+        return []
+
+    received = received or time.time()
+    ticks = []
+    for trade in message.get('data') or []:
+        try:
+            ticks.append(Tick(
+                ticker=trade['s'],
+                price=float(trade['p']),
+                size=float(trade.get('v') or 0),
+                timestamp=float(trade.get('t') or 0) / 1000,
+                received=received,
+            ))
+        except (KeyError, TypeError, ValueError):
+            continue
+    return ticks
+
+
+def load_reference_bars(tickers: Iterable[str], days: int = REFERENCE_DAYS) -> Dict[str, Dict[str, float]]:
+    """
+    What the detectors measure ticks against, from one uncached bulk daily
+    download.
+
+    Returns:
+        {ticker: {'prev_close', 'avg_volume', 'volume'}} where volume is
+        today's volume so far (0 before the open) and avg_volume excludes today
+    """
+    from .market_data import get_market_data_service
+
+    tickers = list(dict.fromkeys(tickers))
+    today = market_date()
+    start = (today - timedelta(days=days * 2)).isoformat()
+    frames = get_market_data_service().download_range(tickers, start=start)
+
+    reference = {}
+    for ticker, hist in frames.items():
+        if hist is None or hist.empty or 'Close' not in hist:
+            continue
+        hist = hist.dropna(subset=['Close'])
+        is_today = len(hist) and hist.index[-1].date() == today
+        history = hist.iloc[:-1] if is_today else hist
+        if history.empty:
+            continue
+        reference[ticker] = {
+            'prev_close': float(history['Close'].iloc[-1]),
+            'avg_volume': float(history['Volume'].tail(days).mean()),
+            'volume': float(hist['Volume'].iloc[-1]) if is_today else 0.0,
+        }
+    return reference
+
+
+class DailyReference:
+    """
+    load_reference_bars() for a fixed ticker list, reloaded when the market
+    date rolls over.
+
+    refresh() downloads, so call it from a monitor's status loop, not from
+    a bus handler. If a reload comes back empty the old values are kept and
+    the next refresh() tries again.
+    """
+
+    def __init__(self, tickers: Iterable[str], days: int = REFERENCE_DAYS):
+        self.tickers = list(dict.fromkeys(tickers))
+        self.days = days
+        self.data: Dict[str, Dict[str, float]] = {}
+        self.day: Optional[date] = None
+        self.refresh()
+
+    def refresh(self, force: bool = False) -> bool:
+        """Reload if it's a new market date (or force); True if reloaded"""
+        today = market_date()
+        if today == self.day and not force:
+            return False
+        data = load_reference_bars(self.tickers, self.days)
+        if not data and self.data:
+            return False
+        self.data = data
+        self.day = today
+        return True
+
+    def field(self, name: str) -> Dict[str, float]:
+        """{ticker: value} for 'prev_close', 'avg_volume' or 'volume'"""
+        return {ticker: ref[name] for ticker, ref in self.data.items()}
+
+    def get(self, ticker: str, name: str, default: Optional[float] = None) -> Optional[float]:
+        return self.data.get(ticker, {}).get(name, default)
+
+    def __contains__(self, ticker: str) -> bool:
+        return ticker in self.data
+
+    def __iter__(self):
+        return iter(self.data)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+
+class QuoteBus:
+    """
+    In-process publish/subscribe for ticks.
+
+    publish() never blocks: ticks are queued and delivered to handlers on a
+    dispatcher thread. A handler that raises is counted and skipped (and
+    reported the first time).
+
+    stats:
+        published - ticks accepted
+        delivered - handler calls made
+        errors    - handler calls that raised
+        dropped   - ticks dropped because the queue was full
+        max_lag   - worst seconds between receive and dispatch
+    """
+
+    def __init__(self, max_queue: int = BUS_QUEUE_SIZE):
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._handlers: List[tuple] = []
+        self._lock = threading.Lock()
+        self._last: Dict[str, Tick] = {}
+        self._failing: set = set()
+        self._thread: Optional[threading.Thread] = None
+        self._running = threading.Event()
+        self.stats = {'published': 0, 'delivered': 0, 'errors': 0, 'dropped': 0, 'max_lag': 0.0}
+
+    def subscribe(self, handler: Callable[[Tick], None], tickers: Optional[Iterable[str]] = None):
+        """Call handler(tick) for every tick (or only for these tickers)"""
+        wanted = set(tickers) if tickers is not None else None
+        with self._lock:
+            self._handlers.append((handler, wanted))
+        return handler
+
+    def unsubscribe(self, handler: Callable[[Tick], None]):
+        with self._lock:
+            self._handlers = [(h, w) for h, w in self._handlers if h is not handler]
+
+    def publish(self, tick: Tick):
+        if not tick.received:
+            tick.received = time.time()
+        try:
+            self._queue.put_nowait(tick)
+            self.stats['published'] += 1
+        except queue.Full:
+            self.stats['dropped'] += 1
+
+    def last(self, ticker: str) -> Optional[Tick]:
+        """Most recent dispatched tick for a ticker"""
+        return self._last.get(ticker)
+
+    def prices(self) -> Dict[str, float]:
+        return {ticker: tick.price for ticker, tick in self._last.items()}
+
+    def dispatch(self, tick: Tick):
+        """Deliver one tick to matching handlers on the calling thread"""
+        self._last[tick.ticker] = tick
+        lag = time.time() - tick.received
+        if lag > self.stats['max_lag']:
+            self.stats['max_lag'] = lag
+
+        with self._lock:
+            handlers = list(self._handlers)
+        for handler, wanted in handlers:
+            if wanted is not None and tick.ticker not in wanted:
+                continue
+            try:
+                handler(tick)
+                self.stats['delivered'] += 1
+            except Exception as e:
+                self.stats['errors'] += 1
+                # Report a failing handler once, not on every tick
+                if id(handler) not in self._failing:
+                    self._failing.add(id(handler))
+                    print(f"⚠️  Quote handler error ({tick.ticker}): {e}")
+
+    def start(self) -> 'QuoteBus':
+        if self._thread and self._thread.is_alive():
+            return self
+        self._running.set()
+        self._thread = threading.Thread(target=self._dispatch_loop, name='quote-bus', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, drain: bool = True, timeout: float = 5.0):
+        """Stop the dispatcher (after delivering what's queued, if drain)"""
+        if drain:
+            deadline = time.time() + timeout
+            while not self._queue.empty() and time.time() < deadline:
+                time.sleep(0.01)
+        self._running.clear()
+        if self._thread:
+            self._thread.join(timeout=timeout)
+
+    def _dispatch_loop(self):
+        while self._running.is_set():
+            try:
+                tick = self._queue.get(timeout=0.2)
+            except queue.Empty:
+                continue
+            self.dispatch(tick)
+
+
+class QuoteStream:
+    """
+    Background websocket client publishing trades to a QuoteBus.
+
+    Runs its own asyncio loop on a daemon thread and reconnects with
+    exponential backoff. Subscriptions are re-sent after every reconnect.
+    """
+
+    def __init__(self, bus: QuoteBus, tickers: Iterable[str] = (), url: Optional[str] = None):
+        self.bus = bus
+        self.url = url or default_stream_url()
+        self.tickers = list(dict.fromkeys(tickers))
+        self.connected = threading.Event()
+        self.stats = {'messages': 0, 'ticks': 0, 'reconnects': 0}
+        self._stopping = threading.Event()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._ws = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def available(self) -> bool:
+        return WEBSOCKETS_AVAILABLE and bool(self.url)
+
+    def start(self, wait: float = 0) -> 'QuoteStream':
+        """Start streaming; optionally wait up to `wait` seconds to connect"""
+        if not WEBSOCKETS_AVAILABLE:
+            raise RuntimeError("websockets not installed (pip install websockets)")
+        if not self.url:
+            raise RuntimeError("No stream URL: set QUOTE_STREAM_URL or FINNHUB_API_KEY")
+        self._stopping.clear()
+        self._thread = threading.Thread(target=lambda: asyncio.run(self._run()),
+                                        name='quote-stream', daemon=True)
+        self._thread.start()
+        if wait:
+            self.connected.wait(wait)
+        return self
+
+    def stop(self, timeout: float = 5.0):
+        self._stopping.set()
+        if self._loop and self._ws is not None:
+            try:
+                asyncio.run_coroutine_threadsafe(self._ws.close(), self._loop)
+            except RuntimeError:
+                pass
+        if self._thread:
+            self._thread.join(timeout=timeout)
+
+    def add_tickers(self, tickers: Iterable[str]):
+        """Subscribe to more tickers (takes effect immediately if connected)"""
+        new = [t for t in tickers if t not in self.tickers]
+        self.tickers.extend(new)
+        if new and self._loop and self.connected.is_set():
+            asyncio.run_coroutine_threadsafe(self._subscribe(new), self._loop)
+
+    async def _subscribe(self, tickers: Iterable[str]):
+        for ticker in tickers:
+            await self._ws.send(json.dumps({'type': 'subscribe', 'symbol': ticker}))
+
+    async def _run(self):
+        self._loop = asyncio.get_running_loop()
+        backoff = RECONNECT_MIN_SECONDS
+        while not self._stopping.is_set():
+            try:
+                async with websockets.connect(self.url, max_size=None) as ws:
+                    self._ws = ws
+                    await self._subscribe(self.tickers)
+                    self.connected.set()
+                    backoff = RECONNECT_MIN_SECONDS
+                    async for raw in ws:
+                        self.stats['messages'] += 1
+                        for tick in parse_message(raw):
+                            self.stats['ticks'] += 1
+                            self.bus.publish(tick)
+            except Exception as e:
+                if not self._stopping.is_set():
+                    print(f"⚠️  Quote stream disconnected: {e}")
+            finally:
+                self._ws = None
+                self.connected.clear()
+
+            if self._stopping.is_set():
+                break
+            self.stats['reconnects'] += 1
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, RECONNECT_MAX_SECONDS)
+
+
+class SimulatedFeedServer:
+    """
+    Local websocket server speaking the Finnhub trade protocol.
+
+    Each client gets random-walk trades for the symbols it subscribed to.
+    inject() pushes a specific trade to every subscriber right away, so
+    tests can trigger a detector and time the alert.
+    """
+
+    def __init__(self, prices: Dict[str, float], ticks_per_second: float = 50,
+                 volatility: float = 0.001, size_range=(100, 5_000),
+                 host: str = '127.0.0.1', port: int = 0, seed: Optional[int] = None):
+        self.prices = dict(prices)
+        self.ticks_per_second = ticks_per_second
+        self.volatility = volatility
+        self.size_range = size_range
+        self.host = host
+        self.port = port
+        self.url: Optional[str] = None
+        self.stats = {'clients': 0, 'sent': 0}
+        self._random = random.Random(seed)
+        self._clients: Dict[object, set] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stopped: Optional[asyncio.Event] = None
+        self._ready = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self, timeout: float = 5.0) -> str:
+        """Start serving in the background; returns the ws:// URL"""
+        if not WEBSOCKETS_AVAILABLE:
+            raise RuntimeError("websockets not installed (pip install websockets)")
+        self._thread = threading.Thread(target=lambda: asyncio.run(self._serve()),
+                                        name='quote-feed-sim', daemon=True)
+        self._thread.start()
+        if not self._ready.wait(timeout):
+            raise RuntimeError("Simulated feed server did not start")
+        return self.url
+
+    def stop(self, timeout: float = 5.0):
+        if self._loop and self._stopped:
+            self._loop.call_soon_threadsafe(self._stopped.set)
+        if self._thread:
+            self._thread.join(timeout=timeout)
+
+    def inject(self, ticker: str, price: float, size: float = 100):
+        """Send one trade to every client subscribed to ticker"""
+        self.prices[ticker] = price
+        if self._loop:
+            asyncio.run_coroutine_threadsafe(self._broadcast([(ticker, price, size)]), self._loop)
+
+    async def _serve(self):
+        self._loop = asyncio.get_running_loop()
+        self._stopped = asyncio.Event()
+        async with websockets.serve(self._handle, self.host, self.port, max_size=None) as server:
+            port = server.sockets[0].getsockname()[1]
+            self.url = f"ws://{self.host}:{port}"
+            self._ready.set()
+            producer = asyncio.create_task(self._produce())
+            await self._stopped.wait()
+            producer.cancel()
+
+    async def _handle(self, ws, path=None):
+        self._clients[ws] = set()
+        self.stats['clients'] += 1
+        try:
+            async for raw in ws:
+                try:
+                    message = json.loads(raw)
+                except ValueError:
+                    continue
+                symbol = message.get('symbol')
+                if message.get('type') == 'subscribe' and symbol:
+                    self._clients[ws].add(symbol)
+                    self.prices.setdefault(symbol, 10.0)
+                elif message.get('type') == 'unsubscribe':
+                    self._clients[ws].discard(symbol)
+        except Exception:
+            pass
+        finally:
+            self._clients.pop(ws, None)
+
+    async def _produce(self):
+        """Random-walk trades, sent in batches every 10ms"""
+        interval = 0.01
+        carry = 0.0
+        while True:
+            await asyncio.sleep(interval)
+            symbols = sorted(set().union(*self._clients.values())) if self._clients else []
+            if not symbols:
+                continue
+            carry += self.ticks_per_second * interval
+            count, carry = int(carry), carry - int(carry)
+            trades = []
+            for _ in range(count):
+                ticker = self._random.choice(symbols)
+                price = self.prices[ticker] * (1 + self._random.gauss(0, self.volatility))
+                self.prices[ticker] = price
+                trades.append((ticker, round(price, 4), self._random.randint(*self.size_range)))
+            if trades:
+                await self._broadcast(trades)
+
+    async def _broadcast(self, trades):
+        now_ms = int(time.time() * 1000)
+        for ws, symbols in list(self._clients.items()):
+            data = [{'s': s, 'p': p, 'v': v, 't': now_ms} for s, p, v in trades if s in symbols]
+            if not data:
+                continue
+            try:
+                await ws.send(json.dumps({'type': 'trade', 'data': data}))
+                self.stats['sent'] += len(data)
+            except Exception:
+                self._clients.pop(ws, None)
+
+
+class _Detector:
+    """Bus subscriber that alerts at most once per ticker per day"""
+
+    def __init__(self):
+        self._fired: set = set()
+        self._day = market_date()
+
+    def _once(self, ticker: str) -> bool:
+        today = market_date()
+        if today != self._day:
+            self._day = today
+            self._fired.clear()
+        if ticker in self._fired:
+            return False
+        self._fired.add(ticker)
+        return True
+
+    def reset(self, ticker: Optional[str] = None):
+        if ticker is None:
+            self._fired.clear()
+        else:
+            self._fired.discard(ticker)
+
+
+class MoveDetector(_Detector):
+    """
+    Fires on_move(tick, change_pct) when price is threshold_pct or more
+    away from the reference (usually yesterday's close), either direction.
+    """
+
+    def __init__(self, reference: Dict[str, float], threshold_pct: float = 5.0,
+                 on_move: Optional[Callable[[Tick, float], None]] = None):
+        super().__init__()
+        self.reference = dict(reference)
+        self.threshold_pct = threshold_pct
+        self.on_move = on_move
+
+    def rebase(self, reference: Dict[str, float]):
+        """New session's reference prices"""
+        self.reference = dict(reference)
+
+    def __call__(self, tick: Tick):
+        base = self.reference.get(tick.ticker)
+        if not base:
+            return
+        change_pct = (tick.price / base - 1) * 100
+        if abs(change_pct) >= self.threshold_pct and self._once(tick.ticker):
+            if self.on_move:
+                self.on_move(tick, change_pct)
+
+
+class VolumeSpikeDetector(_Detector):
+    """
+    Keeps a running day volume per ticker (baseline at start + streamed
+    trade sizes) and fires on_spike(tick, volume, ratio) when the ratio
+    reaches `ratio`.
+
+    With profiles (utils/volume_profile.py) the ratio is against normal
+    volume by this minute of the session; otherwise, and outside the
+    session, it is against avg_volume (a full day).
+    """
+
+    def __init__(self, avg_volume: Dict[str, float], ratio: float = 5.0,
+                 baseline: Optional[Dict[str, float]] = None,
+                 on_spike: Optional[Callable[[Tick, float, float], None]] = None,
+                 profiles=None):
+        super().__init__()
+        self.avg_volume = dict(avg_volume)
+        self.ratio = ratio
+        self.volume: Dict[str, float] = dict(baseline or {})
+        self.on_spike = on_spike
+        self.profiles = profiles
+        self._volume_day = market_date()
+
+    def rebase(self, avg_volume: Dict[str, float], baseline: Optional[Dict[str, float]] = None):
+        """New session's averages, with day volume restarted from baseline"""
+        self.avg_volume = dict(avg_volume)
+        self.volume = dict(baseline or {})
+        self._volume_day = market_date()
+
+    def __call__(self, tick: Tick):
+        today = market_date()
+        if today != self._volume_day:
+            self._volume_day = today
+            self.volume.clear()
+        volume = self.volume.get(tick.ticker, 0.0) + tick.size
+        self.volume[tick.ticker] = volume
+
+        avg = self.avg_volume.get(tick.ticker)
+        if self.profiles is not None:
+            avg = self.profiles.expected_volume(tick.ticker, avg_daily_volume=avg) or avg
+        if not avg:
+            return
+        ratio = volume / avg
+        if ratio >= self.ratio and self._once(tick.ticker):
+            if self.on_spike:
+                self.on_spike(tick, volume, ratio)
+
+
+class StopMonitor(_Detector):
+    """Fires on_stop(tick, stop) when price trades at or below a stop level"""
+
+    def __init__(self, stops: Dict[str, float],
+                 on_stop: Optional[Callable[[Tick, float], None]] = None):
+        super().__init__()
+        self.stops = dict(stops)
+        self.on_stop = on_stop
+
+    def set_stop(self, ticker: str, stop: float):
+        self.stops[ticker] = stop
+        self.reset(ticker)
+
+    def __call__(self, tick: Tick):
+        stop = self.stops.get(tick.ticker)
+        if stop and tick.price <= stop and self._once(tick.ticker):
+            if self.on_stop:
+                self.on_stop(tick, stop)
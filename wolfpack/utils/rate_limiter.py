@@ -0,0 +1,307 @@
+"""
+Shared Rate Limiter
+Cross-process token buckets for every external API key.
+
+Replaces the per-process, sleep-polling limiters in:
+- data_fetcher.py (RateLimiter.wait_if_needed - time.sleep(1) loop)
+- src/core/realtime_volume_monitor.py (RealTimeVolumeMonitor._respect_rate_limit)
+
+Bucket state lives in data/rate_limits.db, so autonomous_brain,
+safe_position_monitor, maestro and anything else sharing one API key draw
+from the same budget. Each caller sleeps exactly until its token is due
+(no one-second polling).
+
+Priorities: while a higher-priority caller is waiting on a bucket, lower
+priorities hold off, so position monitoring (HIGH) gets tokens before
+background research (LOW). Every acquire() returns how long the caller
+waited, and totals per bucket/priority are kept in the same database.
+
+Usage:
+    from utils.rate_limiter import get_rate_limiter, Priority
+
+    limiter = get_rate_limiter('finnhub')
+    waited = limiter.acquire(Priority.HIGH)   # seconds spent waiting
+    print(limiter.report())
+"""
+
+import os
+import time
+import uuid
+import sqlite3
+import threading
+from enum import IntEnum
+from typing import Dict, Optional
+
+import requests
+
+
+DEFAULT_DB_PATH = os.getenv(
+    'RATE_LIMIT_DB_PATH',
+    os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'rate_limits.db')
+)
+
+# Provider budgets: `rate` calls every `per` seconds, bursts up to `burst`
+RATE_LIMITS = {
+    'finnhub': {'rate': 60, 'per': 60, 'burst': 30},           # 60/min free tier
+    'polygon': {'rate': 5, 'per': 60, 'burst': 5},             # 5/min free tier
+    'newsapi': {'rate': 100, 'per': 86400, 'burst': 25},       # 100/day
+    'alphavantage': {'rate': 5, 'per': 60, 'burst': 1},        # 5/min, 12s spacing
+    'sec': {'rate': 10, 'per': 1, 'burst': 10},                # SEC fair-access 10/s
+}
+
+# Longest single sleep before re-checking the bucket (lets a higher
+# priority waiter or a config change take effect)
+MAX_SLEEP = 5.0
+
+# Waiter rows not refreshed for this long are from dead processes
+WAITER_GRACE = 2.0
+
+
+class Priority(IntEnum):
+    """Lower value = served first"""
+    HIGH = 0      # Position monitoring, stops
+    NORMAL = 1    # Interactive scans
+    LOW = 2       # Background research
+
+
+class RateLimitTimeout(requests.exceptions.RequestException):
+    """
+    Raised when acquire() could not get a token within its timeout.
+
+    A RequestException, so HTTP callers' existing error handling treats a
+    bucket that's empty for too long like any other failed request.
+    """
+    pass
+
+
+class TokenBucket:
+    """
+    One provider's budget, shared by every process using the same database.
+
+    Each acquire runs in a BEGIN IMMEDIATE transaction, so refill-and-take
+    is atomic across processes.
+    """
+
+    def __init__(self, name: str, rate: float, per: float = 60.0, burst: Optional[float] = None,
+                 db_path: str = DEFAULT_DB_PATH):
+        """
+        Args:
+            name: Bucket name (usually the provider)
+            rate: Calls allowed per `per` seconds
+            per: Window in seconds
+            burst: Bucket capacity (defaults to rate)
+            db_path: SQLite file shared between processes
+        """
+        self.name = name
+        self.refill_rate = rate / per            # tokens per second
+        self.capacity = float(burst if burst is not None else rate)
+        self.db_path = db_path
+
+        self._lock = threading.Lock()
+        self.stats = {p.name: {'calls': 0, 'waited': 0.0, 'max_wait': 0.0} for p in Priority}
+
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self._init_database()
+
+    def _connect(self) -> sqlite3.Connection:
+        # Autocommit mode - transactions are opened explicitly with BEGIN IMMEDIATE
+        return sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+
+    def _init_database(self):
+        conn = self._connect()
+        cursor = conn.cursor()
+
+        cursor.execute('PRAGMA journal_mode=WAL')
+
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS token_buckets (
+            name TEXT PRIMARY KEY,
+            tokens REAL NOT NULL,
+            updated_at REAL NOT NULL
+        )
+        ''')
+
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS bucket_waiters (
+            ticket TEXT PRIMARY KEY,
+            name TEXT NOT NULL,
+            priority INTEGER NOT NULL,
+            expires_at REAL NOT NULL
+        )
+        ''')
+
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS bucket_stats (
+            name TEXT NOT NULL,
+            priority TEXT NOT NULL,
+            calls INTEGER NOT NULL DEFAULT 0,
+            waited_seconds REAL NOT NULL DEFAULT 0,
+            max_wait REAL NOT NULL DEFAULT 0,
+            PRIMARY KEY (name, priority)
+        )
+        ''')
+
+        conn.close()
+
+    # ==================== PUBLIC API ====================
+
+    def acquire(self, priority: Priority = Priority.NORMAL, tokens: float = 1.0,
+                timeout: Optional[float] = None) -> float:
+        """
+        Block until `tokens` are granted.
+
+        Args:
+            priority: Who goes first when the bucket is contended
+            tokens: Tokens this call costs
+            timeout: Give up after this many seconds (None = wait forever)
+
+        Returns:
+            float: Seconds spent waiting
+
+        Raises:
+            RateLimitTimeout: if timeout elapsed first
+        """
+        priority = Priority(priority)
+        tokens = min(float(tokens), self.capacity)
+        ticket = uuid.uuid4().hex
+        start = time.monotonic()
+
+        conn = self._connect()
+        try:
+            while True:
+                granted, wait = self._try_take(conn, ticket, priority, tokens)
+                if granted:
+                    break
+
+                if timeout is not None and time.monotonic() - start + wait > timeout:
+                    self._drop_waiter(conn, ticket)
+                    raise RateLimitTimeout(
+                        f"{self.name}: no token within {timeout:.2f}s ({priority.name})"
+                    )
+                time.sleep(min(wait, MAX_SLEEP))
+
+            waited = time.monotonic() - start
+            self._record(conn, priority, waited)
+            return waited
+        finally:
+            conn.close()
+
+    def report(self) -> Dict[str, Dict]:
+        """Wait totals per priority, across every process using this bucket"""
+        conn = self._connect()
+        cursor = conn.cursor()
+        cursor.execute(
+            'SELECT priority, calls, waited_seconds, max_wait FROM bucket_stats WHERE name = ?',
+            (self.name,)
+        )
+        report = {
+            priority: {
+                'calls': calls,
+                'waited_seconds': round(waited, 3),
+                'avg_wait': round(waited / calls, 3) if calls else 0.0,
+                'max_wait': round(max_wait, 3),
+            }
+            for priority, calls, waited, max_wait in cursor.fetchall()
+        }
+        conn.close()
+        return report
+
+    # ==================== INTERNALS ====================
+
+    def _try_take(self, conn: sqlite3.Connection, ticket: str, priority: Priority,
+                  tokens: float) -> tuple:
+        """
+        One atomic refill-and-take attempt.
+
+        Returns:
+            (granted, seconds until it is worth trying again)
+        """
+        cursor = conn.cursor()
+        cursor.execute('BEGIN IMMEDIATE')
+        try:
+            now = time.time()
+
+            cursor.execute('SELECT tokens, updated_at FROM token_buckets WHERE name = ?', (self.name,))
+            row = cursor.fetchone()
+            if row:
+                available = min(self.capacity, row[0] + max(0.0, now - row[1]) * self.refill_rate)
+            else:
+                available = self.capacity
+
+            cursor.execute('''
+                SELECT COUNT(*) FROM bucket_waiters
+                WHERE name = ? AND priority < ? AND expires_at > ? AND ticket != ?
+            ''', (self.name, int(priority), now, ticket))
+            outranked = cursor.fetchone()[0] > 0
+
+            if available >= tokens and not outranked:
+                available -= tokens
+                cursor.execute('DELETE FROM bucket_waiters WHERE ticket = ?', (ticket,))
+                granted, wait = True, 0.0
+            else:
+                # Exact time until enough tokens exist; if outranked, give the
+                # higher priority waiter one token's worth of time to take it
+                deficit = max(tokens - available, 1.0 if outranked else 0.0)
+                wait = deficit / self.refill_rate
+                cursor.execute('''
+                    INSERT OR REPLACE INTO bucket_waiters (ticket, name, priority, expires_at)
+                    VALUES (?, ?, ?, ?)
+                ''', (ticket, self.name, int(priority), now + min(wait, MAX_SLEEP) + WAITER_GRACE))
+                granted = False
+
+            cursor.execute('''
+                INSERT OR REPLACE INTO token_buckets (name, tokens, updated_at)
+                VALUES (?, ?, ?)
+            ''', (self.name, available, now))
+
+            # Housekeeping: waiters left behind by killed processes
+            cursor.execute('DELETE FROM bucket_waiters WHERE expires_at < ?', (now,))
+
+            cursor.execute('COMMIT')
+        except Exception:
+            cursor.execute('ROLLBACK')
+            raise
+
+        return granted, wait
+
+    def _drop_waiter(self, conn: sqlite3.Connection, ticket: str):
+        conn.execute('DELETE FROM bucket_waiters WHERE ticket = ?', (ticket,))
+
+    def _record(self, conn: sqlite3.Connection, priority: Priority, waited: float):
+        with self._lock:
+            stats = self.stats[priority.name]
+            stats['calls'] += 1
+            stats['waited'] += waited
+            stats['max_wait'] = max(stats['max_wait'], waited)
+
+        conn.execute('''
+            INSERT INTO bucket_stats (name, priority, calls, waited_seconds, max_wait)
+            VALUES (?, ?, 1, ?, ?)
+            ON CONFLICT(name, priority) DO UPDATE SET
+                calls = calls + 1,
+                waited_seconds = waited_seconds + excluded.waited_seconds,
+                max_wait = MAX(max_wait, excluded.max_wait)
+        ''', (self.name, priority.name, waited, waited))
+
+
+# Process-wide shared instances, one per provider
+_limiters: Dict[str, TokenBucket] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(name: str) -> Optional[TokenBucket]:
+    """
+    Get the shared TokenBucket for a provider.
+
+    Returns:
+        TokenBucket, or None if the provider has no configured limit
+    """
+    if name not in RATE_LIMITS:
+        return None
+
+    with _limiters_lock:
+        limiter = _limiters.get(name)
+        if limiter is None:
+            limiter = TokenBucket(name, **RATE_LIMITS[name])
+            _limiters[name] = limiter
+        return limiter
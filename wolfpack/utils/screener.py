@@ -0,0 +1,217 @@
+"""
+Vectorized Universe Screener
+Gap, relative volume, multi-horizon returns and distance from highs for the
+whole universe in one NumPy pass.
+
+Replaces per-ticker feature math in:
+- wolfpack/wolf_pack.py (WolfPack._scan_market_v2.analyze_ticker)
+- src/wolf_brain/universe_scanner.py (TickerDataFetcher - feeds
+  _score_steady_setup / _score_head_hunter_setup)
+- overnight_scan.py (OvernightScanner.score_ticker)
+- lightweight_researcher.py (LightweightResearcher.analyze_wounded_prey)
+
+Closes, highs, lows, opens and volumes are loaded into (ticker x day)
+arrays. Each ticker's bars are right-aligned, so column -1 is every
+ticker's latest bar and column -7 is "7 bars back", the same as
+hist['Close'].iloc[-7]. Features are then plain column operations, and
+the V2 WOUNDED_PREY / EARLY_MOMENTUM / TOO_LATE rules are boolean masks.
+
+Usage:
+    from utils.screener import screen_universe
+
+    table = screen_universe(tickers, period='6mo')   # DataFrame indexed by ticker
+    hits = table[table['signal'] != '']
+    table.loc['MU', 'change_30d']
+"""
+
+import warnings
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+
+FIELDS = ['Open', 'High', 'Low', 'Close', 'Volume']
+
+# Return horizons in bars: change_{n}d = close[-1] / close[-n] - 1
+RETURN_HORIZONS = (2, 5, 7, 20, 30)
+
+# V2 scanner rules (wolf_pack._scan_market_v2)
+TOO_LATE_30D = 30              # Already ran: 30d change above this
+WOUNDED_FROM_HIGH = -30        # % below period high to count as wounded
+EARLY_MOMENTUM_7D = (5, 20)    # 7d change window for early momentum
+EARLY_MOMENTUM_MAX_30D = 25    # ...as long as the 30d move is still below this
+MIN_BARS = 50
+
+SIGNAL_SCORES = {'WOUNDED_PREY': 65, 'EARLY_MOMENTUM': 55}
+
+
+def panel_to_arrays(panel: pd.DataFrame, tickers: Optional[Iterable[str]] = None) -> Dict:
+    """
+    (timestamp x (ticker, field)) panel -> right-aligned (ticker x day) arrays.
+
+    Returns:
+        {'tickers': [...], 'bars': int array, 'Close': 2-D array, ...}
+        Missing bars are NaN and sit at the left of each row.
+    """
+    if panel is None or panel.empty:
+        names = list(tickers or [])
+        empty = np.full((len(names), 0), np.nan)
+        return {'tickers': names, 'bars': np.zeros(len(names), dtype=int),
+                **{field: empty for field in FIELDS}}
+
+    available = set(panel.columns.get_level_values(0))
+    wanted = tickers if tickers is not None else panel.columns.get_level_values(0)
+    names = [t for t in dict.fromkeys(wanted) if t in available]
+
+    # One reindex + reshape: (day, ticker * field) -> (field, ticker, day)
+    columns = pd.MultiIndex.from_product([names, FIELDS])
+    cube = panel.reindex(columns=columns).to_numpy(dtype=float)
+    cube = cube.reshape(len(panel.index), len(names), len(FIELDS)).transpose(2, 1, 0)
+    arrays = {field: cube[i] for i, field in enumerate(FIELDS)}
+
+    # Push each ticker's missing days to the left, keeping bar order
+    valid = ~np.isnan(arrays['Close'])
+    order = np.argsort(valid, axis=1, kind='stable')
+    for field in FIELDS:
+        arrays[field] = np.take_along_axis(arrays[field], order, axis=1)
+
+    arrays['tickers'] = names
+    arrays['bars'] = valid.sum(axis=1)
+    return arrays
+
+
+def _back(values: np.ndarray, bars: np.ndarray, n: int) -> np.ndarray:
+    """values[:, -n] where a ticker has at least n bars, else NaN"""
+    if values.shape[1] < n:
+        return np.full(values.shape[0], np.nan)
+    return np.where(bars >= n, values[:, -n], np.nan)
+
+
+def _window(values: np.ndarray, n: Optional[int]) -> np.ndarray:
+    return values if n is None else values[:, -n:]
+
+
+def compute_features(arrays: Dict, horizons: Iterable[int] = RETURN_HORIZONS,
+                     high_window: Optional[int] = None, volume_window: Optional[int] = None,
+                     recent_volume_window: int = 1, rsi_period: int = 14,
+                     sma_period: int = 50) -> pd.DataFrame:
+    """
+    Per-ticker features as vectorized column operations.
+
+    Args:
+        arrays: Output of panel_to_arrays()
+        horizons: Bars back for change_{n}d columns
+        high_window: Bars for high/low (None = every bar loaded)
+        volume_window: Bars for avg_volume (None = every bar loaded)
+        recent_volume_window: Bars averaged into `volume` (1 = latest bar)
+
+    Returns:
+        DataFrame indexed by ticker. Percent columns are in percent
+        (5.0 = +5%); change_{n}d is 0 when a ticker has fewer than n bars.
+    """
+    close, high, low = arrays['Close'], arrays['High'], arrays['Low']
+    opens, volume, bars = arrays['Open'], arrays['Volume'], arrays['bars']
+
+    with warnings.catch_warnings(), np.errstate(divide='ignore', invalid='ignore'):
+        warnings.simplefilter('ignore', RuntimeWarning)
+
+        price = _back(close, bars, 1)
+        prev_close = _back(close, bars, 2)
+
+        features = {
+            'bars': bars,
+            'price': price,
+            'prev_close': prev_close,
+            'gap_pct': (_back(opens, bars, 1) / prev_close - 1) * 100,
+        }
+
+        for n in horizons:
+            change = (price / _back(close, bars, n) - 1) * 100
+            features[f'change_{n}d'] = np.where(np.isfinite(change), change, 0.0)
+
+        period_high = np.nanmax(_window(high, high_window), axis=1) if high.shape[1] else np.full(len(bars), np.nan)
+        period_low = np.nanmin(_window(low, high_window), axis=1) if low.shape[1] else np.full(len(bars), np.nan)
+        features['high'] = period_high
+        features['low'] = period_low
+        features['distance_from_high'] = (price / period_high - 1) * 100
+        features['drawdown'] = (period_high - price) / period_high
+
+        avg_volume = np.nanmean(_window(volume, volume_window), axis=1) if volume.shape[1] else np.full(len(bars), np.nan)
+        if recent_volume_window > 1:
+            recent_volume = np.nanmean(volume[:, -recent_volume_window:], axis=1)
+        else:
+            recent_volume = _back(volume, bars, 1)
+        features['volume'] = recent_volume
+        features['avg_volume'] = avg_volume
+        features['volume_ratio'] = np.where(avg_volume > 0, recent_volume / avg_volume, 1.0)
+
+        # RSI over the last rsi_period changes (same as calculate_rsi)
+        if close.shape[1] > rsi_period:
+            delta = np.diff(close[:, -(rsi_period + 1):], axis=1)
+            gain = np.where(delta > 0, delta, 0.0).mean(axis=1)
+            loss = np.where(delta < 0, -delta, 0.0).mean(axis=1)
+            rsi = 100 - 100 / (1 + gain / loss)
+            features['rsi'] = np.where((bars > rsi_period) & ~np.isnan(rsi), rsi, 50.0)
+        else:
+            features['rsi'] = np.full(len(bars), 50.0)
+
+        if close.shape[1] >= sma_period:
+            sma = close[:, -sma_period:].mean(axis=1)
+            features[f'sma_{sma_period}'] = np.where(bars >= sma_period, sma, np.nan)
+        else:
+            features[f'sma_{sma_period}'] = np.full(len(bars), np.nan)
+
+    return pd.DataFrame(features, index=pd.Index(arrays['tickers'], name='ticker'))
+
+
+def apply_setup_rules(features: pd.DataFrame, min_bars: int = MIN_BARS) -> pd.DataFrame:
+    """
+    WOUNDED_PREY / EARLY_MOMENTUM / TOO_LATE as boolean masks.
+
+    Adds columns too_late, wounded_prey, early_momentum, signal
+    ('' = no setup), score and stop. Rules are checked in the V2 scanner's
+    order: too late first, then wounded prey, then early momentum.
+    """
+    table = features.copy()
+    change_7d = table['change_7d'].to_numpy()
+    change_30d = table['change_30d'].to_numpy()
+    distance = table['distance_from_high'].to_numpy()
+
+    eligible = table['bars'].to_numpy() >= min_bars
+    too_late = eligible & (change_30d > TOO_LATE_30D)
+    wounded = eligible & ~too_late & (distance < WOUNDED_FROM_HIGH) & (change_7d > 0)
+    early = (eligible & ~too_late & ~wounded
+             & (change_7d > EARLY_MOMENTUM_7D[0]) & (change_7d < EARLY_MOMENTUM_7D[1])
+             & (change_30d < EARLY_MOMENTUM_MAX_30D))
+
+    table['too_late'] = too_late
+    table['wounded_prey'] = wounded
+    table['early_momentum'] = early
+    table['signal'] = np.select([wounded, early], ['WOUNDED_PREY', 'EARLY_MOMENTUM'], default='')
+    table['score'] = np.select([wounded, early], [SIGNAL_SCORES['WOUNDED_PREY'], SIGNAL_SCORES['EARLY_MOMENTUM']], default=0)
+
+    # Simple stop: just above the period low if well off highs, else -15%
+    price = table['price'].to_numpy()
+    table['stop'] = np.where(distance < -20, table['low'].to_numpy() * 1.05, price * 0.85)
+    return table
+
+
+def screen_panel(panel: pd.DataFrame, tickers: Optional[Iterable[str]] = None,
+                 min_bars: int = MIN_BARS, **feature_kwargs) -> pd.DataFrame:
+    """Features + setup rules for an already-loaded panel"""
+    features = compute_features(panel_to_arrays(panel, tickers), **feature_kwargs)
+    return apply_setup_rules(features, min_bars=min_bars)
+
+
+def screen_universe(tickers: Iterable[str], period: str = '6mo',
+                    min_bars: int = MIN_BARS, **feature_kwargs) -> pd.DataFrame:
+    """
+    Screen tickers using the shared market data service (one bulk download,
+    or none if the panel is already cached).
+    """
+    from .market_data import get_market_data_service
+
+    tickers = list(dict.fromkeys(tickers))
+    panel = get_market_data_service().get_panel(tickers, period=period)
+    return screen_panel(panel, tickers, min_bars=min_bars, **feature_kwargs)
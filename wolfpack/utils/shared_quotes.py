@@ -0,0 +1,497 @@
+"""
+Shared-Memory Quote Table
+One live price table in shared memory, written by a single feeder process
+and read by every other wolf script with no network calls.
+
+Used by:
+- quote_feeder.py (the one writer)
+- data_fetcher.py (DataFetcher.get_quote)
+- src/wolf_brain/autonomous_brain.py (AutonomousBrain._get_price_data)
+- src/wolf_brain/wolf_terminal.py (DataFetcher.get_ticker_data)
+
+autonomous_brain, safe_position_monitor, maestro, wolf_terminal and the
+dashboards run side by side and each used to fetch the same prices. Now
+quote_feeder.py streams or bulk-polls the combined watchlist and writes
+every quote into a fixed-size table in multiprocessing.shared_memory.
+Readers attach by name and read a quote in microseconds. If no feeder is
+running, or a quote is older than the caller's max_age, the lookup returns
+None and callers fall back to their normal fetch.
+
+Each slot has a sequence counter (seqlock). The writer makes it odd before
+changing the slot and even again after. A reader copies the slot and keeps
+the copy only if the counter was even and unchanged across the copy. So
+readers never take a lock and never block the writer; a torn read is
+simply retried. Slots are handed out in order and never move, so readers
+cache ticker -> slot after the first lookup.
+
+Staleness is judged by when the feeder last vouched for a quote, not by
+the trade time: a slot's receive time is set on every write, and while
+the feeder's stream is connected its heartbeat vouches for every quote
+(a thin name's last trade is still its current price). The trade time
+stays in 'timestamp'.
+
+Usage:
+    # Any process
+    from utils.shared_quotes import get_live_quote, get_live_price
+
+    quote = get_live_quote('MU', max_age=60)   # DataFetcher.get_quote() shape, or None
+    price = get_live_price('MU')
+
+    # The feeder (see quote_feeder.py)
+    table = SharedQuoteTable.create()
+    QuoteFeeder(table, tickers).run()            # or table.write('MU', price=412.3, ...)
+"""
+
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional
+
+import numpy as np
+
+
+DEFAULT_NAME = os.getenv('SHARED_QUOTES_NAME', 'wolfpack_quotes')
+DEFAULT_CAPACITY = 2048
+
+LIVE_MAX_AGE = 60           # Seconds before a quote counts as stale for callers
+FEEDER_STALE_SECONDS = 120  # No heartbeat for this long = feeder is gone
+ATTACH_RETRY_SECONDS = 30   # How often readers look for a feeder that wasn't there
+READ_RETRIES = 1000
+
+MAGIC = 0x574F4C4651554F54   # "WOLFQUOT"
+VERSION = 2
+
+HEADER_DTYPE = np.dtype([
+    ('magic', '<u8'),
+    ('version', '<u4'),
+    ('capacity', '<u4'),
+    ('count', '<u8'),
+    ('feeder_pid', '<i8'),
+    ('heartbeat', '<f8'),
+    ('streamed_through', '<f8'),   # Stream connected as of - every quote current
+], align=True)
+
+SLOT_DTYPE = np.dtype([
+    ('seq', '<u8'),
+    ('ticker', 'S16'),
+    ('price', '<f8'),
+    ('prev_close', '<f8'),
+    ('open', '<f8'),
+    ('high', '<f8'),
+    ('low', '<f8'),
+    ('volume', '<f8'),
+    ('timestamp', '<f8'),    # Trade (or poll) time
+    ('received', '<f8'),     # When the feeder wrote it
+], align=True)
+
+HEADER_BYTES = 64   # Header padded to one cache line
+QUOTE_FIELDS = ('price', 'prev_close', 'open', 'high', 'low', 'volume', 'timestamp', 'received')
+
+
+# Tables created (owned) by this process
+_created = set()
+
+
+def _pid_alive(pid: int) -> bool:
+    if pid <= 0:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    except OSError:
+        return False
+    return True
+
+
+class SharedQuoteTable:
+    """
+    Fixed-capacity quote table over a shared memory block.
+
+    Exactly one process writes (create()); any number read (attach()).
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool):
+        self.shm = shm
+        self.owner = owner
+        self.name = shm.name
+        self._header = np.ndarray((1,), dtype=HEADER_DTYPE, buffer=shm.buf, offset=0)
+        if owner:
+            self.capacity = (shm.size - HEADER_BYTES) // SLOT_DTYPE.itemsize
+        else:
+            self.capacity = int(self._header['capacity'][0])
+        self._slots = np.ndarray((self.capacity,), dtype=SLOT_DTYPE, buffer=shm.buf, offset=HEADER_BYTES)
+        self._seq = self._slots['seq']
+        self._index: Dict[str, int] = {}
+        self._write_lock = threading.Lock()
+        self.stats = {'reads': 0, 'retries': 0, 'misses': 0, 'writes': 0}
+
+    # ==================== LIFECYCLE ====================
+
+    @classmethod
+    def create(cls, name: str = DEFAULT_NAME, capacity: int = DEFAULT_CAPACITY) -> 'SharedQuoteTable':
+        """
+        Create the table as its writer. A block left behind by a feeder that
+        died is replaced; one owned by a live feeder raises RuntimeError.
+        """
+        size = HEADER_BYTES + capacity * SLOT_DTYPE.itemsize
+        try:
+            shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        except FileExistsError:
+            existing = cls.attach(name)
+            if existing is not None and existing.feeder_alive():
+                pid = existing.feeder_pid
+                existing.close()
+                raise RuntimeError(f"Quote table '{name}' already has a live feeder (pid {pid})")
+            if existing is not None:
+                existing.close()
+            stale = shared_memory.SharedMemory(name=name, create=False)
+            stale.close()
+            stale.unlink()
+            shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+
+        _created.add(name)
+        shm.buf[:size] = bytes(size)
+        table = cls(shm, owner=True)
+        header = table._header
+        header['version'] = VERSION
+        header['capacity'] = table.capacity
+        header['count'] = 0
+        header['feeder_pid'] = os.getpid()
+        header['heartbeat'] = time.time()
+        header['magic'] = MAGIC   # Last: readers ignore the block until it's set
+        return table
+
+    @classmethod
+    def attach(cls, name: str = DEFAULT_NAME) -> Optional['SharedQuoteTable']:
+        """Attach as a reader; None if no table exists (or it isn't ours)"""
+        try:
+            shm = shared_memory.SharedMemory(name=name, create=False)
+        except (FileNotFoundError, ValueError):
+            return None
+
+        # Python < 3.13 registers attached blocks with the resource tracker,
+        # which would unlink the feeder's table when this reader exits
+        if name not in _created:
+            try:
+                from multiprocessing import resource_tracker
+                resource_tracker.unregister(shm._name, 'shared_memory')
+            except Exception:
+                pass
+
+        header = np.ndarray((1,), dtype=HEADER_DTYPE, buffer=shm.buf, offset=0)
+        if shm.size < HEADER_BYTES or header['magic'][0] != MAGIC or header['version'][0] != VERSION:
+            del header
+            shm.close()
+            return None
+        del header
+        return cls(shm, owner=False)
+
+    def close(self):
+        """Detach (the owner also removes the block)"""
+        self._header = self._slots = self._seq = None
+        self.shm.close()
+        if self.owner:
+            _created.discard(self.name)
+            try:
+                self.shm.unlink()
+            except FileNotFoundError:
+                pass
+
+    # ==================== WRITER ====================
+
+    def heartbeat(self, streaming: bool = False):
+        """Feeder is alive; streaming=True (stream connected) also vouches for every quote"""
+        now = time.time()
+        self._header['heartbeat'] = now
+        if streaming:
+            self._header['streamed_through'] = now
+
+    def write(self, ticker: str, price: float, prev_close: Optional[float] = None,
+              open: Optional[float] = None, high: Optional[float] = None, low: Optional[float] = None,
+              volume: Optional[float] = None, timestamp: Optional[float] = None):
+        """
+        Update one ticker's quote. Fields left as None keep their previous
+        value (high/low default to the running max/min of price).
+        """
+        with self._write_lock:
+            slot = self._index.get(ticker)
+            if slot is None:
+                slot = int(self._header['count'][0])
+                if slot >= self.capacity:
+                    raise RuntimeError(f"Quote table full ({self.capacity} tickers)")
+                self._slots['ticker'][slot] = ticker.encode()[:16]
+                self._index[ticker] = slot
+
+            row = self._slots[slot:slot + 1]
+            current = row[0]
+            fields = {
+                'price': price,
+                'prev_close': prev_close,
+                'open': open,
+                'high': high if high is not None else max(price, current['high'] or price),
+                'low': low if low is not None else min(price, current['low'] or price),
+                'volume': volume,
+                'timestamp': timestamp or time.time(),
+                'received': time.time(),
+            }
+
+            self._seq[slot] += 1          # odd: write in progress
+            for field, value in fields.items():
+                if value is not None:
+                    self._slots[field][slot] = value
+            self._seq[slot] += 1          # even: consistent again
+
+            if slot == self._header['count'][0]:
+                self._header['count'] = slot + 1   # Publish the new ticker last
+            self._header['heartbeat'] = time.time()
+            self.stats['writes'] += 1
+
+    # ==================== READERS ====================
+
+    @property
+    def feeder_pid(self) -> int:
+        return int(self._header['feeder_pid'][0])
+
+    def feeder_alive(self, stale_seconds: float = FEEDER_STALE_SECONDS) -> bool:
+        """Feeder process exists and wrote a heartbeat recently"""
+        fresh = time.time() - float(self._header['heartbeat'][0]) < stale_seconds
+        return fresh and _pid_alive(self.feeder_pid)
+
+    def tickers(self) -> List[str]:
+        count = int(self._header['count'][0])
+        return [t.decode() for t in self._slots['ticker'][:count]]
+
+    def _slot_for(self, ticker: str) -> Optional[int]:
+        slot = self._index.get(ticker)
+        if slot is not None:
+            return slot
+        count = int(self._header['count'][0])
+        matches = np.flatnonzero(self._slots['ticker'][:count] == ticker.encode()[:16])
+        if not len(matches):
+            return None
+        self._index[ticker] = int(matches[0])
+        return self._index[ticker]
+
+    def read(self, ticker: str, max_age: Optional[float] = None) -> Optional[Dict]:
+        """
+        Consistent copy of one quote, or None if the ticker isn't in the
+        table or the feeder last vouched for it more than max_age seconds ago.
+        """
+        self.stats['reads'] += 1
+        slot = self._slot_for(ticker)
+        if slot is None:
+            self.stats['misses'] += 1
+            return None
+
+        for _ in range(READ_RETRIES):
+            before = int(self._seq[slot])
+            if before % 2:
+                self.stats['retries'] += 1
+                time.sleep(0)     # Writer is mid-update: yield and retry
+                continue
+            row = self._slots[slot:slot + 1].copy()[0]
+            if int(self._seq[slot]) == before:
+                break
+            self.stats['retries'] += 1
+        else:
+            self.stats['misses'] += 1
+            return None
+
+        if before == 0:
+            return None   # Slot claimed but never written
+        quote = {field: float(row[field]) for field in QUOTE_FIELDS}
+        age = time.time() - max(quote['received'], float(self._header['streamed_through'][0]))
+        if max_age is not None and age > max_age:
+            self.stats['misses'] += 1
+            return None
+
+        prev_close = quote['prev_close']
+        change = quote['price'] - prev_close if prev_close else 0.0
+        quote.update({
+            'ticker': ticker,
+            'change': change,
+            'change_pct': change / prev_close * 100 if prev_close else 0.0,
+            'volume': int(quote['volume']),
+            'age': age,
+            'timestamp': datetime.fromtimestamp(quote['timestamp']).isoformat(),
+            'received': datetime.fromtimestamp(quote['received']).isoformat(),
+            'source': 'shared',
+        })
+        return quote
+
+    def snapshot(self, max_age: Optional[float] = None) -> Dict[str, Dict]:
+        """Every ticker's quote"""
+        quotes = {}
+        for ticker in self.tickers():
+            quote = self.read(ticker, max_age=max_age)
+            if quote:
+                quotes[ticker] = quote
+        return quotes
+
+
+# Process-wide reader
+_reader: Optional[SharedQuoteTable] = None
+_reader_checked = 0.0
+_reader_lock = threading.Lock()
+
+
+def get_shared_quotes(name: str = DEFAULT_NAME) -> Optional[SharedQuoteTable]:
+    """
+    The shared quote table for this process, or None if no live feeder.
+    Looks again every ATTACH_RETRY_SECONDS, so processes started before the
+    feeder pick it up later.
+    """
+    global _reader, _reader_checked
+    with _reader_lock:
+        if _reader is not None and not _reader.feeder_alive():
+            _reader.close()
+            _reader = None
+        if _reader is None and time.time() - _reader_checked >= ATTACH_RETRY_SECONDS:
+            _reader_checked = time.time()
+            table = SharedQuoteTable.attach(name)
+            if table is not None and table.feeder_alive():
+                _reader = table
+            elif table is not None:
+                table.close()
+        return _reader
+
+
+def get_live_quote(ticker: str, max_age: float = LIVE_MAX_AGE) -> Optional[Dict]:
+    """Fresh quote from the shared table (DataFetcher.get_quote() shape), else None"""
+    table = get_shared_quotes()
+    if table is None:
+        return None
+    return table.read(ticker, max_age=max_age)
+
+
+def get_live_price(ticker: str, max_age: float = LIVE_MAX_AGE) -> Optional[float]:
+    quote = get_live_quote(ticker, max_age=max_age)
+    return quote['price'] if quote else None
+
+
+class QuoteFeeder:
+    """
+    The writer side: keeps the shared table current for a watchlist.
+
+    Streams trades when a quote stream is configured (utils/quote_stream.py)
+    and otherwise bulk-polls daily bars, whose last bar is today's live
+    price. Either way it's one connection / one download for every reader.
+    """
+
+    def __init__(self, table: SharedQuoteTable, tickers: List[str]):
+        self.table = table
+        self.tickers = list(dict.fromkeys(tickers))
+        self.reference = None              # DailyReference while streaming
+        self.volume: Dict[str, float] = {}
+        self.opened: set = set()           # Tickers that traded this session
+
+    def __call__(self, tick):
+        """QuoteBus subscriber: write each trade through"""
+        volume = self.volume.get(tick.ticker, 0.0) + tick.size
+        self.volume[tick.ticker] = volume
+        prev_close = self.reference.get(tick.ticker, 'prev_close') if self.reference else None
+        first = tick.ticker not in self.opened
+        self.opened.add(tick.ticker)
+        self.table.write(tick.ticker, tick.price, prev_close=prev_close,
+                         open=tick.price if first else None,
+                         high=tick.price if first else None,
+                         low=tick.price if first else None,
+                         volume=volume, timestamp=tick.timestamp or tick.received)
+
+    def new_session(self):
+        """
+        Market date rolled over (streaming): restart volume and open/high/low
+        from the reloaded reference and move every quote onto the new prev close.
+        """
+        self.volume = self.reference.field('volume')
+        self.opened = {ticker for ticker, volume in self.volume.items() if volume > 0}
+        for ticker in self.table.tickers():
+            prev_close = self.reference.get(ticker, 'prev_close')
+            quote = self.table.read(ticker)
+            if prev_close is None or quote is None:
+                continue
+            self.table.write(ticker, quote['price'], prev_close=prev_close,
+                             volume=self.volume.get(ticker, 0.0),
+                             timestamp=datetime.fromisoformat(quote['timestamp']).timestamp())
+
+    def poll(self) -> int:
+        """One bulk daily download -> every ticker's quote; returns tickers written"""
+        from .quote_stream import market_date
+        from .market_data import get_market_data_service
+
+        today = market_date()
+        start = (today - timedelta(days=7)).isoformat()
+        frames = get_market_data_service().download_range(self.tickers, start=start)
+
+        written = 0
+        for ticker, hist in frames.items():
+            if hist is None or hist.empty or 'Close' not in hist:
+                continue
+            hist = hist.dropna(subset=['Close'])
+            if hist.empty:
+                continue
+            last = hist.iloc[-1]
+            live = hist.index[-1].date() == today
+            prev_close = float(hist['Close'].iloc[-2]) if len(hist) > 1 else None
+            self.table.write(
+                ticker, float(last['Close']), prev_close=prev_close,
+                open=float(last['Open']) if live else None,
+                high=float(last['High']) if live else None,
+                low=float(last['Low']) if live else None,
+                volume=float(last['Volume']) if live else 0.0,
+            )
+            if live:
+                self.volume[ticker] = float(last['Volume'])
+                self.opened.add(ticker)
+            written += 1
+        return written
+
+    def run(self, stream: bool = True, poll_seconds: float = 30, status_seconds: float = 60):
+        """Feed until interrupted"""
+        from .quote_stream import (QuoteBus, QuoteStream, DailyReference,
+                                   default_stream_url, WEBSOCKETS_AVAILABLE)
+
+        print(f"📡 Shared quote table '{self.table.name}' - {len(self.tickers)} tickers")
+        written = self.poll()
+        print(f"   Seeded {written} quotes")
+
+        streaming = stream and WEBSOCKETS_AVAILABLE and default_stream_url()
+        bus = quotes = None
+        if streaming:
+            self.reference = DailyReference(self.tickers)
+            bus = QuoteBus().start()
+            bus.subscribe(self)
+            quotes = QuoteStream(bus, self.tickers).start()
+            print("   Mode: streaming")
+        else:
+            print(f"   Mode: polling every {poll_seconds:.0f}s")
+
+        last_poll = last_status = time.time()
+        try:
+            while True:
+                time.sleep(1)
+                self.table.heartbeat(streaming=bool(quotes and quotes.connected.is_set()))
+                now = time.time()
+                if now - last_poll >= poll_seconds:
+                    if not streaming:
+                        self.poll()
+                    elif self.reference.refresh():
+                        self.new_session()
+                        print(f"   New session {self.reference.day} - prev closes reloaded, volume reset", flush=True)
+                    last_poll = now
+                if now - last_status >= status_seconds:
+                    print(f"   [{datetime.now().strftime('%H:%M:%S')}] {self.table.stats['writes']:,} writes | "
+                          f"{len(self.table.tickers())} tickers", flush=True)
+                    last_status = now
+        except KeyboardInterrupt:
+            print("\n🛑 Feeder stopped")
+        finally:
+            if quotes:
+                quotes.stop()
+            if bus:
+                bus.stop()
@@ -0,0 +1,105 @@
+"""
+Single-Flight Request Coalescing
+Concurrent identical lookups share one in-flight call.
+
+Used by:
+- data_fetcher.py (DataFetcher.get_quote)
+- src/wolf_brain/universe_scanner.py (TickerDataFetcher.get_ticker_data)
+
+When the wolf pack scanner's thread pool, the convergence engine and the
+pattern services ask for the same ticker at the same moment, only the first
+caller hits the API; the rest wait for it and get the same result (or the
+same exception). Nothing is cached after the call finishes - that is still
+the caller's own cache's job.
+
+Usage:
+    from utils.single_flight import get_single_flight
+
+    flight = get_single_flight('quotes')
+    quote = flight.do(ticker, fetch_quote, ticker)
+    flight.stats   # {'calls': 12, 'executed': 4, 'saved': 8}
+"""
+
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class _Call:
+    """One in-flight call and the callers waiting on it"""
+
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Thread-safe call de-duplication keyed by an arbitrary hashable key.
+
+    stats:
+        calls    - every do() call
+        executed - calls that actually ran the function
+        saved    - calls served by someone else's in-flight result
+    """
+
+    def __init__(self, name: str = 'default'):
+        self.name = name
+        self._inflight: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self.stats = {'calls': 0, 'executed': 0, 'saved': 0}
+
+    def do(self, key: Hashable, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run fn(*args, **kwargs) unless an identical call (same key) is already
+        running, in which case wait for it and return its result.
+        """
+        with self._lock:
+            self.stats['calls'] += 1
+            call = self._inflight.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._inflight[key] = call
+                self.stats['executed'] += 1
+            else:
+                self.stats['saved'] += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn(*args, **kwargs)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            call.done.set()
+
+    def in_flight(self) -> int:
+        """Number of distinct calls currently running"""
+        with self._lock:
+            return len(self._inflight)
+
+
+# Process-wide named groups, so every instance of a fetcher shares one
+_groups: Dict[str, SingleFlight] = {}
+_groups_lock = threading.Lock()
+
+
+def get_single_flight(name: str) -> SingleFlight:
+    """Get the shared SingleFlight group for a name"""
+    with _groups_lock:
+        group = _groups.get(name)
+        if group is None:
+            group = SingleFlight(name)
+            _groups[name] = group
+        return group
@@ -0,0 +1,192 @@
+"""
+Task Graph Executor
+Runs scans as a small dependency graph instead of one after another.
+
+Used by:
+- src/layer1_hunter/wolf_pack_scanner.py (run_master_scan)
+- src/core/orchestrator.py (WolfPackOrchestrator.run_full_scan)
+
+Each node declares the inputs it needs (other nodes: the universe bars, the
+SEC feed, a scored watchlist). A node starts as soon as its inputs are
+done, so independent scans run in parallel over inputs that were fetched
+once. Every node is timed. A node that raises does not stop the run: its
+error is recorded and only the nodes that depend on it are skipped.
+
+Scans print their own reports. A node that starts while other nodes are
+running has its output buffered and printed as one block when it finishes,
+so parallel reports don't interleave. A node that starts alone streams its
+output as it goes (progress lines, prints from threads it starts).
+
+Usage:
+    from utils.task_graph import TaskGraph
+
+    graph = TaskGraph(max_workers=6)
+    graph.add('bars', load_universe_bars)
+    graph.add('volume', scan_volume_spikes, inputs=['bars'])
+    graph.add('movers', scan_day_movers, inputs=['bars'])
+    results = graph.run()          # {name: NodeResult}
+    results['volume'].value        # scan_volume_spikes(bars)
+    graph.print_timings(results)
+"""
+
+import io
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+
+DEFAULT_MAX_WORKERS = 6
+
+
+@dataclass
+class NodeResult:
+    """Outcome of one node"""
+    name: str
+    value: Any = None
+    error: Optional[str] = None
+    seconds: float = 0.0
+    skipped: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class _Node:
+    name: str
+    func: Callable
+    inputs: List[str]
+
+
+class _NodeOutput(io.TextIOBase):
+    """
+    sys.stdout stand-in while a graph runs: writes from a node's worker
+    thread go to that node's buffer, everything else passes straight through.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.local = threading.local()
+
+    def write(self, text):
+        buffer = getattr(self.local, 'buffer', None)
+        if buffer is None:
+            return self.stream.write(text)
+        return buffer.write(text)
+
+    def flush(self):
+        self.stream.flush()
+
+
+class TaskGraph:
+    """
+    Dependency-ordered, thread-pooled runner for scan functions.
+
+    Node functions are called with their inputs' values as positional
+    arguments, in the order the inputs were declared.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS):
+        self.max_workers = max_workers
+        self._nodes: Dict[str, _Node] = {}
+        self._print_lock = threading.Lock()
+
+    def add(self, name: str, func: Callable, inputs: Optional[List[str]] = None) -> 'TaskGraph':
+        """
+        Add a node. Inputs must already be in the graph, which also rules
+        out cycles.
+        """
+        if name in self._nodes:
+            raise ValueError(f"Duplicate node: {name}")
+        inputs = list(inputs or [])
+        unknown = [i for i in inputs if i not in self._nodes]
+        if unknown:
+            raise ValueError(f"{name}: unknown inputs {unknown}")
+        self._nodes[name] = _Node(name, func, inputs)
+        return self
+
+    def run(self, buffer_output: bool = True) -> Dict[str, NodeResult]:
+        """
+        Run every node as soon as its inputs are ready.
+
+        Args:
+            buffer_output: Print the output of nodes that run alongside
+                           others as one block when they finish (False =
+                           stream everything, letting parallel prints interleave)
+
+        Returns:
+            {name: NodeResult} in the order nodes were added
+        """
+        results: Dict[str, NodeResult] = {}
+        pending = dict(self._nodes)
+        running = {}
+
+        output = _NodeOutput(sys.stdout) if buffer_output else None
+        if output:
+            sys.stdout = output
+
+        def call(node: _Node, args: List[Any], buffered: bool) -> NodeResult:
+            if buffered:
+                output.local.buffer = io.StringIO()
+            start = time.perf_counter()
+            try:
+                result = NodeResult(node.name, value=node.func(*args))
+            except Exception as e:
+                result = NodeResult(node.name, error=f"{type(e).__name__}: {e}")
+            result.seconds = time.perf_counter() - start
+            if buffered:
+                text = output.local.buffer.getvalue()
+                output.local.buffer = None
+                with self._print_lock:
+                    output.stream.write(text)
+                    output.stream.flush()
+            return result
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                while pending or running:
+                    # Skip nodes whose inputs failed; start nodes whose inputs are done
+                    ready = []
+                    for name, node in list(pending.items()):
+                        failed = [i for i in node.inputs if i in results and not results[i].ok]
+                        if failed:
+                            results[name] = NodeResult(name, error=f"skipped: {', '.join(failed)} failed", skipped=True)
+                            del pending[name]
+                        elif all(i in results for i in node.inputs):
+                            ready.append(node)
+                            del pending[name]
+
+                    # A node with nothing running beside it streams its output
+                    buffered = output is not None and len(running) + len(ready) > 1
+                    for node in ready:
+                        args = [results[i].value for i in node.inputs]
+                        running[executor.submit(call, node, args, buffered)] = node.name
+
+                    if not running:
+                        continue
+
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        results[running.pop(future)] = future.result()
+        finally:
+            if output:
+                sys.stdout = output.stream
+
+        return {name: results[name] for name in self._nodes}
+
+    @staticmethod
+    def print_timings(results: Dict[str, NodeResult]):
+        """Per-node timing / status table"""
+        print("\n⏱️  SCAN TIMINGS")
+        for result in results.values():
+            if result.skipped:
+                status = f"⏭️  {result.error}"
+            elif result.ok:
+                status = "✅"
+            else:
+                status = f"❌ {result.error}"
+            print(f"   {result.name:<14} {result.seconds:>6.2f}s  {status}")
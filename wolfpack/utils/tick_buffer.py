@@ -0,0 +1,291 @@
+"""
+Tick Ring Buffers
+Fixed-capacity, array-backed recent history per ticker, with window queries
+and batched background flushing to disk.
+
+Used by:
+- safe_position_monitor.py (SafePositionMonitor - quote logging, spike context)
+
+Each ticker gets one ring of parallel NumPy arrays (timestamp, price, size,
+day volume) allocated once at `capacity` rows, so memory is bounded no
+matter how fast ticks arrive: 200 tickers x 4096 rows is about 23 MB. Recording a
+tick is a few array stores under a lock - nothing touches SQLite on the hot
+path. Window queries (last N minutes VWAP, high/low, slope) are vectorized
+over the ring's live rows.
+
+A flusher thread hands rows recorded since the last flush to a sink
+(e.g. one executemany) every few seconds. Flushes are serialized, so an
+explicit flush() racing the flusher thread never writes a row twice. If a
+ring wraps before it is flushed, the oldest unflushed rows are lost and
+counted in stats['overrun'].
+
+Usage:
+    from utils.tick_buffer import TickBuffers
+
+    ticks = TickBuffers(capacity=4096)
+    ticks.record('MU', time.time(), 412.30, size=100)
+    bus.subscribe(ticks)                     # or record every QuoteBus tick
+    ticks.vwap('MU', minutes=15)
+    ticks.high_low('MU', minutes=15)         # (high, low)
+    ticks.slope('MU', minutes=15)            # % per minute
+    ticks.snapshot(minutes=15)               # DataFrame, one row per ticker
+
+    ticks.start_flusher(write_rows, interval=5)   # write_rows([(ticker, ts, price, size, volume), ...])
+    ticks.stop_flusher()                          # final flush
+"""
+
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+DEFAULT_CAPACITY = 4096
+DEFAULT_FLUSH_SECONDS = 5.0
+
+Row = Tuple[str, float, float, float, float]   # ticker, timestamp, price, size, volume
+
+
+class TickRing:
+    """
+    One ticker's ring: parallel arrays plus a running write count.
+
+    Row i of the ring lives at slot i % capacity; `written` only grows, so
+    (written - flushed) is the unflushed backlog.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self.timestamp = np.zeros(capacity, dtype=np.float64)
+        self.price = np.zeros(capacity, dtype=np.float64)
+        self.size = np.zeros(capacity, dtype=np.float32)
+        self.volume = np.zeros(capacity, dtype=np.float64)
+        self.written = 0
+        self.flushed = 0
+
+    def __len__(self) -> int:
+        return min(self.written, self.capacity)
+
+    def append(self, timestamp: float, price: float, size: float = 0.0, volume: Optional[float] = None):
+        slot = self.written % self.capacity
+        if volume is None:
+            # Running volume since the ring started (no day total supplied)
+            previous = self.volume[(self.written - 1) % self.capacity] if self.written else 0.0
+            volume = previous + size
+        self.timestamp[slot] = timestamp
+        self.price[slot] = price
+        self.size[slot] = size
+        self.volume[slot] = volume
+        self.written += 1
+
+    def _order(self, start: int, stop: int) -> np.ndarray:
+        """Slots for absolute rows [start, stop), oldest first"""
+        return np.arange(start, stop) % self.capacity
+
+    def rows(self, start: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """Live rows (from absolute row `start` if given), oldest first"""
+        oldest = max(self.written - self.capacity, 0)
+        start = oldest if start is None else max(start, oldest)
+        slots = self._order(start, self.written)
+        return {
+            'timestamp': self.timestamp[slots],
+            'price': self.price[slots],
+            'size': self.size[slots],
+            'volume': self.volume[slots],
+        }
+
+    def window(self, seconds: float, now: Optional[float] = None) -> Dict[str, np.ndarray]:
+        """Rows with timestamp within `seconds` of now, oldest first"""
+        rows = self.rows()
+        now = time.time() if now is None else now
+        # Timestamps are appended in order, so the window is a suffix
+        first = np.searchsorted(rows['timestamp'], now - seconds, side='left')
+        return {key: values[first:] for key, values in rows.items()}
+
+
+class TickBuffers:
+    """
+    Thread-safe map of ticker -> TickRing with window queries.
+
+    Also a QuoteBus subscriber: calling it with a Tick records the tick.
+
+    stats:
+        recorded - ticks recorded
+        flushed  - rows handed to the sink
+        overrun  - rows lost because a ring wrapped before it was flushed
+        flushes  - sink calls
+        errors   - sink calls that raised (rows are retried next flush)
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self._rings: Dict[str, TickRing] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()    # one flush at a time, snapshot through mark
+        self._flusher: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._sink: Optional[Callable[[List[Row]], None]] = None
+        self.stats = {'recorded': 0, 'flushed': 0, 'overrun': 0, 'flushes': 0, 'errors': 0}
+
+    def __call__(self, tick):
+        self.record(tick.ticker, tick.timestamp or tick.received, tick.price, tick.size)
+
+    def record(self, ticker: str, timestamp: float, price: float, size: float = 0.0,
+               volume: Optional[float] = None):
+        """Append one tick (volume = day volume so far, if known)"""
+        with self._lock:
+            ring = self._rings.get(ticker)
+            if ring is None:
+                ring = self._rings[ticker] = TickRing(self.capacity)
+            ring.append(timestamp, price, size, volume)
+            self.stats['recorded'] += 1
+
+    def tickers(self) -> List[str]:
+        with self._lock:
+            return list(self._rings)
+
+    def memory_bytes(self) -> int:
+        with self._lock:
+            return sum(r.timestamp.nbytes + r.price.nbytes + r.size.nbytes + r.volume.nbytes
+                       for r in self._rings.values())
+
+    # ==================== WINDOW QUERIES ====================
+
+    def window(self, ticker: str, minutes: float, now: Optional[float] = None) -> Dict[str, np.ndarray]:
+        """Copies of the last `minutes` of rows (empty arrays if none)"""
+        with self._lock:
+            ring = self._rings.get(ticker)
+            if ring is None:
+                empty = np.array([])
+                return {'timestamp': empty, 'price': empty, 'size': empty, 'volume': empty}
+            return ring.window(minutes * 60, now)
+
+    def last(self, ticker: str) -> Optional[Dict[str, float]]:
+        with self._lock:
+            ring = self._rings.get(ticker)
+            if ring is None or not ring.written:
+                return None
+            slot = (ring.written - 1) % ring.capacity
+            return {'timestamp': float(ring.timestamp[slot]), 'price': float(ring.price[slot]),
+                    'size': float(ring.size[slot]), 'volume': float(ring.volume[slot])}
+
+    def vwap(self, ticker: str, minutes: float = 15, now: Optional[float] = None) -> Optional[float]:
+        """Size-weighted average price over the window (plain mean if sizes are 0)"""
+        rows = self.window(ticker, minutes, now)
+        return _vwap(rows['price'], rows['size'])
+
+    def high_low(self, ticker: str, minutes: float = 15,
+                 now: Optional[float] = None) -> Tuple[Optional[float], Optional[float]]:
+        rows = self.window(ticker, minutes, now)
+        if not len(rows['price']):
+            return None, None
+        return float(rows['price'].max()), float(rows['price'].min())
+
+    def slope(self, ticker: str, minutes: float = 15, now: Optional[float] = None) -> Optional[float]:
+        """Least-squares price trend over the window, in % of VWAP per minute"""
+        rows = self.window(ticker, minutes, now)
+        return _slope_pct(rows['timestamp'], rows['price'], rows['size'])
+
+    def snapshot(self, minutes: float = 15, now: Optional[float] = None) -> pd.DataFrame:
+        """Window stats for every ticker: last, vwap, high, low, slope_pct, ticks, volume"""
+        records = {}
+        for ticker in self.tickers():
+            rows = self.window(ticker, minutes, now)
+            prices = rows['price']
+            if not len(prices):
+                continue
+            records[ticker] = {
+                'last': float(prices[-1]),
+                'vwap': _vwap(prices, rows['size']),
+                'high': float(prices.max()),
+                'low': float(prices.min()),
+                'slope_pct': _slope_pct(rows['timestamp'], prices, rows['size']),
+                'ticks': len(prices),
+                'volume': float(rows['size'].sum()),
+            }
+        return pd.DataFrame.from_dict(records, orient='index')
+
+    # ==================== FLUSHING ====================
+
+    def start_flusher(self, sink: Callable[[List[Row]], None],
+                      interval: float = DEFAULT_FLUSH_SECONDS) -> 'TickBuffers':
+        """Call sink(rows) with newly recorded rows every `interval` seconds"""
+        self._sink = sink
+        self._stop.clear()
+
+        def loop():
+            while not self._stop.wait(interval):
+                self.flush()
+
+        self._flusher = threading.Thread(target=loop, name='tick-flusher', daemon=True)
+        self._flusher.start()
+        return self
+
+    def stop_flusher(self, timeout: float = 10.0):
+        """Stop the flusher thread and flush what's left"""
+        self._stop.set()
+        if self._flusher:
+            self._flusher.join(timeout=timeout)
+            self._flusher = None
+        self.flush()
+
+    def flush(self) -> int:
+        """Hand unflushed rows to the sink now; returns rows written"""
+        if self._sink is None:
+            return 0
+
+        with self._flush_lock:
+            # Copy rows out under the lock, write them without it
+            batch: List[Row] = []
+            marks = {}
+            with self._lock:
+                for ticker, ring in self._rings.items():
+                    if ring.written == ring.flushed:
+                        continue
+                    lost = ring.written - ring.flushed - ring.capacity
+                    if lost > 0:
+                        self.stats['overrun'] += lost
+                        ring.flushed += lost
+                    rows = ring.rows(ring.flushed)
+                    batch.extend(zip([ticker] * len(rows['price']), rows['timestamp'].tolist(),
+                                     rows['price'].tolist(), rows['size'].tolist(), rows['volume'].tolist()))
+                    marks[ticker] = ring.written
+
+            if not batch:
+                return 0
+            try:
+                self._sink(batch)
+            except Exception as e:
+                self.stats['errors'] += 1
+                print(f"⚠️  Tick flush error ({len(batch)} rows): {e}")
+                return 0
+
+            with self._lock:
+                for ticker, written in marks.items():
+                    self._rings[ticker].flushed = written
+                self.stats['flushed'] += len(batch)
+                self.stats['flushes'] += 1
+            return len(batch)
+
+
+def _vwap(prices: np.ndarray, sizes: np.ndarray) -> Optional[float]:
+    if not len(prices):
+        return None
+    total = sizes.sum()
+    if total > 0:
+        return float(np.dot(prices, sizes) / total)
+    return float(prices.mean())
+
+
+def _slope_pct(timestamps: np.ndarray, prices: np.ndarray, sizes: np.ndarray) -> Optional[float]:
+    if len(prices) < 2:
+        return None
+    minutes = (timestamps - timestamps[0]) / 60
+    spread = minutes - minutes.mean()
+    denominator = np.dot(spread, spread)
+    if denominator == 0:
+        return None
+    per_minute = np.dot(spread, prices - prices.mean()) / denominator
+    return float(per_minute / _vwap(prices, sizes) * 100)
@@ -0,0 +1,296 @@
+"""
+Intraday Volume Profiles
+Per-ticker "normal volume by this minute" curves, so relative volume is
+measured against the time of day instead of a full-day average.
+
+Replaces full-day volume ratios in:
+- src/core/free_volume_monitor.py (FreeVolumeMonitor.get_realtime_data)
+- src/core/realtime_volume_monitor.py (RealTimeVolumeMonitor.detect_volume_spike)
+- utils/quote_stream.py (VolumeSpikeDetector)
+
+A full-day average makes every morning look quiet and every afternoon look
+hot. build() (run nightly by wolfpack_recorder.py) pulls 5-minute bars for
+the universe in one bulk download and merges them into the stored
+per-session bucket volumes, keeping the last PROFILE_SESSIONS sessions. From
+those it precomputes, for every ticker, the average cumulative volume at
+each minute of the regular session (391 points, minute 0 = the open).
+
+Everything lives in one NumPy .npz file. During the session a lookup is a
+dict hit plus an array index - no network call per check. Tickers without
+enough history fall back to the universe's median curve shape scaled by
+their average daily volume, when the caller supplies one.
+
+Usage:
+    from utils.volume_profile import get_volume_profiles
+
+    profiles = get_volume_profiles()
+    profiles.build(ALL_TICKERS)                       # nightly
+    profiles.expected_volume('MU')                    # normal volume by now
+    profiles.relative_volume('MU', 4_200_000)         # 2.1 = 2.1x normal for this minute
+    profiles.avg_daily_volume('MU')
+"""
+
+import os
+import threading
+import warnings
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pandas as pd
+
+
+DEFAULT_PATH = os.getenv(
+    'VOLUME_PROFILE_PATH',
+    os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'volume_profiles.npz')
+)
+
+MARKET_TZ = ZoneInfo('America/New_York')
+SESSION_OPEN_MINUTE = 9 * 60 + 30   # 9:30 ET, minutes after midnight
+SESSION_MINUTES = 390
+BUCKET_MINUTES = 5
+BUCKETS = SESSION_MINUTES // BUCKET_MINUTES
+
+PROFILE_SESSIONS = 20     # Sessions averaged into each curve
+MIN_SESSIONS = 5          # Fewer full sessions than this = no ticker curve
+FULL_SESSION_BUCKETS = int(BUCKETS * 0.9)   # Half days and gappy sessions are left out
+MIN_MINUTE = BUCKET_MINUTES                 # First bucket is too noisy to compare against
+
+
+def session_minute(when: Optional[datetime] = None) -> Optional[int]:
+    """
+    Minutes since the 9:30 ET open (capped at the close), or None before the
+    open / on weekends.
+    """
+    now = (when or datetime.now(MARKET_TZ))
+    now = now.astimezone(MARKET_TZ) if now.tzinfo else now.replace(tzinfo=MARKET_TZ)
+    if now.weekday() > 4:
+        return None
+    minute = now.hour * 60 + now.minute - SESSION_OPEN_MINUTE
+    if minute < 0:
+        return None
+    return min(minute, SESSION_MINUTES)
+
+
+def _bucket_volumes(hist: pd.DataFrame) -> pd.DataFrame:
+    """5-minute bars -> (session date x bucket) volume frame"""
+    if hist is None or hist.empty or 'Volume' not in hist:
+        return pd.DataFrame(columns=range(BUCKETS))
+
+    index = hist.index
+    if getattr(index, 'tz', None) is not None:
+        index = index.tz_convert(MARKET_TZ).tz_localize(None)
+    minutes = index.hour * 60 + index.minute - SESSION_OPEN_MINUTE
+    regular = (minutes >= 0) & (minutes < SESSION_MINUTES)
+
+    frame = pd.DataFrame({
+        'session': index[regular].normalize(),
+        'bucket': minutes[regular] // BUCKET_MINUTES,
+        'volume': hist['Volume'].to_numpy(dtype=float)[regular],
+    })
+    return frame.pivot_table(index='session', columns='bucket', values='volume',
+                             aggfunc='sum').reindex(columns=range(BUCKETS))
+
+
+class VolumeProfileStore:
+    """
+    Stored bucket volumes + precomputed cumulative-volume-by-minute curves.
+
+    Arrays (all rows follow self.tickers):
+        sessions       - (D,) session dates, oldest first
+        buckets        - (N, D, BUCKETS) volume per 5-minute bucket, NaN = no bar
+        expected       - (N, SESSION_MINUTES + 1) average cumulative volume by
+                         minute, NaN row = not enough full sessions
+        default_shape  - (SESSION_MINUTES + 1,) median cumulative share of day
+                         volume across tickers (fallback curve)
+    """
+
+    def __init__(self, path: str = DEFAULT_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self.tickers: List[str] = []
+        self.sessions = np.array([], dtype='datetime64[D]')
+        self.buckets = np.zeros((0, 0, BUCKETS), dtype=np.float32)
+        self.expected = np.zeros((0, SESSION_MINUTES + 1), dtype=np.float32)
+        self.default_shape = np.full(SESSION_MINUTES + 1, np.nan, dtype=np.float32)
+        self.built_at: Optional[str] = None
+        self._rows: Dict[str, int] = {}
+        self.load()
+
+    # ==================== LOOKUPS ====================
+
+    def has(self, ticker: str) -> bool:
+        row = self._rows.get(ticker)
+        return row is not None and not np.isnan(self.expected[row, -1])
+
+    def expected_volume(self, ticker: str, minute: Optional[int] = None,
+                        avg_daily_volume: Optional[float] = None) -> Optional[float]:
+        """
+        Normal cumulative volume for this ticker by `minute` of the session
+        (default: now). Falls back to default_shape * avg_daily_volume for
+        tickers without a curve. None outside the session or with no basis.
+        """
+        if minute is None:
+            minute = session_minute()
+        if minute is None:
+            return None
+        minute = max(min(int(minute), SESSION_MINUTES), MIN_MINUTE)
+
+        row = self._rows.get(ticker)
+        if row is not None:
+            value = self.expected[row, minute]
+            if not np.isnan(value) and value > 0:
+                return float(value)
+
+        shape = self.default_shape[minute]
+        if avg_daily_volume and not np.isnan(shape):
+            return float(shape * avg_daily_volume)
+        return None
+
+    def avg_daily_volume(self, ticker: str) -> Optional[float]:
+        """Average full-session volume (the end of the ticker's curve)"""
+        return self.expected_volume(ticker, minute=SESSION_MINUTES)
+
+    def relative_volume(self, ticker: str, volume: float, minute: Optional[int] = None,
+                        avg_daily_volume: Optional[float] = None) -> Optional[float]:
+        """volume / normal volume by this minute (None if there's no basis)"""
+        expected = self.expected_volume(ticker, minute, avg_daily_volume)
+        if not expected:
+            return None
+        return volume / expected
+
+    # ==================== BUILD ====================
+
+    def build(self, tickers: Iterable[str], sessions: int = PROFILE_SESSIONS) -> int:
+        """
+        Fetch recent 5-minute bars in bulk, merge them into the stored
+        bucket volumes and recompute every curve.
+
+        Returns:
+            Number of tickers with a usable curve afterwards
+        """
+        from .market_data import get_market_data_service
+
+        tickers = list(dict.fromkeys(tickers))
+        # ~1.6 calendar days per session covers weekends and holidays;
+        # yfinance serves 5-minute bars for the last 60 days only
+        days = min(int(sessions * 1.6) + 3, 59)
+        start = (datetime.now(MARKET_TZ).date() - timedelta(days=days)).isoformat()
+        frames = get_market_data_service().download_range(tickers, start=start, interval=f'{BUCKET_MINUTES}m')
+
+        fetched = {ticker: _bucket_volumes(hist) for ticker, hist in frames.items()}
+
+        with self._lock:
+            self._merge(fetched, sessions)
+            self._compute_curves()
+            self.built_at = datetime.now().isoformat(timespec='seconds')
+            self.save()
+            return int((~np.isnan(self.expected[:, -1])).sum())
+
+    def _merge(self, fetched: Dict[str, pd.DataFrame], sessions: int):
+        """Union stored and fetched sessions, keep the newest `sessions`"""
+        new_dates = [d for frame in fetched.values() for d in frame.index.values.astype('datetime64[D]')]
+        all_sessions = np.unique(np.concatenate([self.sessions, np.array(new_dates, dtype='datetime64[D]')]))
+        kept = all_sessions[-sessions:]
+
+        names = self.tickers + [t for t in fetched if t not in self._rows]
+        buckets = np.full((len(names), len(kept), BUCKETS), np.nan, dtype=np.float32)
+
+        # Carry over stored sessions still in the window
+        if len(self.sessions) and len(self.tickers):
+            old_cols = np.searchsorted(kept, self.sessions)
+            in_window = (old_cols < len(kept)) & (kept[np.minimum(old_cols, len(kept) - 1)] == self.sessions)
+            buckets[:len(self.tickers), old_cols[in_window]] = self.buckets[:, in_window]
+
+        # Fresh bars replace stored ones for the same session
+        rows = {t: i for i, t in enumerate(names)}
+        for ticker, frame in fetched.items():
+            if frame.empty:
+                continue
+            dates = frame.index.values.astype('datetime64[D]')
+            cols = np.searchsorted(kept, dates)
+            keep = (cols < len(kept)) & (kept[np.minimum(cols, len(kept) - 1)] == dates)
+            buckets[rows[ticker], cols[keep]] = frame.to_numpy(dtype=np.float32)[keep]
+
+        self.tickers = names
+        self._rows = rows
+        self.sessions = kept
+        self.buckets = buckets
+
+    def _compute_curves(self):
+        """Average cumulative volume by minute from full sessions only"""
+        n = len(self.tickers)
+        if n == 0 or self.buckets.shape[1] == 0:
+            self.expected = np.full((n, SESSION_MINUTES + 1), np.nan, dtype=np.float32)
+            return
+
+        traded = ~np.isnan(self.buckets)
+        full = traded.sum(axis=2) >= FULL_SESSION_BUCKETS                  # (N, D)
+        cumulative = np.nancumsum(self.buckets, axis=2)                    # (N, D, BUCKETS)
+        cumulative = np.where(full[:, :, None], cumulative, np.nan)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)     # all-NaN rows
+            per_bucket = np.nanmean(cumulative, axis=1)                     # (N, BUCKETS)
+        per_bucket[full.sum(axis=1) < MIN_SESSIONS] = np.nan
+
+        # Bucket ends sit at minutes 5, 10, ... 390; interpolate the minutes between
+        knots = np.concatenate([np.zeros((n, 1)), per_bucket], axis=1)     # (N, BUCKETS + 1)
+        minutes = np.arange(SESSION_MINUTES + 1)
+        position = minutes / BUCKET_MINUTES
+        left = np.minimum(position.astype(int), BUCKETS - 1)
+        weight = position - left
+        self.expected = (knots[:, left] * (1 - weight) + knots[:, left + 1] * weight).astype(np.float32)
+
+        valid = ~np.isnan(self.expected[:, -1]) & (self.expected[:, -1] > 0)
+        if valid.any():
+            shares = self.expected[valid] / self.expected[valid, -1:]
+            self.default_shape = np.median(shares, axis=0).astype(np.float32)
+
+    # ==================== PERSISTENCE ====================
+
+    def load(self) -> bool:
+        if not os.path.exists(self.path):
+            return False
+        try:
+            with np.load(self.path, allow_pickle=False) as data:
+                self.tickers = [str(t) for t in data['tickers']]
+                self.sessions = data['sessions'].astype('datetime64[D]')
+                self.buckets = data['buckets']
+                self.expected = data['expected']
+                self.default_shape = data['default_shape']
+                self.built_at = str(data['built_at']) or None
+        except Exception as e:
+            print(f"⚠️  Could not load volume profiles ({self.path}): {e}")
+            return False
+        self._rows = {t: i for i, t in enumerate(self.tickers)}
+        return True
+
+    def save(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        tmp_path = self.path + '.tmp.npz'
+        np.savez_compressed(
+            tmp_path,
+            tickers=np.array(self.tickers, dtype=str),
+            sessions=self.sessions,
+            buckets=self.buckets,
+            expected=self.expected,
+            default_shape=self.default_shape,
+            built_at=np.array(self.built_at or ''),
+        )
+        os.replace(tmp_path, self.path)
+
+
+# Process-wide shared instance
+_profiles: Optional[VolumeProfileStore] = None
+_profiles_lock = threading.Lock()
+
+
+def get_volume_profiles() -> VolumeProfileStore:
+    """Get the shared VolumeProfileStore for this process"""
+    global _profiles
+    with _profiles_lock:
+        if _profiles is None:
+            _profiles = VolumeProfileStore()
+        return _profiles
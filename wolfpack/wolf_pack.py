@@ -30,6 +30,11 @@ from thesis_tracker import THESIS_DATABASE
 # Import WolfPack database helpers
 from config import DB_PATH
 
+# Shared batched market data (one bulk download per scan)
+from utils.market_data import get_market_data_service
+from utils.screener import screen_universe
+from utils.cassette import install_from_env
+
 # Import BR0KKR service
 try:
     from br0kkr_service import scan_institutional_activity
@@ -95,14 +100,6 @@ except ImportError:
     print("⚠️  Earnings service not available")
     EARNINGS_AVAILABLE = False
 
-# Scanner V2 - import the main scanning function
-try:
-    import yfinance as yf
-    from concurrent.futures import ThreadPoolExecutor, as_completed
-except ImportError:
-    print("⚠️  Missing dependencies. Run: pip install yfinance")
-    sys.exit(1)
-
 class WolfPack:
     """Unified trading intelligence - all systems working together"""
     
@@ -121,6 +118,7 @@ class WolfPack:
         self.pattern_data = None  # WolfPack database patterns
         self.db_connection = None
         self.account_value = account_value
+        self.market_data = get_market_data_service()
         
         # Initialize convergence engine
         if CONVERGENCE_AVAILABLE:
@@ -446,91 +444,59 @@ class WolfPack:
         """Integrated market scanner with V2 logic"""
         setups = []
         
-        def analyze_ticker(ticker):
-            """Simplified scanner logic with DANGER ZONE filter (Layer 0)"""
-            try:
-                # LAYER 0: DANGER ZONE CHECK (RUNS FIRST!)
-                # THE WOLF DOESN'T WALK INTO TRAPS.
-                if DANGER_ZONE_AVAILABLE and self.danger_zone:
-                    danger_result = self.danger_zone.scan(ticker)
-                    
-                    if danger_result['status'] == 'BLOCKED':
-                        # Trap detected - skip this ticker
-                        print(f"   🚫 {ticker} BLOCKED: {', '.join(danger_result['dangers'])}")
-                        
-                        # Add to wounded prey watchlist for later
-                        self.danger_zone.add_to_wounded_prey_watchlist(
-                            ticker, 
-                            danger_result['dangers']
-                        )
-                        return None
-                    # If CLEAR, proceed to opportunity analysis
-                
-                stock = yf.Ticker(ticker)
-                hist = stock.history(period="6mo")
-                
-                if hist.empty or len(hist) < 50:
-                    return None
-                
-                current_price = hist['Close'].iloc[-1]
-                high_52w = hist['High'].max()
-                low_52w = hist['Low'].min()
-                
-                # Calculate momentum
-                change_7d = ((current_price / hist['Close'].iloc[-7] - 1) * 100) if len(hist) >= 7 else 0
-                change_30d = ((current_price / hist['Close'].iloc[-30] - 1) * 100) if len(hist) >= 30 else 0
-                
-                # Distance from highs
-                distance_from_high = ((current_price / high_52w - 1) * 100)
-                
-                # Simple pattern detection
-                signal_type = "UNKNOWN"
-                score = 50
-                reasoning = f"{change_7d:+.1f}% (7d), {change_30d:+.1f}% (30d)"
-                
-                # TOO_LATE filter (from V2)
-                if change_30d > 30:
-                    return None  # Skip extended runners
-                
-                # WOUNDED PREY (core strategy)
-                if distance_from_high < -30 and change_7d > 0:
-                    signal_type = "WOUNDED_PREY"
-                    score = 65
-                    reasoning = f"Down {distance_from_high:.1f}% from highs, starting bounce"
-                
-                # EARLY MOMENTUM
-                elif 5 < change_7d < 20 and change_30d < 25:
-                    signal_type = "EARLY_MOMENTUM"
-                    score = 55
-                    reasoning = f"Early move: {change_7d:+.1f}% (7d), {change_30d:+.1f}% (30d)"
-                
-                else:
-                    return None  # No clear setup
-                
-                # Calculate stop loss (simple version)
-                stop_loss = low_52w * 1.05 if distance_from_high < -20 else current_price * 0.85
-                
-                return {
-                    'ticker': ticker,
-                    'type': signal_type,
-                    'score': score,
-                    'entry': current_price,
-                    'stop': stop_loss,
-                    'reasoning': reasoning,
-                    'change_7d': change_7d,
-                    'change_30d': change_30d
-                }
-                
-            except Exception:
-                return None
+        # One bulk download for the whole universe, screened in one vectorized pass
+        table = screen_universe(self.scan_universe, period="6mo")
         
-        # Parallel scanning
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            futures = {executor.submit(analyze_ticker, t): t for t in self.scan_universe}
-            for future in as_completed(futures):
-                result = future.result()
-                if result:
-                    setups.append(result)
+        # LAYER 0 for the whole universe in one batch (shares the download above)
+        # THE WOLF DOESN'T WALK INTO TRAPS.
+        danger_table = None
+        if DANGER_ZONE_AVAILABLE and self.danger_zone:
+            try:
+                danger_table = self.danger_zone.scan_many(self.scan_universe)
+            except Exception as e:
+                # Fall back to one check per candidate - a ticker whose check
+                # errors is skipped, never waved through
+                print(f"   ⚠️ Danger zone batch scan failed: {e} - checking candidates one by one")
+                checked = {}
+                for ticker in table.index[table['signal'] != '']:
+                    try:
+                        result = self.danger_zone.scan(ticker)
+                    except Exception:
+                        continue
+                    checked[ticker] = {'status': result['status'], 'dangers': result['dangers']}
+                danger_table = pd.DataFrame.from_dict(checked, orient='index', columns=['status', 'dangers'])
+        
+        if danger_table is not None:
+            blocked = danger_table[danger_table['status'] == 'BLOCKED']
+            for ticker, danger_result in blocked.iterrows():
+                # Trap detected - skip this ticker
+                print(f"   🚫 {ticker} BLOCKED: {', '.join(danger_result['dangers'])}")
+                
+                # Add to wounded prey watchlist for later
+                self.danger_zone.add_to_wounded_prey_watchlist(
+                    ticker, 
+                    danger_result['dangers']
+                )
+            # Only tickers the danger zone cleared go on
+            table = table[table.index.isin(danger_table.index[danger_table['status'] == 'CLEAR'])]
+        
+        # WOUNDED_PREY / EARLY_MOMENTUM (TOO_LATE already masked out)
+        for ticker, row in table[table['signal'] != ''].iterrows():
+            if row['signal'] == 'WOUNDED_PREY':
+                reasoning = f"Down {row['distance_from_high']:.1f}% from highs, starting bounce"
+            else:
+                reasoning = f"Early move: {row['change_7d']:+.1f}% (7d), {row['change_30d']:+.1f}% (30d)"
+            
+            setups.append({
+                'ticker': ticker,
+                'type': row['signal'],
+                'score': int(row['score']),
+                'entry': row['price'],
+                'stop': row['stop'],
+                'reasoning': reasoning,
+                'change_7d': row['change_7d'],
+                'change_30d': row['change_30d']
+            })
         
         # Sort by score
         setups.sort(key=lambda x: x['score'], reverse=True)
@@ -983,6 +949,8 @@ class WolfPack:
 def main():
     """Entry point - one command for everything"""
     
+    install_from_env()  # CASSETTE_MODE=record|replay
+    
     # Initialize Wolf Pack
     pack = WolfPack()
     pack.initialize()
@@ -5,15 +5,16 @@ Captures EVERYTHING. Technical indicators, move classification, ALL data.
 """
 
 import sqlite3
-import yfinance as yf
 import pandas as pd
 from datetime import datetime, timedelta
-import time
 import warnings
 warnings.filterwarnings('ignore')
 
-from config import ALL_TICKERS, TICKER_TO_SECTOR, DB_PATH, RATE_LIMIT_DELAY
-from utils.indicators import calculate_rsi, calculate_sma
+from config import ALL_TICKERS, TICKER_TO_SECTOR, DB_PATH
+from utils.indicators import calculate_rsi, calculate_sma, latest_indicators
+from utils.bar_store import get_bar_store
+from utils.screener import panel_to_arrays
+from utils.volume_profile import get_volume_profiles
 from config import BIG_MOVE_THRESHOLD, MEDIUM_MOVE_THRESHOLD
 from wolfpack_db import init_database
 
@@ -50,13 +51,44 @@ def calculate_technicals(hist):
             'above_sma_200': None
         }
 
+def calculate_technicals_batch(histories):
+    """
+    calculate_technicals() for the whole universe in one vectorized call
+    
+    Args:
+        histories: {ticker: OHLCV DataFrame}
+        
+    Returns:
+        {ticker: technicals dict} with the same keys as calculate_technicals()
+    """
+    frames = {t: h for t, h in histories.items() if h is not None and not h.empty}
+    if not frames:
+        return {}
+    
+    arrays = panel_to_arrays(pd.concat(frames, axis=1, sort=True))
+    table = latest_indicators(arrays['Close'], arrays['High'], arrays['Low'], tickers=arrays['tickers'])
+    
+    technicals = {}
+    for ticker, row in table.iterrows():
+        sma = {n: (None if pd.isna(row[f'sma_{n}']) else float(row[f'sma_{n}'])) for n in (20, 50, 200)}
+        price = float(row['price'])
+        technicals[ticker] = {
+            'sma_20': sma[20],
+            'sma_50': sma[50],
+            'sma_200': sma[200],
+            'rsi_14': float(row['rsi_14']),
+            'above_sma_20': price > sma[20] if sma[20] else None,
+            'above_sma_50': price > sma[50] if sma[50] else None,
+            'above_sma_200': price > sma[200] if sma[200] else None
+        }
+    return technicals
+
 def calculate_consecutive_days(ticker, current_return):
     """Calculate consecutive green/red days by looking at history"""
     
     try:
         # Get last 30 days of history
-        stock = yf.Ticker(ticker)
-        hist = stock.history(period='1mo')
+        hist = get_bar_store().get_history(ticker, period='1mo')
         
         if len(hist) < 2:
             return 0, 0
@@ -89,14 +121,18 @@ def calculate_consecutive_days(ticker, current_return):
     except:
         return 0, 0
 
-def get_stock_data(ticker, sector):
-    """Pull all metrics for a ticker - enhanced with technicals and move classification"""
+def get_stock_data(ticker, sector, hist=None, technicals=None):
+    """
+    Pull all metrics for a ticker - enhanced with technicals and move classification
+    
+    hist / technicals: preloaded history and calculate_technicals_batch() row
+    (read / computed here if omitted)
+    """
     
     try:
-        stock = yf.Ticker(ticker)
-        
-        # Get sufficient history for calculations
-        hist = stock.history(period='1y')  # Need more for 200 SMA
+        # Get sufficient history for calculations (local bar store)
+        if hist is None:
+            hist = get_bar_store().get_history(ticker, period='1y')  # Need more for 200 SMA
         
         if len(hist) < 2:
             return None
@@ -135,7 +171,8 @@ def get_stock_data(ticker, sector):
         consecutive_green, consecutive_red = calculate_consecutive_days(ticker, daily_return)
         
         # Technical indicators
-        technicals = calculate_technicals(hist)
+        if technicals is None:
+            technicals = calculate_technicals(hist)
         
         # Move classification
         is_big_move = abs(daily_return) >= BIG_MOVE_THRESHOLD
@@ -248,6 +285,19 @@ def record_daily_data():
     recorded = 0
     failed = 0
     
+    # Fetch only the days missing from the local bar store - one bulk call
+    print(f"Updating bar store for {total} stocks...")
+    fetched = get_bar_store().update(ALL_TICKERS, period='1y')
+    print(f"   {fetched} tickers needed new bars")
+    
+    # Time-of-day volume curves for tomorrow's intraday spike checks
+    profiled = get_volume_profiles().build(ALL_TICKERS)
+    print(f"   Volume profiles: {profiled} tickers\n")
+    
+    # Technicals for the whole universe in one vectorized pass
+    histories = get_bar_store().get_many(ALL_TICKERS, period='1y')
+    technicals = calculate_technicals_batch(histories)
+    
     print(f"Recording {total} stocks...\n")
     
     for i, ticker in enumerate(ALL_TICKERS, 1):
@@ -256,7 +306,7 @@ def record_daily_data():
         print(f"[{i}/{total}] {ticker:6} ({sector:10})... ", end='', flush=True)
         
         # Get data
-        record = get_stock_data(ticker, sector)
+        record = get_stock_data(ticker, sector, histories.get(ticker), technicals.get(ticker))
         
         if record:
             # Store in database
@@ -269,9 +319,6 @@ def record_daily_data():
         else:
             failed += 1
             print("❌ No data")
-        
-        # Rate limit
-        time.sleep(RATE_LIMIT_DELAY)
     
     conn.close()
     
@@ -6,26 +6,23 @@ Run BEFORE recorder each day
 """
 
 import sqlite3
-import yfinance as yf
 from datetime import datetime, timedelta
-import time
 import warnings
 warnings.filterwarnings('ignore')
 
-from config import DB_PATH, RATE_LIMIT_DELAY
+from config import DB_PATH
 from wolfpack_db import get_records_needing_forward_returns, update_forward_returns
+from utils.bar_store import get_bar_store
 
 def calculate_forward_return(ticker, record_date, record_price, days_forward):
     """Calculate actual return X days after record date"""
     
     try:
-        stock = yf.Ticker(ticker)
-        
-        # Get data from record date forward
+        # Get data from record date forward (local bar store)
         start_date = datetime.strptime(record_date, '%Y-%m-%d')
         end_date = start_date + timedelta(days=days_forward + 5)  # Extra buffer
         
-        hist = stock.history(start=start_date, end=end_date)
+        hist = get_bar_store().get_bars(ticker, start=start_date, end=end_date)
         
         if len(hist) <= days_forward:
             return None  # Not enough data yet
@@ -72,9 +69,14 @@ def update_all_forward_returns():
         
         print(f"Found {len(pending)} records to update\n")
         
+        # Fill any bar-store gaps for these tickers in one bulk call.
+        # Reads below are local, so the old 50-record rate-limit cap is gone.
+        oldest = min(record_date for _, record_date, _ in pending)
+        get_bar_store().update([ticker for ticker, _, _ in pending], start=oldest)
+        
         updated = 0
         
-        for ticker, date, close in pending[:50]:  # Limit to 50 per timeframe to avoid rate limits
+        for ticker, date, close in pending:
             
             # Calculate forward return
             forward_ret = calculate_forward_return(ticker, date, close, days)
@@ -85,9 +87,6 @@ def update_all_forward_returns():
                 if update_forward_returns(conn, ticker, date, **kwargs):
                     updated += 1
                     print(f"  ✅ {ticker:6} | {date} | {days}d: {forward_ret:+6.1f}%")
-            
-            # Rate limit
-            time.sleep(RATE_LIMIT_DELAY)
         
         total_updates += updated
         print(f"\n  Updated {updated} records for {days}d timeframe")